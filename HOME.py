@@ -1,10 +1,10 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import streamlit.components.v1 as components
-
-# 페이지 제목
-st.markdown("<h1 style='text-align: center; color: #4CAF50;'>반도체 시뮬레이터</h1>", unsafe_allow_html=True)
-st.markdown("<p style='text-align: center; color: #555;'>MOSFET 및 BJT의 동작 특성을 시뮬레이션하고 3D 구조를 시각화합니다.</p>", unsafe_allow_html=True)
-image_url = "https://raw.githubusercontent.com/roust33/abcd/main/%EB%B0%98%EB%8F%84%EC%B2%B4%20%EC%82%AC%EC%A7%84.png"
-st.image(image_url, use_column_width=True)
\ No newline at end of file
+import streamlit as st
+
+from semisim.assets import asset_path, asset_url
+
+# 페이지 제목
+st.markdown("<h1 style='text-align: center; color: #4CAF50;'>반도체 시뮬레이터</h1>", unsafe_allow_html=True)
+st.markdown("<p style='text-align: center; color: #555;'>MOSFET 및 BJT의 동작 특성을 시뮬레이션하고 3D 구조를 시각화합니다.</p>", unsafe_allow_html=True)
+# 로컬에 설치된 배너 이미지가 있으면 사용 (python -m semisim.assets 참고)
+banner = asset_path("banner")
+st.image(str(banner) if banner else asset_url("banner"), use_column_width=True)
\ No newline at end of file
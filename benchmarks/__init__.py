@@ -0,0 +1,11 @@
+"""
+성능 벤치마크 및 회귀 검사.
+
+    python -m benchmarks                     # 커널 + 페이지 벤치마크, 결과를 JSON으로 출력
+    python -m benchmarks --save-baseline     # 현재 결과를 기준값으로 저장
+    python -m benchmarks --quick --skip-pages
+    python -m benchmarks --skip-kernels      # 모듈 import 시간과 페이지 cold/rerun 시간만
+
+기준값 파일(benchmarks/baseline.json)이 있으면 결과를 비교하고,
+허용 범위보다 느려진 항목이 있으면 종료 코드 1로 끝난다.
+"""
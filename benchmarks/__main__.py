@@ -0,0 +1,56 @@
+import argparse
+import sys
+
+from benchmarks import harness, kernels, pages, startup
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="커널 및 페이지 성능 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="작은 격자 크기만 측정 (최대 1e5 점)")
+    parser.add_argument("--sizes", type=float, nargs="+", help="커널 격자 크기 목록 (예: 1e3 1e6)")
+    parser.add_argument("--kernels", nargs="+", choices=list(kernels.KERNELS), help="측정할 커널")
+    parser.add_argument("--skip-kernels", action="store_true")
+    parser.add_argument("--skip-pages", action="store_true")
+    parser.add_argument("--skip-startup", action="store_true", help="모듈 import 시간 측정 생략")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSON 경로 (기본값: 표준 출력)")
+    parser.add_argument("--baseline", default=str(harness.DEFAULT_BASELINE), help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 속도 저하 비율 (기본값: 0.25)")
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    results = {}
+    if not args.skip_kernels:
+        sizes = [int(n) for n in args.sizes] if args.sizes else (kernels.QUICK_SIZES if args.quick else kernels.SIZES)
+        results.update(kernels.run(sizes, args.kernels, log=log))
+    if not args.skip_startup:
+        results.update(startup.run(log=log))
+    if not args.skip_pages:
+        results.update(pages.run(log=log))
+
+    harness.save(results, args.output)
+    if args.save_baseline:
+        harness.save(results, args.baseline)
+        log(f"기준값 저장: {args.baseline}")
+        return 0
+
+    try:
+        baseline = harness.load(args.baseline)
+    except FileNotFoundError:
+        log(f"기준값 없음: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+
+    regressions, rows = harness.compare(results, baseline, args.tolerance)
+    for name, before, after, ratio in rows:
+        mark = " <-- 회귀" if ratio > 1 + args.tolerance else ""
+        log(f"{name}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms ({ratio:.2f}x){mark}")
+    if regressions:
+        log(f"{len(regressions)}개 항목이 {args.tolerance:.0%} 이상 느려졌습니다.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
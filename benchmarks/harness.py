@@ -0,0 +1,91 @@
+"""
+벤치마크 측정 도구: 시간 측정, 최대 메모리 측정, 결과 JSON 저장과 기준값 비교.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+MIN_TIME = 0.2  # 항목 하나당 최소 측정 시간 (s)
+MAX_REPEAT = 50
+MIN_REPEAT = 3
+
+
+def measure(func, min_time=MIN_TIME, max_repeat=MAX_REPEAT, min_repeat=MIN_REPEAT):
+    """
+    func를 반복 실행하여 실행 시간과 최대 메모리를 측정.
+    최대 메모리는 별도의 한 번의 실행에서 tracemalloc으로 측정한다 (numpy 할당 포함).
+
+    Returns:
+    - {"median_s", "min_s", "repeat", "peak_bytes"} dict
+    """
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_repeat or (time.perf_counter() - start < min_time and len(times) < max_repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "repeat": len(times),
+        "peak_bytes": peak,
+    }
+
+
+def environment():
+    """결과 비교에 필요한 실행 환경 정보."""
+    import numpy as np
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(results, path):
+    payload = {"meta": environment(), "results": results}
+    text = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    if path == "-":
+        sys.stdout.write(text)
+    else:
+        Path(path).write_text(text, encoding="utf-8")
+
+
+def load(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준값과 비교. median 시간이 (1 + tolerance)배보다 커진 항목을 회귀로 본다.
+
+    Returns:
+    - [(이름, 기준 median, 현재 median, 비율)] 회귀 목록, 전체 비교 행 목록
+    """
+    rows, regressions = [], []
+    for name, current in sorted(results.items()):
+        if name not in baseline:
+            continue
+        ratio = current["median_s"] / baseline[name]["median_s"]
+        row = (name, baseline[name]["median_s"], current["median_s"], ratio)
+        rows.append(row)
+        if ratio > 1 + tolerance:
+            regressions.append(row)
+    return regressions, rows
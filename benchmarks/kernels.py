@@ -0,0 +1,74 @@
+"""
+물리 커널 벤치마크. 각 커널은 점 개수 n을 받아 측정할 함수를 만드는 setup 함수로 정의한다.
+"""
+import numpy as np
+
+from benchmarks.harness import measure
+
+SIZES = [10 ** k for k in range(2, 8)]
+QUICK_SIZES = [10 ** k for k in range(2, 6)]
+
+
+def _mobility(n, rng):
+    from semisim.mobility import calculate_mobility_sic
+    N_D = 10 ** rng.uniform(13, 20, n)
+    N_A = 10 ** rng.uniform(15, 17, n)
+    return lambda: calculate_mobility_sic(N_D, N_A, 300)
+
+
+def _calculate_id(n, rng):
+    from semisim.mosfet import calculate_id
+    Vgs = rng.uniform(0, 5, n)
+    Vds = rng.uniform(0, 5, n)
+    return lambda: calculate_id(Vgs, Vds, 10.0, 10.0, 1e19, 1e16)
+
+
+def _bjt_input(n, rng):
+    from semisim.bjt import common_base_input
+    V_BE = rng.uniform(0, 1, n)
+    V_CB = rng.uniform(0, 20, n)
+    return lambda: common_base_input(V_BE, V_CB)
+
+
+def _bjt_output(n, rng):
+    from semisim.bjt import common_base_output
+    I_E = rng.uniform(1e-4, 1e-2, n)
+    V_CB = rng.uniform(0, 20, n)
+    return lambda: common_base_output(I_E, V_CB)
+
+
+def _deal_grove(n, rng):
+    from semisim.kinetics import AMBIENTS, oxide_thickness
+    t = rng.uniform(1, 600, n)
+    T_C = rng.uniform(800, 1200, n)
+    ambient = rng.choice(AMBIENTS, n)
+    return lambda: oxide_thickness(t, T_C, ambient)
+
+
+# 커널 이름: setup 함수
+KERNELS = {
+    "calculate_mobility_sic": _mobility,
+    "calculate_id": _calculate_id,
+    "bjt_input": _bjt_input,
+    "bjt_output": _bjt_output,
+    "deal_grove": _deal_grove,
+}
+
+
+def run(sizes=SIZES, names=None, log=print):
+    """
+    커널 벤치마크 실행.
+
+    Returns:
+    - {"kernel/<이름>/<점 개수>": 측정 결과} dict
+    """
+    results = {}
+    for name in names or KERNELS:
+        for n in sizes:
+            func = KERNELS[name](n, np.random.default_rng(0))
+            result = measure(func)
+            result["points"] = n
+            results[f"kernel/{name}/{n:.0e}"] = result
+            log(f"kernel/{name}/{n:.0e}: {result['median_s'] * 1e3:.3f} ms, "
+                f"peak {result['peak_bytes'] / 1e6:.1f} MB")
+    return results
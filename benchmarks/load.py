@@ -0,0 +1,329 @@
+"""
+동시 접속 부하 테스트.
+
+Streamlit 서버 (``streamlit run HOME.py``)를 띄우고, N개의 세션이 브라우저와 같은 websocket
+프로토콜 (``/_stcore/stream``, protobuf BackMsg / ForwardMsg)로 동시에 접속하여 slider를 움직이거나
+공정 페이지의 뷰어에서 단계를 이동한다 (브라우저 component가 보고하는 단계 값으로 fragment만 rerun). rerun 요청을 보낸 뒤 script_finished를 받을 때까지를
+지연 시간으로 측정하고, 서버 프로세스의 RSS를 주기적으로 기록한다.
+
+    python -m benchmarks.load --sessions 100 --actions 10
+    python -m benchmarks.load --sessions 30 --pages mosfet process --distinct 3 -o load.json
+    python -m benchmarks.load --url ws://host:8501 --pid 1234     # 이미 실행 중인 서버
+
+slider 값은 범위를 --distinct개로 나눈 값 중에서 고르므로 (수업에서 같은 값을 따라 하는 경우),
+서로 다른 파라미터 조합의 수를 조절할 수 있다. 결과로 페이지/동작별 rerun 지연 시간의
+p50 / p95 / p99, 처리량 (rerun/s), 서버 RSS (시작 / 최대 / 끝)를 보고한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+from benchmarks.harness import ROOT, environment
+from semisim.process import PROCESS_FLOW
+
+# 페이지 이름 -> Streamlit page_name (pages/ 파일 이름의 URL 경로)
+PAGES = {
+    "mosfet": "MOSFET_SIMULATION",
+    "bjt": "BJT_SIMULATION",
+    "process": "MOSFET_공정",
+}
+SERVER_TIMEOUT = 60  # 서버 시작 대기 시간 (s)
+RERUN_TIMEOUT = 300  # rerun 하나의 최대 대기 시간 (s)
+RSS_INTERVAL = 0.1  # RSS 표본 간격 (s)
+PERCENTILES = (50, 95, 99)
+VIEWER_COMPONENT = "semisim.viewer.process_viewer"  # 공정 페이지 뷰어의 component 이름
+
+
+def rss_bytes(pid):
+    """프로세스 pid의 현재 RSS (bytes), 읽을 수 없으면 None."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port=None, log=print):
+    """
+    HOME.py로 Streamlit 서버를 띄우고 health check가 통과할 때까지 기다린다.
+
+    Returns:
+    - (subprocess.Popen, websocket 기준 URL)
+    """
+    port = port or _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(ROOT / "HOME.py"), "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_TIMEOUT
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1):
+                break
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError(f"Streamlit 서버가 시작되지 않음 (port {port})")
+            time.sleep(0.2)
+    log(f"서버 시작: pid {process.pid}, port {port}")
+    return process, f"ws://localhost:{port}"
+
+
+class Session:
+    """브라우저 하나를 흉내 내는 websocket 세션. 위젯 값은 브라우저처럼 매 rerun마다 전부 보낸다."""
+
+    def __init__(self, websocket, page):
+        self.websocket = websocket
+        self.page = page
+        self.widgets = {}  # label (component는 이름) -> (종류, 위젯 proto)
+        self.fragments = {}  # 위젯 id -> 위젯이 속한 fragment id
+        self.values = {}  # 위젯 id -> WidgetState (바꾼 위젯만)
+
+    async def rerun(self, trigger=None, fragment_id=""):
+        """
+        rerun 요청을 보내고 script_finished까지 기다린다. trigger는 이번 rerun에만 누르는 버튼 id,
+        fragment_id를 주면 페이지 전체 대신 그 fragment만 다시 실행한다.
+
+        Returns:
+        - 지연 시간 (s), 받은 bytes, 오류 메시지 (없으면 None)
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_name = self.page
+        message.rerun_script.fragment_id = fragment_id
+        states = list(self.values.values())
+        if trigger is not None:
+            states.append(WidgetState(id=trigger, trigger_value=True))
+        message.rerun_script.widget_states.widgets.extend(states)
+
+        t0 = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        received, error = 0, None
+        while True:
+            data = await asyncio.wait_for(self.websocket.recv(), RERUN_TIMEOUT)
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                return time.perf_counter() - t0, received, error
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                widget = element.WhichOneof("type")
+                if widget in ("slider", "button"):
+                    proto = getattr(element, widget)
+                    self.widgets[proto.label] = (widget, proto)
+                elif widget == "component_instance":
+                    proto = element.component_instance
+                    self.widgets[proto.component_name] = (widget, proto)
+                    self.fragments[proto.id] = forward.delta.fragment_id
+                elif widget == "exception":
+                    error = f"{element.exception.type}: {element.exception.message}"
+
+    def set_slider(self, proto, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        state = WidgetState(id=proto.id)
+        state.double_array_value.data.append(value)
+        self.values[proto.id] = state
+
+    def set_component(self, proto, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        self.values[proto.id] = WidgetState(id=proto.id, json_value=json.dumps(value))
+
+
+def _slider_value(proto, rng, distinct):
+    """slider 범위를 distinct개로 나눈 값 (step 단위로 맞춤) 중 하나."""
+    lo, hi, step = proto.min, proto.max, proto.step
+    value = rng.choice(np.linspace(lo, hi, distinct))
+    if step:
+        value = lo + round((value - lo) / step) * step
+    return float(min(max(value, lo), hi))
+
+
+def _move_slider(session, rng, distinct):
+    sliders = [proto for kind, proto in session.widgets.values() if kind == "slider"]
+    proto = sliders[int(rng.integers(len(sliders)))]
+    session.set_slider(proto, _slider_value(proto, rng, distinct))
+    return {}
+
+
+def _step_viewer(session, rng, distinct):
+    # 브라우저 안에서 단계를 이동한 뒤 component가 보고하는 값 (대부분 앞으로 진행)
+    proto = session.widgets[VIEWER_COMPONENT][1]
+    current = json.loads(session.values[proto.id].json_value)["step"] if proto.id in session.values else 0
+    step = min(max(0, current + (1 if rng.random() < 0.7 else -1)), len(PROCESS_FLOW) - 1)
+    session.set_component(proto, {"step": step})
+    return {"fragment_id": session.fragments[proto.id]}
+
+
+# 페이지별 사용자 동작: (session, rng, distinct) -> 이번 rerun의 Session.rerun 인자
+ACTIONS = {"mosfet": _move_slider, "bjt": _move_slider, "process": _step_viewer}
+
+
+async def _session(url, page, actions, think, distinct, seed, start, samples, errors):
+    """사용자 한 명: 페이지를 열고 actions번 조작한다."""
+    import websockets
+
+    rng = np.random.default_rng(seed)
+    try:
+        async with websockets.connect(f"{url}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+            session = Session(ws, PAGES[page])
+            await start.wait()  # 모든 세션이 동시에 접속 (수업 시작)
+            for index in range(actions + 1):
+                kwargs = {}
+                if index:
+                    if think:
+                        await asyncio.sleep(rng.exponential(think))
+                    kwargs = ACTIONS[page](session, rng, distinct)
+                seconds, received, error = await session.rerun(**kwargs)
+                samples.setdefault((page, "open" if index == 0 else "rerun"), []).append((seconds, received))
+                if error:
+                    errors.append(f"{page}: {error}")
+                    return
+    except Exception as exc:  # 세션 하나의 실패가 전체 측정을 멈추지 않게 한다
+        errors.append(f"{page}: {exc!r}")
+
+
+async def _sample_rss(pid, stop, samples):
+    while not stop.is_set():
+        rss = rss_bytes(pid) if pid else None
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), RSS_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _run(url, pid, sessions, actions, pages, think, distinct, seed):
+    samples, errors, rss = {}, [], []
+    start, stop = asyncio.Event(), asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(pid, stop, rss))
+    tasks = [asyncio.create_task(_session(url, pages[i % len(pages)], actions, think, distinct, seed + i,
+                                          start, samples, errors))
+             for i in range(sessions)]
+    await asyncio.sleep(0.5)  # 접속을 마친 뒤 동시에 시작
+    t0 = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await sampler
+    return samples, errors, rss, elapsed
+
+
+def _summary(samples):
+    seconds = np.array([s for s, _ in samples])
+    result = {"count": len(seconds), "median_s": float(np.median(seconds)), "min_s": float(seconds.min()),
+              "max_s": float(seconds.max()), "mean_bytes": float(np.mean([b for _, b in samples]))}
+    for q in PERCENTILES:
+        result[f"p{q}_s"] = float(np.percentile(seconds, q))
+    return result
+
+
+def run(sessions=20, actions=10, pages=tuple(PAGES), think=0.0, distinct=5, seed=0, url=None, pid=None,
+        log=print):
+    """
+    부하 테스트 실행. 세션은 pages에 차례로 나누어 배정한다.
+
+    Parameters:
+    - sessions: 동시 세션 수
+    - actions: 세션당 조작 횟수 (처음 페이지를 여는 rerun은 제외)
+    - pages: 사용할 페이지 이름 (PAGES의 키)
+    - think: 조작 사이 평균 대기 시간 (s, 지수 분포), 0이면 쉬지 않고 조작
+    - distinct: slider 하나가 가질 수 있는 서로 다른 값의 수
+    - seed: 난수 seed
+    - url: 이미 실행 중인 서버의 websocket 기준 URL (None이면 서버를 새로 띄운다)
+    - pid: url 서버의 프로세스 id (RSS 측정용)
+
+    Returns:
+    - {"results": {"load/<페이지>/<open|rerun>": 지연 통계}, "summary": {...}} dict
+    """
+    server = None
+    if url is None:
+        server, url = start_server(log=log)
+        pid = server.pid
+    try:
+        rss_start = rss_bytes(pid) if pid else None
+        samples, errors, rss, elapsed = asyncio.run(
+            _run(url, pid, sessions, actions, tuple(pages), think, distinct, seed))
+        rss_end = rss_bytes(pid) if pid else None
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    results = {f"load/{page}/{kind}": _summary(values) for (page, kind), values in sorted(samples.items())}
+    reruns = sum(result["count"] for result in results.values())
+    summary = {
+        "sessions": sessions,
+        "actions": actions,
+        "pages": list(pages),
+        "distinct": distinct,
+        "elapsed_s": elapsed,
+        "reruns": reruns,
+        "throughput_per_s": reruns / elapsed if elapsed else 0.0,
+        "rss_start_bytes": rss_start,
+        "rss_peak_bytes": max(rss) if rss else None,
+        "rss_end_bytes": rss_end,
+        "errors": errors,
+    }
+
+    for name, result in results.items():
+        log(f"{name}: n={result['count']}, p50 {result['p50_s'] * 1e3:.0f} ms, "
+            f"p95 {result['p95_s'] * 1e3:.0f} ms, p99 {result['p99_s'] * 1e3:.0f} ms, "
+            f"{result['mean_bytes'] / 1e3:.0f} kB/rerun")
+    log(f"처리량: {summary['throughput_per_s']:.1f} rerun/s ({reruns} rerun / {elapsed:.1f} s)")
+    if rss:
+        log(f"서버 RSS: 시작 {rss_start / 1e6:.0f} MB, 최대 {max(rss) / 1e6:.0f} MB, 끝 {rss_end / 1e6:.0f} MB")
+    for error in errors:
+        log(f"오류: {error}")
+    return {"results": results, "summary": summary}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="동시 세션 부하 테스트")
+    parser.add_argument("--sessions", type=int, default=20, help="동시 세션 수 (기본값: 20)")
+    parser.add_argument("--actions", type=int, default=10, help="세션당 조작 횟수 (기본값: 10)")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES), help="사용할 페이지")
+    parser.add_argument("--think", type=float, default=0.0, help="조작 사이 평균 대기 시간 (s)")
+    parser.add_argument("--distinct", type=int, default=5, help="slider 하나의 서로 다른 값 개수 (기본값: 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="이미 실행 중인 서버 (예: ws://localhost:8501), 없으면 새로 띄운다")
+    parser.add_argument("--pid", type=int, help="--url 서버의 프로세스 id (RSS 측정용)")
+    parser.add_argument("-o", "--output", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    report = run(args.sessions, args.actions, tuple(args.pages), args.think, args.distinct, args.seed,
+                 args.url, args.pid, log=log)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(dict(meta=environment(), **report), f, indent=2, sort_keys=True)
+            f.write("\n")
+    return 1 if report["summary"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+페이지 rerun 벤치마크. Streamlit AppTest로 각 페이지를 headless 실행한다.
+"""
+import sys
+import time
+
+from benchmarks.harness import ROOT, measure
+
+PAGE_TIMEOUT = 120
+
+
+def page_paths():
+    """HOME.py와 pages/ 아래의 모든 페이지."""
+    return [ROOT / "HOME.py"] + sorted((ROOT / "pages").glob("*.py"))
+
+
+def run(log=print):
+    """
+    각 페이지의 첫 실행(cold)과 반복 rerun 시간 측정.
+
+    Returns:
+    - {"page/<파일 이름>/cold", "page/<파일 이름>/rerun": 측정 결과} dict
+    """
+    from streamlit.testing.v1 import AppTest
+
+    # streamlit run과 같이 앱 디렉터리에서 semisim 패키지를 import할 수 있게 한다
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    results = {}
+    for path in page_paths():
+        app = AppTest.from_file(str(path), default_timeout=PAGE_TIMEOUT)
+        t0 = time.perf_counter()
+        app.run()
+        elapsed = time.perf_counter() - t0
+        cold = {"median_s": elapsed, "min_s": elapsed, "repeat": 1}
+        if app.exception:
+            raise RuntimeError(f"{path.name}: {app.exception[0].value}")
+        rerun = measure(app.run)
+        for kind, result in (("cold", cold), ("rerun", rerun)):
+            results[f"page/{path.name}/{kind}"] = result
+            log(f"page/{path.name}/{kind}: {result['median_s'] * 1e3:.1f} ms")
+    return results
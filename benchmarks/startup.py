@@ -0,0 +1,71 @@
+"""
+시작 비용 벤치마크. 새 Python 프로세스에서 모듈을 import하는 시간과,
+그 과정에서 numpy / matplotlib이 함께 로드되는지를 측정한다.
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks.harness import ROOT
+
+REPEAT = 5
+
+# 측정할 모듈. streamlit은 모든 페이지가 공통으로 지불하는 기준 비용이다
+MODULES = [
+    "streamlit",
+    "semisim",
+    "semisim.assets",
+    "semisim.profiler",
+    "semisim.process",
+    "semisim.mobility",
+    "semisim.mosfet",
+    "semisim.bjt",
+    "semisim.montecarlo",
+    "semisim.render",
+]
+
+HEAVY = ("numpy", "matplotlib", "matplotlib.pyplot", "pandas")
+
+_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"s": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def import_time(module, repeat=REPEAT):
+    """
+    새 프로세스에서 module을 import하는 시간 측정 (cold import).
+
+    Returns:
+    - {"median_s", "min_s", "repeat", "loaded"} dict, loaded는 함께 로드된 무거운 모듈 목록
+    """
+    times, loaded = [], []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(module=module, heavy=HEAVY)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        times.append(result["s"])
+        loaded = result["loaded"]
+    return {"median_s": statistics.median(times), "min_s": min(times), "repeat": repeat, "loaded": loaded}
+
+
+def run(modules=MODULES, log=print):
+    """
+    모듈별 cold import 시간 측정.
+
+    Returns:
+    - {"import/<모듈 이름>": 측정 결과} dict
+    """
+    results = {}
+    for module in modules:
+        result = import_time(module)
+        results[f"import/{module}"] = result
+        loaded = ", ".join(result["loaded"]) or "-"
+        log(f"import/{module}: {result['median_s'] * 1e3:.1f} ms (loads: {loaded})")
+    return results
@@ -1,581 +1,225 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import streamlit.components.v1 as components
-
-
-st.sidebar.title("MOSFET 공정 시뮬레이션")
-st.sidebar.write("각 공정 단계를 순서대로 확인하세요.")
-
-# 버튼 상태 관리
-if 'step' not in st.session_state:
-    st.session_state['step'] = 0
-
-# 각 공정 단계에 대한 설명 텍스트
-steps_description = [
-    "1. 웨이퍼(P-Silicon)",
-    "2. 증착을 통해 산화막(SiO2) 형성",
-    "3. 포토레지스트(Positive PR) 도포",
-    "4. 소스/드레인 부분 마스크, 노광 공정을 통해 패턴 형성",
-    "5. 현상(Develope)을 통해 빛을 받은 부분 제거",
-    "6. 식각(Etching)을 통해 PR이 없는 부분의 산화막 제거",
-    "7. 애싱(Ashing)을 통해 PR 제거",
-    "8. 증착을 통해 Gate 산화막 형성",
-    "9. 증착을 통해 Poly-Si 형성",
-    "10. PR 도포",
-    "11. Mask 추가 후 노광 공정을 통해 패턴 형성",
-    "12. 현상(Develope)을 통해 빛을 받은 부분 제거",
-    "13. 식각(Etching)을 통해 PR이 없는 부분의 산화막과 Poly-Si 제거",
-    "14. 애싱(Ashing)을 통해 PR 제거",
-    "15. 이온 주입 공정 후 확산을 통해 P-type실리콘에 N+ 영역 생성",
-    "16. ILD(SiO2) 증착 후 CMP(연마)",
-    "17. PR 도포",
-    "18. Mask 추가 후 노광 공정을 통해 패턴 형성",
-    "19. 현상(Develope)을 통해 빛을 받은 부분 제거",
-    "20. 식각(Etching)을 통해 빛을 받은 부분의 ILD(SiO2) 제거",
-    "21. 애싱(Ashing)을 통해 PR 제거",
-    "22. Metal(Al) 증착 후 CMP(연마)",
-    "23. PR 도포",
-    "24. Mask 추가 후 노광 공정을 통해 패턴 형성",
-    "25. 현상(Develope)을 통해 빛을 받은 부분 제거",
-    "26. 식각(Etching)을 통해 Metal 제거",
-    "27. 애싱(Ashing)을 통해 PR 제거",
-    ]
-
-# CSS와 HTML을 사용하여 스타일 설정
-st.markdown("""
-    <style>
-        .main { background-color: #f9f9f9; }
-        .stTitle { color: #34495e; font-weight: bold; font-size: 26px; text-align: center; margin-top: 10px; margin-bottom: 10px; }
-        .button-container { display: flex; justify-content: space-between; align-items: center; padding: 5px 80px; margin-top: -10px; margin-bottom: 10px; }
-        .stButton button { background-color: #3498db; color: white; border: none; padding: 10px 20px; border-radius: 5px; font-size: 14px; font-weight: bold; cursor: pointer; transition: background-color 0.3s; }
-        .stButton button:hover { background-color: #2980b9; }
-        .step-display { text-align: center; font-size: 16px; color: #444444; font-weight: bold; margin-top: 5px; }
-        .three-js-container { display: flex; justify-content: center; border-radius: 10px; background-color: #ffffff; padding: 5px; box-shadow: 0px 4px 8px rgba(0, 0, 0, 0.2); margin-top: 10px; margin-bottom: 10px; }
-        .description-box { background-color: #ecf0f1; border-radius: 10px; padding: 15px; font-size: 16px; color: #2c3e50; margin-top: 10px; text-align: left; }
-    </style>
-""", unsafe_allow_html=True)
-# Three.js 애니메이션 스크립트
-three_js_script_template = """
-<script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/three@0.128.0/examples/js/controls/OrbitControls.js"></script>
-<script>
-document.addEventListener("DOMContentLoaded", function() {{
-    let scene, camera, renderer, controls;
-
-    // 전역 변수로 객체 선언
-    let wafer = null, oxide = null, pr = null;
-    let leftPart = null, rightPart = null, middlePart = null, topPart = null;
-
-    function init() {{
-        scene = new THREE.Scene();
-        camera = new THREE.PerspectiveCamera(75, 1, 0.1, 1000);
-
-        // 초기 카메라 위치
-        camera.position.set(5, 5, 10);
-        camera.lookAt(0, 0, 0);
-
-        renderer = new THREE.WebGLRenderer({{ alpha: true }});
-        renderer.setSize(500, 350);
-        document.getElementById('3d-simulation').appendChild(renderer.domElement);
-
-        controls = new THREE.OrbitControls(camera, renderer.domElement);
-        controls.enableDamping = true;
-        controls.dampingFactor = 0.05;
-
-        // 객체 생성 함수 (테두리 포함)
-        function createLayer(geometry, color, position) {{
-            const material = new THREE.MeshBasicMaterial({{ color: color, opacity: 1, transparent: true }});
-            const mesh = new THREE.Mesh(geometry, material);
-            mesh.position.set(...position);
-
-            // 테두리 추가
-            const edges = new THREE.EdgesGeometry(geometry);
-            const line = new THREE.LineSegments(edges, new THREE.LineBasicMaterial({{ color: 0x000000 }}));
-            mesh.add(line);
-
-            return mesh;
-        }}
-
-        // 단계별 객체 관리
-        if ({step} >= 0) {{
-            // 1단계: 웨이퍼 생성
-            if (!wafer) {{
-                wafer = createLayer(new THREE.BoxGeometry(4, 1, 3), 0x87CEFA, [0, -0.5, 0]);
-                scene.add(wafer);
-            }}
-        }}
-
-        if ({step} >= 1) {{
-            // 2단계: 산화막 추가
-            if (!oxide) {{
-                oxide = createLayer(new THREE.BoxGeometry(4, 0.5, 3), 0xA9A9A9, [0, 0.25, 0]);
-                scene.add(oxide);
-            }}
-        }}
-
-        if ({step} >= 2) {{
-            // 3단계: PR 추가
-            if (!pr) {{
-                pr = createLayer(new THREE.BoxGeometry(4, 0.2, 3), 0xFF0000, [0, 0.6, 0]);
-                scene.add(pr);
-            }}
-        }}
-
-        if ({step} >= 3) {{
-            // 4단계: 소스/드레인 마스크 추가
-            if (!leftPart && !rightPart && !middlePart && !topPart) {{
-                leftPart = createLayer(new THREE.BoxGeometry(0.5, 0.2, 3), 0x000000, [-1.75, 1, 0]);
-                rightPart = createLayer(new THREE.BoxGeometry(0.5, 0.2, 3), 0x000000, [1.75, 1, 0]);
-                topPart = createLayer(new THREE.BoxGeometry(4, 0.2, 1.2), 0x000000, [0, 1, -0.9]);
-
-                 scene.add(leftPart);
-                scene.add(rightPart);
-                scene.add(topPart);
-            }}
-        }}
-
-        if ({step} >= 4) {{
-            // 5단계: 현상
-            if (pr) {{
-                scene.remove(pr);
-                pr = null;
-            }}
-
-            if (leftPart) {{
-                scene.remove(leftPart);
-                leftPart = null;
-            }}
-            if (rightPart) {{
-                scene.remove(rightPart);
-                rightPart = null;
-            }}
-            if (topPart) {{
-                scene.remove(topPart);
-                topPart = null;
-            }}
-
-            if (!pr) {{
-                leftPartp = createLayer(new THREE.BoxGeometry(0.5, 0.2, 3), 0xFF0000, [-1.75, 0.6, 0]);
-                rightPartp = createLayer(new THREE.BoxGeometry(0.5, 0.2, 3), 0xFF0000, [1.75, 0.6, 0]);
-                topPartp = createLayer(new THREE.BoxGeometry(4, 0.2, 1.2), 0xFF0000, [0, 0.6, -0.9]);
-
-                scene.add(leftPartp);
-                scene.add(rightPartp);
-                scene.add(topPartp);
-            }}
-        }}
-
-        if ({step} >= 5) {{
-            // 6단계: 애칭
-            if (oxide) {{
-                scene.remove(oxide);
-                oxide = null;
-            }}
-            if (!oxide) {{
-                leftParto = createLayer(new THREE.BoxGeometry(0.5, 0.5, 3), 0xA9A9A9, [-1.75, 0.25, 0]);
-                rightParto = createLayer(new THREE.BoxGeometry(0.5, 0.5, 3), 0xA9A9A9, [1.75, 0.25, 0]);
-                topParto = createLayer(new THREE.BoxGeometry(4, 0.5, 1.2), 0xA9A9A9, [0, 0.25, -0.9]);
-
-                scene.add(leftParto);
-                scene.add(rightParto);
-                scene.add(topParto);
-            }}
-        }}
-
-        if ({step} >= 6) {{
-            // 7단계: 애싱
-            if (leftPartp) {{
-                scene.remove(leftPartp);
-                leftPartp = null;
-            }}
-            if (rightPartp) {{
-                scene.remove(rightPartp);
-                rightPartp = null;
-            }}
-            if (topPartp) {{
-                scene.remove(topPartp);
-                topPartp = null;
-            }}
-        }}        
-        if ({step} >= 7) {{
-            // 8단계: 산화막 형성
-            if (wafer) {{
-                leftParto8 = createLayer(new THREE.BoxGeometry(0.5, 0.25, 3), 0x7F7F7F, [-1.75, 0.625, 0]);
-                rightParto8 = createLayer(new THREE.BoxGeometry(0.5, 0.25, 3), 0x7F7F7F, [1.75, 0.625, 0]);
-                topParto8 = createLayer(new THREE.BoxGeometry(4, 0.25, 1.2), 0x7F7F7F, [0, 0.625, -0.9]);
-                middleParto8 = createLayer(new THREE.BoxGeometry(3, 0.25, 1.8), 0x7F7F7F, [0, 0.125, 0.6]);
-
-
-                scene.add(leftParto8);
-                scene.add(rightParto8);
-                scene.add(topParto8);
-                scene.add(middleParto8);
-            }}
-        }}
-        if ({step} >= 8) {{
-            // 9단계: Poly-Si 형성
-            if (wafer) {{
-                leftPartp9 = createLayer(new THREE.BoxGeometry(0.5, 0.25, 3), 0x0000FF, [-1.75, 0.875, 0]);
-                rightPartp9 = createLayer(new THREE.BoxGeometry(0.5, 0.25, 3), 0x0000FF, [1.75, 0.875, 0]);
-                topPartp9 = createLayer(new THREE.BoxGeometry(4, 0.25, 1.2), 0x0000FF, [0, 0.875, -0.9]);
-                middlePartp9 = createLayer(new THREE.BoxGeometry(3, 0.25, 1.8), 0x0000FF, [0, 0.375, 0.6]);
-
-
-                scene.add(leftPartp9);
-                scene.add(rightPartp9);
-                scene.add(topPartp9);
-                scene.add(middlePartp9);
-            }}  
-        }}
-        if ({step} >= 9) {{
-            // 10단계: PR 도포
-            if (wafer) {{
-                leftPartp10 = createLayer(new THREE.BoxGeometry(0.5, 0.1, 3), 0xFF0000, [-1.75, 1.05, 0]);
-                rightPartp10 = createLayer(new THREE.BoxGeometry(0.5, 0.1, 3), 0xFF0000, [1.75, 1.05, 0]);
-                topPartp10 = createLayer(new THREE.BoxGeometry(4, 0.1, 1.2), 0xFF0000, [0, 1.05, -0.9]);
-                middlePartp10 = createLayer(new THREE.BoxGeometry(3, 0.1, 1.8), 0xFF0000, [0, 0.55, 0.6]);
-
-
-                scene.add(leftPartp10);
-                scene.add(rightPartp10);
-                scene.add(topPartp10);
-                scene.add(middlePartp10);
-            }}  
-        }}
-        if ({step} >= 10) {{
-            // 11단계: Mask 추가 후 노광 공정
-            if (wafer) {{
-                mask11 = createLayer(new THREE.BoxGeometry(1, 0.2, 1.8), 0x000000, [0, 1.3, 0.6]);
-
-                scene.add(mask11);
-            }}  
-        }}
-        if ({step} >= 11) {{
-            // 12단계: 현상
-            if (mask11) {{
-                scene.remove(mask11);
-                mask11 = null;
-
-                scene.remove(leftPartp10);
-                leftPartp10 = null;
-                scene.remove(rightPartp10);
-                rightPartp10 = null;
-                scene.remove(topPartp10);
-                topPartp10 = null;
-                scene.remove(middlePartp10);
-                middlePartp10 = null;
-
-                PR12 = createLayer(new THREE.BoxGeometry(1, 0.1, 1.8), 0xFF0000, [0, 0.55, 0.6]);
-
-                scene.add(PR12);
-            }}  
-        }}                 
-        if ({step} >= 12) {{
-            // 13단계: 식각(etching)을 통해 산화막과 Poly-Si 제거
-        if (PR12){{
-                scene.remove(leftParto8);
-                leftParto8 = null;
-                scene.remove(rightParto8);
-                rightParto8 = null;
-                scene.remove(topParto8);
-                topParto8 = null;
-                scene.remove(middleParto8);
-                middleParto8 = null;
-
-                scene.remove(leftPartp9);
-                leftPartp9 = null;
-                scene.remove(rightPartp9);
-                rightPartp9 = null;
-                scene.remove(topPartp9);
-                topPartp9 = null;
-                scene.remove(middlePartp9);
-                middlePartp9 = null;
-
-                Si12 = createLayer(new THREE.BoxGeometry(1, 0.25, 1.8), 0x7F7F7F, [0, 0.125, 0.6]);
-                Poly12 = createLayer(new THREE.BoxGeometry(1, 0.25, 1.8), 0x0000FF, [0, 0.375, 0.6]);
-                    
-                scene.add(Si12);
-                scene.add(Poly12);
-        }}
-        }}                 
-        if ({step} >= 13) {{
-            // 14단계: 애싱(ashing)을 통해 PR 제거
-            if (PR12) {{
-                scene.remove(PR12);
-                PR2 = null;
-                }}
-        }}       
-        if ({step} >= 14) {{
-            // 15단계: 이온 주입후 확산
-            if (wafer) {{
-                scene.remove(wafer);
-                wafer = null;
-            }}
-            if(!wafer) {{
-                waferunder = createLayer(new THREE.BoxGeometry(4, 0.5, 3), 0x87CEFA, [0, -0.75, 0]);
-                scene.add(waferunder);                
-            }}
-            if(!wafer) {{
-                waferleft = createLayer(new THREE.BoxGeometry(0.25, 0.5, 3), 0x87CEFA, [-1.875, -0.25, 0]);
-                scene.add(waferleft);
-                waferright = createLayer(new THREE.BoxGeometry(0.25, 0.5, 3), 0x87CEFA, [1.875, -0.25, 0]);
-                scene.add(waferright);
-                wafertop = createLayer(new THREE.BoxGeometry(4, 0.5, 1), 0x87CEFA, [0, -0.25, -1]);
-                scene.add(wafertop);
-                wafermiddle = createLayer(new THREE.BoxGeometry(0.5, 0.5, 3), 0x87CEFA, [0, -0.25, 0]);
-                scene.add(wafermiddle);                       
-            }}
-            if(!wafer) {{
-                doppingNP = createLayer(new THREE.BoxGeometry(1.5, 0.5, 2), 0x4682B4, [-1, -0.25, 0.5]);
-                scene.add(doppingNP);
-                doppingN = createLayer(new THREE.BoxGeometry(1.5, 0.5, 2), 0x4682B4, [1, -0.25, 0.5]);
-                scene.add(doppingN);                      
-            }}
-        }}               
-        if ({step} >= 15) {{
-            // 16단계: ILD(SiO2) 증착 후 CMP
-            if(!wafer) {{
-                ILDL = createLayer(new THREE.BoxGeometry(1, 0.5, 1.8), 0x8F8F8F, [-1, 0.25, 0.6]);
-                scene.add(ILDL);
-                ILDR = createLayer(new THREE.BoxGeometry(1, 0.5, 1.8), 0x8F8F8F, [1, 0.25, 0.6]);
-                scene.add(ILDR); 
-                ILD = createLayer(new THREE.BoxGeometry(4, 1, 3), 0x8F8F8F, [0, 1, 0]);
-                scene.add(ILD);                   
-            }}
-        }} 
-        if ({step} >= 16) {{
-            // 17단계: PR 도포
-            if(!wafer) {{
-                PR17 = createLayer(new THREE.BoxGeometry(4, 0.2, 3), 0xFF0000, [0, 1.6, 0]);
-                scene.add(PR17);
-            }}
-        }}     
-        if ({step} >= 17) {{
-            // 18단계: Mask 추가 후 노광 공정
-            if(!wafer) {{
-                ML18 = createLayer(new THREE.BoxGeometry(0.6, 0.2, 3), 0x000000, [-1.7, 2, 0]);
-                MR18 = createLayer(new THREE.BoxGeometry(0.6, 0.2, 3), 0x000000, [1.7, 2, 0]);
-                MML18 = createLayer(new THREE.BoxGeometry(0.2, 0.2, 3), 0x000000, [-0.5, 2, 0]);
-                MMR18 = createLayer(new THREE.BoxGeometry(0.2, 0.2, 3), 0x000000, [0.5, 2, 0]);
-                MT18 = createLayer(new THREE.BoxGeometry(4, 0.2, 1.2), 0x000000, [0, 2, -0.9]);
-
-                scene.add(ML18);
-                scene.add(MR18);
-                scene.add(MML18);
-                scene.add(MMR18);
-                scene.add(MT18);
-            }}
-        }}             
-        if ({step} >= 18) {{
-            // 19단계: 현상
-            if(!wafer) {{
-                scene.remove(ML18);
-                scene.remove(MR18);
-                scene.remove(MML18);
-                scene.remove(MMR18);
-                scene.remove(MT18);
-                
-                ML18 = null;
-                MR18 = null;
-                MML18 = null;
-                MMR18 = null;
-                MT18 = null;
-
-                scene.remove(PR17);
-                PR17 = null;
-
-                ML19 = createLayer(new THREE.BoxGeometry(0.6, 0.2, 3), 0xFF0000, [-1.7, 1.6, 0]);
-                MR19 = createLayer(new THREE.BoxGeometry(0.6, 0.2, 3), 0xFF0000, [1.7, 1.6, 0]);
-                MML19 = createLayer(new THREE.BoxGeometry(0.2, 0.2, 3), 0xFF0000, [-0.5, 1.6, 0]);
-                MMR19 = createLayer(new THREE.BoxGeometry(0.2, 0.2, 3), 0xFF0000, [0.5, 1.6, 0]);
-                MT19 = createLayer(new THREE.BoxGeometry(4, 0.2, 1.2), 0xFF0000, [0, 1.6, -0.9]);
-
-                scene.add(ML19);
-                scene.add(MR19);
-                scene.add(MML19);
-                scene.add(MMR19);
-                scene.add(MT19);
-            }}
-        }}
-        if ({step} >= 19) {{
-            // 20단계: 식각(etching)을 통해 ILD 제거
-            if(!wafer) {{
-                scene.remove(ILDL);
-                ILDL = null;
-                scene.remove(ILDR);
-                ILDR = null;
-                scene.remove(ILD);
-                ILD = null;
-
-                ILDL19 = createLayer(new THREE.BoxGeometry(0.6, 1, 3), 0x8F8F8F, [-1.7, 1, 0]);
-                ILDR19 = createLayer(new THREE.BoxGeometry(0.6, 1, 3), 0x8F8F8F, [1.7, 1, 0]);
-                ILDT19 = createLayer(new THREE.BoxGeometry(4, 1, 1.2), 0x8F8F8F, [0, 1, -0.9]);
-                ILDML19 = createLayer(new THREE.BoxGeometry(0.2, 1, 3), 0x8F8F8F, [-0.5, 1, 0]);
-                ILDMR19 = createLayer(new THREE.BoxGeometry(0.2, 1, 3), 0x8F8F8F, [0.5, 1, 0]);
-
-                scene.add(ILDL19);
-                scene.add(ILDR19);
-                scene.add(ILDT19);
-                scene.add(ILDML19);
-                scene.add(ILDMR19);
-
-                ILDUL = createLayer(new THREE.BoxGeometry(0.1, 0.5, 1.8), 0x8F8F8F, [-1.45, 0.25, 0.6]);
-                ILDUR = createLayer(new THREE.BoxGeometry(0.1, 0.5, 1.8), 0x8F8F8F, [1.45, 0.25, 0.6]);
-                ILDUML = createLayer(new THREE.BoxGeometry(0.1, 0.5, 1.8), 0x8F8F8F, [-0.55, 0.25, 0.6]);
-                ILDUMR = createLayer(new THREE.BoxGeometry(0.1, 0.5, 1.8), 0x8F8F8F, [0.55, 0.25, 0.6]);
-
-                scene.add(ILDUL);
-                scene.add(ILDUR);
-                scene.add(ILDUML);
-                scene.add(ILDUMR);
-            }}
-        }}     
-        if ({step} >= 20) {{
-            // 21단계: 애싱(ashing)을 통해 PR 제거
-            if (!wafer) {{
-                scene.remove(ML19);
-                ML19 = null;
-                scene.remove(MR19);
-                MR19 = null;
-                scene.remove(MML19);
-                MML9 = null;
-                scene.remove(MMR19);
-                MMR19 = null;
-                scene.remove(MT19);
-                MT19 = null;
-            }}             
-        }}
-        if ({step} >= 21) {{
-            // 22단계: Metal(Al) 증착 후 CMP
-            if (!wafer) {{
-                ML22 = createLayer(new THREE.BoxGeometry(0.8, 1.5, 1.8), 0x800080, [-1, 0.75, 0.6]);
-                MR22 = createLayer(new THREE.BoxGeometry(0.8, 1.5, 1.8), 0x800080, [1, 0.75, 0.6]);
-                MM22 = createLayer(new THREE.BoxGeometry(0.8, 1, 1.8), 0x800080, [0, 1, 0.6]);
-                M22 = createLayer(new THREE.BoxGeometry(4, 0.4, 3), 0x800080, [0, 1.7, 0]);
-                scene.add(ML22);
-                scene.add(MR22);
-                scene.add(MM22);
-                scene.add(M22);
-            }}             
-        }}
-        if ({step} >= 22) {{
-            // 23단계: PR 도포
-            if (!wafer) {{
-                PR23 = createLayer(new THREE.BoxGeometry(4, 0.2, 3), 0xFF0000, [0, 2, 0]);
-                scene.add(PR23);
-            }}             
-        }}
-        if ({step} >= 23) {{
-            // 24단계: Mask 추가 후 노광 공정
-            if (!wafer) {{
-                ML24 = createLayer(new THREE.BoxGeometry(0.3, 0.2, 3), 0x000000, [-1.85, 2.4, 0]);
-                MR24 = createLayer(new THREE.BoxGeometry(0.3, 0.2, 3), 0x000000, [1.85, 2.4, 0]);
-                MML24 = createLayer(new THREE.BoxGeometry(0.1, 0.2, 3), 0x000000, [-0.5, 2.4, 0]);
-                MMR24 = createLayer(new THREE.BoxGeometry(0.1, 0.2, 3), 0x000000, [0.5, 2.4, 0]);
-                MT24 = createLayer(new THREE.BoxGeometry(4, 0.2, 1.2), 0x000000, [0, 2.4, -0.9]);
-                scene.add(ML24);
-                scene.add(MR24);
-                scene.add(MML24);
-                scene.add(MMR24);
-                scene.add(MT24);
-            }}             
-        }}
-        if ({step} >= 24) {{
-            // 25단계: 현상
-            if (!wafer) {{
-                scene.remove(ML24);
-                scene.remove(MR24);
-                scene.remove(MML24);
-                scene.remove(MMR24);
-                scene.remove(MT24);
-                ML24 = null;
-                MR24 = null;
-                MML24 = null;
-                MMR24 = null;
-                MR24 = null;
-
-                scene.remove(PR23);
-                PR23 = null;
-
-                PRL25 = createLayer(new THREE.BoxGeometry(1.15, 0.2, 1.8), 0xFF0000, [-1.125, 2, 0.6]);
-                PRR25 = createLayer(new THREE.BoxGeometry(1.15, 0.2, 1.8), 0xFF0000, [1.125, 2, 0.6]);
-                PRM25 = createLayer(new THREE.BoxGeometry(0.9, 0.2, 1.8), 0xFF0000, [0, 2, 0.6]);
-                scene.add(PRL25);
-                scene.add(PRR25);
-                scene.add(PRM25);
-            }}             
-        }}
-        if ({step} >= 25) {{
-            // 26단계: 식각(etching)을 통해 Metal 제거
-            if (M22) {{
-                scene.remove(M22);
-                M22 = null;
-
-                ML25 = createLayer(new THREE.BoxGeometry(1.15, 0.4, 1.8), 0x800080, [-1.125, 1.7, 0.6]);
-                MR25 = createLayer(new THREE.BoxGeometry(1.15, 0.4, 1.8), 0x800080, [1.125, 1.7, 0.6]);
-                MM25 = createLayer(new THREE.BoxGeometry(0.9, 0.4, 1.8), 0x800080, [0, 1.7, 0.6]);
-                scene.add(ML25);
-                scene.add(MR25);
-                scene.add(MM25);
-            }}             
-        }}
-        if ({step} >= 26) {{
-            // 27단계: 애싱(ashing)을 통해 PR 제거
-            if (!wafer) {{
-                scene.remove(PRL25);
-                PRL25 = null;
-                scene.remove(PRR25);
-                PRR25 = null;
-                scene.remove(PRM25);
-                PRM25 = null;
-
-            }}             
-        }}
-
-        animate();
-            function animate() {{
-            requestAnimationFrame(animate);
-            controls.update();
-            renderer.render(scene, camera);
-        }}
-    }}
-
-    init();
-}});
-</script>
-
-<!-- 3D 시뮬레이션 화면 -->
-<div class="three-js-container">
-    <div id="3d-simulation" style="width: 100%; height: 350px;"></div>
-</div>
-"""
-
-# Streamlit에서 HTML 포함
-with st.container():
-    st.markdown("<div class='stTitle'>MOSFET 3D 공정 시뮬레이션</div>", unsafe_allow_html=True)
-
-    # 버튼 영역 생성
-    st.write('<div class="button-container">', unsafe_allow_html=True)
-
-    col1, col2, col3 = st.columns([1, 3, 1])
-    with col1:
-        if st.button("이전"):
-            if st.session_state['step'] > 0:
-                st.session_state['step'] -= 1
-                st.experimental_set_query_params(rerun="true")
-
-    with col3:
-        if st.button("다음"):
-            if st.session_state['step'] < len(steps_description) - 1:
-                st.session_state['step'] += 1
-                st.experimental_set_query_params(rerun="true")
-
-    st.write('</div>', unsafe_allow_html=True)
-
-    # 현재 단계 표시 및 단계별 설명 박스
-    st.write(f'<div class="step-display">현재 단계: {st.session_state["step"] + 1}</div>', unsafe_allow_html=True)
-    st.write(f'<div class="description-box">{steps_description[st.session_state["step"]]}</div>', unsafe_allow_html=True)
-
-    # 3D 시뮬레이션 HTML 삽입
-    components.html(three_js_script_template.format(step=st.session_state['step']), height=400)
+import streamlit as st
+import numpy as np
+
+from semisim import profiler
+from semisim.graph import Graph
+from semisim.implant import DIFFUSIVITY, MODELS, source_drain
+from semisim.kinetics import AMBIENTS
+from semisim.litho import THRESHOLD, WAVELENGTHS, critical_dimension, expose_steps, exposure_steps, focus_exposure
+from semisim.process import DEFAULT_RECIPE, film_thicknesses, recipe_engine
+from semisim.render import show_image
+from semisim.viewer import frame_stats, process_viewer
+
+profiler.start()
+
+st.sidebar.title("MOSFET 공정 시뮬레이션")
+st.sidebar.write("각 공정 단계를 순서대로 확인하세요.")
+
+# 현재 단계 (다른 페이지에 다녀와도 이어서 보여준다)
+if 'step' not in st.session_state:
+    st.session_state['step'] = 0
+
+# 산화 / 증착 조건: 3D 뷰의 막 두께와 MOSFET 시뮬레이션의 t_ox (게이트 산화막)를 정한다
+films = {**DEFAULT_RECIPE, **st.session_state.get('films', {})}
+with st.sidebar.expander("산화 / 증착 조건 (2, 8, 9, 16, 22단계)"):
+    field_ambient = st.radio("필드 산화 ambient", AMBIENTS, index=AMBIENTS.index(films['field_ambient']),
+                             horizontal=True)
+    field_T = st.slider("필드 산화 온도 [°C]", 800.0, 1200.0, films['field_T'], step=10.0)
+    field_min = st.slider("필드 산화 시간 [분]", 0.0, 300.0, films['field_min'], step=5.0)
+    gate_ambient = st.radio("게이트 산화 ambient", AMBIENTS, index=AMBIENTS.index(films['gate_ambient']),
+                            horizontal=True)
+    gate_T = st.slider("게이트 산화 온도 [°C]", 800.0, 1200.0, films['gate_T'], step=10.0)
+    gate_min = st.slider("게이트 산화 시간 [분]", 0.0, 180.0, films['gate_min'], step=1.0)
+    poly_T = st.slider("Poly-Si LPCVD 온도 [°C]", 560.0, 700.0, films['poly_T'], step=5.0)
+    poly_min = st.slider("Poly-Si 증착 시간 [분]", 0.0, 60.0, films['poly_min'], step=1.0)
+    ild_T = st.slider("ILD LPCVD 온도 [°C]", 600.0, 800.0, films['ild_T'], step=5.0)
+    ild_min = st.slider("ILD 증착 시간 [분]", 0.0, 180.0, films['ild_min'], step=5.0)
+    al_min = st.slider("Al sputtering 시간 [분]", 0.0, 3.0, films['al_min'], step=0.1)
+films = {"field_ambient": field_ambient, "field_T": field_T, "field_min": field_min,
+         "gate_ambient": gate_ambient, "gate_T": gate_T, "gate_min": gate_min,
+         "poly_T": poly_T, "poly_min": poly_min, "ild_T": ild_T, "ild_min": ild_min, "al_min": al_min}
+st.session_state['films'] = films
+thickness = film_thicknesses(films)
+st.sidebar.caption(f"필드 산화막 {thickness['Oxide']:.3f} µm, 게이트 산화막 {thickness['GateOxide'] * 1e3:.1f} nm (t_ox), "
+                   f"Poly-Si {thickness['Poly']:.3f} µm, ILD {thickness['ILD']:.3f} µm, Al {thickness['Al']:.3f} µm")
+
+# 15단계 이온 주입 / 확산 조건. MOSFET 시뮬레이션 페이지가 N_D로 쓰도록 세션에 보관한다
+st.sidebar.header("이온 주입 / 확산 (15단계)")
+recipe = st.session_state.get('implant', {})
+ions = list(DIFFUSIVITY)
+ion = st.sidebar.selectbox("주입 이온", ions, index=ions.index(recipe.get('ion', "As")))
+model = st.sidebar.radio("깊이 분포", MODELS, index=MODELS.index(recipe.get('model', "pearson")), horizontal=True)
+energy = st.sidebar.slider("주입 에너지 [keV]", 10.0, 200.0, recipe.get('energy', 50.0), step=5.0)
+dose = st.sidebar.slider("주입량 [cm^-2]", min_value=1e13, max_value=1e16, value=recipe.get('dose', 5e15), format="%.1e")
+anneal_C = st.sidebar.slider("확산 온도 [°C]", 800.0, 1100.0, recipe.get('anneal_C', 1000.0), step=10.0)
+anneal_min = st.sidebar.slider("확산 시간 [분]", 0.0, 120.0, recipe.get('anneal_min', 30.0), step=5.0)
+N_A = st.sidebar.slider("p형 기판 농도 (cm^-3)", min_value=1e15, max_value=1e17, value=recipe.get('N_A', 1e16),
+                        format="%.1e")
+st.session_state['implant'] = {"ion": ion, "model": model, "energy": energy, "dose": dose,
+                               "anneal_C": anneal_C, "anneal_min": anneal_min, "N_A": N_A}
+
+# 노광 조건 (4, 11, 18, 24단계): aerial image, 현상 패턴, CD의 focus / dose 의존성
+st.sidebar.header("노광 (4, 11, 18, 24단계)")
+litho = st.session_state.get('litho', {})
+exposures = [step for step, _, _ in exposure_steps()]
+light = st.sidebar.selectbox("광원", list(WAVELENGTHS), index=list(WAVELENGTHS).index(litho.get('light', "ArF")))
+NA = st.sidebar.slider("NA", 0.3, 1.35, litho.get('NA', 0.93), step=0.01)
+sigma = st.sidebar.slider("부분 결맞음 σ", 0.1, 1.0, litho.get('sigma', 0.5), step=0.05)
+defocus = st.sidebar.slider("Defocus [µm]", -0.3, 0.3, litho.get('defocus', 0.0), step=0.01)
+exposure_dose = st.sidebar.slider("노광량 (정규화)", 0.5, 2.0, litho.get('dose', 1.0), step=0.05)
+litho_step = st.sidebar.selectbox("노광 단계", exposures, index=exposures.index(litho.get('step', exposures[1])),
+                                  format_func=lambda step: f"{step + 1}단계")
+cd_x = st.sidebar.slider("CD 측정 위치 x [µm]", -2.0, 2.0, litho.get('cd_x', 0.0), step=0.05)
+st.session_state['litho'] = {"light": light, "NA": NA, "sigma": sigma, "defocus": defocus, "dose": exposure_dose,
+                             "step": litho_step, "cd_x": cd_x}
+
+# CSS와 HTML을 사용하여 스타일 설정 (버튼, 단계 표시, 설명 박스 스타일은 뷰어 component 안에 있다)
+st.markdown("""
+    <style>
+        .main { background-color: #f9f9f9; }
+        .stTitle { color: #34495e; font-weight: bold; font-size: 26px; text-align: center; margin-top: 10px; margin-bottom: 10px; }
+    </style>
+""", unsafe_allow_html=True)
+
+
+# 15단계 소스/드레인 도핑: 공정 엔진의 주입 개구부 -> 이온 주입 분포 -> 2D 확산 (ADI)
+graph = Graph("process")
+
+
+@graph.node("ion", "energy", "dose", "model", "anneal_C", "anneal_min", "N_A")
+def implant(ion, energy, dose, model, anneal_C, anneal_min, N_A):
+    return source_drain(ion, energy, dose, model, anneal_C, anneal_min, N_A)
+
+
+@graph.figure("process_doping", "implant", figsize=(10, 4))
+def doping_figure(fig, result):
+    ax_map, ax_profile = fig.subplots(1, 2, gridspec_kw={"width_ratios": [2, 1]})
+    extent = [result.x[0], result.x[-1], result.y[-1], result.y[0]]
+    im = ax_map.imshow(np.log10(np.maximum(result.C, 1e10)), extent=extent, aspect="auto", cmap="viridis",
+                       vmin=np.log10(result.N_A) - 1)
+    ax_map.contour(result.x, result.y, result.C, levels=[result.N_A], colors="w", linewidths=1)
+    for x0, x1 in result.openings:
+        ax_map.plot([x0, x1], [0, 0], color="r", linewidth=4)
+    ax_map.set_ylim(min(result.y[-1], 3 * result.junction_depth), 0)
+    ax_map.set_xlabel("x [µm]")
+    ax_map.set_ylabel("Depth [µm]")
+    ax_map.set_title(f"log10 N_D [cm^-3], {result.ion} {result.energy:.0f} keV, "
+                     f"{result.anneal_C:.0f} °C {result.anneal_min:.0f} min")
+    fig.colorbar(im, ax=ax_map)
+
+    center = result.center
+    ax_profile.semilogy(result.y, np.maximum(result.as_implanted[:, center], 1e10), "--", label="As-implanted")
+    ax_profile.semilogy(result.y, np.maximum(result.C[:, center], 1e10), label="Annealed")
+    ax_profile.axhline(result.N_A, color="k", linestyle=":", linewidth=0.8, label="N_A")
+    ax_profile.axvline(result.junction_depth, color="tab:red", linestyle="--", linewidth=0.8)
+    ax_profile.set_xlim(0, min(result.y[-1], 3 * result.junction_depth))
+    ax_profile.set_ylim(result.N_A / 10, None)
+    ax_profile.set_xlabel("Depth [µm]")
+    ax_profile.set_ylabel("Concentration [cm^-3]")
+    ax_profile.set_title(f"x_j = {result.junction_depth * 1e3:.0f} nm")
+    ax_profile.grid(True, which="both", linestyle="--", linewidth=0.5)
+    ax_profile.legend(fontsize="small")
+    fig.tight_layout()
+
+
+# 노광: 마스크 -> aerial image (SOCS) -> threshold 현상. CD는 z = CD_Z 단면에서 잰다
+CD_Z = 0.5
+FOCUS = np.linspace(-0.3, 0.3, 7)
+DOSES = (0.8, 0.9, 1.0, 1.1, 1.2)
+
+
+@graph.node("light", "NA", "sigma", "defocus")
+def exposure(light, NA, sigma, defocus):
+    return expose_steps(WAVELENGTHS[light], NA, sigma, defocus)
+
+
+@graph.node("light", "NA", "sigma", "litho_step", "cd_x")
+def bossung(light, NA, sigma, litho_step, cd_x):
+    return focus_exposure(exposures.index(litho_step), FOCUS, DOSES, WAVELENGTHS[light], NA, sigma,
+                          x_center=cd_x, z=CD_Z)
+
+
+@graph.figure("process_litho", "exposure", "exposure_dose", "litho_step", "cd_x", figsize=(12, 3.6))
+def litho_figure(fig, result, dose, step, x_center):
+    i = result.steps.index(step)
+    ax_mask, ax_image, ax_resist = fig.subplots(1, 3)
+    extent = [result.x[0], result.x[-1], result.z[0], result.z[-1]]
+    ax_mask.imshow(result.masks[i], extent=extent, origin="lower", cmap="gray", vmin=0, vmax=1)
+    ax_mask.set_title(f"Step {step + 1} mask (white: clear)")
+    im = ax_image.imshow(result.intensity[i], extent=extent, origin="lower", cmap="inferno")
+    ax_image.contour(result.x, result.z, result.intensity[i], levels=[THRESHOLD / dose], colors="c", linewidths=0.8)
+    ax_image.set_title(f"Aerial image, {result.optics.wavelength * 1e3:.0f} nm NA {result.optics.NA:.2f} "
+                       f"σ {result.optics.sigma:.2f}")
+    fig.colorbar(im, ax=ax_image)
+    ax_resist.imshow(~result.developed(dose)[i], extent=extent, origin="lower", cmap="Reds", vmin=0, vmax=1.5)
+    ax_resist.set_title(f"Developed PR ({result.tones[i]}), dose {dose:.2f}")
+    for ax in (ax_mask, ax_image, ax_resist):
+        ax.axhline(CD_Z, color="tab:blue", linestyle=":", linewidth=0.8)
+        ax.plot([x_center], [CD_Z], "x", color="tab:blue")
+        ax.set_xlabel("x [µm]")
+    ax_mask.set_ylabel("z [µm]")
+    fig.tight_layout()
+
+
+@graph.figure("process_bossung", "bossung", "defocus", figsize=(6, 3.6))
+def bossung_figure(fig, cd, defocus):
+    ax = fig.subplots()
+    for dose, row in zip(DOSES, cd.T):
+        ax.plot(FOCUS, row * 1e3, "o-", label=f"dose {dose:.1f}")
+    ax.axvline(defocus, color="k", linestyle=":", linewidth=0.8)
+    ax.set_xlabel("Defocus [µm]")
+    ax.set_ylabel("CD [nm]")
+    ax.set_title("Bossung (focus-exposure)")
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.legend(fontsize="small")
+    fig.tight_layout()
+
+
+run = graph.run({"ion": ion, "energy": energy, "dose": dose, "model": model, "anneal_C": anneal_C,
+                 "anneal_min": anneal_min, "N_A": N_A, "light": light, "NA": NA, "sigma": sigma,
+                 "defocus": defocus, "exposure_dose": exposure_dose, "litho_step": litho_step, "cd_x": cd_x})
+result = run["implant"]
+
+
+# 단계 이동은 브라우저 안에서 처리되고, 보고된 단계가 바뀔 때만 이 fragment가 다시 실행된다
+# (fragment만 다시 실행될 때는 직전 전체 실행의 recipe 인자를 그대로 쓴다)
+@st.fragment
+def viewer(recipe):
+    # 공정 조건이 바뀌면 단면이 바뀐 단계만 브라우저에 보낸다
+    engine = recipe_engine(recipe)
+    st.session_state['step'] = process_viewer(engine, step=st.session_state['step'], key="process_viewer")
+    # 브라우저는 단계를 보고할 때 frame 통계를 같이 보낸다 (가만히 있는 동안은 프레임을 그리지 않는다)
+    stats = frame_stats()
+    if stats is not None:
+        st.caption(f"3D 뷰: {stats['seconds']:.0f} s 동안 {stats['frames']}프레임, 렌더 시간 평균 "
+                   f"{stats['mean_ms']:.2f} ms / 최대 {stats['max_ms']:.2f} ms, draw call {stats['draw_calls']}, "
+                   f"box {stats['meshes']}개, GPU geometry {stats['geometries']}개")
+
+
+# Streamlit에서 HTML 포함
+with st.container():
+    st.markdown("<div class='stTitle'>MOSFET 3D 공정 시뮬레이션</div>", unsafe_allow_html=True)
+    viewer({**films, "junction_depth": result.junction_depth})
+
+with st.container():
+    st.markdown("<div class='stTitle'>N+ 소스/드레인 도핑 (15단계)</div>", unsafe_allow_html=True)
+    show_image("process_doping", run["doping_figure"])
+    st.caption(f"접합 깊이 x_j = {result.junction_depth * 1e3:.0f} nm, 게이트 아래 가로 확산 "
+               f"{result.lateral_diffusion * 1e3:.0f} nm, 확산 길이 2√(Dt) = {result.diffusion_length * 1e3:.1f} nm, "
+               f"평균 N_D = {result.N_D:.2e} cm^-3 (MOSFET 시뮬레이션의 n형 도핑 농도로 사용), "
+               f"확산 계산 {result.solve_s * 1e3:.0f} ms")
+
+with st.container():
+    st.markdown("<div class='stTitle'>노광 aerial image와 현상 패턴 (4, 11, 18, 24단계)</div>", unsafe_allow_html=True)
+    show_image("process_litho", run["litho_figure"])
+    show_image("process_bossung", run["bossung_figure"])
+    exposed = run["exposure"]
+    i = exposed.steps.index(litho_step)
+    cd = critical_dimension(exposed.x, exposed.intensity[i, exposed.row(CD_Z)], THRESHOLD / exposure_dose, cd_x)
+    st.caption(f"x = {cd_x:.2f} µm 패턴의 CD = {cd * 1e3:.0f} nm (z = {CD_Z} µm 단면), "
+               f"SOCS kernel {len(exposed.optics)}개 (광원 점 {exposed.optics.sources}개, TCC 에너지 "
+               f"{exposed.optics.energy:.1%}), 노광 단계 {len(exposed.steps)}개 batch 결상 "
+               f"{exposed.image_s * 1e3:.0f} ms. 3D 뷰는 마스크 모양 그대로의 모식도다.")
+
+run.panel()
+profiler.panel()
@@ -1,112 +1,384 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import streamlit.components.v1 as components
-
-# MOSFET 3D 시뮬레이터
-st.markdown("<h1 style='text-align: center; color: #000000;'>MOSFET 시뮬레이션</h1>", unsafe_allow_html=True)
-st.markdown("<h3 style='text-align: center;'>Vt = 1V, T = 300K</h2>", unsafe_allow_html=True)
-
-st.sidebar.header("⚙️ MOSFET 파라미터")
-st.sidebar.markdown("---")
-W = st.sidebar.slider("채널 폭 (W) [µm]", 0.1, 20.0, 1000.0, step=0.5)
-L = st.sidebar.slider("채널 길이 (L) [µm]", 0.01, 20.0, 10.0, step=0.5)
-Vgs = st.sidebar.slider("Gate-Source Voltage (Vgs) [V]", 0.0, 5.0, 1.0, step=0.1)
-
-N_A = st.sidebar.slider(
-"p형 도핑 농도 (cm^-3)", 
-min_value=1e15, max_value=1e17, value=1e16, format="%.1e"
-)
-
-# 특정 n형 도핑 농도 선택
-N_D_selected = st.sidebar.slider(
-"n형 도핑 농도 (cm^-3)", 
-min_value=1e13, max_value=1e20, value=1e19, format="%.1e"
-)
-T = 300
-Vds_values = np.linspace(0, 5, 100)
-
-# 도핑 농도 및 온도 범위 생성
-N_D_values = np.logspace(np.log10(1e13), np.log10(1e20), 100)
-
-
-
-# 이동도 계산 함수
-def calculate_mobility_sic(N_D, N_A, T, mu_1_e=950, mu_0_e=950, mu_1_h=120, mu_0_h=120, 
-                        N_ref=1e17, alpha_e=2.5, alpha_h=2.1, gamma=1.5):
-    """
-    SiC의 전자 및 정공 이동도 계산 함수.
-
-    Parameters:
-    - N_D: n형 도핑 농도 (cm^-3)
-    - N_A: p형 도핑 농도 (cm^-3)
-    - T: 온도 (K)
-    - mu_1_e: 전자 격자 이동도 상수 (cm^2/V·s)
-    - mu_0_e: 전자 최대 이동도 (cm^2/V·s)
-    - mu_1_h: 정공 격자 이동도 상수 (cm^2/V·s)
-    - mu_0_h: 정공 최대 이동도 (cm^2/V·s)
-    - N_ref: 불순물 산란 기준 농도 (cm^-3)
-    - alpha_e: 전자 격자 산란 온도 계수
-    - alpha_h: 정공 격자 산란 온도 계수
-    - gamma: 불순물 산란 계수
-
-    Returns:
-    - 전자 이동도 (μ_e)와 정공 이동도 (μ_h)
-    """
-    N_total = N_D + N_A  # 총 도핑 농도
-
-    # 전자 이동도 계산
-    mu_lattice_e = mu_1_e * (T / 300) ** (-alpha_e)
-    mu_impurity_e = mu_0_e / (1 + (N_total / N_ref) ** gamma)
-    mu_e = 1 / (1 / mu_lattice_e + 1 / mu_impurity_e)
-
-    # 정공 이동도 계산
-    mu_lattice_h = mu_1_h * (T / 300) ** (-alpha_h)
-    mu_impurity_h = mu_0_h / (1 + (N_total / N_ref) ** gamma)
-    mu_h = 1 / (1 / mu_lattice_h + 1 / mu_impurity_h)
-
-    return mu_e, mu_h
-
-# 효과적인 이동도 계산 함수 (전자의 이동도와 정공의 이동도를 이용)
-def effective_mobility(mu_e, mu_h):
-    """
-    전자 이동도(mu_e)와 정공 이동도(mu_h)를 입력받아,
-    효과적인 이동도(mu_eff)를 계산하는 함수.
-    """
-    mu_eff = (mu_e * mu_h) / (mu_e + mu_h)
-    return mu_eff
-
-
-    
-# 선택된 n형 도핑 농도에서의 전자 및 정공 이동도 계산
-mu_e_selected, mu_h_selected = calculate_mobility_sic(N_D_selected, N_A, T)
-
-# 효과적인 이동도 계산
-mu_eff_selected = effective_mobility(mu_e_selected, mu_h_selected)
-
-# 드레인 전류 계산 함수
-def calculate_id(Vgs, Vds, W, L, N_D, N_A):
-    Cox = 2.3e-8  # 산화막 캐패시턴스 (F/cm^2)
-    W_cm = W * 1e-4  # µm to cm
-    L_cm = L * 1e-4  # µm to cm
-    mu_eff = mu_eff_selected  # 이동도에 농도 영향을 반영
-    if Vgs < 1.0:  # 임계 전압 Vth
-        return 0
-    elif Vds < Vgs - 1.0:
-        return mu_eff * Cox * (W_cm / L_cm) * ((Vgs - 1.0) * Vds - (Vds ** 2) / 2)
-    else:
-        return 0.5 * mu_eff * Cox * (W_cm / L_cm) * (Vgs - 1.0) ** 2
-
-
-
-# 드레인 전류 계산 및 그래프 생성
-Id_values = [calculate_id(Vgs, Vds, W, L, N_D_selected, N_A) for Vds in Vds_values]
-
-fig, ax = plt.subplots()
-ax.plot(Vds_values, Id_values, label=f"Vgs = {Vgs} V, W = {W:.1f} µm, L = {L:.1f} µm")
-ax.set_xlabel("Drain-Source Voltage (Vds) [V]")
-ax.set_ylabel("Drain Current (Id) [A]")
-ax.set_title("MOSFET Output Characteristics")
-ax.grid(True, which='both', linestyle='--', linewidth=0.5)
-ax.legend()
-st.pyplot(fig)
+import streamlit as st
+import numpy as np
+
+from semisim import cache, profiler, surfaces
+from semisim.circuit import common_source, mosfet_mirror
+from semisim.graph import Graph
+from semisim.implant import source_drain
+from semisim.mobility import cache_info, cached_mobility
+from semisim.mosfet import id_grid, small_signal
+from semisim.poisson import T_OX, mos_solution
+from semisim.process import film_thicknesses
+from semisim.render import show_curves, show_image
+from semisim.sampling import adaptive_grid
+from semisim.thermal import CURVE_TEMPERATURES_C, T_MAX_C, T_MIN_C, kelvin, mosfet_id, mosfet_table
+
+profiler.start()
+
+# MOSFET 3D 시뮬레이터
+st.markdown("<h1 style='text-align: center; color: #000000;'>MOSFET 시뮬레이션</h1>", unsafe_allow_html=True)
+
+st.sidebar.header("⚙️ MOSFET 파라미터")
+st.sidebar.markdown("---")
+W = st.sidebar.slider("채널 폭 (W) [µm]", 0.1, 20.0, 1000.0, step=0.5)
+L = st.sidebar.slider("채널 길이 (L) [µm]", 0.01, 20.0, 10.0, step=0.5)
+Vgs = st.sidebar.slider("Gate-Source Voltage (Vgs) [V]", 0.0, 5.0, 1.0, step=0.1)
+
+N_A = st.sidebar.slider(
+"p형 도핑 농도 (cm^-3)", 
+min_value=1e15, max_value=1e17, value=1e16, format="%.1e"
+)
+
+# 공정 페이지에서 정한 조건이 있으면 이온 주입 / 확산 결과의 소스/드레인 평균 농도를 N_D로,
+# 게이트 산화 (Deal-Grove) 결과의 산화막 두께를 t_ox로 쓸 수 있다
+recipe = st.session_state.get('implant')
+films = st.session_state.get('films')
+use_process = (recipe is not None or films is not None) and st.sidebar.checkbox(
+    "공정 시뮬레이션 결과 (N_D, t_ox) 사용", value=True)
+
+# 특정 n형 도핑 농도 선택
+N_D_selected = st.sidebar.slider(
+"n형 도핑 농도 (cm^-3)", 
+min_value=1e13, max_value=1e20, value=1e19, format="%.1e", disabled=use_process and recipe is not None
+)
+if use_process and recipe is not None:
+    implant = source_drain(**{**recipe, "N_A": N_A})
+    N_D_selected = implant.N_D
+    st.sidebar.caption(f"{recipe['ion']} {recipe['energy']:.0f} keV, {recipe['dose']:.1e} cm^-2, "
+                       f"{recipe['anneal_C']:.0f} °C {recipe['anneal_min']:.0f}분: "
+                       f"N_D = {N_D_selected:.2e} cm^-3, x_j = {implant.junction_depth * 1e3:.0f} nm")
+
+t_ox = st.sidebar.slider("산화막 두께 (t_ox) [nm]", 10.0, 200.0, T_OX, step=5.0,
+                         disabled=use_process and films is not None)
+if use_process and films is not None:
+    t_ox = round(film_thicknesses(films)["GateOxide"] * 1e3, 2)
+    st.sidebar.caption(f"게이트 산화 {films['gate_ambient']} {films['gate_T']:.0f} °C {films['gate_min']:.0f}분: "
+                       f"t_ox = {t_ox:.1f} nm")
+T_C = st.sidebar.slider("온도 (°C)", T_MIN_C, T_MAX_C, 27.0, step=1.0)
+T = float(kelvin(T_C))
+
+n_curves = st.sidebar.slider("Vgs 곡선 개수", 1, 50, 1)
+
+# 바이어스 회로: 입력 (또는 출력 전압) sweep의 동작점 궤적 (부하선)과 Q점을 출력 특성 위에 그린다
+CIRCUITS = {"none": "없음", "common-source": "Common-source (저항 부하)", "mirror": "전류 거울 (M1 diode, M2 출력)"}
+with st.sidebar.expander("바이어스 회로 (부하선)"):
+    circuit_kind = st.radio("회로", list(CIRCUITS), format_func=CIRCUITS.get)
+    V_DD = st.slider("V_DD [V]", 0.5, 5.0, 5.0, step=0.1)
+    R_D = st.number_input("부하 저항 R_D [MΩ]", min_value=0.01, max_value=1e4, value=50.0,
+                          disabled=circuit_kind != "common-source")
+    I_ref = st.number_input("기준 전류 I_ref [nA]", min_value=0.1, max_value=1e5, value=50.0,
+                            disabled=circuit_kind != "mirror")
+
+client_side = st.sidebar.checkbox("브라우저에서 그래프 그리기", value=False)
+
+# gm / gds 지도 (imshow)용 균일 격자. 곡선 그래프는 knee와 turn-on에 점을 모은 적응 격자를 쓴다
+Vds_values = np.linspace(0, 5, 100)
+Vgs_sweep = np.linspace(0, 5, 200)
+Vds_transfer = np.array([0.1, 1.0, 2.0, 5.0])
+Vds_derating = 5.0  # 온도 특성을 보는 포화 영역 Vds (V)
+LOAD_POINTS = 1000  # 부하선 DC sweep 점 개수
+
+# 계산 그래프: 각 노드는 선언한 입력이 바뀐 경우에만 다시 실행된다
+graph = Graph("mosfet")
+
+
+# 선택된 n형 도핑 농도에서의 전자, 정공 및 효과적인 이동도 (세션 간 공유 캐시)
+@graph.node("N_D", "N_A", "T")
+def mobility(N_D, N_A, T):
+    return cached_mobility(N_D, N_A, T)
+
+
+# 기판 도핑과 산화막 두께로부터 Vt, Cox를 구한다 (1D Poisson, 직전 해에서 warm start)
+@graph.node("N_A", "t_ox", "T")
+def mos(N_A, t_ox, T):
+    return mos_solution(N_A, t_ox, T)
+
+
+# Poisson 해로 구한 임계 전압과 산화막 캐패시턴스, 이동도
+@graph.node("mobility", "mos", "T")
+def device(mobility, mos, T):
+    return {"T": T, "mu_eff": mobility[2], "Vt": mos.Vt, "Cox": mos.Cox}
+
+
+@graph.node("n_curves", "Vgs", "mos", cutoff=True)
+def Vgs_values(n_curves, Vgs, mos):
+    if n_curves > 1:
+        return np.linspace(min(mos.Vt, 5), 5, n_curves)
+    return np.array([Vgs])
+
+
+def drain_current(Vgs_values, Vds_values, W, L, N_D, N_A, t_ox, device):
+    # 미리 계산한 Id 곡면에서 보간하고, 곡면이 없거나 범위 밖이면 직접 계산한다
+    Id = surfaces.mosfet_id(Vgs_values, Vds_values, W, L, N_D, N_A, device["T"], t_ox)
+    if Id is None:
+        Id = id_grid(Vgs_values, Vds_values, W, L, N_D, N_A, **device)
+    return Id
+
+
+# 드레인 전류 계산 (Vgs 곡선 전체와 적응 격자 한 단계의 Vds 점들을 한 번에 계산).
+# Vds 점은 포화 knee (Vds = Vgs - Vt) 근처에 모이고 포화 영역에는 거의 없다
+@graph.node("Vgs_values", "W", "L", "N_D", "N_A", "t_ox", "device")
+def output_curves(Vgs_values, W, L, N_D, N_A, t_ox, device):
+    Vds_grid, Id_grid = adaptive_grid(
+        lambda Vds: drain_current(Vgs_values, Vds, W, L, N_D, N_A, t_ox, device), Vds_values[0], Vds_values[-1])
+    return Vds_grid, {f"Vgs = {v:.2f} V": Id for v, Id in zip(Vgs_values, Id_grid)}, "Vds [V]"
+
+
+# 바이어스 회로의 DC sweep (continuation)과 동작점. common-source는 V_in을 0 ~ 5 V로 바꾸고 Q점은 Vgs,
+# 전류 거울은 출력 전압을 0 ~ 5 V로 바꾸고 Q점은 V_DD이다
+@graph.node("circuit_kind", "V_DD", "R_D", "I_ref", "Vgs", "W", "L", "N_D", "N_A", "t_ox", "device")
+def bias(circuit_kind, V_DD, R_D, I_ref, Vgs, W, L, N_D, N_A, t_ox, device):
+    if circuit_kind == "none":
+        return None
+    params = dict(device, W=W, L=L, N_D=N_D, N_A=N_A, t_ox=t_ox)
+    if circuit_kind == "common-source":
+        circuit, source, name = common_source(V_DD, R_D * 1e6, Vgs, params), "V_in", "M1"
+    else:
+        circuit, source, name = mosfet_mirror(I_ref * 1e-9, V_DD, params), "V_out", "M2"
+    sweep = circuit.dc_sweep(source, np.linspace(0, 5, LOAD_POINTS))
+    point = circuit.operating_point()
+    locus, q = sweep.device(name), point.device(name)
+    return {"Vds": locus["Vds"], "Id": locus["Id"], "Q": (float(q["Vds"][0]), float(q["Id"][0])),
+            "converged": bool(sweep.converged.all() and point.converged.all()),
+            "iterations": float(sweep.iterations.mean())}
+
+
+def load_line(x, bias):
+    """부하선을 x 격자에 보간한 값 (궤적 밖은 nan), 브라우저 차트용."""
+    order = np.argsort(bias["Vds"])
+    Vds, Id = bias["Vds"][order], bias["Id"][order]
+    return np.where((x >= Vds[0]) & (x <= Vds[-1]), np.interp(x, Vds, Id), np.nan)
+
+
+@graph.node("W", "L", "N_D", "N_A", "t_ox", "device")
+def transfer_curves(W, L, N_D, N_A, t_ox, device):
+    # Vgs 점은 turn-on (Vgs = Vt)과 선형/포화 경계 근처에 모인다
+    Vgs_grid, Id_transfer = adaptive_grid(
+        lambda Vgs: drain_current(Vgs, Vds_transfer, W, L, N_D, N_A, t_ox, device).T, Vgs_sweep[0], Vgs_sweep[-1])
+    return Vgs_grid, {f"Vds = {v:.1f} V": Id for v, Id in zip(Vds_transfer, Id_transfer)}, "Vgs [V]"
+
+
+@graph.node("W", "L", "N_D", "N_A", "device")
+def conductances(W, L, N_D, N_A, device):
+    return small_signal(Vgs_sweep[:, np.newaxis], Vds_values, W, L, N_D, N_A, **device)
+
+
+# 온도 테이블 (Vt(T), μ_eff(T), -55 °C ~ 150 °C): 온도 slider와 무관하며 세션 간 공유 캐시
+@graph.node("N_D", "N_A", "t_ox")
+def temperature_table(N_D, N_A, t_ox):
+    return mosfet_table(N_D, N_A, t_ox)
+
+
+# 온도별 전달 특성 (온도 축까지 한 번의 broadcast 호출로 계산)
+@graph.node("temperature_table", "W", "L")
+def temperature_curves(table, W, L):
+    rows = table.select(CURVE_TEMPERATURES_C)
+    Id = mosfet_id(Vgs_sweep, Vds_derating, W, L, table, rows)
+    return Vgs_sweep, {f"T = {T_curve:.0f} °C": Id_T for T_curve, Id_T in zip(table.T_C[rows], Id)}, "Vgs [V]"
+
+
+# 온도에 따른 Vt와 이동도 (25 °C 대비): Vgs와 무관하다
+@graph.node("temperature_table")
+def table_curves(table):
+    ref = table.select([25.0])[0]
+    return table.T_C, {"Vt [V]": table.Vt, "μ_eff / μ_eff(25 °C)": table.mu_eff / table.mu_eff[ref]}, "T [°C]"
+
+
+# 선택한 Vgs에서의 온도 derating Id(T) / Id(25 °C): 그래프 대신 숫자로 표시한다
+@graph.node("temperature_table", "W", "L", "Vgs")
+def derating(table, W, L, Vgs):
+    Id = mosfet_id(Vgs, Vds_derating, W, L, table)
+    ref = table.select([25.0])[0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return table.T_C, Id / Id[ref]
+
+
+@graph.node("mos")
+def mos_curves(mos):
+    return mos.V_G, {"ψ_s [V]": mos.psi_s, "Q_inv [µC/cm²]": mos.Q_inv * 1e6}, "V_G [V]"
+
+
+# 선택한 Vgs에서의 깊이 방향 전위 (Vgs가 바뀌면 이 작은 그래프만 다시 그린다)
+@graph.node("mos", "Vgs")
+def profile_curves(mos, Vgs):
+    x, psi = mos.profile(Vgs)
+    return x * 1e4, {"ψ [V]": psi}, "Depth [µm]"
+
+
+@graph.figure("mosfet_output", "output_curves", "Vgs_values", "W", "L", "n_curves", "bias")
+def output_figure(fig, curves, Vgs_values, W, L, n_curves, bias):
+    ax = fig.subplots()
+    Vds_grid, series, _ = curves
+    for Vgs_curve, Id_values in zip(Vgs_values, series.values()):
+        ax.plot(Vds_grid, Id_values, label=f"Vgs = {Vgs_curve:.2f} V, W = {W:.1f} µm, L = {L:.1f} µm")
+    if bias is not None:
+        ax.plot(bias["Vds"], bias["Id"], "k--", linewidth=1, label="Load line")
+        ax.plot(*bias["Q"], "ko", label=f"Q (Vds = {bias['Q'][0]:.2f} V, Id = {bias['Q'][1]:.2e} A)")
+        ax.set_xlim(Vds_grid[0], Vds_grid[-1])
+    ax.set_xlabel("Drain-Source Voltage (Vds) [V]")
+    ax.set_ylabel("Drain Current (Id) [A]")
+    ax.set_title("MOSFET Output Characteristics")
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    if n_curves <= 10:
+        ax.legend()
+
+
+@graph.figure("mosfet_transfer", "transfer_curves")
+def transfer_figure(fig, curves):
+    ax = fig.subplots()
+    Vgs_grid, series, _ = curves
+    for label, Id_values in series.items():
+        ax.plot(Vgs_grid, Id_values, label=label)
+    ax.set_xlabel("Gate-Source Voltage (Vgs) [V]")
+    ax.set_ylabel("Drain Current (Id) [A]")
+    ax.set_title("MOSFET Transfer Characteristics")
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.legend()
+
+
+@graph.figure("mosfet_gm", "conductances", figsize=(10, 4))
+def gm_figure(fig, conductances):
+    gm, gds = conductances
+    ax_gm, ax_gds = fig.subplots(1, 2)
+    extent = [Vds_values[0], Vds_values[-1], Vgs_sweep[0], Vgs_sweep[-1]]
+    for ax, data, title in ((ax_gm, gm, "gm [S]"), (ax_gds, gds, "gds [S]")):
+        im = ax.imshow(data, origin="lower", aspect="auto", extent=extent, cmap="viridis")
+        ax.set_xlabel("Vds [V]")
+        ax.set_ylabel("Vgs [V]")
+        ax.set_title(title)
+        fig.colorbar(im, ax=ax)
+    fig.tight_layout()
+
+
+@graph.figure("mosfet_mos", "mos", figsize=(5, 4))
+def mos_figure(fig, mos):
+    ax_psi = fig.subplots()
+    ax_q = ax_psi.twinx()
+    ax_psi.plot(mos.V_G, mos.psi_s, color="tab:blue", label="ψ_s")
+    ax_q.semilogy(mos.V_G, np.maximum(mos.Q_inv, 1e-30), color="tab:red", label="Q_inv")
+    ax_psi.axhline(2 * mos.phi_F, linestyle=":", color="tab:blue", linewidth=0.8)
+    ax_psi.axvline(mos.Vt, linestyle="--", color="k", linewidth=0.8)
+    ax_psi.set_xlabel("Gate Voltage (V_G) [V]")
+    ax_psi.set_ylabel("Surface Potential (ψ_s) [V]", color="tab:blue")
+    ax_q.set_ylabel("Inversion Charge (Q_inv) [C/cm²]", color="tab:red")
+    ax_q.set_ylim(1e-12, None)
+    ax_psi.set_title(f"Vt = {mos.Vt:.2f} V")
+    ax_psi.grid(True, linestyle='--', linewidth=0.5)
+    fig.tight_layout()
+
+
+@graph.figure("mosfet_profile", "profile_curves", "Vgs", figsize=(5, 4))
+def profile_figure(fig, curves, Vgs):
+    ax = fig.subplots()
+    x, series, _ = curves
+    ax.plot(x, series["ψ [V]"])
+    ax.set_xlabel("Depth [µm]")
+    ax.set_ylabel("Potential (ψ) [V]")
+    ax.set_title(f"V_G = {Vgs:.1f} V")
+    ax.grid(True, linestyle='--', linewidth=0.5)
+    fig.tight_layout()
+
+
+@graph.figure("mosfet_temperature", "temperature_curves", "table_curves", figsize=(10, 4))
+def temperature_figure(fig, curves, table_curves):
+    ax_transfer, ax_vt = fig.subplots(1, 2)
+    _, series, _ = curves
+    for label, Id_values in series.items():
+        ax_transfer.plot(Vgs_sweep, Id_values, label=label)
+    ax_transfer.set_xlabel("Gate-Source Voltage (Vgs) [V]")
+    ax_transfer.set_ylabel("Drain Current (Id) [A]")
+    ax_transfer.set_title(f"Transfer Characteristics vs Temperature (Vds = {Vds_derating:.0f} V)")
+    ax_transfer.grid(True, linestyle='--', linewidth=0.5)
+    ax_transfer.legend(fontsize="small")
+
+    T_values, series, _ = table_curves
+    ax_ratio = ax_vt.twinx()
+    ax_vt.plot(T_values, series["Vt [V]"], color="k", label="Vt")
+    ax_ratio.plot(T_values, series["μ_eff / μ_eff(25 °C)"], color="tab:blue", label="μ_eff / μ_eff(25 °C)")
+    ax_vt.set_xlabel("Temperature [°C]")
+    ax_vt.set_ylabel("Threshold Voltage (Vt) [V]")
+    ax_ratio.set_ylabel("Ratio to 25 °C")
+    ax_vt.set_title("Vt and Mobility vs Temperature")
+    ax_vt.grid(True, linestyle='--', linewidth=0.5)
+    ax_ratio.legend(fontsize="small")
+    fig.tight_layout()
+
+
+run = graph.run({"W": W, "L": L, "Vgs": Vgs, "N_A": N_A, "N_D": N_D_selected, "t_ox": t_ox, "T": T,
+                 "n_curves": n_curves, "circuit_kind": circuit_kind, "V_DD": V_DD, "R_D": R_D, "I_ref": I_ref})
+
+solution = run["mos"]
+st.markdown(f"<h3 style='text-align: center;'>Vt = {solution.Vt:.2f}V, T = {T_C:.0f}°C</h2>", unsafe_allow_html=True)
+
+with st.sidebar.expander("MOS 정전기"):
+    st.caption(f"Vt = {solution.Vt:.3f} V, V_FB = {solution.V_FB:.3f} V, φ_F = {solution.phi_F:.3f} V")
+    st.caption(f"Cox = {solution.Cox:.3e} F/cm², Newton 반복 {solution.iterations}회")
+
+# st.tabs는 모든 탭의 내용을 매 rerun마다 만든다. 선택한 보기의 노드만 평가하도록 보기 선택 radio를 쓴다
+# (그래프는 지연 평가이므로 다른 보기의 그래프는 계산도 렌더링도 하지 않는다)
+VIEWS = {"output": "출력 특성", "transfer": "전달 특성", "gm": "gm / gds", "mos": "MOS 정전기", "temperature": "온도 특성"}
+view = st.radio("보기", list(VIEWS), format_func=VIEWS.get, horizontal=True, key="mosfet_view",
+                label_visibility="collapsed")
+
+if view == "output":
+    operating = run["bias"]
+    if client_side:
+        x, series, x_name = run["output_curves"]
+        if operating is not None:
+            series = dict(series, **{"부하선": load_line(x, operating)})
+        show_curves("mosfet_output", (x, series, x_name))
+    else:
+        show_image("mosfet_output", run["output_figure"])
+    if operating is not None:
+        st.caption(f"{CIRCUITS[circuit_kind]}: Q점 Vds = {operating['Q'][0]:.3f} V, Id = {operating['Q'][1]:.3e} A "
+                   f"(부하선 {LOAD_POINTS}점, 점당 Newton 평균 {operating['iterations']:.1f}회"
+                   f"{'' if operating['converged'] else ', 일부 점 수렴 실패'})")
+
+elif view == "transfer":
+    if client_side:
+        show_curves("mosfet_transfer", run["transfer_curves"])
+    else:
+        show_image("mosfet_transfer", run["transfer_figure"])
+
+elif view == "gm":
+    show_image("mosfet_gm", run["gm_figure"])
+
+elif view == "mos":
+    # ψ_s / Q_inv 그래프는 Vgs와 무관하므로 Vgs를 바꾸면 오른쪽 깊이 분포만 다시 그린다
+    col_mos, col_profile = st.columns(2)
+    with col_mos:
+        if client_side:
+            show_curves("mosfet_mos", run["mos_curves"])
+        else:
+            show_image("mosfet_mos", run["mos_figure"])
+    with col_profile:
+        if client_side:
+            show_curves("mosfet_profile", run["profile_curves"])
+        else:
+            show_image("mosfet_profile", run["profile_figure"])
+
+elif view == "temperature":
+    if client_side:
+        show_curves("mosfet_temperature", run["temperature_curves"])
+    else:
+        show_image("mosfet_temperature", run["temperature_figure"])
+    # 선택한 Vgs의 derating은 Vgs마다 그래프를 다시 그리지 않도록 숫자로 표시한다
+    T_values, Id_ratio = run["derating"]
+    st.caption(f"Id(T) / Id(25 °C) at Vgs = {Vgs:.1f} V, Vds = {Vds_derating:.0f} V")
+    for col, T_point in zip(st.columns(3), (T_MIN_C, T_C, T_MAX_C)):
+        col.metric(f"{T_point:.0f} °C", f"{np.interp(T_point, T_values, Id_ratio):.3f}")
+
+with st.sidebar.expander("이동도 캐시 통계"):
+    for name, stats in cache_info().items():
+        st.caption(f"{name}: hits {stats['hits']}, misses {stats['misses']}, "
+                   f"size {stats['currsize']}/{stats['maxsize']}")
+
+with st.sidebar.expander("공유 캐시 통계"):
+    for name, stats in cache.stats().items():
+        st.caption(f"{name}: hits {stats['hits']}, misses {stats['misses']}, waits {stats['waits']}, "
+                   f"evictions {stats['evictions']}, {stats['entries']}개 / {stats['bytes'] / 1e6:.1f} MB")
+
+run.panel()
+surface_stats = surfaces.lookup_stats()
+st.sidebar.caption(f"특성 곡면 조회: {surface_stats['hits']} hit, {surface_stats['misses']} miss")
+profiler.panel()
@@ -1,64 +1,274 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import streamlit.components.v1 as components
-
-# BJT 시뮬레이터
-st.markdown("<h1 style='text-align: center; color: #000000;'>BJT 시뮬레이션</h1>", unsafe_allow_html=True)
-
-
-default_params = {
-    "I_S": 1e-14,
-    "V_T": 0.026,
-    "V_CB_min": 0,
-    "V_CB_max": 20,
-    "I_E_min": 0.001,
-    "I_E_max": 0.005
-}
-
-
-st.sidebar.header("⚙️ BJT 파라미터")
-I_S = st.sidebar.slider("포화전류 (I_S, pA)", 0.001, 1.0, default_params["I_S"], step=0.001)
-V_T = st.sidebar.slider("열전압 (V_T, V)", 0.01, 0.05, default_params["V_T"], step=0.001)
-V_CB_min = st.sidebar.slider("Min Collector-Base Voltage (V_CB, V)", 0, 20, default_params["V_CB_min"], step=1)
-V_CB_max = st.sidebar.slider("Max Collector-Base Voltage (V_CB, V)", 0, 20, default_params["V_CB_max"], step=1)
-I_E_min = st.sidebar.slider("Min Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_min"], step=1e-4, format="%.4f")
-I_E_max = st.sidebar.slider("Max Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_max"], step=1e-4, format="%.4f")
-
-col1, col2 = st.columns(2)
-
-# Input Characteristics
-with col1:
-    st.subheader("입력 특성 곡선")
-    fig, ax = plt.subplots()
-    V_BE_values = np.linspace(0, 1, 200)
-    V_CB_values = np.linspace(V_CB_min, V_CB_max, 3)
-
-    for V_CB in V_CB_values:
-        I_E_values = I_S * 1e-12 * (np.exp(V_BE_values / V_T) - 1) * (1 + V_CB / (V_CB + V_T))
-        ax.plot(V_BE_values, I_E_values * 1e3, label=f"V_CB = {V_CB:.1f} V")
-
-    ax.set_xlabel("V_BE (V)")
-    ax.set_ylabel("I_E (mA)")
-    ax.set_title("V_BE - I_E Curve")
-    ax.legend()
-    ax.grid()
-    st.pyplot(fig)
-
-# Output Characteristics
-with col2:
-    st.subheader("출력 특성 곡선")
-    fig, ax = plt.subplots()
-    V_CB_values = np.linspace(0, 10, 200)
-    I_E_values = np.linspace(I_E_min, I_E_max, 3)
-
-    for I_E in I_E_values:
-        I_C_values = I_E * (1 - np.exp(-V_CB_values / V_T))
-        ax.plot(V_CB_values, I_C_values * 1e3, label=f"I_E = {I_E * 1e3:.1f} mA")
-
-    ax.set_xlabel("V_CB (V)")
-    ax.set_ylabel("I_C (mA)")
-    ax.set_title("V_CB - I_C Curve")
-    ax.legend()
-    ax.grid()
-    st.pyplot(fig)
\ No newline at end of file
+import streamlit as st
+import numpy as np
+
+from semisim import profiler, surfaces
+from semisim.bjt import MODELS, at_temperature, common_base_input, common_base_output, default_params, gummel
+from semisim.circuit import bjt_mirror, common_emitter
+from semisim.graph import Graph
+from semisim.render import show_curves, show_image
+from semisim.sampling import adaptive_grid
+from semisim.thermal import CURVE_TEMPERATURES_C, T_MAX_C, T_MIN_C, TEMPERATURES_C, bjt_gummel, bjt_v_be, kelvin
+
+profiler.start()
+
+# BJT 시뮬레이터
+st.markdown("<h1 style='text-align: center; color: #000000;'>BJT 시뮬레이션</h1>", unsafe_allow_html=True)
+
+
+st.sidebar.header("⚙️ BJT 파라미터")
+model = st.sidebar.radio("모델", MODELS, format_func={"gummel-poon": "Gummel-Poon", "ebers-moll": "Ebers-Moll"}.get)
+I_S = st.sidebar.slider("포화전류 (I_S @ 27 °C, pA)", 0.001, 1.0, default_params["I_S"] * 1e12, step=0.001)
+# 열전압 V_T = kT/q와 I_S(T), β(T)는 온도로부터 구한다
+T_C = st.sidebar.slider("온도 (°C)", T_MIN_C, T_MAX_C, 27.0, step=1.0)
+V_CB_min = st.sidebar.slider("Min Collector-Base Voltage (V_CB, V)", 0, 20, int(default_params["V_CB_min"]), step=1)
+V_CB_max = st.sidebar.slider("Max Collector-Base Voltage (V_CB, V)", 0, 20, int(default_params["V_CB_max"]), step=1)
+I_E_min = st.sidebar.slider("Min Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_min"], step=1e-4, format="%.4f")
+I_E_max = st.sidebar.slider("Max Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_max"], step=1e-4, format="%.4f")
+n_curves = st.sidebar.slider("곡선 개수", 1, 300, 3)
+
+with st.sidebar.expander("Gummel-Poon 파라미터"):
+    BF = st.slider("순방향 β (BF)", 10.0, 500.0, default_params["BF"], step=10.0)
+    BR = st.slider("역방향 β (BR)", 0.1, 10.0, default_params["BR"], step=0.1)
+    VAF = st.slider("순방향 Early 전압 (VAF, V)", 5.0, 500.0, default_params["VAF"], step=5.0)
+    VAR = st.slider("역방향 Early 전압 (VAR, V)", 1.0, 100.0, default_params["VAR"], step=1.0)
+    IKF = st.slider("고주입 knee 전류 (IKF, mA)", 0.1, 100.0, default_params["IKF"] * 1e3, step=0.1) * 1e-3
+
+# 바이어스 회로: 입력 (또는 출력 전압) sweep의 동작점 궤적 (부하선)과 Q점을 출력 특성 위에 그린다
+CIRCUITS = {"none": "없음", "common-emitter": "Common-emitter (저항 부하)", "mirror": "전류 거울 (Q1 diode, Q2 출력)"}
+with st.sidebar.expander("바이어스 회로 (부하선)"):
+    circuit_kind = st.radio("회로", list(CIRCUITS), format_func=CIRCUITS.get)
+    V_CC = st.slider("V_CC [V]", 1.0, 20.0, 10.0, step=0.5)
+    R_C = st.number_input("컬렉터 저항 R_C [kΩ]", min_value=0.01, max_value=1e3, value=2.0,
+                          disabled=circuit_kind != "common-emitter")
+    R_B = st.number_input("베이스 저항 R_B [kΩ]", min_value=0.1, max_value=1e4, value=50.0,
+                          disabled=circuit_kind != "common-emitter")
+    V_BB = st.slider("입력 전압 V_BB [V]", 0.0, 5.0, 2.0, step=0.05, disabled=circuit_kind != "common-emitter")
+    I_ref = st.number_input("기준 전류 I_ref [mA]", min_value=0.01, max_value=10.0, value=2.0,
+                            disabled=circuit_kind != "mirror")
+
+client_side = st.sidebar.checkbox("브라우저에서 그래프 그리기", value=False)
+
+V_BE_range = (0.0, 1.0)  # 입력 특성 V_BE 범위 (점은 turn-on 근처에 모은 적응 격자)
+V_BE_gummel = np.linspace(0.2, 1.0, 200)
+LOAD_POINTS = 1000  # 부하선 DC sweep 점 개수
+
+# 계산 그래프: 각 노드는 선언한 입력이 바뀐 경우에만 다시 실행된다
+# (예: I_E 범위를 바꾸면 출력 특성만 다시 계산한다)
+graph = Graph("bjt")
+
+
+# 기준 온도 (TNOM = 27 °C)의 파라미터
+@graph.node("I_S", "BF", "BR", "VAF", "VAR", "IKF")
+def nominal(I_S, BF, BR, VAF, VAR, IKF):
+    return dict(default_params, I_S=I_S * 1e-12, BF=BF, BR=BR, VAF=VAF, VAR=VAR, IKF=IKF)
+
+
+# 선택한 온도로 보정한 파라미터 (V_T, I_S, β)
+@graph.node("nominal", "T_C")
+def params(nominal, T_C):
+    return at_temperature(kelvin(T_C), nominal)
+
+
+@graph.node("params", "model", "V_CB_min", "V_CB_max", "n_curves")
+def input_curves(params, model, V_CB_min, V_CB_max, n_curves):
+    V_CB_values = np.linspace(V_CB_min, V_CB_max, n_curves)
+    # (V_CB, V_BE) 격자를 적응 격자 단계마다 한 번에 계산. V_BE 점은 지수 turn-on 근처에 모인다
+    V_BE_grid, I_E_grid = adaptive_grid(
+        lambda V_BE: common_base_input(V_BE, V_CB_values[:, np.newaxis], params, model), *V_BE_range)
+    curves = {f"V_CB = {V_CB:.1f} V": I_E * 1e3 for V_CB, I_E in zip(V_CB_values, I_E_grid)}
+    return V_BE_grid, curves, "V_BE (V)"
+
+
+@graph.node("params", "model", "V_CB_min", "V_CB_max", "I_E_min", "I_E_max", "n_curves")
+def output_curves(params, model, V_CB_min, V_CB_max, I_E_min, I_E_max, n_curves):
+    I_E_values = np.linspace(I_E_min, I_E_max, n_curves)
+
+    def collector_current(V_CB_values):
+        # 미리 계산한 I_C 곡면에서 보간하고, 없으면 (I_E, V_CB) 격자 전체를 한 번에 계산
+        I_C_grid = surfaces.bjt_output(I_E_values, V_CB_values, params, model)
+        if I_C_grid is None:
+            I_C_grid = common_base_output(I_E_values[:, np.newaxis], V_CB_values, params, model)
+        return I_C_grid
+
+    # V_CB 점은 포화 knee (V_CB ≈ 0) 근처에 모이고 Early 효과만 있는 곧은 구간에는 거의 없다
+    V_CB_grid, I_C_grid = adaptive_grid(collector_current, V_CB_min, V_CB_max)
+    curves = {f"I_E = {I_E * 1e3:.2f} mA": I_C * 1e3 for I_E, I_C in zip(I_E_values, I_C_grid)}
+    return V_CB_grid, curves, "V_CB (V)"
+
+
+# 바이어스 회로의 DC sweep (continuation)과 동작점. common-emitter는 V_in을 0 ~ 5 V로 바꾸고 Q점은 V_BB,
+# 전류 거울은 출력 전압을 0 ~ V_CC로 바꾸고 Q점은 V_CC이다. 궤적은 출력 특성의 (V_CB, I_C) 좌표로 돌려준다
+@graph.node("circuit_kind", "V_CC", "R_C", "R_B", "V_BB", "I_ref", "params", "model")
+def bias(circuit_kind, V_CC, R_C, R_B, V_BB, I_ref, params, model):
+    if circuit_kind == "none":
+        return None
+    if circuit_kind == "common-emitter":
+        circuit = common_emitter(V_CC, R_C * 1e3, R_B * 1e3, V_BB, params, model)
+        source, values, name = "V_in", np.linspace(0, 5, LOAD_POINTS), "Q1"
+    else:
+        circuit = bjt_mirror(I_ref * 1e-3, V_CC, params, model)
+        source, values, name = "V_out", np.linspace(0, V_CC, LOAD_POINTS), "Q2"
+    sweep = circuit.dc_sweep(source, values)
+    point = circuit.operating_point()
+    locus, q = sweep.device(name), point.device(name)
+    return {"V_CB": locus["V_CB"], "I_C": locus["I_C"] * 1e3,
+            "Q": (float(q["V_CB"][0]), float(q["I_C"][0]) * 1e3), "V_CE": float(q["V_CE"][0]),
+            "converged": bool(sweep.converged.all() and point.converged.all()),
+            "iterations": float(sweep.iterations.mean())}
+
+
+def load_line(x, bias):
+    """부하선을 x 격자에 보간한 값 (궤적 밖은 nan), 브라우저 차트용."""
+    order = np.argsort(bias["V_CB"])
+    V_CB, I_C = bias["V_CB"][order], bias["I_C"][order]
+    return np.where((x >= V_CB[0]) & (x <= V_CB[-1]), np.interp(x, V_CB, I_C), np.nan)
+
+
+@graph.node("params", "model", "V_CB_min")
+def gummel_data(params, model, V_CB_min):
+    return gummel(V_BE_gummel, V_CB_min, params, model)
+
+
+@graph.node("gummel_data")
+def gummel_curves(gummel_data):
+    I_C, I_B, _ = gummel_data
+    return V_BE_gummel, {"I_C (A)": I_C, "I_B (A)": I_B}, "V_BE (V)"
+
+
+# 온도 특성: 온도 축 전체를 한 번의 broadcast 호출로 계산 (온도 slider와 무관하다)
+@graph.node("nominal", "model")
+def temperature_gummel(nominal, model):
+    I_C, _, beta = bjt_gummel(kelvin(CURVE_TEMPERATURES_C), V_BE_gummel, 0.0, nominal, model)
+    return I_C, beta
+
+
+@graph.node("nominal", "model", "I_E_min", "I_E_max")
+def temperature_v_be(nominal, model, I_E_min, I_E_max):
+    V_BE = bjt_v_be(kelvin(TEMPERATURES_C), np.array([I_E_min, I_E_max]), 0.0, nominal, model)
+    return TEMPERATURES_C, {f"I_E = {I_E * 1e3:.2f} mA": V_BE[:, j] for j, I_E in enumerate((I_E_min, I_E_max))}, "T (°C)"
+
+
+def draw_curves(fig, curves, xlabel, ylabel, title):
+    ax = fig.subplots()
+    x, series, _ = curves
+    for label, y in series.items():
+        ax.plot(x, y, label=label)
+
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    if len(series) <= 10:
+        ax.legend()
+    ax.grid()
+    return ax
+
+
+@graph.figure("bjt_input", "input_curves")
+def input_figure(fig, curves):
+    draw_curves(fig, curves, "V_BE (V)", "I_E (mA)", "V_BE - I_E Curve")
+
+
+@graph.figure("bjt_output", "output_curves", "bias")
+def output_figure(fig, curves, bias):
+    ax = draw_curves(fig, curves, "V_CB (V)", "I_C (mA)", "V_CB - I_C Curve")
+    if bias is not None:
+        x = curves[0]
+        ax.plot(bias["V_CB"], bias["I_C"], "k--", linewidth=1, label="Load line")
+        ax.plot(*bias["Q"], "ko", label=f"Q (V_CB = {bias['Q'][0]:.2f} V, I_C = {bias['Q'][1]:.2f} mA)")
+        ax.set_xlim(x[0], x[-1])
+        ax.legend()
+
+
+@graph.figure("bjt_gummel", "gummel_curves")
+def gummel_figure(fig, curves):
+    ax = draw_curves(fig, curves, "V_BE (V)", "Current (A)", "Gummel Plot")
+    ax.set_yscale("log")
+
+
+@graph.figure("bjt_beta", "gummel_data")
+def beta_figure(fig, gummel_data):
+    ax = fig.subplots()
+    I_C, _, beta = gummel_data
+    ax.semilogx(I_C, beta)
+    ax.set_xlabel("I_C (A)")
+    ax.set_ylabel("β")
+    ax.set_title("β - I_C Curve")
+    ax.grid(True, which="both")
+
+
+@graph.figure("bjt_temperature", "temperature_gummel", "temperature_v_be", figsize=(10, 4))
+def temperature_figure(fig, temperature_gummel, temperature_v_be):
+    ax_beta, ax_v_be = fig.subplots(1, 2)
+    for T_curve, I_C, beta in zip(CURVE_TEMPERATURES_C, *temperature_gummel):
+        ax_beta.semilogx(I_C, beta, label=f"{T_curve:.0f} °C")
+    ax_beta.set_xlabel("I_C (A)")
+    ax_beta.set_ylabel("β")
+    ax_beta.set_title("β - I_C vs Temperature")
+    ax_beta.legend(fontsize="small")
+    ax_beta.grid(True, which="both")
+
+    T_values, series, _ = temperature_v_be
+    for label, V_BE in series.items():
+        ax_v_be.plot(T_values, V_BE, label=label)
+    ax_v_be.set_xlabel("T (°C)")
+    ax_v_be.set_ylabel("V_BE (V)")
+    ax_v_be.set_title("V_BE - T (V_CB = 0 V)")
+    ax_v_be.legend()
+    ax_v_be.grid()
+    fig.tight_layout()
+
+
+run = graph.run({
+    "model": model, "I_S": I_S, "T_C": T_C, "BF": BF, "BR": BR, "VAF": VAF, "VAR": VAR, "IKF": IKF,
+    "V_CB_min": V_CB_min, "V_CB_max": V_CB_max, "I_E_min": I_E_min, "I_E_max": I_E_max, "n_curves": n_curves,
+    "circuit_kind": circuit_kind, "V_CC": V_CC, "R_C": R_C, "R_B": R_B, "V_BB": V_BB, "I_ref": I_ref,
+})
+
+derived = run["params"]
+st.sidebar.caption(f"T = {T_C:.0f} °C: V_T = {derived['V_T'] * 1e3:.2f} mV, I_S = {derived['I_S']:.3e} A")
+
+col1, col2 = st.columns(2)
+
+# Input Characteristics
+with col1:
+    st.subheader("입력 특성 곡선")
+    if client_side:
+        show_curves("bjt_input", run["input_curves"])
+    else:
+        show_image("bjt_input", run["input_figure"])
+
+# Output Characteristics
+with col2:
+    st.subheader("출력 특성 곡선")
+    operating = run["bias"]
+    if client_side:
+        x, series, x_name = run["output_curves"]
+        if operating is not None:
+            series = dict(series, **{"부하선": load_line(x, operating)})
+        show_curves("bjt_output", (x, series, x_name))
+    else:
+        show_image("bjt_output", run["output_figure"])
+    if operating is not None:
+        st.caption(f"{CIRCUITS[circuit_kind]}: Q점 V_CB = {operating['Q'][0]:.3f} V "
+                   f"(V_CE = {operating['V_CE']:.3f} V), I_C = {operating['Q'][1]:.3f} mA "
+                   f"(부하선 {LOAD_POINTS}점, 점당 Newton 평균 {operating['iterations']:.1f}회"
+                   f"{'' if operating['converged'] else ', 일부 점 수렴 실패'})")
+
+col3, col4 = st.columns(2)
+
+with col3:
+    st.subheader("Gummel plot")
+    show_image("bjt_gummel", run["gummel_figure"])
+
+with col4:
+    st.subheader("β - I_C")
+    show_image("bjt_beta", run["beta_figure"])
+
+st.subheader(f"온도 특성 ({T_MIN_C:.0f} °C ~ {T_MAX_C:.0f} °C)")
+if client_side:
+    show_curves("bjt_temperature", run["temperature_v_be"])
+else:
+    show_image("bjt_temperature", run["temperature_figure"])
+
+run.panel()
+profiler.panel()
@@ -0,0 +1,83 @@
+import os
+
+import streamlit as st
+import numpy as np
+
+from semisim import profiler
+from semisim.montecarlo import CORNERS, default_distributions, run_corners, run_monte_carlo
+from semisim.render import mathtext_lock, new_figure, release
+
+profiler.start()
+
+# Monte Carlo / 공정 코너 해석
+st.markdown("<h1 style='text-align: center; color: #000000;'>Monte Carlo 및 공정 코너 해석</h1>", unsafe_allow_html=True)
+
+st.sidebar.header("⚙️ 해석 설정")
+n_samples = st.sidebar.select_slider("샘플 수", options=[1_000, 10_000, 100_000, 1_000_000], value=10_000)
+seed = st.sidebar.number_input("Seed", min_value=0, value=0, step=1)
+jobs = st.sidebar.number_input("프로세스 수", min_value=1, max_value=os.cpu_count() or 1, value=1, step=1)
+n_sigma = st.sidebar.slider("코너 (σ)", 1.0, 6.0, 3.0, step=0.5)
+
+st.sidebar.markdown("---")
+st.sidebar.subheader("파라미터 분포 (σ)")
+distributions = {}
+for name, (kind, mean, sigma) in default_distributions.items():
+    label = f"{name} ({'log σ' if kind == 'lognormal' else 'σ'}, 평균 {mean:g})"
+    distributions[name] = (kind, mean, st.sidebar.number_input(label, min_value=0.0, value=sigma, format="%g"))
+
+if st.button("해석 실행"):
+    with profiler.section("run_monte_carlo", samples=n_samples, jobs=int(jobs)):
+        result = run_monte_carlo(distributions, n_samples=n_samples, seed=int(seed), jobs=int(jobs))
+    with profiler.section("run_corners"):
+        corners = run_corners(distributions, n_sigma=n_sigma)
+
+    col1, col2 = st.columns(2)
+    for col, name, unit, scale in ((col1, "Id", "A", 1), (col2, "I_C", "mA", 1e3)):
+        with col:
+            st.subheader(f"{name} 분포")
+            fig = new_figure()
+            ax = fig.subplots()
+            values = getattr(result, name) * scale
+            ax.hist(values, bins=60, color="#3498db")
+            for corner, outputs in corners.items():
+                value = outputs[0 if name == "Id" else 1] * scale
+                ax.axvline(value, linestyle="--", linewidth=0.8, color="k")
+                ax.text(value, ax.get_ylim()[1] * 0.95, corner, rotation=90, va="top", fontsize=8)
+            ax.set_xlabel(f"{name} ({unit})")
+            ax.set_ylabel("Count")
+            ax.grid(True, linestyle='--', linewidth=0.5)
+            with mathtext_lock:
+                st.pyplot(fig)
+            release(fig)
+            p1, p50, p99 = np.percentile(values, [1, 50, 99])
+            st.caption(f"P1 = {p1:.4g}, P50 = {p50:.4g}, P99 = {p99:.4g} {unit}")
+
+    col1, col2 = st.columns(2)
+    bands = ((col1, "Id", result.Vds_sweep, result.Id_band, "Vds (V)", "Id (A)", 1),
+             (col2, "I_C", result.V_BE_sweep, result.I_C_band, "V_BE (V)", "I_C (mA)", 1e3))
+    for col, name, x, band, xlabel, ylabel, scale in bands:
+        with col:
+            st.subheader(f"{name} 백분위 대역")
+            fig = new_figure()
+            ax = fig.subplots()
+            ax.fill_between(x, band[1] * scale, band[99] * scale, alpha=0.2, label="P1 - P99")
+            ax.fill_between(x, band[5] * scale, band[95] * scale, alpha=0.4, label="P5 - P95")
+            ax.plot(x, band[50] * scale, color="k", label="P50")
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.grid(True, linestyle='--', linewidth=0.5)
+            ax.legend()
+            with mathtext_lock:
+                st.pyplot(fig)
+            release(fig)
+
+    st.subheader("공정 코너")
+    st.table({
+        "코너": list(corners),
+        "Id (A)": [f"{outputs[0]:.4g}" for outputs in corners.values()],
+        "I_C (mA)": [f"{outputs[1] * 1e3:.4g}" for outputs in corners.values()],
+    })
+else:
+    st.info(f"왼쪽에서 분포를 설정하고 '해석 실행'을 누르세요. 코너: {', '.join(CORNERS)}")
+
+profiler.panel()
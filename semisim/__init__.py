@@ -0,0 +1,24 @@
+"""
+반도체 시뮬레이터의 소자 모델 패키지.
+
+Streamlit 페이지 스크립트에서 공통으로 사용하는 물리 계산 코드를 모아 둔다.
+하위 모듈은 처음 접근할 때 import한다 (``semisim.bjt`` 등). 따라서 HOME처럼 모델을 쓰지 않는
+페이지는 numpy나 matplotlib을 불러오지 않으며, 한 번 import한 모델 코드는 rerun마다 다시
+실행되지 않고 프로세스 안에서 재사용된다.
+"""
+import importlib
+
+__all__ = ["assets", "bjt", "circuit", "extract", "graph", "implant", "kinetics", "litho", "mobility", "montecarlo", "mosfet", "poisson", "process", "profiler", "render",
+           "sampling", "surfaces", "sweep", "thermal", "topography", "viewer"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,170 @@
+"""
+앱이 직접 서빙하는 정적 asset (three.js, OrbitControls, 배너 이미지) 관리.
+
+asset은 Streamlit 정적 파일 서빙(server.enableStaticServing)으로 ``static/`` 디렉터리에서
+``app/static/<파일>`` 경로로 제공된다. 파일 이름에 내용 hash를 붙이므로
+URL이 바뀌지 않는 한 내용도 바뀌지 않아 브라우저/프록시가 오래 캐시할 수 있다.
+설치되지 않은 asset은 원본 (CDN) URL로 대신하고 asset마다 한 번 경고 log를 남긴다. 배포 전에는
+``check``로 모든 asset이 설치되었는지 확인한다 (하나라도 없으면 종료 코드 1).
+
+사용법::
+
+    python -m semisim.assets fetch                 # 네트워크가 되는 곳에서 원본 URL로부터 받기
+    python -m semisim.assets install three ./three.min.js   # 폐쇄망에서 로컬 파일로 설치
+    python -m semisim.assets list
+    python -m semisim.assets check                 # 배포 전 확인
+
+캐시 헤더:
+Streamlit은 ``app/static/`` 응답에 Cache-Control을 붙이지 않으므로 앞단 프록시에서 붙인다.
+hash가 붙은 파일 (``<이름>.<hash 12자리>.<확장자>``)은 내용이 바뀌면 이름도 바뀌므로 영구 캐시하고,
+그 밖의 파일 (manifest.json 등)은 매번 재검증한다. nginx 예::
+
+    location ~ "^/app/static/.+[.][0-9a-f]{12}[.][a-z.]+$" {
+        proxy_pass http://streamlit;
+        add_header Cache-Control "public, max-age=31536000, immutable";
+    }
+    location /app/static/ {
+        proxy_pass http://streamlit;
+        add_header Cache-Control "no-cache";
+    }
+"""
+import argparse
+import hashlib
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+MANIFEST_PATH = STATIC_DIR / "manifest.json"
+STATIC_URL = "app/static/"  # iframe(srcdoc) 안에서도 앱 기준으로 해석되도록 상대 경로 사용
+
+# asset 이름: (파일 이름, 원본 URL)
+ASSETS = {
+    "three": ("three.min.js",
+              "https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"),
+    "orbit_controls": ("OrbitControls.js",
+                       "https://cdn.jsdelivr.net/npm/three@0.128.0/examples/js/controls/OrbitControls.js"),
+    "banner": ("banner.png",
+               "https://raw.githubusercontent.com/roust33/abcd/main/%EB%B0%98%EB%8F%84%EC%B2%B4%20%EC%82%AC%EC%A7%84.png"),
+}
+
+# (mtime, 내용). 여러 세션 스레드가 반쯤 갱신된 상태를 보지 않도록 tuple 전체를 한 번에 바꾼다
+_manifest_cache = (None, {})
+_warned = set()  # CDN으로 대신한다고 경고한 asset 이름
+
+
+def load_manifest():
+    """asset 이름 -> 설치된 (hash가 붙은) 파일 이름. 파일이 바뀐 경우에만 다시 읽는다."""
+    global _manifest_cache
+    try:
+        mtime = MANIFEST_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached_mtime, data = _manifest_cache
+    if cached_mtime != mtime:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        _manifest_cache = (mtime, data)
+    return data
+
+
+def asset_path(name):
+    """설치된 asset의 로컬 경로. 설치되지 않았으면 None."""
+    filename = load_manifest().get(name)
+    if filename and (STATIC_DIR / filename).exists():
+        return STATIC_DIR / filename
+    return None
+
+
+def asset_url(name):
+    """
+    브라우저에서 사용할 asset URL.
+    로컬에 설치되어 있으면 content-hash URL, 아니면 원본 URL을 돌려준다 (asset마다 한 번 경고 log).
+    """
+    path = asset_path(name)
+    if path is not None:
+        return STATIC_URL + path.name
+    if name not in _warned:
+        _warned.add(name)
+        logger.warning("asset '%s'이 static/에 설치되지 않아 원본 URL (%s)을 사용한다. "
+                       "python -m semisim.assets fetch 또는 install로 설치할 것", name, ASSETS[name][1])
+    return ASSETS[name][1]
+
+
+def missing():
+    """설치되지 않은 asset 이름 목록."""
+    return [name for name in ASSETS if asset_path(name) is None]
+
+
+def install(name, source):
+    """
+    로컬 파일을 ``static/``에 content-hash 이름으로 복사하고 manifest를 갱신.
+
+    Returns:
+    - 설치된 파일 경로
+    """
+    filename = ASSETS[name][0]
+    data = Path(source).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    stem, dot, suffix = filename.partition(".")
+    target = STATIC_DIR / f"{stem}.{digest}{dot}{suffix}"
+
+    STATIC_DIR.mkdir(exist_ok=True)
+    manifest = dict(load_manifest())
+    old = manifest.get(name)
+    if old and old != target.name:
+        (STATIC_DIR / old).unlink(missing_ok=True)
+    target.write_bytes(data)
+    manifest[name] = target.name
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return target
+
+
+def fetch(names=None):
+    """원본 URL에서 asset을 내려받아 설치."""
+    import urllib.request  # 페이지에서 asset 경로만 조회할 때는 필요 없다
+    for name in names or ASSETS:
+        url = ASSETS[name][1]
+        with urllib.request.urlopen(url, timeout=30) as response, tempfile.NamedTemporaryFile() as tmp:
+            shutil.copyfileobj(response, tmp)
+            tmp.flush()
+            print(f"{name}: {install(name, tmp.name).name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.assets", description="정적 asset 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fetch_parser = sub.add_parser("fetch", help="원본 URL에서 내려받아 설치")
+    fetch_parser.add_argument("names", nargs="*", help=f"asset 이름 (기본값: 전체, {', '.join(ASSETS)})")
+    install_parser = sub.add_parser("install", help="로컬 파일로 설치 (폐쇄망)")
+    install_parser.add_argument("name", choices=list(ASSETS))
+    install_parser.add_argument("path")
+    sub.add_parser("list", help="설치 상태 출력")
+    sub.add_parser("check", help="설치되지 않은 asset이 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    if args.command == "fetch":
+        unknown = set(args.names) - set(ASSETS)
+        if unknown:
+            parser.error(f"알 수 없는 asset: {', '.join(sorted(unknown))}")
+        fetch(args.names)
+    elif args.command == "install":
+        print(install(args.name, args.path).name)
+    elif args.command == "check":
+        names = missing()
+        if names:
+            print(f"설치되지 않은 asset: {', '.join(names)}", file=sys.stderr)
+            return 1
+    else:
+        for name in ASSETS:
+            path = asset_path(name)
+            print(f"{name}: {path.name if path else '(미설치, ' + ASSETS[name][1] + ')'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import numpy as np
+
+from semisim.poisson import K_B
+
+
+# BJT 모델 파라미터 (NPN, SPICE Gummel-Poon 이름 사용)
+default_params = {
+    "I_S": 1e-14,      # 포화전류 (A)
+    "V_T": 0.026,      # 열전압 (V)
+    "V_CB_min": 0.0,   # 출력 특성 V_CB 범위 (V)
+    "V_CB_max": 20.0,
+    "I_E_min": 0.001,  # 출력 특성 I_E 범위 (A)
+    "I_E_max": 0.005,
+    "BF": 100.0,       # 순방향 전류 이득
+    "BR": 1.0,         # 역방향 전류 이득
+    "NF": 1.0,         # 순방향 이상 계수
+    "NR": 1.0,         # 역방향 이상 계수
+    "VAF": 100.0,      # 순방향 Early 전압 (V)
+    "VAR": 10.0,       # 역방향 Early 전압 (V)
+    "IKF": 0.01,       # 순방향 고주입 knee 전류 (A)
+    "IKR": 0.001,      # 역방향 고주입 knee 전류 (A)
+    "ISE": 0.0,        # B-E 누설 포화전류 (A)
+    "NE": 1.5,         # B-E 누설 이상 계수
+    "ISC": 0.0,        # B-C 누설 포화전류 (A)
+    "NC": 2.0,         # B-C 누설 이상 계수
+    "TNOM": 300.15,    # 파라미터를 측정한 온도 (K, 27 °C)
+    "EG": 1.11,        # I_S 온도 의존성의 에너지 갭 (eV)
+    "XTI": 3.0,        # I_S 온도 지수
+    "XTB": 0.0,        # β 온도 지수
+}
+
+# Ebers-Moll 모델은 Early 효과, 고주입, 누설 전류가 없는 Gummel-Poon 모델과 같다
+EBERS_MOLL = {"VAF": np.inf, "VAR": np.inf, "IKF": np.inf, "IKR": np.inf, "ISE": 0.0, "ISC": 0.0}
+
+MODELS = ("gummel-poon", "ebers-moll")
+
+
+def model_params(params=None, model="gummel-poon"):
+    """기본값과 합친 모델 파라미터 dict. model="ebers-moll"이면 2차 효과를 끈다."""
+    if model not in MODELS:
+        raise ValueError(f"지원하지 않는 BJT 모델: {model}")
+    p = dict(default_params, **(params or {}))
+    if model == "ebers-moll":
+        p.update(EBERS_MOLL)
+    return p
+
+
+def at_temperature(T, params=None):
+    """
+    온도 T에서의 파라미터 (SPICE Gummel-Poon 온도 모델).
+    V_T = kT/q이고, I_S, ISE, ISC, BF, BR은 TNOM에서의 값을 EG, XTI, XTB로 온도 보정한다.
+    T가 배열이면 보정된 값도 같은 shape의 배열이므로 한 번의 호출로 온도 축 전체를 계산할 수 있다.
+
+    Parameters:
+    - T: 온도 (K), 스칼라 또는 배열
+    - params: TNOM에서의 파라미터 dict (일부만 주어도 된다)
+
+    Returns:
+    - 온도 보정한 파라미터 dict
+    """
+    p = dict(default_params, **(params or {}))
+    T = np.asarray(T, dtype=float)
+    ratio = T / p["TNOM"]
+    V_T = K_B * T
+    # 접합 포화전류: (T/TNOM)^(XTI/N) exp(EG/(N V_T) (T/TNOM - 1)), 누설 전류는 β 보정도 나눈다
+    arrhenius = p["EG"] / V_T * (ratio - 1)
+    beta_factor = ratio ** p["XTB"]
+    scaled = {
+        "V_T": V_T,
+        "I_S": p["I_S"] * ratio ** (p["XTI"] / p["NF"]) * np.exp(arrhenius / p["NF"]),
+        "ISE": p["ISE"] * ratio ** (p["XTI"] / p["NE"]) * np.exp(arrhenius / p["NE"]) / beta_factor,
+        "ISC": p["ISC"] * ratio ** (p["XTI"] / p["NC"]) * np.exp(arrhenius / p["NC"]) / beta_factor,
+        "BF": p["BF"] * beta_factor,
+        "BR": p["BR"] * beta_factor,
+    }
+    p.update({name: float(value) if np.ndim(value) == 0 else value for name, value in scaled.items()})
+    return p
+
+
+def terminal_currents(V_BE, V_BC, params=None, model="gummel-poon"):
+    """
+    Gummel-Poon / Ebers-Moll 단자 전류 계산 함수 (NPN).
+    V_BE, V_BC와 파라미터 값은 서로 broadcast 가능한 배열이다.
+
+    Parameters:
+    - V_BE: 베이스-이미터 전압 (V)
+    - V_BC: 베이스-컬렉터 전압 (V), 공통 베이스 회로에서는 -V_CB
+    - params: default_params 형식의 파라미터 dict (일부만 주어도 된다)
+    - model: "gummel-poon" 또는 "ebers-moll"
+
+    Returns:
+    - 컬렉터 전류 I_C (A), 베이스 전류 I_B (A), 이미터 전류 I_E = I_C + I_B (A)
+    """
+    p = model_params(params, model)
+    V_T = p["V_T"]
+    I_f = p["I_S"] * np.expm1(np.divide(V_BE, p["NF"] * V_T))
+    I_r = p["I_S"] * np.expm1(np.divide(V_BC, p["NR"] * V_T))
+    I_be_leak = p["ISE"] * np.expm1(np.divide(V_BE, p["NE"] * V_T))
+    I_bc_leak = p["ISC"] * np.expm1(np.divide(V_BC, p["NC"] * V_T))
+
+    # base charge: Early 효과 (q1)와 고주입 (q2)
+    q1 = 1 / (1 - np.divide(V_BC, p["VAF"]) - np.divide(V_BE, p["VAR"]))
+    q2 = I_f / p["IKF"] + I_r / p["IKR"]
+    q_b = q1 / 2 * (1 + np.sqrt(np.maximum(1 + 4 * q2, 0)))
+
+    I_CT = (I_f - I_r) / q_b
+    I_C = I_CT - I_r / p["BR"] - I_bc_leak
+    I_B = I_f / p["BF"] + I_be_leak + I_r / p["BR"] + I_bc_leak
+    return I_C, I_B, I_C + I_B
+
+
+def solve_v_be(I_E, V_CB, params=None, model="gummel-poon", tol=1e-9, max_iter=60):
+    """
+    이미터 전류 I_E를 흘리는 V_BE를 구하는 함수 (공통 베이스 출력 특성용).
+    I_E(V_BE)는 단조 증가하므로, 전체 (I_E, V_CB) 격자에 대해 구간 [lo, hi]를 유지하는
+    벡터화 Newton 반복을 수행하고 Newton 단계가 구간을 벗어나는 점만 이분법으로 대신한다.
+
+    Returns:
+    - V_BE (V), I_E, V_CB와 파라미터 값을 broadcast한 shape
+    """
+    p = model_params(params, model)
+    I_E, V_CB = np.broadcast_arrays(np.asarray(I_E, dtype=float), np.asarray(V_CB, dtype=float))
+    V_BC = -V_CB
+    h = 1e-7
+
+    def residual(V_BE):
+        return terminal_currents(V_BE, V_BC, p)[2] - I_E
+
+    V_BE = p["NF"] * p["V_T"] * np.log1p(I_E / p["I_S"])  # 이상적인 다이오드 초기값
+    # 파라미터가 배열 (예: 온도 축)이면 격자를 파라미터 shape까지 broadcast한다
+    V_BE, I_E, V_BC = np.broadcast_arrays(V_BE, I_E, V_BC)
+    lo = np.full(I_E.shape, -1.0)
+    hi = np.maximum(V_BE, V_BC) + 0.5
+    while np.any(residual(hi) < 0):
+        hi = np.where(residual(hi) < 0, hi + 0.5, hi)
+
+    for _ in range(max_iter):
+        f = residual(V_BE)
+        converged = np.abs(f) <= tol * I_E
+        if np.all(converged):
+            break
+        lo = np.where(f < 0, V_BE, lo)
+        hi = np.where(f > 0, V_BE, hi)
+        slope = (residual(V_BE + h) - f) / h
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = V_BE - f / slope
+        inside = (step >= lo) & (step <= hi)
+        V_BE = np.where(converged, V_BE, np.where(inside, step, (lo + hi) / 2))
+    return V_BE
+
+
+def common_base_input(V_BE, V_CB, params=None, model="gummel-poon"):
+    """공통 베이스 입력 특성: (V_BE, V_CB) 격자의 이미터 전류 I_E (A)."""
+    return terminal_currents(V_BE, np.negative(V_CB), params, model)[2]
+
+
+def common_base_output(I_E, V_CB, params=None, model="gummel-poon"):
+    """공통 베이스 출력 특성: (I_E, V_CB) 격자의 컬렉터 전류 I_C (A)."""
+    V_BE = solve_v_be(I_E, V_CB, params, model)
+    return terminal_currents(V_BE, np.negative(V_CB), params, model)[0]
+
+
+def gummel(V_BE, V_CB=0.0, params=None, model="gummel-poon"):
+    """
+    Gummel plot 데이터.
+
+    Returns:
+    - I_C (A), I_B (A), 전류 이득 β = I_C / I_B
+    """
+    I_C, I_B, _ = terminal_currents(V_BE, np.negative(V_CB), params, model)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(I_B > 0, I_C / I_B, np.nan)
+    return I_C, I_B, beta
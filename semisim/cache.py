@@ -0,0 +1,147 @@
+"""
+세션 사이에서 공유하는 프로세스 전역 캐시.
+
+Streamlit 서버는 한 프로세스 안에서 세션마다 별도의 스레드로 페이지 스크립트를 실행한다.
+여기의 캐시는 모든 세션이 공유하므로, 같은 파라미터로 여러 사용자가 페이지를 열어도
+계산과 렌더링은 한 번만 일어난다. 따라서 비용은 사용자 수가 아니라 서로 다른 파라미터
+조합의 수에 비례한다.
+
+- 값의 byte 크기 합으로 제한하는 LRU (가장 오래 쓰이지 않은 항목부터 제거)
+- 같은 키를 여러 세션이 동시에 요청하면 한 스레드만 계산하고 나머지는 결과를 기다린다
+  (수업 시작처럼 모두가 기본값으로 동시에 접속하는 경우)
+
+    figures = shared_cache("render", 64 * 1024 * 1024)
+    data = figures.get_or_compute(key, lambda: draw_png(...))
+"""
+import dataclasses
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+CACHES = {}  # 이름 -> SharedCache (통계 표시용 registry)
+
+
+def nbytes(value):
+    """
+    캐시 크기 계산용 값의 대략적인 byte 크기.
+    numpy 배열은 데이터 크기, 컨테이너와 dataclass는 구성 요소 크기의 합이다.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(nbytes(k) + nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(nbytes(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sum(nbytes(getattr(value, f.name)) for f in dataclasses.fields(value))
+    return sys.getsizeof(value)
+
+
+class SharedCache:
+    """byte 크기로 제한되는 thread-safe LRU 캐시."""
+
+    def __init__(self, name, max_bytes, sizeof=nbytes):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._items = OrderedDict()  # 키 -> (값, 크기)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._pending = {}  # 계산 중인 키 -> threading.Event
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.waits = 0  # 다른 세션의 계산을 기다려 얻은 횟수
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._insert(key, value, size)
+
+    def _insert(self, key, value, size):
+        if key in self._items:
+            self._bytes -= self._items.pop(key)[1]
+        self._items[key] = (value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._items.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        캐시 값 또는 compute()의 결과. 같은 키를 계산 중인 스레드가 있으면 그 결과를 기다린다.
+        compute가 예외를 내면 기다리던 스레드가 대신 계산한다.
+        """
+        while True:
+            with self._lock:
+                item = self._items.get(key)
+                if item is not None:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return item[0]
+                event = self._pending.get(key)
+                if event is None:
+                    self.misses += 1
+                    event = self._pending[key] = threading.Event()
+                    break
+                self.waits += 1
+            event.wait()
+
+        try:
+            value = compute()
+            size = self.sizeof(value)
+            with self._lock:
+                if size <= self.max_bytes:
+                    self._insert(key, value, size)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            event.set()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """캐시 통계 (hits, misses, waits, evictions, entries, bytes, max_bytes)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "evictions": self.evictions,
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def shared_cache(name, max_bytes, sizeof=nbytes):
+    """이름으로 등록된 SharedCache (처음 호출할 때 만든다)."""
+    if name not in CACHES:
+        CACHES[name] = SharedCache(name, max_bytes, sizeof)
+    return CACHES[name]
+
+
+def stats():
+    """등록된 모든 공유 캐시의 통계 {이름: stats}."""
+    return {name: cache.stats() for name, cache in CACHES.items()}
@@ -0,0 +1,501 @@
+"""
+작은 MOSFET / BJT 회로의 DC 동작점과 DC sweep (modified nodal analysis).
+
+회로는 노드 이름 사이에 소자를 붙여 만든다 (접지는 "0"). 미지수는 접지 외의 노드 전압과
+전압원 전류이고, 선형 소자 (저항, 전압원, 전류원)는 행렬 G와 source 벡터로, 비선형 소자는
+semisim.mosfet.calculate_id / small_signal과 semisim.bjt.terminal_currents로 계산한다.
+같은 종류의 소자는 모두 한 번의 모델 호출로 계산하고 (소자 축), 여러 동작점도 한 번에 푼다
+(동작점 축, Jacobian shape (동작점, 미지수, 미지수)).
+
+동작점은 감쇠 Newton-Raphson으로 푼다. 한 번의 Newton 단계에서 노드 전압 변화는 DV_MAX로,
+BJT 접합 전압 증가는 SPICE pnjlim 방식 (V_crit 위에서는 log로 누른 값)으로 제한하고, 제한이
+걸리면 단계 전체를 같은 비율로 줄인다. 모든 노드에 GMIN 컨덕턴스를 접지로 달아서 차단된 소자만
+연결된 노드에서도 행렬이 특이하지 않게 한다. 0에서 수렴하지 않으면 모든 source를 0부터
+키우는 source stepping으로 다시 푼다.
+
+DC sweep은 continuation으로 푼다: STRIDE 간격의 점을 순서대로 직전 해에서 출발해 풀고
+(수렴하지 않으면 구간을 나누어 다시 푼다), 그 사이의 점은 양쪽 해를 선형 보간한 초기값에서
+한 번의 batch Newton으로 모두 푼다.
+
+    circuit = common_source(V_DD=5.0, R_D=50e6, V_in=2.0, device={"W": 20.0, "L": 10.0})
+    circuit.operating_point().device("M1")          # {"Vgs": ..., "Vds": ..., "Id": ...}
+    sweep = circuit.dc_sweep("V_in", np.linspace(0, 5, 1000))
+    sweep.voltage("out"), sweep.device("M1")["Id"]
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from semisim.bjt import model_params, terminal_currents
+from semisim.mobility import mobility_bulk
+from semisim.mosfet import T_ROOM, calculate_id, small_signal
+from semisim.poisson import T_OX, oxide_capacitance, threshold_voltage
+
+GROUND = "0"
+GMIN = 1e-12  # 노드-접지 최소 컨덕턴스 (S)
+DV_MAX = 1.0  # Newton 단계 하나의 최대 노드 전압 변화 (V)
+RELTOL = 1e-6
+VNTOL = 1e-9  # 전압 절대 허용 오차 (V)
+ABSTOL = 1e-15  # 전류 절대 허용 오차 (A)
+MAX_ITER = 100
+SOURCE_STEPS = 20  # source stepping 단계 수
+STRIDE = 16  # sweep에서 순서대로 푸는 점 간격
+MAX_BISECT = 8  # continuation 구간을 나누는 최대 횟수
+BJT_STEP = 1e-7  # BJT 컨덕턴스 전진 차분 간격 (V)
+
+# MOSFET 기본 소자 파라미터 (calculate_id 인자), Vt, Cox, mu_eff가 None이면 도핑 / 산화막으로부터 구한다
+MOSFET_DEFAULTS = {"W": 10.0, "L": 10.0, "N_D": 1e19, "N_A": 1e16, "T": T_ROOM, "t_ox": T_OX,
+                   "Vt": None, "Cox": None, "mu_eff": None}
+
+
+@dataclass
+class _Mosfet:
+    name: str
+    nodes: tuple  # (d, g, s)
+    params: dict
+
+
+@dataclass
+class _Bjt:
+    name: str
+    nodes: tuple  # (c, b, e)
+    params: dict
+
+
+@dataclass
+class Circuit:
+    """
+    MNA 회로. 노드는 처음 쓰일 때 만들어지고, 소자 이름은 회로 안에서 유일해야 한다.
+    모든 MOSFET은 n채널, BJT는 NPN이다 (source / drain은 대칭으로 다룬다).
+    """
+    nodes: list = field(default_factory=list)
+    resistors: list = field(default_factory=list)  # (이름, a, b, R)
+    vsources: list = field(default_factory=list)  # (이름, +, -, V)
+    isources: list = field(default_factory=list)  # (이름, a, b, I): a에서 source를 지나 b로 흐른다
+    mosfets: list = field(default_factory=list)
+    bjts: list = field(default_factory=list)
+
+    def _node(self, name):
+        name = str(name)
+        if name != GROUND and name not in self.nodes:
+            self.nodes.append(name)
+        return name
+
+    def _check(self, name):
+        names = [e[0] for e in self.resistors + self.vsources + self.isources]
+        names += [e.name for e in self.mosfets + self.bjts]
+        if name in names:
+            raise ValueError(f"이미 있는 소자 이름: {name}")
+
+    def resistor(self, name, a, b, R):
+        self._check(name)
+        if R <= 0:
+            raise ValueError(f"저항 {name}의 값은 양수여야 합니다: {R}")
+        self.resistors.append((name, self._node(a), self._node(b), float(R)))
+        return self
+
+    def vsource(self, name, plus, minus, V):
+        self._check(name)
+        self.vsources.append((name, self._node(plus), self._node(minus), float(V)))
+        return self
+
+    def isource(self, name, a, b, I):
+        self._check(name)
+        self.isources.append((name, self._node(a), self._node(b), float(I)))
+        return self
+
+    def mosfet(self, name, d, g, s, **params):
+        """n채널 MOSFET. params는 calculate_id의 소자 인자 (W, L, N_D, N_A, T, Vt, Cox, mu_eff, t_ox)."""
+        self._check(name)
+        unknown = set(params) - set(MOSFET_DEFAULTS)
+        if unknown:
+            raise ValueError(f"알 수 없는 MOSFET 파라미터: {sorted(unknown)}")
+        self.mosfets.append(_Mosfet(name, (self._node(d), self._node(g), self._node(s)),
+                                    dict(MOSFET_DEFAULTS, **params)))
+        return self
+
+    def bjt(self, name, c, b, e, params=None, model="gummel-poon"):
+        """NPN BJT. params는 default_params 형식 (일부만 주어도 된다)."""
+        self._check(name)
+        self.bjts.append(_Bjt(name, (self._node(c), self._node(b), self._node(e)), model_params(params, model)))
+        return self
+
+    @property
+    def sources(self):
+        """source 이름 목록 (전압원, 전류원 순서). dc_sweep의 source 인자로 쓴다."""
+        return [e[0] for e in self.vsources + self.isources]
+
+    def system(self):
+        """회로를 MNA 행렬과 소자 batch로 정리한 System."""
+        return System(self)
+
+    def operating_point(self):
+        """DC 동작점 (Solution, 동작점 1개)."""
+        return self.system().operating_point()
+
+    def dc_sweep(self, source, values, stride=STRIDE):
+        """source 값을 values로 바꾸며 푼 DC sweep (Solution, 동작점 len(values)개)."""
+        return self.system().dc_sweep(source, values, stride)
+
+
+class System:
+    """
+    컴파일한 MNA 시스템. 미지수 x는 노드 전압 (Circuit.nodes 순서) 다음에 전압원 전류
+    (+ 단자에서 source로 들어가는 방향)가 온다. 소자 단자 인덱스의 접지는 x 끝에 붙인 0 칸이다.
+    """
+
+    def __init__(self, circuit):
+        self.circuit = circuit
+        self.n = len(circuit.nodes)
+        self.size = self.n + len(circuit.vsources)
+        index = {name: i for i, name in enumerate(circuit.nodes)}
+        index[GROUND] = self.size  # 확장 벡터의 0 칸
+        self._index = index
+
+        # 선형 부분: 확장 행렬 (size + 1)에 stamp하고 접지 행 / 열을 버린다
+        G = np.zeros((self.size + 1, self.size + 1))
+        G[np.arange(self.n), np.arange(self.n)] += GMIN
+        for _, a, b, R in circuit.resistors:
+            self._stamp(G, index[a], index[b], 1 / R)
+        for k, (_, plus, minus, _) in enumerate(circuit.vsources):
+            row = self.n + k
+            G[index[plus], row] += 1
+            G[index[minus], row] -= 1
+            G[row, index[plus]] += 1
+            G[row, index[minus]] -= 1
+        self.G = G[:self.size, :self.size]
+
+        # source 값 -> 잔차 상수항: 전류원은 a에서 빠져 b로 들어가고, 전압원 행은 -V
+        n_sources = len(circuit.vsources) + len(circuit.isources)
+        S = np.zeros((self.size + 1, n_sources))
+        for k in range(len(circuit.vsources)):
+            S[self.n + k, k] = -1
+        for k, (_, a, b, _) in enumerate(circuit.isources):
+            S[index[a], len(circuit.vsources) + k] += 1
+            S[index[b], len(circuit.vsources) + k] -= 1
+        self.S = S[:self.size]
+        self.values = np.array([e[3] for e in circuit.vsources + circuit.isources], dtype=float)
+
+        # MOSFET batch: 도핑 / 산화막에서 구하는 값은 한 번만 계산한다
+        self.mos_nodes = np.array([[index[v] for v in m.nodes] for m in circuit.mosfets], dtype=int).reshape(-1, 3)
+        p = {name: np.array([m.params[name] if m.params[name] is not None else np.nan for m in circuit.mosfets])
+             for name in MOSFET_DEFAULTS}
+        if circuit.mosfets:
+            p["Vt"] = np.where(np.isnan(p["Vt"]), threshold_voltage(p["N_A"], p["t_ox"], p["T"]), p["Vt"])
+            p["Cox"] = np.where(np.isnan(p["Cox"]), oxide_capacitance(p["t_ox"]), p["Cox"])
+            p["mu_eff"] = np.where(np.isnan(p["mu_eff"]), mobility_bulk(p["N_D"], p["N_A"], p["T"])[2], p["mu_eff"])
+        self.mos_params = p
+
+        self.bjt_nodes = np.array([[index[v] for v in q.nodes] for q in circuit.bjts], dtype=int).reshape(-1, 3)
+        names = circuit.bjts[0].params if circuit.bjts else {}
+        self.bjt_params = {name: np.array([q.params[name] for q in circuit.bjts], dtype=float) for name in names}
+        if circuit.bjts:
+            # 접합별 임계 전압 V_crit = N V_T ln(N V_T / (√2 I_S)) (pnjlim)
+            p = self.bjt_params
+            self.bjt_vt = np.stack([p["NF"] * p["V_T"], p["NR"] * p["V_T"]], axis=-1)
+            self.bjt_vcrit = self.bjt_vt * np.log(self.bjt_vt / (np.sqrt(2) * p["I_S"][:, np.newaxis]))
+
+    @staticmethod
+    def _stamp(G, a, b, g):
+        G[a, a] += g
+        G[b, b] += g
+        G[a, b] -= g
+        G[b, a] -= g
+
+    def _extend(self, x):
+        """x 끝에 접지 전압 0 칸을 붙인다."""
+        return np.concatenate([x, np.zeros(x.shape[:-1] + (1,))], axis=-1)
+
+    # --- 소자 모델 (소자 축 batch) -----------------------------------------
+
+    def mosfet_currents(self, x, derivatives=False):
+        """
+        동작점 x (shape (P, size))에서 MOSFET 드레인 전류 Id (P, 소자)와 (derivatives면)
+        (Vd, Vg, Vs)에 대한 도함수 shape (P, 소자, 3). source / drain이 뒤바뀌면 (Vds < 0) 대칭으로 계산한다.
+        """
+        v = self._extend(x)[:, self.mos_nodes]  # (P, 소자, 3)
+        Vd, Vg, Vs = v[..., 0], v[..., 1], v[..., 2]
+        reverse = Vd < Vs
+        low = np.where(reverse, Vd, Vs)
+        Vgs, Vds = Vg - low, np.abs(Vd - Vs)
+        p = self.mos_params
+        args = (Vgs, Vds, p["W"], p["L"], p["N_D"], p["N_A"], p["T"])
+        kwargs = {"Vt": p["Vt"], "Cox": p["Cox"], "mu_eff": p["mu_eff"], "t_ox": p["t_ox"]}
+        sign = np.where(reverse, -1.0, 1.0)
+        Id = sign * calculate_id(*args, **kwargs)
+        if not derivatives:
+            return Id
+        gm, gds = small_signal(*args, **kwargs)
+        # 정방향: dVd = gds, dVg = gm, dVs = -gm - gds / 역방향 (drain이 low 쪽): dVd = gm + gds, dVg = -gm, dVs = -gds
+        dId = np.stack([np.where(reverse, gm + gds, gds), sign * gm, np.where(reverse, -gds, -gm - gds)], axis=-1)
+        return Id, dId
+
+    def bjt_currents(self, x, derivatives=False):
+        """
+        동작점 x에서 BJT 단자 전류 (I_C, I_B) shape (P, 소자, 2)와 (derivatives면) (V_BE, V_BC)에 대한
+        도함수 shape (P, 소자, 2, 2). 도함수는 세 바이어스를 쌓은 한 번의 모델 호출로 구하는 전진 차분이다.
+        """
+        v = self._extend(x)[:, self.bjt_nodes]
+        V_BE = v[..., 1] - v[..., 2]
+        V_BC = v[..., 1] - v[..., 0]
+        if derivatives:
+            V_BE = np.stack([V_BE, V_BE + BJT_STEP, V_BE])
+            V_BC = np.stack([V_BC, V_BC, V_BC + BJT_STEP])
+        with np.errstate(over="ignore", invalid="ignore"):
+            I_C, I_B, _ = terminal_currents(V_BE, V_BC, self.bjt_params)
+        I = np.stack([I_C, I_B], axis=-1)
+        if not derivatives:
+            return I
+        return I[0], np.stack([(I[1] - I[0]) / BJT_STEP, (I[2] - I[0]) / BJT_STEP], axis=-1)
+
+    # --- MNA 잔차와 Jacobian -----------------------------------------------
+
+    def residual(self, x, values, jacobian=False):
+        """
+        KCL / 전압원 잔차 F(x) shape (P, size) (노드에서 빠져나가는 전류의 합)와 (jacobian이면) dF/dx.
+        values는 shape (P, source 수)의 source 값이다.
+        """
+        P = len(x)
+        F = np.zeros((P, self.size + 1))
+        F[:, :self.size] = x @ self.G.T + values @ self.S.T
+        J = np.zeros((P, self.size + 1, self.size + 1)) if jacobian else None
+        every = slice(None)
+
+        if len(self.mos_nodes):
+            d, g, s = self.mos_nodes.T
+            result = self.mosfet_currents(x, jacobian)
+            Id, dId = result if jacobian else (result, None)
+            np.add.at(F, (every, d), Id)  # drain에서 빠져나가 source로 들어온다
+            np.add.at(F, (every, s), -Id)
+            if jacobian:
+                for j, column in enumerate((d, g, s)):
+                    np.add.at(J, (every, d, column), dId[..., j])
+                    np.add.at(J, (every, s, column), -dId[..., j])
+
+        if len(self.bjt_nodes):
+            c, b, e = self.bjt_nodes.T
+            result = self.bjt_currents(x, jacobian)
+            I, dI = result if jacobian else (result, None)
+            np.add.at(F, (every, c), I[..., 0])
+            np.add.at(F, (every, b), I[..., 1])
+            np.add.at(F, (every, e), -I[..., 0] - I[..., 1])
+            if jacobian:
+                # V_BE = Vb - Ve, V_BC = Vb - Vc -> 단자 (c, b, e)에 대한 도함수
+                dV = np.stack([-dI[..., 1], dI[..., 0] + dI[..., 1], -dI[..., 0]], axis=-1)  # (P, 소자, 2, 3)
+                for j, column in enumerate((c, b, e)):
+                    np.add.at(J, (every, c, column), dV[..., 0, j])
+                    np.add.at(J, (every, b, column), dV[..., 1, j])
+                    np.add.at(J, (every, e, column), -dV[..., 0, j] - dV[..., 1, j])
+
+        F = F[:, :self.size]
+        if not jacobian:
+            return F
+        return F, self.G + J[:, :self.size, :self.size]
+
+    def _limit(self, x, dx):
+        """Newton 단계 dx의 감쇠 비율 shape (P,): 노드 전압 변화 DV_MAX, BJT 접합 pnjlim."""
+        nodes = np.abs(dx[:, :self.n]).max(axis=1, initial=0.0)
+        scale = np.minimum(1.0, DV_MAX / np.maximum(nodes, 1e-300))
+        if len(self.bjt_nodes):
+            old = self._extend(x)[:, self.bjt_nodes]
+            new = self._extend(x + dx)[:, self.bjt_nodes]
+            v_old = np.stack([old[..., 1] - old[..., 2], old[..., 1] - old[..., 0]], axis=-1)
+            v_new = np.stack([new[..., 1] - new[..., 2], new[..., 1] - new[..., 0]], axis=-1)
+            vt, vcrit = self.bjt_vt, self.bjt_vcrit
+            step = v_new - v_old
+            limit = (v_new > vcrit) & (step > 2 * vt)
+            # pnjlim: 이전 값이 양수면 v_old + vt ln(1 + Δ/vt), 아니면 vt ln(v_new / vt)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                limited = np.where(v_old > 0, v_old + vt * np.log1p(step / vt),
+                                   vt * np.log(np.maximum(v_new, vt) / vt))
+                ratio = np.where(limit, np.clip((limited - v_old) / step, 0.0, 1.0), 1.0)
+            scale = np.minimum(scale, ratio.min(axis=(1, 2), initial=1.0))
+        return scale
+
+    def newton(self, x, values, max_iter=MAX_ITER):
+        """
+        여러 동작점을 한꺼번에 푸는 감쇠 Newton-Raphson.
+
+        Parameters:
+        - x: 초기값 shape (P, size)
+        - values: source 값 shape (P, source 수)
+
+        Returns:
+        - 해 shape (P, size), 수렴 여부 shape (P,), 반복 횟수 shape (P,)
+        """
+        x = np.array(x, dtype=float)
+        converged = np.zeros(len(x), dtype=bool)
+        iterations = np.zeros(len(x), dtype=int)
+        tol = np.concatenate([np.full(self.n, VNTOL), np.full(self.size - self.n, ABSTOL)])
+        for _ in range(max_iter):
+            rows = np.nonzero(~converged)[0]
+            if len(rows) == 0:
+                break
+            F, J = self.residual(x[rows], values[rows], jacobian=True)
+            try:
+                dx = -np.linalg.solve(J, F[..., np.newaxis])[..., 0]
+            except np.linalg.LinAlgError:
+                raise ValueError("MNA 행렬이 특이합니다 (전압원 loop나 전압원과 병렬인 전류원이 있는지 확인하세요)")
+            scale = self._limit(x[rows], dx)
+            dx *= scale[:, np.newaxis]
+            x[rows] += dx
+            iterations[rows] += 1
+            small = np.all(np.abs(dx) <= RELTOL * np.abs(x[rows]) + tol, axis=1)
+            converged[rows] = (scale == 1.0) & small & np.all(np.isfinite(x[rows]), axis=1)
+        return x, converged, iterations
+
+    def _values(self, source, values):
+        """source 하나를 values로 바꾼 source 값 행렬 shape (len(values), source 수)."""
+        names = self.circuit.sources
+        if source not in names:
+            raise ValueError(f"회로에 없는 source: {source} (가능한 값: {names})")
+        table = np.tile(self.values, (len(values), 1))
+        table[:, names.index(source)] = values
+        return table
+
+    def _continue(self, x, start, stop, depth=0):
+        """source 값 start에서의 해 x로부터 stop까지 (수렴하지 않으면 구간을 나누어) 푼다."""
+        solution, converged, iterations = self.newton(x[np.newaxis], stop[np.newaxis])
+        if converged[0] or depth >= MAX_BISECT:
+            return solution[0], bool(converged[0]), int(iterations[0])
+        middle = (start + stop) / 2
+        x, ok, n1 = self._continue(x, start, middle, depth + 1)
+        if not ok:
+            return x, False, n1
+        x, ok, n2 = self._continue(x, middle, stop, depth + 1)
+        return x, ok, n1 + n2
+
+    def operating_point(self, values=None):
+        """
+        source 값 values (기본값: 회로에 적힌 값)에서의 동작점. 0에서 출발하는 Newton으로 풀고,
+        수렴하지 않으면 source stepping으로 다시 푼다.
+        """
+        values = self.values if values is None else np.asarray(values, dtype=float)
+        x, converged, iterations = self.newton(np.zeros((1, self.size)), values[np.newaxis])
+        if not converged[0]:
+            x = np.zeros(self.size)
+            total = 0
+            factors = np.linspace(0, 1, SOURCE_STEPS + 1)
+            for f0, f1 in zip(factors, factors[1:]):
+                x, ok, n = self._continue(x, f0 * values, f1 * values)
+                total += n
+            x, converged, iterations = x[np.newaxis], np.array([ok]), np.array([total])
+        return Solution(self, np.array([np.nan]), x, converged, iterations)
+
+    def dc_sweep(self, source, values, stride=STRIDE):
+        """
+        source 값을 values 순서로 바꾸며 continuation으로 푼 DC sweep.
+
+        Returns:
+        - Solution (동작점 len(values)개)
+        """
+        values = np.asarray(values, dtype=float)
+        table = self._values(source, values)
+        x = np.zeros((len(values), self.size))
+        converged = np.zeros(len(values), dtype=bool)
+        iterations = np.zeros(len(values), dtype=int)
+
+        # 1) STRIDE 간격의 점: 직전 해에서 출발 (첫 점은 동작점 해법)
+        coarse = np.unique(np.r_[np.arange(0, len(values), max(1, stride)), len(values) - 1])
+        start = self.operating_point(table[coarse[0]])
+        x[coarse[0]], converged[coarse[0]], iterations[coarse[0]] = start.x[0], start.converged[0], start.iterations[0]
+        for previous, i in zip(coarse, coarse[1:]):
+            x[i], converged[i], iterations[i] = self._continue(x[previous], table[previous], table[i])
+
+        # 2) 사이의 점: 양쪽 해를 선형 보간한 초기값에서 한 번의 batch Newton
+        fine = np.setdiff1d(np.arange(len(values)), coarse)
+        if len(fine):
+            right = np.searchsorted(coarse, fine)
+            lo, hi = coarse[right - 1], coarse[right]
+            t = ((fine - lo) / (hi - lo))[:, np.newaxis]
+            x[fine], converged[fine], iterations[fine] = self.newton((1 - t) * x[lo] + t * x[hi], table[fine])
+            # 수렴하지 않은 점은 바로 앞 점의 해에서 다시 continuation
+            for i in fine[~converged[fine]]:
+                x[i], converged[i], n = self._continue(x[i - 1], table[i - 1], table[i])
+                iterations[i] += n
+        return Solution(self, values, x, converged, iterations)
+
+
+@dataclass(frozen=True)
+class Solution:
+    """
+    DC 해 (동작점 P개).
+
+    - values: sweep한 source 값 shape (P,) (동작점 해법이면 nan)
+    - x: 미지수 shape (P, size), converged / iterations: 동작점별 수렴 여부와 Newton 반복 횟수
+    """
+    system: System
+    values: np.ndarray
+    x: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+    def voltage(self, node):
+        """노드 전압 (V), shape (P,)."""
+        if str(node) == GROUND:
+            return np.zeros(len(self.x))
+        return self.x[:, self.system.circuit.nodes.index(str(node))]
+
+    def current(self, source):
+        """전압원 전류 (A, + 단자에서 source로 들어가는 방향), shape (P,)."""
+        names = [e[0] for e in self.system.circuit.vsources]
+        return self.x[:, self.system.n + names.index(source)]
+
+    def device(self, name):
+        """
+        소자 하나의 단자 전압과 전류, shape (P,) 배열 dict.
+        MOSFET: Vgs, Vds, Id / BJT: V_BE, V_CB, V_CE, I_C, I_B, I_E
+        """
+        circuit = self.system.circuit
+        mos = [m.name for m in circuit.mosfets]
+        if name in mos:
+            k = mos.index(name)
+            d, g, s = (self.voltage(v) for v in circuit.mosfets[k].nodes)
+            return {"Vgs": g - s, "Vds": d - s, "Id": self.system.mosfet_currents(self.x)[:, k]}
+        bjts = [q.name for q in circuit.bjts]
+        if name in bjts:
+            k = bjts.index(name)
+            c, b, e = (self.voltage(v) for v in circuit.bjts[k].nodes)
+            I = self.system.bjt_currents(self.x)[:, k]
+            return {"V_BE": b - e, "V_CB": c - b, "V_CE": c - e,
+                    "I_C": I[:, 0], "I_B": I[:, 1], "I_E": I[:, 0] + I[:, 1]}
+        raise ValueError(f"회로에 없는 소자: {name}")
+
+
+# --- 기본 회로 -------------------------------------------------------------
+
+def common_source(V_DD, R_D, V_in, device=None):
+    """저항 부하 common-source 증폭기: V_in -> gate, drain (out) -> R_D -> V_DD."""
+    return (Circuit()
+            .vsource("V_DD", "vdd", GROUND, V_DD)
+            .vsource("V_in", "in", GROUND, V_in)
+            .resistor("R_D", "vdd", "out", R_D)
+            .mosfet("M1", "out", "in", GROUND, **(device or {})))
+
+
+def common_emitter(V_CC, R_C, R_B, V_in, params=None, model="gummel-poon"):
+    """저항 부하 common-emitter 증폭기: V_in -> R_B -> base, collector (out) -> R_C -> V_CC."""
+    return (Circuit()
+            .vsource("V_CC", "vcc", GROUND, V_CC)
+            .vsource("V_in", "in", GROUND, V_in)
+            .resistor("R_B", "in", "base", R_B)
+            .resistor("R_C", "vcc", "out", R_C)
+            .bjt("Q1", "out", "base", GROUND, params, model))
+
+
+def mosfet_mirror(I_ref, V_out, device=None):
+    """MOSFET 전류 거울: I_ref -> diode 연결 M1, 같은 gate의 M2 drain (out)은 V_out에 연결."""
+    return (Circuit()
+            .isource("I_ref", GROUND, "gate", I_ref)
+            .vsource("V_out", "out", GROUND, V_out)
+            .mosfet("M1", "gate", "gate", GROUND, **(device or {}))
+            .mosfet("M2", "out", "gate", GROUND, **(device or {})))
+
+
+def bjt_mirror(I_ref, V_out, params=None, model="gummel-poon"):
+    """BJT 전류 거울: I_ref -> diode 연결 Q1, 같은 base의 Q2 collector (out)는 V_out에 연결."""
+    return (Circuit()
+            .isource("I_ref", GROUND, "base", I_ref)
+            .vsource("V_out", "out", GROUND, V_out)
+            .bjt("Q1", "base", "base", GROUND, params, model)
+            .bjt("Q2", "out", "base", GROUND, params, model))
@@ -0,0 +1,404 @@
+"""
+측정 I-V 데이터로부터 MOSFET / BJT 모델 파라미터를 추출하는 batch Levenberg-Marquardt.
+
+측정 파일 (.csv 또는 .npz)은 측정 점마다 한 행인 긴 형식이다. device 열이 같은 행이 한 소자의
+측정이고, device 열이 없으면 파일 하나가 한 소자 (이름은 파일 이름)다.
+
+- mosfet: Vgs, Vds, Id 열과 소자 상수 W, L, N_D, N_A, T, t_ox 열 (선택, 없으면 sweep 기본값)
+- bjt: V_BE, V_CB 열, I_C와 I_E 중 하나 이상, default_params의 모델 파라미터 열 (선택)
+
+맞출 파라미터는 mosfet이면 Vt, Cox, mu_eff 또는 calculate_mobility_sic의 이동도 상수,
+bjt면 default_params의 Gummel-Poon 파라미터 (I_S, V_T, VAF (Early 전압), BF, ...)다.
+Id는 mu_eff * Cox에만 의존하므로 둘을 함께 맞추면 곱만 정해진다.
+
+소자마다 측정 점 개수가 다르므로 batch 안의 소자는 가장 긴 소자에 맞춰 가중치 0인 점으로 채우고,
+batch 전체를 shape (소자, 점) 배열로 한 번에 계산한다. Jacobian은 파라미터마다 한 칸씩 움직인
+모델을 shape (소자, 파라미터, 점) 배열의 한 번의 모델 호출로 구하는 batch 전진 차분이고,
+LM 단계는 소자별 정규 방정식 (JᵀJ + λ diag(JᵀJ)) δ = -Jᵀr를 np.linalg.solve로 한꺼번에 푼다.
+damping λ는 소자마다 따로 조절하고, 수렴한 소자는 다음 반복부터 계산에서 뺀다.
+Vt 외의 파라미터는 양수이므로 log 공간에서 맞춘다.
+
+잔차는 측정 전류 대비 상대 오차이다. 차단 영역의 0 근처 전류가 잔차를 지배하지 않도록
+소자별 최대 전류의 FLOOR 배를 분모에 더한다. batch는 ProcessPoolExecutor로 나누어 계산한다.
+
+사용법::
+
+    python -m semisim.extract lot42/*.csv -o params.csv --jobs 4
+    python -m semisim.extract gummel.npz -o params.csv --device bjt --fit I_S V_T VAF BF
+
+    result = extract(load_measurements(paths), "mosfet", fit=("Vt", "mu_eff"))
+    result.rows()      # [{"device": ..., "Vt": ..., "mu_eff": ..., "rms": ..., ...}, ...]
+"""
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from semisim.bjt import terminal_currents
+from semisim.mobility import SIC_PARAMS, calculate_mobility_sic, effective_mobility, mobility_bulk
+from semisim.mosfet import calculate_id
+from semisim.poisson import oxide_capacitance, threshold_voltage
+from semisim.sweep import DEVICES as SWEEP_DEVICES
+from semisim.sweep import imap_ordered
+
+# 소자별 바이어스 열, 측정 전류 열, 기본으로 맞추는 파라미터
+DEVICES = {
+    "mosfet": {"bias": ("Vgs", "Vds"), "outputs": ("Id",), "fit": ("Vt", "mu_eff")},
+    "bjt": {"bias": ("V_BE", "V_CB"), "outputs": ("I_C", "I_E"), "fit": ("I_S", "V_T", "VAF", "BF")},
+}
+
+LINEAR = ("Vt",)  # log 공간이 아닌 선형 공간에서 맞추는 파라미터
+FLOOR = 1e-3  # 잔차 분모에 더하는 소자별 최대 전류 비율
+ON_RATIO = 1e-2  # Vt 초기값: 최대 Id의 이 비율을 넘는 가장 낮은 Vgs
+
+STEP = 1e-6  # 전진 차분 간격 (log 파라미터는 상대 간격)
+LAMBDA0 = 1e-3
+LAMBDA_UP = 10.0
+LAMBDA_DOWN = 0.1
+LAMBDA_MAX = 1e10  # 이보다 커지면 더 줄일 수 없는 (극소) 점으로 보고 멈춘다
+MAX_STEP = 1.0  # 한 번의 LM 단계에서 파라미터의 최대 변화 (log 파라미터는 e배, Vt는 V)
+TOL = 1e-10  # 상대 cost 감소가 이보다 작으면 수렴
+MAX_ITER = 100
+BATCH_SIZE = 1000  # worker 작업 하나의 소자 수
+
+
+def constants(device):
+    """소자 상수 열 이름과 기본값 (sweep CLI의 입력 기본값에서 바이어스를 뺀 것)."""
+    bias = DEVICES[device]["bias"]
+    return {name: value for name, value in SWEEP_DEVICES[device]["inputs"].items()
+            if name not in bias and value is not None}
+
+
+def parameters(device):
+    """device에서 맞출 수 있는 파라미터 이름."""
+    if device == "mosfet":
+        return ("Vt", "Cox", "mu_eff") + tuple(SIC_PARAMS)
+    return tuple(constants(device))
+
+
+def _currents(device, values, bias, const):
+    """
+    맞추는 파라미터 values와 고정 상수 const에서의 모델 전류 {열 이름: 배열}.
+    values, bias, const는 서로 broadcast 가능한 배열 dict이다.
+    """
+    p = dict(const, **values)
+    if device == "mosfet":
+        mobility = {name: p[name] for name in SIC_PARAMS if name in values}
+        if mobility:
+            mu_e, mu_h = calculate_mobility_sic(p["N_D"], p["N_A"], p["T"], **dict(SIC_PARAMS, **mobility))
+            p["mu_eff"] = effective_mobility(mu_e, mu_h)
+        Id = calculate_id(bias["Vgs"], bias["Vds"], p["W"], p["L"], p["N_D"], p["N_A"], p["T"],
+                          Vt=p["Vt"], Cox=p["Cox"], mu_eff=p["mu_eff"], t_ox=p["t_ox"])
+        return {"Id": Id}
+    I_C, _, I_E = terminal_currents(bias["V_BE"], np.negative(bias["V_CB"]), p)
+    return {"I_C": I_C, "I_E": I_E}
+
+
+# --- 측정 데이터 ----------------------------------------------------------
+
+def _read(path):
+    path = Path(path)
+    if path.suffix.lower() == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in data.files}
+    if path.suffix.lower() != ".csv":
+        raise ValueError(f"지원하지 않는 측정 파일 형식: {path.suffix} (.csv, .npz)")
+    with open(path, encoding="utf-8") as file:
+        header = next(csv.reader(file))
+    names = [name.strip() for name in header]
+    numeric = [i for i, name in enumerate(names) if name != "device"]
+    values = np.loadtxt(path, delimiter=",", skiprows=1, usecols=numeric, ndmin=2)
+    columns = {names[i]: values[:, j] for j, i in enumerate(numeric)}
+    if "device" in names:
+        columns["device"] = np.loadtxt(path, delimiter=",", skiprows=1, usecols=names.index("device"),
+                                       dtype=str, ndmin=1)
+    return columns
+
+
+def load_measurements(paths):
+    """
+    측정 파일들을 읽어 하나의 열 dict로 합친다.
+
+    Parameters:
+    - paths: .csv / .npz 파일 경로 (또는 그 목록)
+
+    Returns:
+    - {열 이름: shape (점,) 배열} dict. "device" 열은 소자 이름 문자열이고,
+      일부 파일에만 있는 열은 나머지 파일의 점을 nan으로 채운다 (소자 상수는 기본값으로 대체된다).
+    """
+    paths = [paths] if isinstance(paths, (str, Path)) else list(paths)
+    parts = []
+    for path in paths:
+        columns = _read(path)
+        n = len(next(iter(columns.values())))
+        columns["device"] = np.asarray(columns.get("device", np.full(n, Path(path).stem))).astype(str)
+        parts.append(columns)
+    names = list(dict.fromkeys(name for columns in parts for name in columns))
+    return {name: np.concatenate([columns.get(name, np.full(len(columns["device"]), np.nan))
+                                  for columns in parts]) for name in names}
+
+
+def _group(device_ids):
+    """
+    소자별 점 인덱스를 (소자, 가장 긴 소자의 점 개수) 격자로 모은다.
+
+    Returns:
+    - 소자 이름, 점 인덱스 (채운 칸은 그 소자의 첫 점), 유효한 칸 mask
+    """
+    order = np.argsort(device_ids, kind="stable")
+    names, start, counts = np.unique(device_ids[order], return_index=True, return_counts=True)
+    position = np.arange(counts.max())
+    valid = position[np.newaxis, :] < counts[:, np.newaxis]
+    index = start[:, np.newaxis] + np.where(valid, position[np.newaxis, :], 0)
+    return names, order[index], valid
+
+
+def _initial(device, names, bias, measured, const, valid, initial):
+    """파라미터 초기값 shape (소자, 파라미터). initial에 없는 값은 측정 데이터와 기본값에서 정한다."""
+    guess = {name: const[name] for name in names if name in const}
+    if device == "mosfet":
+        for name in SIC_PARAMS:
+            guess[name] = np.full(len(valid), float(SIC_PARAMS[name]))
+        if "Vt" in names:
+            # 최대 Id의 ON_RATIO를 넘는 가장 낮은 Vgs (Vt보다 조금 위)
+            Id = np.where(valid, np.abs(measured["Id"]), 0.0)
+            on = valid & (Id > ON_RATIO * Id.max(axis=1, keepdims=True))
+            guess["Vt"] = np.where(on, bias["Vgs"], np.inf).min(axis=1)
+    elif "I_S" in names:
+        # 가장 큰 전류의 점에서 이상적인 다이오드 식을 거꾸로 푼다
+        current = measured["I_E" if "I_E" in measured else "I_C"]
+        current = np.where(valid, np.abs(current), 0.0)
+        peak = current.argmax(axis=1)[:, np.newaxis]
+        V_BE = np.take_along_axis(bias["V_BE"], peak, axis=1)[:, 0]
+        slope = const["NF"] * (initial.get("V_T", const["V_T"]))
+        guess["I_S"] = np.take_along_axis(current, peak, axis=1)[:, 0] / np.expm1(V_BE / slope)
+    values = np.stack([np.broadcast_to(np.asarray(initial.get(name, guess[name]), dtype=float), len(valid))
+                       for name in names], axis=1)
+    log_space = np.array([name not in LINEAR for name in names])
+    if np.any(~np.isfinite(values)) or np.any(values[:, log_space] <= 0):
+        raise ValueError("파라미터 초기값을 정할 수 없는 소자가 있습니다 (initial로 지정하세요)")
+    return np.where(log_space, np.log(np.where(log_space, values, 1.0)), values)
+
+
+# --- Levenberg-Marquardt ---------------------------------------------------
+
+def _fit_batch(task):
+    """
+    batch 하나의 LM 반복 (프로세스 풀에서 pickle 가능한 최상위 함수).
+
+    Returns:
+    - 파라미터 shape (소자, 파라미터), rms 상대 잔차, 최대 상대 잔차, 반복 횟수, 수렴 여부
+    """
+    device, names, bias, measured, const, valid, u, max_iter = task
+    log_space = np.array([name not in LINEAR for name in names])
+    scale = {key: np.abs(value) + FLOOR * np.where(valid, np.abs(value), 0.0).max(axis=1, keepdims=True)
+             for key, value in measured.items()}
+
+    def residual(u, rows):
+        """u: shape (소자, k, 파라미터) -> shape (소자, k, 출력 x 점)의 가중 잔차"""
+        # 받아들이지 않을 시험 단계에서 생기는 overflow는 cost가 nan / inf가 되어 걸러진다
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            p = np.where(log_space, np.exp(u), u)
+            values = {name: p[..., i:i + 1] for i, name in enumerate(names)}
+            model = _currents(device,
+                              values,
+                              {key: value[rows, np.newaxis, :] for key, value in bias.items()},
+                              {key: value[rows, np.newaxis, np.newaxis] for key, value in const.items()})
+            w = valid[rows, np.newaxis, :]
+            return np.concatenate([
+                np.where(w, (model[key] - measured[key][rows, np.newaxis, :]) / scale[key][rows, np.newaxis, :], 0.0)
+                for key in measured], axis=-1)
+
+    n_devices, n_params = u.shape
+    u = u.copy()
+    r = residual(u[:, np.newaxis, :], np.arange(n_devices))[:, 0]
+    cost = np.sum(r * r, axis=1)
+    lam = np.full(n_devices, LAMBDA0)
+    done = ~np.isfinite(cost)
+    converged = np.zeros(n_devices, dtype=bool)
+    iterations = np.zeros(n_devices, dtype=int)
+    eye = np.eye(n_params)
+
+    for _ in range(max_iter):
+        rows = np.nonzero(~done)[0]
+        if len(rows) == 0:
+            break
+        # batch 전진 차분 Jacobian (전치): shape (소자, 파라미터, 잔차)
+        Jt = (residual(u[rows, np.newaxis, :] + STEP * eye, rows) - r[rows, np.newaxis, :]) / STEP
+        A = Jt @ Jt.transpose(0, 2, 1)
+        g = Jt @ r[rows, :, np.newaxis]
+        diag = np.diagonal(A, axis1=1, axis2=2)
+        diag = np.maximum(diag, 1e-12 * diag.max(axis=1, keepdims=True) + 1e-300)
+        delta = -np.linalg.solve(A + lam[rows, np.newaxis, np.newaxis] * diag[:, :, np.newaxis] * eye, g)[..., 0]
+        # 민감도가 작은 파라미터 (예: 큰 BF)가 한 번에 멀리 달아나 기울기가 사라지지 않게 단계 크기를 제한한다
+        delta *= np.minimum(1.0, MAX_STEP / np.maximum(np.abs(delta).max(axis=1, keepdims=True), 1e-300))
+
+        trial = u[rows] + delta
+        r_trial = residual(trial[:, np.newaxis, :], rows)[:, 0]
+        with np.errstate(over="ignore", invalid="ignore"):
+            cost_trial = np.sum(r_trial * r_trial, axis=1)
+        better = np.isfinite(cost_trial) & (cost_trial < cost[rows])
+        small = better & ((cost[rows] - cost_trial <= TOL * cost[rows]) | (np.abs(delta).max(axis=1) < TOL))
+
+        accepted = rows[better]
+        u[accepted] = trial[better]
+        r[accepted] = r_trial[better]
+        cost[accepted] = cost_trial[better]
+        lam[rows] = np.where(better, lam[rows] * LAMBDA_DOWN, lam[rows] * LAMBDA_UP)
+        iterations[rows] += 1
+        # 더 줄일 수 없으면 (λ 폭주) 극소 점에 도달한 것으로 본다
+        finished = small | (lam[rows] > LAMBDA_MAX)
+        converged[rows] = finished
+        done[rows] = finished
+
+    counts = np.maximum(valid.sum(axis=1) * len(measured), 1)
+    rms = np.sqrt(cost / counts)
+    max_error = np.abs(r).max(axis=1)
+    return np.where(log_space, np.exp(u), u), rms, max_error, iterations, converged
+
+
+@dataclass(frozen=True)
+class FitResult:
+    """
+    파라미터 추출 결과 (소자 순서는 소자 이름 정렬 순서).
+
+    - devices: 소자 이름, shape (소자,)
+    - names: 맞춘 파라미터 이름
+    - params: shape (소자, 파라미터)
+    - rms, max_error: 측정 전류 대비 상대 잔차의 rms와 최댓값
+    - iterations, converged: LM 반복 횟수와 수렴 여부
+    """
+    device: str
+    devices: np.ndarray
+    names: tuple
+    params: np.ndarray
+    rms: np.ndarray
+    max_error: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __getitem__(self, name):
+        """파라미터 name의 소자별 값."""
+        return self.params[:, self.names.index(name)]
+
+    def columns(self):
+        """표의 열 이름."""
+        return ("device",) + self.names + ("rms", "max_error", "iterations", "converged")
+
+    def rows(self):
+        """소자별 파라미터 표 [{열 이름: 값}, ...]."""
+        return [dict(zip(self.columns(), (str(device), *map(float, values), float(rms), float(error),
+                                          int(iterations), bool(converged))))
+                for device, values, rms, error, iterations, converged in
+                zip(self.devices, self.params, self.rms, self.max_error, self.iterations, self.converged)]
+
+    def write_csv(self, path):
+        """파라미터 표를 CSV로 저장 ("-"이면 표준 출력)."""
+        file = sys.stdout if path == "-" else open(path, "w", encoding="utf-8", newline="")
+        try:
+            writer = csv.writer(file)
+            writer.writerow(self.columns())
+            for row in self.rows():
+                writer.writerow([f"{value:.9g}" if isinstance(value, float) else value for value in row.values()])
+        finally:
+            if file is not sys.stdout:
+                file.close()
+
+
+def extract(columns, device="mosfet", fit=None, initial=None, jobs=1, batch_size=BATCH_SIZE, max_iter=MAX_ITER):
+    """
+    측정 데이터의 모든 소자에 대해 모델 파라미터를 맞춘다.
+
+    Parameters:
+    - columns: load_measurements 형식의 열 dict (device 열이 없으면 전체가 한 소자)
+    - device: "mosfet" 또는 "bjt"
+    - fit: 맞출 파라미터 이름 목록 (기본값: DEVICES[device]["fit"]), 나머지는 소자 상수로 고정
+    - initial: {파라미터 이름: 초기값 (스칼라 또는 소자별 배열)}, 없으면 측정 데이터와 기본값에서 정한다
+    - jobs: 프로세스 수 (1이면 현재 프로세스에서 계산)
+    - batch_size: worker 작업 하나의 소자 수
+    - max_iter: 소자별 최대 LM 반복 횟수
+
+    Returns:
+    - FitResult
+    """
+    if device not in DEVICES:
+        raise ValueError(f"지원하지 않는 소자: {device} ({', '.join(DEVICES)})")
+    spec = DEVICES[device]
+    names = tuple(fit or spec["fit"])
+    unknown = set(names) - set(parameters(device))
+    if unknown:
+        raise ValueError(f"{device}에서 맞출 수 없는 파라미터: {sorted(unknown)}")
+    if "mu_eff" in names and set(names) & set(SIC_PARAMS):
+        raise ValueError("mu_eff와 이동도 상수는 함께 맞출 수 없습니다")
+    outputs = tuple(name for name in spec["outputs"] if name in columns)
+    missing = [name for name in spec["bias"] if name not in columns] + ([] if outputs else list(spec["outputs"]))
+    if missing:
+        raise ValueError(f"측정 데이터에 필요한 열이 없습니다: {missing}")
+
+    n = len(columns[spec["bias"][0]])
+    device_ids = np.asarray(columns.get("device", np.zeros(n, dtype=int))).astype(str)
+    devices, index, valid = _group(device_ids)
+    bias = {name: np.asarray(columns[name], dtype=float)[index] for name in spec["bias"]}
+    measured = {name: np.asarray(columns[name], dtype=float)[index] for name in outputs}
+    # 소자 상수는 소자의 첫 점 값 (열이 없거나 nan이면 기본값)
+    const = {}
+    for name, default in constants(device).items():
+        value = np.asarray(columns.get(name, np.full(n, np.nan)), dtype=float)[index[:, 0]]
+        const[name] = np.where(np.isnan(value), default, value)
+    if device == "mosfet":
+        const["Vt"] = threshold_voltage(const["N_A"], const["t_ox"], const["T"])
+        const["Cox"] = oxide_capacitance(const["t_ox"])
+        const["mu_eff"] = mobility_bulk(const["N_D"], const["N_A"], const["T"])[2]
+    u = _initial(device, names, bias, measured, const, valid, dict(initial or {}))
+
+    tasks = []
+    for start in range(0, len(devices), batch_size):
+        rows = slice(start, start + batch_size)
+        # batch 안에서 가장 긴 소자까지만 남긴다
+        width = int(valid[rows].sum(axis=1).max())
+        tasks.append((device, names,
+                      {key: value[rows, :width] for key, value in bias.items()},
+                      {key: value[rows, :width] for key, value in measured.items()},
+                      {key: value[rows] for key, value in const.items()},
+                      valid[rows, :width], u[rows], max_iter))
+    params, rms, max_error, iterations, converged = (
+        np.concatenate(part) for part in zip(*imap_ordered(_fit_batch, tasks, jobs)))
+    return FitResult(device, devices, names, params, rms, max_error, iterations, converged)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.extract", description="MOSFET / BJT 파라미터 추출")
+    parser.add_argument("paths", nargs="+", help="측정 파일 (.csv, .npz)")
+    parser.add_argument("-o", "--output", default="-", help="파라미터 표 CSV (기본값: 표준 출력)")
+    parser.add_argument("--device", choices=list(DEVICES), default="mosfet")
+    parser.add_argument("--fit", nargs="+", help="맞출 파라미터 (기본값: mosfet Vt mu_eff, bjt I_S V_T VAF BF)")
+    parser.add_argument("--jobs", type=int, default=1, help="프로세스 수 (기본값: 1)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"작업 하나의 소자 수 (기본값: {BATCH_SIZE})")
+    parser.add_argument("--max-iter", type=int, default=MAX_ITER, help=f"최대 LM 반복 횟수 (기본값: {MAX_ITER})")
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs는 1 이상이어야 합니다")
+
+    start = time.perf_counter()
+    try:
+        result = extract(load_measurements(args.paths), args.device, args.fit, jobs=args.jobs,
+                         batch_size=args.batch_size, max_iter=args.max_iter)
+    except (ValueError, OSError) as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - start
+    result.write_csv(args.output)
+    print(f"{len(result):,}개 소자, 수렴 {int(result.converged.sum()):,}, 상대 잔차 rms 중앙값 "
+          f"{np.median(result.rms):.2e}, {elapsed:.2f} s (소자당 {elapsed / len(result) * 1e3:.3f} ms)",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+페이지 계산용 반응형 의존성 그래프.
+
+Streamlit은 위젯이 바뀔 때마다 페이지 스크립트 전체를 다시 실행한다. 파생 값 (이동도, Id 격자,
+그래프 이미지 등)을 입력을 선언한 노드로 정의하면, 세션별로 노드 결과를 기억해 두었다가
+바뀐 파라미터의 하류 노드만 다시 계산한다.
+
+    graph = Graph("mosfet")
+
+    @graph.node("N_D", "N_A", "T")
+    def mobility(N_D, N_A, T):
+        ...
+
+    @graph.figure("mosfet_output", "output_curves")
+    def draw_output(fig, curves):
+        ...
+
+    run = graph.run({"N_D": ..., "N_A": ..., "T": ...})   # 이번 rerun의 파라미터
+    st.image(run["draw_output"])                            # 필요한 노드만 (지연) 계산
+    run.ran                                                  # 이번 rerun에서 실행된 노드
+
+노드 함수는 선언한 입력에만 의존하는 순수 함수여야 하고, 결과 값을 바꾸면 안 된다. 노드마다 값의
+version을 두고, 입력 version이 그대로면 기억한 값을 재사용한다. cutoff=True인 노드는 다시 계산한
+값이 이전과 같으면 version을 올리지 않아 하류 노드가 다시 실행되지 않는다 (예: n_curves > 1일 때
+Vgs slider가 바뀌어도 Vgs 곡선 목록은 그대로다).
+
+세션의 기억 값에 없는 노드는 상류 파라미터 값을 키로 하는 프로세스 전역 캐시 (semisim.cache)에서
+먼저 찾는다. 다른 세션이 같은 파라미터로 이미 계산한 값은 다시 계산하지 않는다.
+"""
+from dataclasses import dataclass, field
+
+from semisim import profiler
+from semisim.cache import shared_cache
+from semisim.render import canonical_key, render
+
+SESSION_PREFIX = "_semisim_graph_"
+NODE_CACHE_BYTES = 128 * 1024 * 1024  # 세션 공유 노드 값 캐시 크기 상한
+
+node_cache = shared_cache("graph", NODE_CACHE_BYTES)
+
+
+@dataclass
+class _Node:
+    func: object
+    inputs: tuple
+    cutoff: bool = False
+    kind: str = None  # 그래프 이미지 노드이면 render 종류 이름
+    render_kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class GraphState:
+    """한 세션의 그래프 상태: 직전 파라미터, 노드/파라미터 version, 노드별 기억 값."""
+    params: dict = field(default_factory=dict)
+    versions: dict = field(default_factory=dict)
+    memo: dict = field(default_factory=dict)  # 노드 이름 -> (입력 version tuple, 값)
+
+
+class Graph:
+    """노드 정의 모음. 페이지 스크립트에서 매 rerun마다 같은 이름으로 다시 정의해도 된다."""
+
+    def __init__(self, name):
+        self.name = name
+        self.nodes = {}
+
+    def node(self, *inputs, name=None, cutoff=False):
+        """
+        노드 등록 decorator.
+
+        Parameters:
+        - inputs: 입력 이름 (파라미터 또는 다른 노드), 함수에 같은 순서의 위치 인자로 전달된다
+        - name: 노드 이름 (기본값: 함수 이름)
+        - cutoff: 다시 계산한 값이 이전과 같으면 하류 노드를 무효화하지 않는다
+        """
+        def decorator(func):
+            self.nodes[name or func.__name__] = _Node(func, inputs, cutoff)
+            return func
+        return decorator
+
+    def figure(self, kind, *inputs, name=None, **render_kwargs):
+        """
+        그래프 이미지 노드 등록 decorator. draw(fig, *inputs)로 그린 이미지 bytes가 노드 값이다.
+        이미지는 상류 파라미터 값으로 render 캐시에 저장되므로 세션 사이에서도 공유된다.
+        """
+        def decorator(draw):
+            self.nodes[name or draw.__name__] = _Node(draw, inputs, kind=kind, render_kwargs=render_kwargs)
+            return draw
+        return decorator
+
+    def upstream_params(self, name):
+        """노드가 (간접적으로) 의존하는 파라미터 이름 집합."""
+        if name not in self.nodes:
+            return {name}
+        result = set()
+        for source in self.nodes[name].inputs:
+            result |= self.upstream_params(source)
+        return result
+
+    def downstream(self, names):
+        """주어진 파라미터/노드에 (간접적으로) 의존하는 노드 이름 집합."""
+        result = set()
+        frontier = set(names)
+        while frontier:
+            frontier = {n for n, node in self.nodes.items() if frontier & set(node.inputs)} - result
+            result |= frontier
+        return result
+
+    def session(self, params, state):
+        """state (GraphState)를 이어받아 이번 rerun의 파라미터로 Run을 만든다."""
+        return Run(self, params, state)
+
+    def run(self, params):
+        """Streamlit 세션 상태에 그래프 상태를 보관하는 Run."""
+        import streamlit as st
+        key = SESSION_PREFIX + self.name
+        if key not in st.session_state:
+            st.session_state[key] = GraphState()
+        return self.session(params, st.session_state[key])
+
+
+def _same(a, b):
+    """cutoff 비교: 정규화한 값이 같은지 (numpy 배열, float 잡음 포함)."""
+    try:
+        return canonical_key("", a) == canonical_key("", b)
+    except TypeError:
+        return False
+
+
+class Run:
+    """한 rerun 동안의 지연 평가. run[노드 이름]으로 값을 얻는다."""
+
+    def __init__(self, graph, params, state):
+        self.graph = graph
+        self.params = params
+        self.state = state
+        self.ran = []  # 이번 rerun에서 실행된 노드 (실행 순서)
+        self.shared = []  # 다른 세션이 계산해 둔 값을 공유 캐시에서 가져온 노드
+        self.reused = []  # 기억 값을 재사용한 노드
+        self._current = set()
+
+        self.changed = [p for p, value in params.items()
+                        if p not in state.params or not _same(state.params[p], value)]
+        for p in self.changed:
+            state.versions[p] = state.versions.get(p, 0) + 1
+        state.params = dict(params)
+
+    def __getitem__(self, name):
+        if name in self.params:
+            return self.params[name]
+        node = self.graph.nodes[name]
+        if name in self._current:
+            return self.state.memo[name][1]
+
+        values = [self[source] for source in node.inputs]
+        deps = tuple(self.state.versions.get(source, 0) for source in node.inputs)
+        memo = self.state.memo.get(name)
+        if memo is not None and memo[0] == deps:
+            value = memo[1]
+            self.reused.append(name)
+        else:
+            with profiler.section(f"graph: {name}"):
+                value, computed = self._evaluate(name, node, values)
+            (self.ran if computed else self.shared).append(name)
+            if memo is None or not (node.cutoff and _same(memo[1], value)):
+                self.state.versions[name] = self.state.versions.get(name, 0) + 1
+        self.state.memo[name] = (deps, value)
+        self._current.add(name)
+        return value
+
+    def _evaluate(self, name, node, values):
+        """
+        노드 값을 상류 파라미터 값을 키로 공유 캐시에서 찾거나 계산한다.
+
+        Returns:
+        - 값, 이 세션에서 직접 계산했는지 여부
+        """
+        params = {p: self.params[p] for p in sorted(self.graph.upstream_params(name))}
+        computed = []
+
+        def call(*args):
+            computed.append(True)
+            return node.func(*args, *values)
+
+        if node.kind is None:
+            value = node_cache.get_or_compute(canonical_key(f"{self.graph.name}/{name}", params), call)
+        else:  # 그래프 이미지는 render 캐시가 공유한다
+            value = render(node.kind, params, call, **node.render_kwargs)
+        return value, bool(computed)
+
+    def report(self):
+        """이번 rerun 요약: 바뀐 파라미터, 무효화된 (하류) 노드, 실행된 노드, 공유 캐시 노드, 재사용된 노드."""
+        return {
+            "changed": list(self.changed),
+            "invalidated": sorted(self.graph.downstream(self.changed)),
+            "ran": list(self.ran),
+            "shared": list(self.shared),
+            "reused": list(self.reused),
+        }
+
+    def panel(self, label="계산 그래프"):
+        """사이드바에 이번 rerun에서 실행된 노드를 표시."""
+        import streamlit as st
+        with st.sidebar.expander(label):
+            st.caption(f"바뀐 입력: {', '.join(self.changed) or '-'}")
+            st.caption(f"실행: {', '.join(self.ran) or '-'}")
+            st.caption(f"공유 캐시: {', '.join(self.shared) or '-'}")
+            st.caption(f"재사용: {', '.join(self.reused) or '-'}")
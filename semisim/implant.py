@@ -0,0 +1,311 @@
+"""
+N+ 소스/드레인의 이온 주입과 열확산 (공정 15단계).
+
+웨이퍼 단면 (x: 가로, y: 깊이, µm)의 균일 격자에서
+
+1. 이온 주입: 마스크 개구부 (앞 단계의 패턴/식각으로 Si가 드러난 곳)를 통한 깊이 방향
+   Gaussian 또는 Pearson IV 분포와, 개구부 가장자리의 가로 방향 Gaussian 퍼짐 (lateral straggle)
+2. 열확산: ∂C/∂t = D (∂²C/∂x² + ∂²C/∂y²), D = D0 exp(-Ea / kT) (진성 확산 계수)
+
+확산은 Peaceman-Rachford ADI로 푼다. 반 step마다 한 방향만 implicit으로 풀고, 각 방향은 모든
+행 (또는 열)을 한 번에 푸는 3중 대각 batch 해법 (poisson.solve_tridiagonal)이다. ADI는 무조건
+안정이므로 큰 time step을 쓸 수 있고, 주입 직후의 뾰족한 분포에서 진동이 생기지 않도록 step
+크기를 등비로 늘린다. 경계는 모두 flux가 없는 (도펀트가 빠져나가지 않는) 조건이다.
+
+결과로 접합 깊이 (C = N_A인 깊이), 게이트 아래로 들어간 가로 확산 길이, MOSFET 모델에 넣을
+소스/드레인 평균 농도 N_D를 얻는다.
+
+    result = source_drain("As", 50.0, 5e15, anneal_C=1000.0, anneal_min=30.0, N_A=1e16)
+    result.junction_depth, result.N_D
+"""
+import functools
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from semisim.poisson import K_B, solve_tridiagonal
+
+# 이온별 Si 내 주입 거리 (에너지 keV -> 투사 거리 Rp, 깊이 방향 표준편차 ΔRp, 가로 표준편차 ΔR⊥, µm)
+# 와 Pearson 분포의 왜도 γ, 첨도 β
+ION_RANGES = {
+    "As": {
+        "energy": (10.0, 20.0, 30.0, 50.0, 100.0, 200.0),
+        "Rp": (0.0097, 0.0159, 0.0215, 0.0322, 0.0582, 0.1099),
+        "dRp": (0.0036, 0.0059, 0.0080, 0.0118, 0.0207, 0.0373),
+        "dRl": (0.0027, 0.0044, 0.0060, 0.0088, 0.0155, 0.0283),
+        "gamma": 0.25,
+        "beta": 3.3,
+    },
+    "P": {
+        "energy": (10.0, 20.0, 30.0, 50.0, 100.0, 200.0),
+        "Rp": (0.0139, 0.0253, 0.0368, 0.0607, 0.1238, 0.2539),
+        "dRp": (0.0069, 0.0119, 0.0166, 0.0256, 0.0456, 0.0775),
+        "dRl": (0.0050, 0.0088, 0.0125, 0.0197, 0.0363, 0.0644),
+        "gamma": -0.4,
+        "beta": 3.6,
+    },
+}
+
+# 진성 확산 계수 D = D0 exp(-Ea / kT): (D0 cm^2/s, Ea eV)
+DIFFUSIVITY = {
+    "As": (22.9, 4.1),
+    "P": (3.85, 3.66),
+}
+
+MODELS = ("gaussian", "pearson")
+X_RANGE = (-2.0, 2.0)  # 단면 가로 범위 (µm), 공정 엔진의 웨이퍼 x 범위와 같다
+DEPTH = 0.5  # 단면 깊이 (µm)
+GRID = (500, 500)  # (깊이, 가로) 격자 점 개수
+DIFFUSION_STEPS = 24  # ADI time step 개수
+STEP_GROWTH = 1.3  # time step 등비 증가율
+CACHE_SIZE = 32
+
+
+def range_parameters(ion, energy):
+    """
+    에너지 (keV)에서의 주입 거리 파라미터. 표의 에너지 사이는 log-log 보간한다.
+
+    Returns:
+    - Rp, ΔRp, ΔR⊥ (µm), 왜도 γ, 첨도 β
+    """
+    table = ION_RANGES[ion]
+    log_E = np.log(table["energy"])
+    values = [float(np.exp(np.interp(np.log(energy), log_E, np.log(table[name])))) for name in ("Rp", "dRp", "dRl")]
+    return (*values, table["gamma"], table["beta"])
+
+
+def gaussian_profile(y, dose, Rp, dRp):
+    """깊이 y (µm)에서의 Gaussian 주입 농도 (cm^-3). dose는 cm^-2다."""
+    return dose / (math.sqrt(2 * math.pi) * dRp * 1e-4) * np.exp(-((y - Rp) ** 2) / (2 * dRp ** 2))
+
+
+def pearson_profile(y, dose, Rp, dRp, gamma, beta):
+    """
+    깊이 y (µm)에서의 Pearson IV 주입 농도 (cm^-3). 4개의 모멘트 (Rp, ΔRp, γ, β)를 맞추며,
+    모멘트가 Pearson IV 영역 밖이면 Gaussian으로 대신한다.
+    """
+    r = 6 * (beta - gamma ** 2 - 1) / (2 * beta - 3 * gamma ** 2 - 6)
+    discriminant = 16 * (r - 1) - gamma ** 2 * (r - 2) ** 2
+    if r <= 2 or discriminant <= 0:
+        return gaussian_profile(y, dose, Rp, dRp)
+    m = (r + 2) / 2
+    nu = -r * (r - 2) * gamma / math.sqrt(discriminant)
+    a = dRp * math.sqrt(discriminant) / 4
+    lam = Rp - (r - 2) * gamma * dRp / 4
+
+    def shape(u):
+        return (1 + u ** 2) ** -m * np.exp(-nu * np.arctan(u))
+
+    # 정규화 상수는 분포 전체를 덮는 조밀한 격자에서 수치 적분한다
+    u = (np.linspace(Rp - 20 * dRp, Rp + 20 * dRp, 4001) - lam) / a
+    norm = shape(u).sum() * (u[1] - u[0]) * a * 1e-4
+    return dose * shape((np.asarray(y) - lam) / a) / norm
+
+
+def implant_profile(y, dose, ion, energy, model="pearson"):
+    """깊이 y (µm)에서의 주입 농도 (cm^-3), model은 "gaussian" 또는 "pearson"."""
+    Rp, dRp, _, gamma, beta = range_parameters(ion, energy)
+    if model == "gaussian":
+        return gaussian_profile(y, dose, Rp, dRp)
+    return pearson_profile(y, dose, Rp, dRp, gamma, beta)
+
+
+_erf = np.vectorize(math.erf, otypes=[float])
+
+
+def lateral_profile(x, openings, dRl):
+    """
+    개구부 (x0, x1) 목록을 통과한 이온의 가로 방향 분포 (0 ~ 1).
+    가장자리에서 표준편차 ΔR⊥의 Gaussian으로 퍼진다.
+    """
+    x = np.asarray(x, dtype=float)
+    s = math.sqrt(2) * dRl
+    return sum(0.5 * (_erf((x - x0) / s) - _erf((x - x1) / s)) for x0, x1 in openings)
+
+
+def diffusivity(ion, T):
+    """온도 T (K)에서의 진성 확산 계수 (µm^2/s)."""
+    D0, Ea = DIFFUSIVITY[ion]
+    return D0 * np.exp(-Ea / (K_B * T)) * 1e8
+
+
+def _operator(n, r):
+    """Neumann 경계 (flux 0)의 유한 체적 2차 차분 -r δ² 의 3중 대각 계수 (lower, diag, upper)."""
+    lower = np.full(n, -r)
+    upper = np.full(n, -r)
+    diag = np.full(n, 2 * r)
+    diag[0] = diag[-1] = r
+    return lower, diag, upper
+
+
+def _explicit(C, r, axis):
+    """C + r δ² C (axis 방향, Neumann 경계)."""
+    flux = np.diff(C, axis=axis)
+    lap = np.zeros_like(C)
+    head = [slice(None)] * C.ndim
+    tail = [slice(None)] * C.ndim
+    head[axis], tail[axis] = slice(None, -1), slice(1, None)
+    lap[tuple(head)] += flux
+    lap[tuple(tail)] -= flux
+    return C + r * lap
+
+
+def _implicit(C, r):
+    """(I - r δ²) X = C 를 첫 축 방향으로 푼다 (나머지 축은 batch)."""
+    lower, diag, upper = _operator(C.shape[0], r)
+    return solve_tridiagonal(lower, 1 + diag, upper, C)
+
+
+def time_steps(t, steps=DIFFUSION_STEPS, growth=STEP_GROWTH):
+    """총 시간 t를 등비로 커지는 steps개의 time step으로 나눈다 (첫 step이 가장 작다)."""
+    return t * (growth - 1) / (growth ** steps - 1) * growth ** np.arange(steps)
+
+
+def diffuse(C, D, dx, dy, t, steps=DIFFUSION_STEPS):
+    """
+    2D 확산 방정식을 Peaceman-Rachford ADI로 푼다.
+
+    Parameters:
+    - C: shape (깊이, 가로)의 초기 농도
+    - D: 확산 계수 (µm^2/s)
+    - dx, dy: 가로, 깊이 격자 간격 (µm)
+    - t: 확산 시간 (s)
+    - steps: time step 개수
+
+    Returns:
+    - 시간 t 후의 농도 (C와 같은 shape)
+    """
+    C = np.asarray(C, dtype=float)
+    for dt in time_steps(t, steps):
+        rx = D * dt / (2 * dx ** 2)
+        ry = D * dt / (2 * dy ** 2)
+        # 가로 방향 implicit, 깊이 방향 explicit (격자 점 축이 연속 메모리가 되도록 전치해서 푼다)
+        C = _implicit(np.ascontiguousarray(_explicit(C, ry, axis=0).T), rx).T
+        # 깊이 방향 implicit, 가로 방향 explicit
+        C = _implicit(_explicit(C, rx, axis=1), ry)
+    return C
+
+
+def junction_depth(y, C, N_A):
+    """깊이 방향 분포 C(y)가 기판 농도 N_A와 만나는 깊이 (µm, log 보간). 접합이 없으면 0."""
+    below = np.nonzero(C < N_A)[0]
+    if len(below) == 0:
+        return float(y[-1])
+    i = below[0]
+    if i == 0:
+        return 0.0
+    c0, c1 = np.log(C[i - 1]), np.log(max(C[i], 1e-300))
+    return float(y[i - 1] + (y[i] - y[i - 1]) * (c0 - np.log(N_A)) / (c0 - c1))
+
+
+def source_drain_openings():
+    """
+    공정 엔진에서 구한 15단계 이온 주입 개구부 (x0, x1) 목록 (µm).
+    주입 창과 Si가 드러난 (산화막, 게이트가 덮지 않은) 영역의 교집합이다.
+    """
+    from semisim.process import default_engine
+    return default_engine().openings("implant")
+
+
+@dataclass(frozen=True)
+class ImplantResult:
+    """이온 주입과 확산 결과. 배열 필드는 shape (깊이, 가로)이다."""
+    ion: str
+    energy: float  # keV
+    dose: float  # cm^-2
+    model: str
+    anneal_C: float  # °C
+    anneal_min: float  # 분
+    N_A: float  # 기판 농도 (cm^-3)
+    openings: tuple  # 개구부 (x0, x1) 목록 (µm)
+    x: np.ndarray  # 가로 격자 (µm)
+    y: np.ndarray  # 깊이 격자 (µm)
+    as_implanted: np.ndarray  # 주입 직후 도너 농도 (cm^-3)
+    C: np.ndarray  # 확산 후 도너 농도 (cm^-3)
+    D: float  # 확산 계수 (µm^2/s)
+    junction_depth: float  # 개구부 중심에서의 접합 깊이 (µm)
+    lateral_diffusion: float  # 개구부 가장자리에서 게이트 쪽으로 들어간 표면 접합 거리 (µm)
+    N_D: float  # 접합 안의 평균 도너 농도 (cm^-3), MOSFET 모델의 n형 도핑 농도
+    solve_s: float  # 확산 계산 시간 (s)
+
+    @property
+    def center(self):
+        """첫 번째 개구부 중심의 가로 격자 인덱스."""
+        x0, x1 = self.openings[0]
+        return int(np.abs(self.x - (x0 + x1) / 2).argmin())
+
+    @property
+    def diffusion_length(self):
+        """확산 길이 2√(Dt) (µm)."""
+        return 2 * math.sqrt(self.D * self.anneal_min * 60)
+
+
+def _key(value):
+    return float(f"{float(value):.10g}")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _source_drain(ion, energy, dose, model, anneal_C, anneal_min, N_A, openings, grid):
+    import time
+
+    ny, nx = grid
+    dx = (X_RANGE[1] - X_RANGE[0]) / nx
+    dy = DEPTH / ny
+    x = X_RANGE[0] + dx * (np.arange(nx) + 0.5)
+    y = dy * (np.arange(ny) + 0.5)
+    dRl = range_parameters(ion, energy)[2]
+    as_implanted = np.multiply.outer(implant_profile(y, dose, ion, energy, model), lateral_profile(x, openings, dRl))
+
+    D = float(diffusivity(ion, anneal_C + 273.15))
+    t0 = time.perf_counter()
+    C = diffuse(as_implanted, D, dx, dy, anneal_min * 60) if anneal_min > 0 else as_implanted.copy()
+    solve_s = time.perf_counter() - t0
+    np.maximum(C, 0.0, out=C)  # 반올림 오차로 생기는 아주 작은 음수 제거
+
+    x0, x1 = openings[0]
+    center = int(np.abs(x - (x0 + x1) / 2).argmin())
+    xj = junction_depth(y, C[:, center], N_A)
+    # 표면에서 개구부 오른쪽 가장자리 (게이트 쪽)부터 C = N_A가 되는 곳까지의 거리
+    surface = C[0, center:]
+    edge = np.nonzero(surface < N_A)[0]
+    lateral = float(x[center + edge[0]] - x1) if len(edge) else float(x[-1] - x1)
+    inside = y <= xj
+    N_D = float(C[inside, center].mean()) if inside.any() else float(C[0, center])
+
+    for array in (x, y, as_implanted, C):
+        array.setflags(write=False)
+    return ImplantResult(
+        ion=ion, energy=energy, dose=dose, model=model, anneal_C=anneal_C, anneal_min=anneal_min, N_A=N_A,
+        openings=openings, x=x, y=y, as_implanted=as_implanted, C=C, D=D, junction_depth=xj,
+        lateral_diffusion=lateral, N_D=N_D, solve_s=solve_s,
+    )
+
+
+def source_drain(ion="As", energy=50.0, dose=5e15, model="pearson", anneal_C=1000.0, anneal_min=30.0,
+                 N_A=1e16, openings=None, grid=GRID):
+    """
+    15단계 N+ 소스/드레인의 이온 주입과 열확산. 결과는 프로세스 전역 캐시에 저장한다.
+
+    Parameters:
+    - ion: 주입 이온 ("As", "P")
+    - energy: 주입 에너지 (keV)
+    - dose: 주입량 (cm^-2)
+    - model: 깊이 방향 분포 ("gaussian", "pearson")
+    - anneal_C, anneal_min: 확산 (drive-in) 온도 (°C)와 시간 (분)
+    - N_A: p형 기판 농도 (cm^-3)
+    - openings: 주입 개구부 (x0, x1) 목록 (µm), None이면 공정 엔진에서 구한다
+    - grid: (깊이, 가로) 격자 점 개수
+
+    Returns:
+    - ImplantResult
+    """
+    if openings is None:
+        openings = source_drain_openings()
+    openings = tuple((_key(x0), _key(x1)) for x0, x1 in openings)
+    return _source_drain(ion, _key(energy), _key(dose), model, _key(anneal_C), _key(anneal_min), _key(N_A),
+                         openings, tuple(grid))
+
+
+def cache_info():
+    return _source_drain.cache_info()
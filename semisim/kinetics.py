@@ -0,0 +1,141 @@
+"""
+박막 성장 kinetics: Deal-Grove 열산화와 rate 기반 CVD / PVD 증착.
+
+열산화 (Deal-Grove, (100) Si)::
+
+    x² + A x = B (t + τ),   B = C1 exp(-E1 / kT) (포물선 속도 상수),   B/A = C2 exp(-E2 / kT) (선형 속도 상수)
+    τ = (x0² + A x0) / B   (처음부터 있던 산화막 x0, 건식은 초기 급성장 영역을 x_i = 25 nm로 대신한다)
+
+증착:
+
+- CVD (Grove 모델): 표면 반응 속도 k_s = k0 exp(-Ea / kT)와 기상 물질 전달 한계 h_g의 직렬 합
+  rate = 1 / (1 / k_s + 1 / h_g)
+- PVD (sputtering): 온도와 무관한 일정한 속도
+
+속도 상수는 온도 격자 (TABLE_T_C, 1 °C 간격)에서 ambient별로 미리 계산한 log 테이블을 선형 보간한다.
+모든 함수는 시간, 온도, ambient 배열을 broadcast하므로 수천 개의 recipe 조합을 한 번에 계산한다.
+
+    x = oxide_thickness(t_min, T_C, ["dry", "wet"])     # µm
+    t = film_thickness("Poly", 25.0, 620.0)              # µm
+"""
+import functools
+
+import numpy as np
+
+from semisim.poisson import K_B
+
+ZERO_CELSIUS = 273.15
+
+AMBIENTS = ("dry", "wet")
+# Deal-Grove 상수 ((100) Si): C1 (µm^2/h), E1 (eV), C2 (µm/h), E2 (eV), 초기 산화막 x_i (µm)
+DEAL_GROVE = {
+    "dry": {"C1": 7.72e2, "E1": 1.23, "C2": 6.23e6, "E2": 2.0, "x_i": 0.025},
+    "wet": {"C1": 3.86e2, "E1": 0.78, "C2": 1.63e8, "E2": 2.05, "x_i": 0.0},
+}
+SI_CONSUMED = 0.44  # 산화막 두께 대비 소모되는 Si 두께 비율
+
+# 증착 방식별 파라미터: CVD는 (k0 nm/min, Ea eV, h_g nm/min), PVD는 속도 (nm/min)
+DEPOSITION = {
+    "Poly": ("cvd", 3.9e10, 1.7, 100.0),  # LPCVD poly-Si (SiH4), 620 °C에서 약 10 nm/min
+    "ILD": ("cvd", 1.04e11, 1.9, 200.0),  # LPCVD TEOS 산화막, 700 °C에서 약 15 nm/min
+    "Al": ("pvd", 500.0),  # Al sputtering
+}
+
+TABLE_T_C = np.arange(500.0, 1301.0, 1.0)  # 속도 상수 테이블의 온도 격자 (°C)
+
+
+def _arrhenius(C, E, T_C):
+    return C * np.exp(-E / (K_B * (np.asarray(T_C, dtype=float) + ZERO_CELSIUS)))
+
+
+@functools.lru_cache(maxsize=1)
+def rate_tables():
+    """
+    ambient별 Deal-Grove 속도 상수 log 테이블.
+
+    Returns:
+    - log B (µm^2/h), log B/A (µm/h), 각각 shape (len(AMBIENTS), len(TABLE_T_C))
+    """
+    log_B = np.log([_arrhenius(DEAL_GROVE[a]["C1"], DEAL_GROVE[a]["E1"], TABLE_T_C) for a in AMBIENTS])
+    log_BA = np.log([_arrhenius(DEAL_GROVE[a]["C2"], DEAL_GROVE[a]["E2"], TABLE_T_C) for a in AMBIENTS])
+    for array in (log_B, log_BA):
+        array.setflags(write=False)
+    return log_B, log_BA
+
+
+def ambient_index(ambient):
+    """ambient 이름 (또는 이름 배열)을 AMBIENTS의 인덱스 배열로. 정수는 그대로 쓴다."""
+    ambient = np.asarray(ambient)
+    if ambient.dtype.kind in "US":
+        match = ambient[..., np.newaxis] == np.array(AMBIENTS)
+        if not match.any(axis=-1).all():
+            raise ValueError(f"알 수 없는 ambient: {ambient[~match.any(axis=-1)]} (가능한 값: {AMBIENTS})")
+        return match.argmax(axis=-1)
+    return ambient.astype(int)
+
+
+def rate_constants(T_C, ambient="dry"):
+    """
+    온도 T_C (°C)와 ambient에서의 Deal-Grove 속도 상수 (테이블 보간, broadcast).
+
+    Returns:
+    - B (µm^2/h), B/A (µm/h)
+    """
+    log_B, log_BA = rate_tables()
+    position = np.clip((np.asarray(T_C, dtype=float) - TABLE_T_C[0]) / (TABLE_T_C[1] - TABLE_T_C[0]),
+                       0, len(TABLE_T_C) - 1)
+    i = np.minimum(position.astype(int), len(TABLE_T_C) - 2)
+    frac = position - i
+    a = ambient_index(ambient)
+    B = np.exp(log_B[a, i] * (1 - frac) + log_B[a, i + 1] * frac)
+    BA = np.exp(log_BA[a, i] * (1 - frac) + log_BA[a, i + 1] * frac)
+    return B, BA
+
+
+def oxide_thickness(t_min, T_C, ambient="dry", x0=0.0):
+    """
+    Deal-Grove 열산화 후 산화막 두께.
+
+    Parameters:
+    - t_min: 산화 시간 (분)
+    - T_C: 온도 (°C)
+    - ambient: "dry", "wet" (또는 그 배열)
+    - x0: 산화 전 산화막 두께 (µm)
+
+    Returns:
+    - 산화막 전체 두께 (µm), 인자들의 broadcast shape
+    """
+    B, BA = rate_constants(T_C, ambient)
+    A = B / BA
+    x_i = np.array([DEAL_GROVE[a]["x_i"] for a in AMBIENTS])[ambient_index(ambient)]
+    x_start = np.maximum(x0, x_i)
+    tau = (x_start ** 2 + A * x_start) / B
+    t = np.asarray(t_min, dtype=float) / 60
+    x = A / 2 * (np.sqrt(1 + (t + tau) / (A ** 2 / (4 * B))) - 1)
+    # 시간이 0이면 처음 산화막 그대로 (x_i는 성장 속도 모델의 보정일 뿐 실제 두께가 아니다)
+    return np.where(t > 0, np.maximum(x, x0), x0)
+
+
+def oxidation_time(x, T_C, ambient="dry", x0=0.0):
+    """목표 산화막 두께 x (µm)까지 걸리는 시간 (분), oxide_thickness의 역함수."""
+    B, BA = rate_constants(T_C, ambient)
+    A = B / BA
+    x_i = np.array([DEAL_GROVE[a]["x_i"] for a in AMBIENTS])[ambient_index(ambient)]
+    x_start = np.maximum(x0, x_i)
+    t = ((np.asarray(x) ** 2 + A * x) - (x_start ** 2 + A * x_start)) / B
+    return np.maximum(t, 0.0) * 60
+
+
+def deposition_rate(material, T_C=25.0):
+    """증착 속도 (nm/min). CVD는 온도에 따라 반응 제한 -> 물질 전달 제한으로 바뀐다."""
+    kind, *params = DEPOSITION[material]
+    if kind == "pvd":
+        return np.full(np.shape(T_C), params[0])
+    k0, Ea, h_g = params
+    k_s = _arrhenius(k0, Ea, T_C)
+    return 1 / (1 / k_s + 1 / h_g)
+
+
+def film_thickness(material, t_min, T_C=25.0):
+    """증착 시간 t_min (분) 후 막 두께 (µm)."""
+    return deposition_rate(material, T_C) * np.asarray(t_min, dtype=float) * 1e-3
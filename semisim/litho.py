@@ -0,0 +1,344 @@
+"""
+노광 (공정 4, 11, 18, 24단계)의 aerial image와 PR 현상 패턴.
+
+마스크 영역 (x0, x1, z0, z1) 목록을 웨이퍼 평면 (x: 가로, z: 안쪽, µm)의 균일 격자로 rasterize하고
+(크롬은 투과율 0, 가장자리 픽셀은 면적 비율), 부분 결맞음 (partially coherent) 결상을
+Hopkins 모델의 SOCS (sum of coherent systems) 분해로 계산한다.
+
+    I(r) = Σ_s J(s) |F⁻¹[M(f) P(f + s)]|² = Σ_k |F⁻¹[M(f) φ_k(f)]|²
+
+- M: 마스크 스펙트럼 (rfft2), P: 동공 함수 (|f| ≤ NA/λ, defocus 위상 포함), J: 원형 광원 (σ)
+- TCC(f1, f2) = Σ_s J(s) P(f1 + s) P*(f2 + s) = Aᴴ A 이므로 A (광원 점 x 주파수)의 SVD로 kernel φ_k를
+  얻고, 에너지 KERNEL_ENERGY까지의 kernel만 쓴다. kernel은 (λ, NA, σ, defocus, 격자)마다 캐시한다.
+- 각 kernel의 장은 동공 대역 안의 주파수만 가지므로 작은 격자에서 역변환하고, 대역이 제한된 intensity를
+  Fourier 보간 (irfft2)으로 원래 격자로 올린다. PR 안의 산 확산 (RESIST_BLUR)은 이때 Gaussian으로 곱한다.
+
+PR은 threshold 모델로 현상한다: 빛을 받은 양 dose x I가 THRESHOLD 이상인 곳이 positive PR에서는
+녹고, negative PR에서는 남는다 (I는 마스크가 없을 때 1로 정규화). 여러 마스크는 한 번의 batch
+변환으로 처리한다. FFT를 쓰므로 결상 영역은 주기적으로 반복되는 die로 취급된다.
+
+    result = expose_steps(wavelength=0.193, NA=0.93, sigma=0.5, defocus=0.0)
+    result.developed(dose=1.0)[i]          # 현상되어 PR이 없어진 곳
+    critical_dimension(result.x, result.intensity[i, row], THRESHOLD, x_center=0.0)
+"""
+import functools
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+# 노광 파장 (µm)
+WAVELENGTHS = {"i-line": 0.365, "KrF": 0.248, "ArF": 0.193}
+
+FIELD = (-2.0, 2.0, -1.5, 1.5)  # 결상 영역 (x0, x1, z0, z1), 공정 엔진의 웨이퍼 영역과 같다
+GRID = (1024, 1024)  # (z, x) 격자 점 개수
+THRESHOLD = 0.3  # PR이 반응하는 정규화 노광량
+RESIST_BLUR = 0.01  # PR 안의 산 확산 길이 (µm, Gaussian 표준편차)
+KERNEL_ENERGY = 0.97  # SOCS kernel을 자르는 누적 에너지 비율 (intensity 오차 약 1e-3)
+KERNEL_CACHE_SIZE = 16
+CACHE_SIZE = 4  # 노광 결과 하나가 1024 x 1024 격자에서 약 32 MB다
+
+
+def _key(value):
+    return float(f"{float(value):.10g}")
+
+
+def _axis(field, grid):
+    """픽셀 중심 좌표 x (nx), z (nz)와 간격 dx, dz."""
+    x0, x1, z0, z1 = field
+    nz, nx = grid
+    dx, dz = (x1 - x0) / nx, (z1 - z0) / nz
+    return x0 + dx * (np.arange(nx) + 0.5), z0 + dz * (np.arange(nz) + 0.5), dx, dz
+
+
+def _coverage(lo, hi, start, step, n):
+    """1D 구간 [lo, hi]가 덮는 각 픽셀의 길이 비율."""
+    left = start + step * np.arange(n)
+    return np.clip(np.minimum(hi, left + step) - np.maximum(lo, left), 0, step) / step
+
+
+def rasterize(rects, grid=GRID, field=FIELD):
+    """
+    마스크 영역 목록의 투과율 격자 (크롬 0, 투명 1).
+
+    Parameters:
+    - rects: 크롬 영역 (x0, x1, z0, z1) 목록 (µm)
+    - grid: (z, x) 격자 점 개수
+    - field: 결상 영역 (x0, x1, z0, z1)
+
+    Returns:
+    - shape grid의 float32 배열. 가장자리 픽셀은 크롬이 덮는 면적 비율만큼 어둡다.
+    """
+    nz, nx = grid
+    dx, dz = (field[1] - field[0]) / nx, (field[3] - field[2]) / nz
+    chrome = np.zeros(grid)
+    for x0, x1, z0, z1 in rects:
+        chrome += np.multiply.outer(_coverage(z0, z1, field[2], dz, nz), _coverage(x0, x1, field[0], dx, nx))
+    return (1 - np.minimum(chrome, 1)).astype(np.float32)
+
+
+def _small_size(radius, n):
+    """대역 반경 radius (주파수 인덱스)의 intensity를 aliasing 없이 담는 작은 격자 크기 (2, 3, 5의 곱인 짝수)."""
+    size = 4 * radius + 2
+    while True:
+        rest = size
+        for p in (2, 3, 5):
+            while rest % p == 0:
+                rest //= p
+        if rest == 1 and size % 2 == 0:
+            break
+        size += 1
+    if 2 * radius + 1 > n:
+        raise ValueError(f"격자 {n}점이 동공 대역 (±{radius})보다 작습니다")
+    return min(size, n)
+
+
+@dataclass(frozen=True)
+class Kernels:
+    """한 광학 조건의 SOCS kernel. kernels[k, j]는 주파수 (iz[j], ix[j])에서 k번째 kernel 값이다."""
+    wavelength: float  # µm
+    NA: float
+    sigma: float
+    defocus: float  # µm
+    grid: tuple  # (z, x)
+    field: tuple
+    iz: np.ndarray  # 동공 대역 안의 주파수 인덱스
+    ix: np.ndarray
+    kernels: np.ndarray  # (kernel 개수, 주파수 개수), 특이값을 곱해 둔 값
+    small: tuple  # 장을 역변환하는 작은 격자 (z, x)
+    energy: float  # 쓰는 kernel의 TCC 에너지 비율
+    sources: int  # 광원 점 개수
+
+    def __len__(self):
+        return len(self.kernels)
+
+
+@functools.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def _kernels(wavelength, NA, sigma, defocus, grid, field):
+    nz, nx = grid
+    Lx, Lz = field[1] - field[0], field[3] - field[2]
+    cutoff = NA / wavelength
+    # 광원 점과 동공은 같은 주파수 격자 (1/Lx, 1/Lz 간격) 위에 놓는다
+    radius = (1 + sigma) * cutoff
+    rx, rz = int(radius * Lx), int(radius * Lz)
+    iz, ix = (a.ravel() for a in np.meshgrid(np.arange(-rz, rz + 1), np.arange(-rx, rx + 1), indexing="ij"))
+    inside = np.hypot(ix / Lx, iz / Lz) <= radius
+    iz, ix = iz[inside], ix[inside]
+
+    sz, sx = (a.ravel() for a in np.meshgrid(np.arange(-rz, rz + 1), np.arange(-rx, rx + 1), indexing="ij"))
+    source = np.hypot(sx / Lx, sz / Lz) <= max(sigma * cutoff, 0.0)
+    sz, sx = sz[source], sx[source]
+    if len(sz) == 0:  # σ가 격자보다 작으면 결맞음 (수직 입사) 광원
+        sz, sx = np.zeros(1, dtype=int), np.zeros(1, dtype=int)
+
+    # A[s, f] = √J(s) P(f + s), defocus는 비근축 위상 2π z (√(1/λ² - |f|²) - 1/λ)
+    fx = (ix[np.newaxis, :] + sx[:, np.newaxis]) / Lx
+    fz = (iz[np.newaxis, :] + sz[:, np.newaxis]) / Lz
+    rho2 = fx ** 2 + fz ** 2
+    pupil = rho2 <= cutoff ** 2
+    phase = 2 * np.pi * defocus * (np.sqrt(np.maximum(1 / wavelength ** 2 - rho2, 0)) - 1 / wavelength)
+    A = np.where(pupil, np.exp(1j * phase), 0) / math.sqrt(len(sz))
+
+    _, S, Vh = np.linalg.svd(A, full_matrices=False)
+    power = S ** 2
+    cumulative = np.cumsum(power) / power.sum()
+    count = int(np.searchsorted(cumulative, KERNEL_ENERGY) + 1)
+    kernels = (S[:count, np.newaxis] * Vh[:count]).astype(np.complex64)
+
+    small = (_small_size(int(np.abs(iz).max()), nz), _small_size(int(np.abs(ix).max()), nx))
+    for array in (iz, ix, kernels):
+        array.setflags(write=False)
+    return Kernels(wavelength=wavelength, NA=NA, sigma=sigma, defocus=defocus, grid=grid, field=field,
+                   iz=iz, ix=ix, kernels=kernels, small=small, energy=float(cumulative[count - 1]),
+                   sources=len(sz))
+
+
+def kernels(wavelength=0.193, NA=0.93, sigma=0.5, defocus=0.0, grid=GRID, field=FIELD):
+    """
+    광학 조건의 SOCS kernel (프로세스 전역 캐시).
+
+    Parameters:
+    - wavelength: 노광 파장 (µm)
+    - NA: 투영 렌즈 개구수
+    - sigma: 부분 결맞음 계수 (광원 반경 / 동공 반경)
+    - defocus: 초점 이탈 (µm)
+    - grid, field: 결상 격자와 영역
+
+    Returns:
+    - Kernels
+    """
+    return _kernels(_key(wavelength), _key(NA), _key(sigma), _key(defocus), tuple(grid),
+                    tuple(_key(v) for v in field))
+
+
+def aerial_image(masks, optics, blur=RESIST_BLUR):
+    """
+    마스크 투과율 격자들의 aerial image (PR 안의 산 확산 포함).
+
+    Parameters:
+    - masks: shape (z, x) 또는 (마스크 개수, z, x)의 투과율 격자 (optics.grid와 같은 크기)
+    - optics: Kernels
+    - blur: PR 산 확산 길이 (µm), 0이면 순수 aerial image
+
+    Returns:
+    - masks와 같은 shape의 float32 intensity (마스크가 없을 때 1)
+    """
+    masks = np.asarray(masks, dtype=np.float32)
+    single = masks.ndim == 2
+    masks = masks[np.newaxis] if single else masks
+    nz, nx = optics.grid
+    mz, mx = optics.small
+    count = len(masks)
+
+    # 동공 대역 안의 마스크 스펙트럼: 실수 마스크이므로 fx < 0은 켤레 대칭 (M(-f) = M(f)*)으로 얻는다
+    spectrum = np.fft.rfft2(masks)
+    negative = optics.ix < 0
+    rows = np.where(negative, -optics.iz, optics.iz) % nz
+    M = spectrum[:, rows, np.abs(optics.ix)]
+    M[:, negative] = np.conj(M[:, negative])
+
+    # kernel별 장을 작은 격자에서 역변환하고 |E|²를 더한다
+    fields = np.zeros((count, len(optics), mz, mx), dtype=np.complex64)
+    fields[:, :, optics.iz % mz, optics.ix % mx] = M[:, np.newaxis, :] * optics.kernels[np.newaxis]
+    E = np.fft.ifft2(fields, norm="forward") / (nz * nx)
+    small = (E.real ** 2 + E.imag ** 2).sum(axis=1)
+
+    # 대역 제한된 intensity를 원래 격자로 Fourier 보간 (산 확산 Gaussian을 같이 곱한다)
+    coeff = np.fft.rfft2(small) / (mz * mx)
+    fz = np.fft.fftfreq(mz, 1 / mz)
+    fx = np.arange(mx // 2 + 1)
+    Lx, Lz = optics.field[1] - optics.field[0], optics.field[3] - optics.field[2]
+    if blur > 0:
+        coeff *= np.exp(-2 * (np.pi * blur) ** 2 * ((fz[:, np.newaxis] / Lz) ** 2 + (fx[np.newaxis, :] / Lx) ** 2))
+    # 작은 격자의 Nyquist 주파수는 대역 밖이므로 버린다
+    keep_z = np.abs(fz) < mz // 2
+    coeff = coeff[:, keep_z][:, :, : mx // 2]
+    big = np.zeros((count, nz, nx // 2 + 1), dtype=np.complex64)
+    big[:, (fz[keep_z] % nz).astype(int), : mx // 2] = coeff
+    intensity = np.fft.irfft2(big, s=(nz, nx), norm="forward").astype(np.float32, copy=False)
+    return intensity[0] if single else intensity
+
+
+def develop(intensity, dose=1.0, threshold=THRESHOLD, tone="positive"):
+    """
+    threshold 모델 현상: 현상되어 PR이 없어진 곳은 True.
+    positive PR은 dose x I ≥ threshold인 곳이, negative PR은 그 반대가 녹는다.
+    """
+    lit = np.asarray(intensity) * dose >= threshold
+    return ~lit if tone == "negative" else lit
+
+
+def critical_dimension(x, profile, level, x_center=0.0):
+    """
+    단면 profile (예: intensity의 한 행)에서 x_center를 포함하는 패턴의 폭 (µm).
+    profile - level의 부호가 바뀌는 두 가장자리를 선형 보간해 픽셀보다 정밀하게 구한다.
+    가장자리가 없으면 (패턴이 생기지 않았거나 이웃 패턴과 붙었으면) nan.
+    """
+    s = np.asarray(profile, dtype=float) - level
+    i = int(np.abs(np.asarray(x) - x_center).argmin())
+    inside = (s >= 0) == (s[i] >= 0)
+    left = np.nonzero(~inside[:i])[0]
+    right = np.nonzero(~inside[i:])[0]
+    if len(left) == 0 or len(right) == 0:
+        return float("nan")
+
+    def edge(k):
+        return x[k] + (x[k + 1] - x[k]) * s[k] / (s[k] - s[k + 1])
+
+    return float(edge(i + right[0] - 1) - edge(left[-1]))
+
+
+def exposure_steps(flow=None):
+    """공정 흐름의 노광 (pattern) 단계: (단계 인덱스, 마스크 영역, PR tone) 목록."""
+    if flow is None:
+        from semisim.process import PROCESS_FLOW as flow
+    return [(i, args["mask"], args.get("tone", "positive"))
+            for i, (_, op, args) in enumerate(flow) if op == "pattern"]
+
+
+@dataclass(frozen=True)
+class ExposureResult:
+    """노광 단계들의 aerial image. intensity는 shape (노광 단계 개수, z, x)이다."""
+    steps: tuple  # 공정 단계 인덱스
+    tones: tuple  # PR tone
+    optics: Kernels
+    x: np.ndarray  # 가로 픽셀 중심 (µm)
+    z: np.ndarray  # 안쪽 픽셀 중심 (µm)
+    masks: np.ndarray  # 투과율 격자
+    intensity: np.ndarray  # PR 산 확산까지 포함한 정규화 intensity
+    image_s: float  # 결상 계산 시간 (kernel 생성 제외, s)
+
+    def developed(self, dose=1.0, threshold=THRESHOLD):
+        """단계별 현상 결과 (PR이 없어진 곳 True), shape intensity와 같다."""
+        return np.stack([develop(I, dose, threshold, tone) for I, tone in zip(self.intensity, self.tones)])
+
+    def row(self, z):
+        """안쪽 좌표 z (µm)에 가장 가까운 격자 행."""
+        return int(np.abs(self.z - z).argmin())
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _expose_steps(wavelength, NA, sigma, defocus, grid, field):
+    optics = _kernels(wavelength, NA, sigma, defocus, grid, field)
+    steps = exposure_steps()
+    x, z, _, _ = _axis(field, grid)
+    masks = np.stack([rasterize(rects, grid, field) for _, rects, _ in steps])
+    t0 = time.perf_counter()
+    intensity = aerial_image(masks, optics)
+    image_s = time.perf_counter() - t0
+    for array in (x, z, masks, intensity):
+        array.setflags(write=False)
+    return ExposureResult(steps=tuple(i for i, _, _ in steps), tones=tuple(tone for _, _, tone in steps),
+                          optics=optics, x=x, z=z, masks=masks, intensity=intensity, image_s=image_s)
+
+
+def expose_steps(wavelength=0.193, NA=0.93, sigma=0.5, defocus=0.0, grid=GRID, field=FIELD):
+    """
+    공정 흐름의 모든 노광 단계를 한 번의 batch로 결상한다. 결과는 프로세스 전역 캐시에 저장한다.
+    (dose와 threshold는 현상 단계의 인자이므로 바꿔도 다시 결상하지 않는다)
+
+    Returns:
+    - ExposureResult
+    """
+    return _expose_steps(_key(wavelength), _key(NA), _key(sigma), _key(defocus), tuple(grid),
+                         tuple(_key(v) for v in field))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _focus_exposure(index, wavelength, NA, sigma, focus, doses, threshold, x_center, z, grid, field):
+    rects = exposure_steps()[index][1]
+    mask = rasterize(rects, grid, field)
+    x, zs, _, _ = _axis(field, grid)
+    row = int(np.abs(zs - z).argmin())
+    cd = np.empty((len(focus), len(doses)))
+    for i, defocus in enumerate(focus):
+        profile = aerial_image(mask, _kernels(wavelength, NA, sigma, defocus, grid, field))[row]
+        # dose는 threshold를 1/dose로 바꾸는 것과 같으므로 한 번 결상한 단면을 재사용한다
+        cd[i] = [critical_dimension(x, profile, threshold / dose, x_center) for dose in doses]
+    cd.setflags(write=False)
+    return cd
+
+
+def focus_exposure(index, focus, doses, wavelength=0.193, NA=0.93, sigma=0.5, threshold=THRESHOLD,
+                   x_center=0.0, z=0.5, grid=GRID, field=FIELD):
+    """
+    focus-exposure matrix: 초점과 노광량에 따른 CD (Bossung 곡선).
+
+    Parameters:
+    - index: exposure_steps()의 노광 단계 순번
+    - focus: defocus 값 목록 (µm)
+    - doses: 정규화 노광량 목록
+    - x_center, z: CD를 재는 패턴 위치 (µm), z 행의 가로 단면에서 잰다
+
+    Returns:
+    - shape (len(focus), len(doses))의 CD (µm), 패턴이 생기지 않으면 nan
+    """
+    return _focus_exposure(index, _key(wavelength), _key(NA), _key(sigma), tuple(_key(f) for f in focus),
+                           tuple(_key(d) for d in doses), _key(threshold), _key(x_center), _key(z), tuple(grid),
+                           tuple(_key(v) for v in field))
+
+
+def cache_info():
+    return {"kernels": _kernels.cache_info(), "expose": _expose_steps.cache_info(),
+            "focus_exposure": _focus_exposure.cache_info()}
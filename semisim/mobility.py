@@ -0,0 +1,114 @@
+import functools
+
+import numpy as np
+
+
+# 이동도 계산 함수
+def calculate_mobility_sic(N_D, N_A, T, mu_1_e=950, mu_0_e=950, mu_1_h=120, mu_0_h=120,
+                        N_ref=1e17, alpha_e=2.5, alpha_h=2.1, gamma=1.5):
+    """
+    SiC의 전자 및 정공 이동도 계산 함수.
+    N_D, N_A, T는 스칼라 또는 서로 broadcast 가능한 배열을 받을 수 있다.
+
+    Parameters:
+    - N_D: n형 도핑 농도 (cm^-3)
+    - N_A: p형 도핑 농도 (cm^-3)
+    - T: 온도 (K)
+    - mu_1_e: 전자 격자 이동도 상수 (cm^2/V·s)
+    - mu_0_e: 전자 최대 이동도 (cm^2/V·s)
+    - mu_1_h: 정공 격자 이동도 상수 (cm^2/V·s)
+    - mu_0_h: 정공 최대 이동도 (cm^2/V·s)
+    - N_ref: 불순물 산란 기준 농도 (cm^-3)
+    - alpha_e: 전자 격자 산란 온도 계수
+    - alpha_h: 정공 격자 산란 온도 계수
+    - gamma: 불순물 산란 계수
+
+    Returns:
+    - 전자 이동도 (μ_e)와 정공 이동도 (μ_h)
+    """
+    N_total = np.add(N_D, N_A)  # 총 도핑 농도
+    T = np.asarray(T, dtype=float)
+
+    # 전자 이동도 계산
+    mu_lattice_e = mu_1_e * (T / 300) ** (-alpha_e)
+    mu_impurity_e = mu_0_e / (1 + (N_total / N_ref) ** gamma)
+    mu_e = 1 / (1 / mu_lattice_e + 1 / mu_impurity_e)
+
+    # 정공 이동도 계산
+    mu_lattice_h = mu_1_h * (T / 300) ** (-alpha_h)
+    mu_impurity_h = mu_0_h / (1 + (N_total / N_ref) ** gamma)
+    mu_h = 1 / (1 / mu_lattice_h + 1 / mu_impurity_h)
+
+    return mu_e, mu_h
+
+
+# 효과적인 이동도 계산 함수 (전자의 이동도와 정공의 이동도를 이용)
+def effective_mobility(mu_e, mu_h):
+    """
+    전자 이동도(mu_e)와 정공 이동도(mu_h)를 입력받아,
+    효과적인 이동도(mu_eff)를 계산하는 함수.
+    """
+    mu_eff = (mu_e * mu_h) / (mu_e + mu_h)
+    return mu_eff
+
+
+# 기본 물질 파라미터 (calculate_mobility_sic의 기본값과 동일)
+SIC_PARAMS = {
+    "mu_1_e": 950, "mu_0_e": 950, "mu_1_h": 120, "mu_0_h": 120,
+    "N_ref": 1e17, "alpha_e": 2.5, "alpha_h": 2.1, "gamma": 1.5,
+}
+
+MOBILITY_CACHE_SIZE = 4096  # 스칼라 LRU 캐시 크기
+
+
+def _params_key(params):
+    """기본값과 합친 물질 파라미터를 해시 가능한 캐시 키로 변환."""
+    unknown = set(params) - set(SIC_PARAMS)
+    if unknown:
+        raise TypeError(f"알 수 없는 이동도 파라미터: {sorted(unknown)}")
+    merged = dict(SIC_PARAMS, **params)
+    return tuple(sorted((name, float(value)) for name, value in merged.items()))
+
+
+@functools.lru_cache(maxsize=MOBILITY_CACHE_SIZE)
+def _cached_mobility(N_D, N_A, T, params_key):
+    mu_e, mu_h = calculate_mobility_sic(N_D, N_A, T, **dict(params_key))
+    return float(mu_e), float(mu_h), float(effective_mobility(mu_e, mu_h))
+
+
+def cached_mobility(N_D, N_A, T, **params):
+    """
+    스칼라 (N_D, N_A, T, 물질 파라미터)에 대한 이동도를 LRU 캐시로 계산.
+    캐시는 프로세스 전역이므로 모든 Streamlit 세션이 공유한다.
+
+    Returns:
+    - 전자 이동도 (μ_e), 정공 이동도 (μ_h), 유효 이동도 (μ_eff)
+    """
+    return _cached_mobility(float(N_D), float(N_A), float(T), _params_key(params))
+
+
+def mobility_bulk(N_D, N_A, T, **params):
+    """
+    배열 입력용 이동도 계산 함수. N_D, N_A, T는 서로 broadcast 가능한 배열이다.
+    SiC 닫힌 식은 벡터화된 직접 계산이 미리 계산한 테이블의 보간보다 빠르므로 매번 직접 계산한다.
+
+    Returns:
+    - 전자 이동도 (μ_e), 정공 이동도 (μ_h), 유효 이동도 (μ_eff)
+    """
+    mu_e, mu_h = calculate_mobility_sic(N_D, N_A, T, **dict(_params_key(params)))
+    return mu_e, mu_h, effective_mobility(mu_e, mu_h)
+
+
+def cache_info():
+    """
+    이동도 캐시의 적중/실패 통계.
+
+    Returns:
+    - {"scalar": {...}} 형태의 dict (hits, misses, maxsize, currsize)
+    """
+    return {"scalar": _cached_mobility.cache_info()._asdict()}
+
+
+def cache_clear():
+    """이동도 캐시 초기화."""
+    _cached_mobility.cache_clear()
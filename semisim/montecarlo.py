@@ -0,0 +1,276 @@
+"""
+Monte Carlo 및 공정 코너 해석.
+
+모델은 시뮬레이션 페이지와 같다: MOSFET은 calculate_id에 샘플마다 기판 도핑 N_A의 MOS Poisson 해로
+구한 임계 전압 (기본 소자에서 약 1.43 V)과 국소 편차 dVt를 더한 Vt를, BJT는 Gummel-Poon 모델
+(semisim.bjt.terminal_currents)을 쓴다. 분포의 평균은 회로 / BJT 모델의 기본 소자 파라미터다.
+Poisson 해는 샘플마다 풀지 않고 N_A의 log 격자에서 한 번 푼 Vt(N_A)를 보간한다.
+
+샘플은 배치 단위로 나누어 벡터화된 모델 식으로 계산한다. 여러 프로세스로 나누면 spawn 방식으로
+만든 모듈 전역 프로세스 풀 하나를 재사용한다 (Streamlit 서버처럼 스레드가 여러 개인 프로세스를
+fork하지 않는다). 각 배치는 SeedSequence에서 파생된 독립 RNG 스트림을 사용하므로,
+같은 seed면 worker 수와 관계없이 같은 결과가 나온다.
+"""
+import functools
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from semisim.bjt import default_params, terminal_currents
+from semisim.circuit import MOSFET_DEFAULTS
+from semisim.mosfet import calculate_id
+from semisim.poisson import threshold_voltage
+
+# 파라미터별 기본 분포: (분포 이름, 평균, 표준편차 또는 상대 표준편차)
+# - "normal": 평균, 표준편차
+# - "lognormal": 중앙값, log 표준편차 (농도, 포화전류처럼 자릿수로 변하는 값)
+# - "uniform": 하한, 상한
+# - 숫자 하나: 고정값
+# dVt는 N_A로부터 구한 Vt에 더하는 국소 편차 (V)
+default_distributions = {
+    "W": ("normal", MOSFET_DEFAULTS["W"], 0.2),
+    "L": ("normal", MOSFET_DEFAULTS["L"], 0.2),
+    "N_A": ("lognormal", MOSFET_DEFAULTS["N_A"], 0.1),
+    "N_D": ("lognormal", MOSFET_DEFAULTS["N_D"], 0.1),
+    "dVt": ("normal", 0.0, 0.03),
+    "I_S": ("lognormal", default_params["I_S"], 0.2),
+    "V_T": ("normal", default_params["V_T"], 0.0005),
+}
+
+# 기본 바이어스 조건
+default_bias = {
+    "Vgs": 2.0,
+    "Vds": 5.0,
+    "V_BE": 0.6,
+    "V_CB": 5.0,
+}
+
+# 각 파라미터가 "fast" 방향으로 움직이는 부호 (Id, I_C가 커지는 방향)
+FAST_DIRECTION = {"W": +1, "L": -1, "N_A": -1, "N_D": -1, "dVt": -1, "I_S": +1, "V_T": -1}
+
+MOSFET_PARAMS = ("W", "L", "N_A", "N_D", "dVt")
+
+# 공정 코너: (MOSFET 방향, BJT 방향). 첫 글자는 MOSFET, 두 번째 글자는 BJT의 fast/slow를 뜻한다.
+CORNERS = {
+    "TT": (0, 0),
+    "FF": (+1, +1),
+    "SS": (-1, -1),
+    "FS": (+1, -1),
+    "SF": (-1, +1),
+}
+
+BATCH_SIZE = 100_000
+VT_GRID = np.geomspace(1e14, 1e18, 257)  # Vt(N_A) 보간 격자 (cm^-3), 밖의 값은 Poisson 해를 직접 푼다
+
+_pool = None  # (worker 수, ProcessPoolExecutor)
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo 결과. Id, I_C는 바이어스 조건에서의 샘플 값이다."""
+    Id: np.ndarray
+    I_C: np.ndarray
+    Vds_sweep: np.ndarray
+    V_BE_sweep: np.ndarray
+    Id_band: dict = field(default_factory=dict)
+    I_C_band: dict = field(default_factory=dict)
+
+    def histogram(self, name, bins=50):
+        """Id 또는 I_C의 히스토그램 (counts, bin_edges)."""
+        return np.histogram(getattr(self, name), bins=bins)
+
+
+def sample_parameters(distributions, n, rng):
+    """
+    분포 정의에 따라 n개의 파라미터 샘플 생성.
+
+    Returns:
+    - {파라미터 이름: shape (n,) 배열} dict
+    """
+    samples = {}
+    for name, spec in distributions.items():
+        if np.isscalar(spec):
+            samples[name] = np.full(n, float(spec))
+            continue
+        kind, a, b = spec
+        if kind == "normal":
+            samples[name] = rng.normal(a, b, n)
+        elif kind == "lognormal":
+            samples[name] = a * np.exp(rng.normal(0.0, b, n))
+        elif kind == "uniform":
+            samples[name] = rng.uniform(a, b, n)
+        else:
+            raise ValueError(f"지원하지 않는 분포: {kind}")
+    return samples
+
+
+def corner_parameters(distributions, corner, n_sigma=3.0):
+    """
+    공정 코너의 파라미터 값. 각 파라미터를 평균에서 n_sigma만큼 fast/slow 방향으로 이동한다.
+
+    Returns:
+    - {파라미터 이름: 값} dict
+    """
+    mos_sign, bjt_sign = CORNERS[corner]
+    values = {}
+    for name, spec in distributions.items():
+        if np.isscalar(spec):
+            values[name] = float(spec)
+            continue
+        kind, a, b = spec
+        sign = (mos_sign if name in MOSFET_PARAMS else bjt_sign) * FAST_DIRECTION.get(name, 0)
+        if kind == "normal":
+            values[name] = a + sign * n_sigma * b
+        elif kind == "lognormal":
+            values[name] = a * np.exp(sign * n_sigma * b)
+        elif kind == "uniform":
+            values[name] = {+1: b, -1: a}.get(sign, (a + b) / 2)
+        else:
+            raise ValueError(f"지원하지 않는 분포: {kind}")
+    return values
+
+
+@functools.lru_cache(maxsize=1)
+def _threshold_table():
+    return np.log(VT_GRID), threshold_voltage(VT_GRID)
+
+
+def threshold(N_A):
+    """
+    기판 도핑 N_A (배열)의 임계 전압 (V, 기본 산화막 두께와 온도의 MOS Poisson 해).
+    VT_GRID 안은 log N_A로 선형 보간하고, 밖의 값만 Poisson 해를 직접 푼다.
+    """
+    N_A = np.asarray(N_A, dtype=float)
+    log_grid, values = _threshold_table()
+    Vt = np.interp(np.log(N_A), log_grid, values)
+    outside = (N_A < VT_GRID[0]) | (N_A > VT_GRID[-1])
+    if np.any(outside):
+        Vt = np.where(outside, threshold_voltage(np.where(outside, N_A, VT_GRID[0])), Vt)
+    return Vt
+
+
+def _collector_current(V_BE, V_CB, params):
+    """Gummel-Poon 모델의 공통 베이스 컬렉터 전류 (샘플 파라미터 배열과 broadcast)."""
+    return terminal_currents(V_BE, np.negative(V_CB), {"I_S": params["I_S"], "V_T": params["V_T"]})[0]
+
+
+def evaluate(params, bias, Vds_sweep=None, V_BE_sweep=None):
+    """
+    파라미터 배열(또는 스칼라)에 대해 MOSFET Id와 BJT I_C를 계산.
+    sweep이 주어지면 마지막 축으로 sweep한 곡선도 함께 돌려준다.
+
+    Returns:
+    - Id, I_C, Id 곡선 (또는 None), I_C 곡선 (또는 None)
+    """
+    params = dict(params, Vt=threshold(params["N_A"]) + params["dVt"])
+    mos = (params["W"], params["L"], params["N_D"], params["N_A"])
+    Id = calculate_id(bias["Vgs"], bias["Vds"], *mos, Vt=params["Vt"])
+    I_C = _collector_current(bias["V_BE"], bias["V_CB"], params)
+
+    Id_curves = I_C_curves = None
+    if Vds_sweep is not None:
+        col = {name: np.asarray(value, dtype=float)[..., None] for name, value in params.items()}
+        Id_curves = calculate_id(bias["Vgs"], Vds_sweep, col["W"], col["L"], col["N_D"], col["N_A"],
+                                 Vt=col["Vt"])
+    if V_BE_sweep is not None:
+        col = {name: np.asarray(value, dtype=float)[..., None] for name, value in params.items()}
+        I_C_curves = _collector_current(V_BE_sweep, bias["V_CB"], col)
+    return Id, I_C, Id_curves, I_C_curves
+
+
+def _run_batch(task):
+    """한 배치를 계산하는 worker 함수 (프로세스 풀에서 pickle 가능한 최상위 함수)."""
+    distributions, bias, n, seed_seq, Vds_sweep, V_BE_sweep, n_curves = task
+    rng = np.random.default_rng(seed_seq)
+    params = sample_parameters(distributions, n, rng)
+    Id, I_C, _, _ = evaluate(params, bias)
+    # 대역 계산용 곡선은 배치 앞쪽 n_curves개 샘플에 대해서만 계산한다 (메모리 제한)
+    head = {name: value[:n_curves] for name, value in params.items()}
+    _, _, Id_curves, I_C_curves = evaluate(head, bias, Vds_sweep, V_BE_sweep)
+    return Id, I_C, Id_curves, I_C_curves
+
+
+def process_pool(jobs):
+    """
+    worker가 jobs개인 모듈 전역 프로세스 풀 (spawn 방식). 처음 요청할 때 만들고 이후 재사용하며,
+    worker 수가 바뀌면 새로 만든다.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool[0] != jobs:
+            if _pool is not None:
+                _pool[1].shutdown(wait=False)
+            _pool = (jobs, ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")))
+        return _pool[1]
+
+
+def run_monte_carlo(distributions=None, n_samples=10_000, bias=None, seed=0, jobs=1,
+                    batch_size=BATCH_SIZE, percentiles=(1, 5, 50, 95, 99), band_samples=5_000,
+                    Vds_sweep=None, V_BE_sweep=None):
+    """
+    Monte Carlo 해석 실행.
+
+    Parameters:
+    - distributions: 파라미터 분포 dict (기본값: default_distributions)
+    - n_samples: 샘플 수
+    - bias: 바이어스 조건 dict (기본값: default_bias)
+    - seed: 재현 가능한 RNG seed
+    - jobs: 프로세스 수 (1이면 현재 프로세스에서 계산, 아니면 process_pool(jobs)을 쓴다)
+    - batch_size: 배치 하나의 샘플 수
+    - percentiles: 대역으로 계산할 백분위수
+    - band_samples: 백분위 대역 계산에 사용할 최대 곡선 수
+    - Vds_sweep, V_BE_sweep: 대역을 계산할 sweep 축
+
+    Returns:
+    - MonteCarloResult
+    """
+    distributions = dict(default_distributions, **(distributions or {}))
+    bias = dict(default_bias, **(bias or {}))
+    Vds_sweep = np.linspace(0, 5, 100) if Vds_sweep is None else np.asarray(Vds_sweep, dtype=float)
+    V_BE_sweep = np.linspace(0.4, 0.8, 100) if V_BE_sweep is None else np.asarray(V_BE_sweep, dtype=float)
+
+    n_batches = max(1, math.ceil(n_samples / batch_size))
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    sizes = [min(batch_size, n_samples - i * batch_size) for i in range(n_batches)]
+    curves_per_batch = max(1, math.ceil(band_samples / n_batches))
+    tasks = [(distributions, bias, size, seed_seq, Vds_sweep, V_BE_sweep, curves_per_batch)
+             for size, seed_seq in zip(sizes, seeds)]
+
+    if jobs == 1 or n_batches == 1:
+        outputs = list(map(_run_batch, tasks))
+    else:
+        outputs = list(process_pool(jobs).map(_run_batch, tasks))
+
+    Id, I_C, Id_curves, I_C_curves = (np.concatenate(part) for part in zip(*outputs))
+    return MonteCarloResult(
+        Id=Id,
+        I_C=I_C,
+        Vds_sweep=Vds_sweep,
+        V_BE_sweep=V_BE_sweep,
+        Id_band={p: np.percentile(Id_curves, p, axis=0) for p in percentiles},
+        I_C_band={p: np.percentile(I_C_curves, p, axis=0) for p in percentiles},
+    )
+
+
+def run_corners(distributions=None, bias=None, corners=tuple(CORNERS), n_sigma=3.0,
+                Vds_sweep=None, V_BE_sweep=None):
+    """
+    공정 코너 해석. 모든 코너를 한 번의 벡터화 호출로 계산한다.
+
+    Returns:
+    - {코너 이름: (Id, I_C, Id 곡선, I_C 곡선)} dict
+    """
+    distributions = dict(default_distributions, **(distributions or {}))
+    bias = dict(default_bias, **(bias or {}))
+    Vds_sweep = np.linspace(0, 5, 100) if Vds_sweep is None else np.asarray(Vds_sweep, dtype=float)
+    V_BE_sweep = np.linspace(0.4, 0.8, 100) if V_BE_sweep is None else np.asarray(V_BE_sweep, dtype=float)
+
+    values = [corner_parameters(distributions, corner, n_sigma) for corner in corners]
+    params = {name: np.array([v[name] for v in values]) for name in distributions}
+    Id, I_C, Id_curves, I_C_curves = evaluate(params, bias, Vds_sweep, V_BE_sweep)
+    return {corner: (Id[i], I_C[i], Id_curves[i], I_C_curves[i]) for i, corner in enumerate(corners)}
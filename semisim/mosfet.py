@@ -0,0 +1,109 @@
+import numpy as np
+
+from semisim.mobility import cached_mobility, mobility_bulk
+from semisim.poisson import T_OX, oxide_capacitance, threshold_voltage
+
+T_ROOM = 300  # 기본 온도 (K)
+
+
+def _as_result(value):
+    """0차원 배열은 파이썬 float으로 돌려준다 (스칼라 입력 호환)."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def _device(N_A, T, Vt, Cox, t_ox):
+    """Vt, Cox가 주어지지 않으면 MOS Poisson 해 (기판 도핑, 산화막 두께, 온도)로부터 구한다."""
+    if Vt is None:
+        Vt = threshold_voltage(N_A, t_ox, T)
+    if Cox is None:
+        Cox = oxide_capacitance(t_ox)
+    return Vt, Cox
+
+
+def _beta(W, L, N_D, N_A, T, Cox, mu_eff):
+    """mu_eff * Cox * W / L 계산. mu_eff가 없으면 도핑 농도로부터 구한다."""
+    if mu_eff is None:  # 이동도에 농도 영향을 반영
+        if np.ndim(N_D) == np.ndim(N_A) == np.ndim(T) == 0:
+            mu_eff = cached_mobility(N_D, N_A, T)[2]
+        else:
+            mu_eff = mobility_bulk(N_D, N_A, T)[2]
+    W_cm = np.multiply(W, 1e-4)  # µm to cm
+    L_cm = np.multiply(L, 1e-4)  # µm to cm
+    return mu_eff * Cox * (W_cm / L_cm)
+
+
+# 드레인 전류 계산 함수
+def calculate_id(Vgs, Vds, W, L, N_D, N_A, T=T_ROOM, Vt=None, Cox=None, mu_eff=None, t_ox=T_OX):
+    """
+    MOSFET 드레인 전류 계산 함수 (square-law 모델).
+    모든 인자는 스칼라 또는 서로 broadcast 가능한 배열이며,
+    동작 영역은 분기 대신 마스크로 선택하므로 한 번의 호출로 전체 Id 텐서를 얻는다.
+
+    Parameters:
+    - Vgs: 게이트-소스 전압 (V)
+    - Vds: 드레인-소스 전압 (V)
+    - W: 채널 폭 (µm)
+    - L: 채널 길이 (µm)
+    - N_D: n형 도핑 농도 (cm^-3)
+    - N_A: p형 도핑 농도 (cm^-3)
+    - T: 온도 (K)
+    - Vt: 임계 전압 (V), None이면 N_A, t_ox, T에 대한 Poisson 해로부터 계산
+    - Cox: 산화막 캐패시턴스 (F/cm^2), None이면 t_ox로부터 계산
+    - mu_eff: 유효 이동도 (cm^2/V·s), None이면 N_D, N_A, T로부터 계산
+    - t_ox: 산화막 두께 (nm)
+
+    Returns:
+    - 드레인 전류 Id (A), 입력을 broadcast한 shape
+    """
+    Vt, Cox = _device(N_A, T, Vt, Cox, t_ox)
+    beta = _beta(W, L, N_D, N_A, T, Cox, mu_eff)
+    Vov = np.subtract(Vgs, Vt)
+    Vds = np.asarray(Vds, dtype=float)
+    beta, Vov, Vds = np.broadcast_arrays(beta, Vov, Vds)
+
+    on = Vov > 0  # 차단 영역 (Vgs < Vth) 제외
+    linear = on & (Vds < Vov)
+    saturation = on & ~linear
+
+    Id = np.zeros(beta.shape)
+    Id[linear] = beta[linear] * (Vov[linear] * Vds[linear] - Vds[linear] ** 2 / 2)
+    Id[saturation] = 0.5 * beta[saturation] * Vov[saturation] ** 2
+    return _as_result(Id)
+
+
+def small_signal(Vgs, Vds, W, L, N_D, N_A, T=T_ROOM, Vt=None, Cox=None, mu_eff=None, t_ox=T_OX):
+    """
+    소신호 파라미터 계산 함수. 인자는 calculate_id와 같다.
+
+    Returns:
+    - 트랜스컨덕턴스 gm = dId/dVgs (S)와 출력 컨덕턴스 gds = dId/dVds (S)
+    """
+    Vt, Cox = _device(N_A, T, Vt, Cox, t_ox)
+    beta = _beta(W, L, N_D, N_A, T, Cox, mu_eff)
+    Vov = np.subtract(Vgs, Vt)
+    Vds = np.asarray(Vds, dtype=float)
+    beta, Vov, Vds = np.broadcast_arrays(beta, Vov, Vds)
+
+    on = Vov > 0
+    linear = on & (Vds < Vov)
+    saturation = on & ~linear
+
+    gm = np.zeros(beta.shape)
+    gds = np.zeros(beta.shape)
+    gm[linear] = beta[linear] * Vds[linear]
+    gds[linear] = beta[linear] * (Vov[linear] - Vds[linear])
+    gm[saturation] = beta[saturation] * Vov[saturation]
+    return _as_result(gm), _as_result(gds)
+
+
+def id_grid(Vgs_values, Vds_values, W, L, N_D, N_A, **kwargs):
+    """
+    (Vgs, Vds) 바이어스 격자 전체의 드레인 전류 계산.
+
+    Returns:
+    - shape (len(Vgs_values), len(Vds_values))의 Id 배열.
+      각 행은 하나의 Vgs에 대한 출력 특성 곡선, 각 열은 하나의 Vds에 대한 전달 특성 곡선이다.
+    """
+    Vgs_grid = np.asarray(Vgs_values, dtype=float)[:, np.newaxis]
+    Vds_grid = np.asarray(Vds_values, dtype=float)[np.newaxis, :]
+    return calculate_id(Vgs_grid, Vds_grid, W, L, N_D, N_A, **kwargs)
@@ -0,0 +1,383 @@
+"""
+MOS 구조 (게이트 / 산화막 / p형 4H-SiC 기판)의 1D Poisson 해석.
+
+깊이 방향 전위 ψ(x) (기판 기준, V)에 대해
+
+    d/dx (ε_s dψ/dx) = -q (p - n - N_A),   p = N_A exp(-ψ/V_th),   n = (n_i² / N_A) exp(ψ/V_th)
+
+를 유한 체적법으로 이산화하고, 3중 대각 Jacobian을 갖는 Newton 반복으로 푼다.
+표면 경계는 산화막을 통한 Gauss 법칙 Cox (V_G - V_FB - ψ_s) = -Q_s, 기판 끝은 ψ = 0이다.
+여러 게이트 전압을 batch로 한 번에 풀며, 같은 정규화 격자를 쓰므로 이전 해를 초기값으로
+재사용 (warm start)할 수 있다.
+
+결과로 표면 전위 ψ_s, 반전층 전하 Q_inv (charge-sheet), 임계 전압 (ψ_s = 2φ_F인 V_G)을 얻는다.
+"""
+import functools
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+Q = 1.602176634e-19  # 기본 전하 (C)
+K_B = 8.617333262e-5  # 볼츠만 상수 (eV/K)
+EPS0 = 8.8541878128e-14  # 진공 유전율 (F/cm)
+EPS_SIC = 9.7  # 4H-SiC 비유전율
+EPS_OX = 3.9  # SiO2 비유전율
+
+# 4H-SiC 밴드 파라미터 (300 K 기준)
+SIC_BAND = {
+    "Eg0": 3.265,    # 0 K 밴드갭 (eV), Eg(T) = Eg0 - a T^2 / (T + b)
+    "Eg_a": 6.5e-4,
+    "Eg_b": 1300.0,
+    "Nc": 1.69e19,   # 전도대 유효 상태 밀도 (cm^-3)
+    "Nv": 2.49e19,   # 가전자대 유효 상태 밀도 (cm^-3)
+    "chi": 3.7,      # 전자 친화도 (eV)
+}
+
+T_OX = 50.0  # 기본 산화막 두께 (nm)
+PHI_M = 4.05  # n+ poly-Si 게이트 일함수 (eV)
+T_ROOM = 300
+
+N_NODES = 200  # 깊이 방향 격자 점 개수
+MESH_STRETCH = 8.0  # 표면 쪽으로 격자를 조밀하게 하는 정도
+V_G_SWEEP = np.linspace(-6.0, 8.0, 141)  # 특성 곡선을 계산하는 고정 게이트 전압 격자 (V)
+CACHE_SIZE = 256
+
+
+def oxide_capacitance(t_ox=T_OX):
+    """단위 면적당 산화막 캐패시턴스 Cox (F/cm^2), t_ox는 nm."""
+    return EPS_OX * EPS0 / (np.multiply(t_ox, 1e-7))
+
+
+def band_parameters(T=T_ROOM):
+    """
+    온도 T에서의 밴드 파라미터.
+
+    Returns:
+    - 열전압 V_th (V), 밴드갭 Eg (eV), 진성 캐리어 농도 n_i (cm^-3),
+      진성 준위의 midgap 대비 위치 (eV)
+    """
+    b = SIC_BAND
+    V_th = K_B * T
+    Eg = b["Eg0"] - b["Eg_a"] * T ** 2 / (T + b["Eg_b"])
+    scale = (T / 300) ** 1.5
+    Nc, Nv = b["Nc"] * scale, b["Nv"] * scale
+    n_i = np.sqrt(Nc * Nv) * np.exp(-Eg / (2 * V_th))
+    return V_th, Eg, n_i, V_th / 2 * np.log(Nv / Nc)
+
+
+def flat_band_voltage(N_A, T=T_ROOM, phi_m=PHI_M, Q_ox=0.0, t_ox=T_OX):
+    """
+    평탄대 전압 V_FB = φ_ms - Q_ox / Cox (V).
+
+    Parameters:
+    - N_A: 기판 도핑 농도 (cm^-3)
+    - T: 온도 (K)
+    - phi_m: 게이트 일함수 (eV)
+    - Q_ox: 산화막 고정 전하 (C/cm^2)
+    - t_ox: 산화막 두께 (nm)
+    """
+    V_th, Eg, n_i, Ei_offset = band_parameters(T)
+    phi_F = V_th * np.log(N_A / n_i)
+    phi_s = SIC_BAND["chi"] + Eg / 2 + Ei_offset + phi_F
+    return phi_m - phi_s - Q_ox / oxide_capacitance(t_ox)
+
+
+def _mesh(N_A, V_th, phi_F):
+    """
+    표면에서 조밀한 깊이 격자 x (cm). 정규화 좌표는 N_A와 무관하여 warm start가 가능하다.
+    인자가 배열이면 열마다 격자 하나인 shape (N_NODES + 1, batch)이다.
+    """
+    L_D = np.sqrt(EPS_SIC * EPS0 * V_th / (Q * N_A))  # Debye 길이
+    W_max = np.sqrt(2 * EPS_SIC * EPS0 * (2 * phi_F + 10 * V_th) / (Q * N_A))  # 최대 공핍 폭
+    depth = 3 * W_max + 10 * L_D
+    xi = np.expm1(MESH_STRETCH * np.arange(N_NODES + 1) / N_NODES) / np.expm1(MESH_STRETCH)
+    return np.multiply.outer(xi, depth)
+
+
+def _columns(x):
+    """격자를 (점, batch) 2차원으로 (1차원 격자는 모든 batch가 공유하는 열 하나)."""
+    return x[:, np.newaxis] if x.ndim == 1 else x
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """
+    3중 대각 선형 방정식을 Thomas 알고리즘으로 푼다. 첫 축이 격자 점, 나머지 축이 batch다.
+    lower[i]는 x[i-1], upper[i]는 x[i+1]의 계수다 (lower[0], upper[-1]은 사용하지 않는다).
+    """
+    n = diag.shape[0]
+    c = np.empty_like(diag)
+    d = np.empty_like(rhs)
+    c[0] = upper[0] / diag[0]
+    d[0] = rhs[0] / diag[0]
+    for i in range(1, n):
+        denom = diag[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / denom
+        d[i] = (rhs[i] - lower[i] * d[i - 1]) / denom
+    x = np.empty_like(d)
+    x[-1] = d[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d[i] - c[i] * x[i + 1]
+    return x
+
+
+def _depletion_guess(V_G, x, N_A, Cox, V_FB, V_th, phi_F):
+    """공핍 근사 해를 Newton 초기값으로 사용 (cold start)."""
+    eps = EPS_SIC * EPS0
+    gamma = np.sqrt(2 * Q * eps * N_A) / Cox
+    V = np.maximum(V_G - V_FB, 0.0)
+    psi_s = ((-gamma + np.sqrt(gamma ** 2 + 4 * V)) / 2) ** 2
+    psi_s = np.minimum(psi_s, 2 * phi_F + 6 * V_th)
+    psi_s = np.where(V_G < V_FB, np.maximum(V_G - V_FB, -6 * V_th), psi_s)
+    W_d = np.sqrt(2 * eps * np.abs(psi_s) / (Q * N_A)) + 1e-12
+    x = _columns(x)[:-1]
+    depleted = psi_s * np.clip(1 - x / W_d, 0, None) ** 2
+    L_D = np.sqrt(eps * V_th / (Q * N_A))
+    accumulated = psi_s * np.exp(-x / L_D)
+    return np.where(psi_s >= 0, depleted, accumulated)
+
+
+def _newton(V_G, x, N_A, Cox, V_FB, V_th, phi_F, psi, tol, max_iter, psi_surface=None):
+    """
+    batch Newton 반복. psi는 shape (N_NODES, batch)의 초기값 (마지막 점 ψ = 0은 제외).
+    나머지 인자는 스칼라 또는 batch 길이의 배열이고, x는 공유 격자 또는 열마다의 격자다.
+    psi_surface가 주어지면 게이트 경계 대신 표면 전위를 고정한다 (V_G는 사용하지 않는다).
+
+    Returns:
+    - 해 psi, 반복 횟수, 수렴 여부
+    """
+    eps = EPS_SIC * EPS0
+    h = np.diff(_columns(x), axis=0)
+    g = eps / h  # 인접한 점 사이의 결합 계수
+    w = np.empty_like(h)  # 점마다 담당하는 체적 폭
+    w[0] = h[0] / 2
+    w[1:] = (h[:-1] + h[1:]) / 2
+    g_left = np.concatenate([np.broadcast_to(Cox, psi[:1].shape), np.broadcast_to(g[:-1], psi[1:].shape)])
+    lower = g_left.copy()
+    lower[0] = 0.0
+    upper = np.broadcast_to(g, psi.shape).copy()
+    upper[-1] = 0.0
+    if psi_surface is not None:
+        upper[0] = 0.0
+    V_gate = V_G - V_FB
+
+    for iteration in range(1, max_iter + 1):
+        p = N_A * np.exp(np.clip(-psi / V_th, -700, 700))
+        n = N_A * np.exp(np.clip((psi - 2 * phi_F) / V_th, -700, 700))
+        rho = Q * (p - n - N_A)
+        drho = -Q / V_th * (p + n)
+
+        flux_left = np.empty_like(psi)
+        flux_left[0] = Cox * (V_gate - psi[0])
+        flux_left[1:] = g[:-1] * (psi[:-1] - psi[1:])
+        psi_next = np.vstack([psi[1:], np.zeros((1, psi.shape[1]))])
+        flux_right = g * (psi_next - psi)
+        F = flux_left + flux_right + rho * w
+        diag = -(g_left + g) + w * drho
+        if psi_surface is not None:
+            F[0] = psi[0] - psi_surface
+            diag[0] = 1.0
+
+        delta = solve_tridiagonal(lower, diag, upper, -F)
+        # 큰 단계는 열전압의 몇 배 이내로 제한 (지수항 때문에 Newton이 튀는 것을 막는다)
+        limit = 20 * V_th
+        delta = np.clip(delta, -limit, limit)
+        psi = psi + delta
+        if np.max(np.abs(delta)) < tol:
+            return psi, iteration, True
+    return psi, max_iter, False
+
+
+@dataclass(frozen=True)
+class MosSolution:
+    """한 파라미터 조합의 MOS 정전기 해."""
+    N_A: float
+    t_ox: float
+    T: float
+    Cox: float  # F/cm^2
+    V_FB: float  # V
+    phi_F: float  # V
+    Vt: float  # 임계 전압 (ψ_s = 2φ_F), V
+    V_G: np.ndarray  # 게이트 전압 격자 (V)
+    psi_s: np.ndarray  # 표면 전위 (V)
+    Q_inv: np.ndarray  # 반전층 전자 전하 크기 (C/cm^2)
+    Q_dep: np.ndarray  # 공핍/축적 전하 (C/cm^2)
+    x: np.ndarray  # 깊이 (cm)
+    psi: np.ndarray  # 전위 분포, shape (len(V_G), len(x))
+    iterations: int  # 전체 Newton 반복 횟수
+
+    def profile(self, V_G):
+        """V_G에 가장 가까운 격자 점의 (깊이 (cm), 전위 (V)) 분포."""
+        index = int(np.argmin(np.abs(self.V_G - V_G)))
+        return self.x, self.psi[index]
+
+
+class _WarmStart:
+    """직전 해 (고정 V_G_SWEEP 격자에서의 전위 분포). 모든 세션이 공유하는 Newton 초기값이다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._psi = None
+
+    def get(self):
+        with self._lock:
+            return None if self._psi is None else self._psi.copy()
+
+    def set(self, psi):
+        with self._lock:
+            self._psi = psi
+
+
+_warm_start = _WarmStart()
+
+
+def solve_mos(V_G, N_A, t_ox=T_OX, T=T_ROOM, Q_ox=0.0, initial=None, tol=1e-9, max_iter=100):
+    """
+    게이트 전압 배열 V_G에 대한 1D Poisson 해.
+
+    Parameters:
+    - V_G: 게이트 전압 (V), 스칼라 또는 1차원 배열
+    - N_A: 기판 도핑 농도 (cm^-3)
+    - t_ox: 산화막 두께 (nm)
+    - T: 온도 (K)
+    - Q_ox: 산화막 고정 전하 (C/cm^2)
+    - initial: 초기 전위 분포 shape (len(V_G), N_NODES + 1), None이면 공핍 근사로 시작
+    - tol: 수렴 판정 전위 변화량 (V)
+
+    Returns:
+    - 표면 전위 ψ_s (V), 반전층 전하 Q_inv (C/cm^2), 깊이 x (cm), 전위 분포 psi, Newton 반복 횟수
+    """
+    V_G = np.atleast_1d(np.asarray(V_G, dtype=float))
+    V_th, _, n_i, _ = band_parameters(T)
+    phi_F = V_th * np.log(N_A / n_i)
+    Cox = oxide_capacitance(t_ox)
+    V_FB = flat_band_voltage(N_A, T, Q_ox=Q_ox, t_ox=t_ox)
+    x = _mesh(N_A, V_th, phi_F)
+
+    iterations = 0
+    converged = False
+    if initial is not None:
+        psi, iterations, converged = _newton(V_G, x, N_A, Cox, V_FB, V_th, phi_F,
+                                             np.asarray(initial, dtype=float)[:, :-1].T, tol, max_iter)
+    if not converged:  # cold start 또는 warm start 실패
+        guess = _depletion_guess(V_G, x, N_A, Cox, V_FB, V_th, phi_F)
+        psi, cold, converged = _newton(V_G, x, N_A, Cox, V_FB, V_th, phi_F, guess, tol, max_iter)
+        iterations += cold
+    if not converged:
+        raise RuntimeError(f"MOS Poisson 해가 수렴하지 않음 (N_A={N_A:g}, t_ox={t_ox:g}, T={T:g})")
+
+    psi = np.vstack([psi, np.zeros((1, psi.shape[1]))]).T  # 기판 끝 ψ = 0 추가
+    n = N_A * np.exp(np.clip((psi - 2 * phi_F) / V_th, -700, 700))
+    Q_inv = Q * np.sum((n[:, 1:] + n[:, :-1]) / 2 * np.diff(x), axis=-1)  # 사다리꼴 적분
+    return psi[:, 0], Q_inv, x, psi, iterations
+
+
+def _threshold(N_A, t_ox, T, Q_ox, V_G, psi_s, psi, tol=1e-9, max_iter=100):
+    """
+    임계 전압: 표면 전위를 2φ_F로 고정하고 풀어, 표면 점의 Gauss 법칙으로 V_G를 역산한다.
+    가장 가까운 격자 해를 초기값으로 쓰므로 몇 번의 반복으로 끝난다.
+
+    Returns:
+    - 임계 전압 (V), Newton 반복 횟수
+    """
+    V_th, _, n_i, _ = band_parameters(T)
+    phi_F = V_th * np.log(N_A / n_i)
+    Cox = oxide_capacitance(t_ox)
+    V_FB = flat_band_voltage(N_A, T, Q_ox=Q_ox, t_ox=t_ox)
+    x = _mesh(N_A, V_th, phi_F)
+    index = int(np.argmin(np.abs(psi_s - 2 * phi_F)))
+    initial = psi[index, :-1, np.newaxis].copy()
+    solution, iterations, converged = _newton(V_G[index:index + 1], x, N_A, Cox, V_FB, V_th, phi_F,
+                                              initial, tol, max_iter, psi_surface=2 * phi_F)
+    if not converged:
+        raise RuntimeError(f"MOS 임계 전압 계산이 수렴하지 않음 (N_A={N_A:g}, t_ox={t_ox:g}, T={T:g})")
+    return float(_gate_voltage(solution, x, N_A, Cox, V_FB, V_th, phi_F)[0]), iterations
+
+
+def _gate_voltage(psi, x, N_A, Cox, V_FB, V_th, phi_F):
+    """표면 점 (반 체적)의 전하 보존 Cox (V_G - V_FB - ψ_0) + g_0 (ψ_1 - ψ_0) + ρ_0 h_0 / 2 = 0으로 V_G 역산."""
+    psi0, psi1 = psi[0], psi[1]
+    h0 = x[1] - x[0]
+    p = N_A * np.exp(-psi0 / V_th)
+    n = N_A * np.exp((psi0 - 2 * phi_F) / V_th)
+    rho0 = Q * (p - n - N_A)
+    flux = EPS_SIC * EPS0 / h0 * (psi1 - psi0) + rho0 * h0 / 2
+    return V_FB + psi0 - flux / Cox
+
+
+def _threshold_batch(N_A, t_ox, T, Q_ox, tol=1e-9, max_iter=100):
+    """
+    여러 파라미터 조합 (1차원 배열)의 임계 전압을 한 번의 batch Newton 반복으로 구한다.
+    표면 전위를 2φ_F로 고정한 해는 V_G와 무관하므로, 열마다 자기 격자와 밴드 파라미터를 갖는
+    batch로 풀 수 있다. 초기값은 ψ_s = 2φ_F인 공핍 근사 해다.
+
+    Returns:
+    - 임계 전압 배열 (V)
+    """
+    V_th, _, n_i, _ = band_parameters(T)
+    phi_F = V_th * np.log(N_A / n_i)
+    Cox = oxide_capacitance(t_ox)
+    V_FB = flat_band_voltage(N_A, T, Q_ox=Q_ox, t_ox=t_ox)
+    x = _mesh(N_A, V_th, phi_F)
+    # 공핍 근사의 임계 전압: 초기값의 표면 전위가 정확히 2φ_F가 된다
+    V_G = V_FB + 2 * phi_F + np.sqrt(2 * Q * EPS_SIC * EPS0 * N_A * 2 * phi_F) / Cox
+    guess = _depletion_guess(V_G, x, N_A, Cox, V_FB, V_th, phi_F)
+    solution, _, converged = _newton(V_G, x, N_A, Cox, V_FB, V_th, phi_F, guess, tol, max_iter,
+                                     psi_surface=2 * phi_F)
+    if not converged:
+        raise RuntimeError("MOS 임계 전압 batch 계산이 수렴하지 않음")
+    return _gate_voltage(solution, x, N_A, Cox, V_FB, V_th, phi_F)
+
+
+def _key(value):
+    """slider 값의 부동소수점 잡음이 캐시를 깨지 않도록 유효숫자 10자리로 정규화."""
+    return float(f"{float(value):.10g}")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _mos_solution(N_A, t_ox, T, Q_ox):
+    initial = _warm_start.get()
+    psi_s, Q_inv, x, psi, iterations = solve_mos(V_G_SWEEP, N_A, t_ox, T, Q_ox, initial=initial)
+    _warm_start.set(psi)
+    Vt, refine = _threshold(N_A, t_ox, T, Q_ox, V_G_SWEEP, psi_s, psi)
+    Cox = float(oxide_capacitance(t_ox))
+    V_FB = float(flat_band_voltage(N_A, T, Q_ox=Q_ox, t_ox=t_ox))
+    V_th, _, n_i, _ = band_parameters(T)
+    Q_s = -Cox * (V_G_SWEEP - V_FB - psi_s)  # Gauss 법칙: 반도체 전체 전하
+    for array in (psi_s, Q_inv, x, psi):
+        array.setflags(write=False)
+    return MosSolution(
+        N_A=N_A, t_ox=t_ox, T=T, Cox=Cox, V_FB=V_FB, phi_F=float(V_th * np.log(N_A / n_i)),
+        Vt=Vt, V_G=V_G_SWEEP, psi_s=psi_s, Q_inv=Q_inv, Q_dep=Q_s + Q_inv, x=x, psi=psi,
+        iterations=iterations + refine,
+    )
+
+
+def mos_solution(N_A, t_ox=T_OX, T=T_ROOM, Q_ox=0.0):
+    """
+    파라미터 조합에 대한 MOS 정전기 해 (V_G_SWEEP 격자 전체와 임계 전압).
+    결과는 프로세스 전역 LRU 캐시에 저장되고, 새 조합은 직전 해에서 warm start한다.
+
+    Returns:
+    - MosSolution
+    """
+    return _mos_solution(_key(N_A), _key(t_ox), _key(T), _key(Q_ox))
+
+
+def threshold_voltage(N_A, t_ox=T_OX, T=T_ROOM, Q_ox=0.0):
+    """
+    임계 전압 Vt (V). 인자는 스칼라 또는 broadcast 가능한 배열이다.
+    스칼라는 캐시된 Poisson 해를 쓰고, 배열이면 서로 다른 값의 조합 전체를 한 번의
+    batch Newton 반복으로 푼다 (예: 온도 배열 전체의 Vt(T)).
+    """
+    N_A, t_ox, T, Q_ox = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (N_A, t_ox, T, Q_ox)))
+    if N_A.ndim == 0:
+        return mos_solution(N_A, t_ox, T, Q_ox).Vt
+    combos, inverse = np.unique(np.stack([a.ravel() for a in (N_A, t_ox, T, Q_ox)], axis=1),
+                                axis=0, return_inverse=True)
+    values = _threshold_batch(*combos.T)
+    return values[inverse.ravel()].reshape(N_A.shape)
+
+
+def cache_info():
+    return _mos_solution.cache_info()
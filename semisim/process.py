@@ -0,0 +1,376 @@
+"""
+MOSFET 공정 단계의 layer stack 엔진.
+
+웨이퍼를 (x, z) 평면의 직사각형 column으로 나누고, 각 column은 아래에서 위로 쌓인
+(물질, y0, y1) 구간의 tuple로 표현한다 (길이 단위 µm). 열산화/증착/패턴/현상/식각/애싱/CMP 연산은
+이전 단계의 snapshot으로부터 새 snapshot을 만들고, 단계별 snapshot은 캐시되어 앞뒤 이동은 O(1) 조회가 된다.
+브라우저에는 겹치는 column을 합친 box 목록만 JSON으로 전달한다. 공정 페이지의 뷰어는 모든 단계의
+box 목록을 받아 단계 이동을 브라우저 안에서 처리하며, 공정 조건이 바뀌면 단면이 바뀐 단계만 다시 받는다
+(delta). 단계별 box JSON은 단계 키 (그 단계까지의 공정 흐름 hash, keys)로 세션 간에 공유한다.
+산화막 / 증착막 두께와 접합 깊이는 recipe (DEFAULT_RECIPE)로부터 semisim.kinetics가 계산한다.
+3D 뷰의 막 모양은 z 띠마다 같은 공정 흐름을 단면 level set으로 푼 semisim.topography가 정하고
+(식각 undercut, conformal 증착, CMP erosion), column snapshot은 노광 / 주입 창 계산과 마스크 표시에 쓴다.
+"""
+import functools
+import json
+import threading
+from dataclasses import dataclass
+
+from semisim.cache import shared_cache
+from semisim.render import canonical_key
+from semisim.topography import TopographyEngine
+
+# 물질별 표시 색상
+MATERIAL_COLORS = {
+    "Si": 0x87CEFA,
+    "Oxide": 0xA9A9A9,
+    "PR": 0xFF0000,
+    "Mask": 0x000000,
+    "GateOxide": 0x7F7F7F,
+    "Poly": 0x0000FF,
+    "N+": 0x4682B4,
+    "ILD": 0x8F8F8F,
+    "Al": 0x800080,
+}
+
+OXIDES = ("Oxide", "GateOxide")  # 열산화로 두꺼워지는 산화막 물질
+
+WAFER = (-2.0, 2.0, -1.5, 1.5)  # 웨이퍼 영역 (x0, x1, z0, z1)
+WAFER_THICKNESS = 1.0
+MASK_THICKNESS = 0.2
+MASK_GAP = 0.2  # PR 윗면과 마스크 사이 간격
+ENGINE_CACHE_SIZE = 8
+STEP_CACHE_BYTES = 16 * 1024 * 1024  # 세션 공유 단계별 box JSON 캐시 크기 상한
+
+# 마스크 영역 (x0, x1, z0, z1)
+BACK = (-2.0, 2.0, -1.5, -0.3)
+SOURCE_DRAIN_MASK = ((-2.0, -1.5, -1.5, 1.5), (1.5, 2.0, -1.5, 1.5), BACK)
+GATE_MASK = ((-0.5, 0.5, -0.3, 1.5),)
+IMPLANT_WINDOWS = ((-1.75, -0.25, -0.5, 1.5), (0.25, 1.75, -0.5, 1.5))
+CONTACT_MASK = ((-2.0, -1.4, -1.5, 1.5), (1.4, 2.0, -1.5, 1.5),
+                (-0.6, -0.4, -1.5, 1.5), (0.4, 0.6, -1.5, 1.5), BACK)
+METAL_MASK = ((-2.0, -1.7, -1.5, 1.5), (1.7, 2.0, -1.5, 1.5),
+              (-0.55, -0.45, -1.5, 1.5), (0.45, 0.55, -1.5, 1.5), BACK)
+
+# 산화 / 증착 recipe: 막 두께는 semisim.kinetics (Deal-Grove, CVD/PVD 속도)로 계산한다
+DEFAULT_RECIPE = {
+    "field_ambient": "wet", "field_T": 1000.0, "field_min": 70.0,  # 필드 산화막 약 0.5 µm
+    "gate_ambient": "dry", "gate_T": 1000.0, "gate_min": 30.0,  # 게이트 산화막 약 50 nm
+    "poly_T": 620.0, "poly_min": 28.0,  # LPCVD Poly-Si 약 0.25 µm
+    "ild_T": 700.0, "ild_min": 70.0,  # LPCVD TEOS ILD 약 1 µm
+    "al_min": 0.8,  # Al sputtering 약 0.4 µm
+    "junction_depth": 0.16,  # N+ 접합 깊이 (µm), semisim.implant 결과
+}
+
+
+def film_thicknesses(recipe=None):
+    """
+    recipe의 막 두께 (µm): 맨 Si 위에서 자란 필드 / 게이트 산화막, Poly-Si, ILD, Al.
+    (이미 산화막이 있는 곳에서의 추가 성장은 공정 엔진이 column마다 계산한다)
+    """
+    from semisim.kinetics import film_thickness, oxide_thickness
+    recipe = {**DEFAULT_RECIPE, **(recipe or {})}
+    return {
+        "Oxide": float(oxide_thickness(recipe["field_min"], recipe["field_T"], recipe["field_ambient"])),
+        "GateOxide": float(oxide_thickness(recipe["gate_min"], recipe["gate_T"], recipe["gate_ambient"])),
+        "Poly": float(film_thickness("Poly", recipe["poly_min"], recipe["poly_T"])),
+        "ILD": float(film_thickness("ILD", recipe["ild_min"], recipe["ild_T"])),
+        "Al": float(film_thickness("Al", recipe["al_min"])),
+    }
+
+
+def process_flow(recipe=None):
+    """
+    공정 흐름: (설명, 연산 이름, 연산 인자) 목록. 산화 / 증착 조건과 접합 깊이는 recipe에서 온다.
+    """
+    recipe = {**DEFAULT_RECIPE, **(recipe or {})}
+    films = film_thicknesses(recipe)
+    field = {"ambient": recipe["field_ambient"], "T_C": recipe["field_T"], "minutes": recipe["field_min"]}
+    gate = {"ambient": recipe["gate_ambient"], "T_C": recipe["gate_T"], "minutes": recipe["gate_min"]}
+    return [
+        ("1. 웨이퍼(P-Silicon)", "wafer", {}),
+        ("2. 열산화를 통해 산화막(SiO2) 형성", "oxidize", {"material": "Oxide", **field}),
+        ("3. 포토레지스트(Positive PR) 도포", "deposit", {"material": "PR", "thickness": 0.2}),
+        ("4. 소스/드레인 부분 마스크, 노광 공정을 통해 패턴 형성", "pattern", {"mask": SOURCE_DRAIN_MASK}),
+        ("5. 현상(Develope)을 통해 빛을 받은 부분 제거", "develop", {}),
+        ("6. 식각(Etching)을 통해 PR이 없는 부분의 산화막 제거", "etch", {"materials": ("Oxide",)}),
+        ("7. 애싱(Ashing)을 통해 PR 제거", "ash", {}),
+        ("8. 열산화를 통해 Gate 산화막 형성", "oxidize", {"material": "GateOxide", **gate}),
+        ("9. 증착을 통해 Poly-Si 형성", "deposit", {"material": "Poly", "thickness": films["Poly"]}),
+        ("10. PR 도포", "deposit", {"material": "PR", "thickness": 0.1}),
+        ("11. Mask 추가 후 노광 공정을 통해 패턴 형성", "pattern", {"mask": GATE_MASK}),
+        ("12. 현상(Develope)을 통해 빛을 받은 부분 제거", "develop", {}),
+        ("13. 식각(Etching)을 통해 PR이 없는 부분의 산화막과 Poly-Si 제거", "etch", {"materials": ("Poly", "GateOxide")}),
+        ("14. 애싱(Ashing)을 통해 PR 제거", "ash", {}),
+        ("15. 이온 주입 공정 후 확산을 통해 P-type실리콘에 N+ 영역 생성", "implant",
+         {"windows": IMPLANT_WINDOWS, "material": "N+", "depth": recipe["junction_depth"]}),
+        ("16. ILD(SiO2) 증착 후 CMP(연마)", "cmp", {"material": "ILD", "thickness": films["ILD"]}),
+        ("17. PR 도포", "deposit", {"material": "PR", "thickness": 0.2}),
+        ("18. Mask 추가 후 노광 공정을 통해 패턴 형성", "pattern", {"mask": CONTACT_MASK}),
+        ("19. 현상(Develope)을 통해 빛을 받은 부분 제거", "develop", {}),
+        ("20. 식각(Etching)을 통해 빛을 받은 부분의 ILD(SiO2) 제거", "etch", {"materials": ("ILD",)}),
+        ("21. 애싱(Ashing)을 통해 PR 제거", "ash", {}),
+        ("22. Metal(Al) 증착 후 CMP(연마)", "cmp", {"material": "Al", "thickness": films["Al"]}),
+        ("23. PR 도포", "deposit", {"material": "PR", "thickness": 0.2}),
+        ("24. Mask 추가 후 노광 공정을 통해 패턴 형성", "pattern", {"mask": METAL_MASK, "tone": "negative"}),
+        ("25. 현상(Develope)을 통해 빛을 받은 부분 제거", "develop", {}),
+        ("26. 식각(Etching)을 통해 Metal 제거", "etch", {"materials": ("Al",)}),
+        ("27. 애싱(Ashing)을 통해 PR 제거", "ash", {}),
+    ]
+
+
+PROCESS_FLOW = process_flow()
+
+
+@dataclass(frozen=True)
+class Box:
+    """직육면체 하나: 물질과 (x0, x1, y0, y1, z0, z1) 범위."""
+    material: str
+    x0: float
+    x1: float
+    y0: float
+    y1: float
+    z0: float
+    z1: float
+
+    @property
+    def position(self):
+        return ((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2, (self.z0 + self.z1) / 2)
+
+    @property
+    def size(self):
+        return (self.x1 - self.x0, self.y1 - self.y0, self.z1 - self.z0)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    한 공정 단계의 불변 상태.
+
+    - columns: column별 (물질, y0, y1) 구간 tuple (아래에서 위 순서)
+    - mask: 노광 중인 마스크 영역 (표시용), 없으면 빈 tuple
+    - exposed: 노광된 column 인덱스 집합 (현상 전까지 유지)
+    """
+    columns: tuple
+    mask: tuple = ()
+    exposed: frozenset = frozenset()
+
+
+class ProcessEngine:
+    """
+    공정 흐름을 단계별로 계산하는 엔진.
+    column 격자는 공정 흐름의 모든 마스크 경계로부터 한 번만 만든다.
+    """
+
+    def __init__(self, flow=PROCESS_FLOW):
+        self.flow = flow
+        xs, zs = {WAFER[0], WAFER[1]}, {WAFER[2], WAFER[3]}
+        for _, _, args in flow:
+            for x0, x1, z0, z1 in args.get("mask", ()) + args.get("windows", ()):
+                xs.update((x0, x1))
+                zs.update((z0, z1))
+        self.x_edges = sorted(xs)
+        self.z_edges = sorted(zs)
+        # column 인덱스 -> (x0, x1, z0, z1)
+        self.cells = [(x0, x1, z0, z1)
+                      for z0, z1 in zip(self.z_edges, self.z_edges[1:])
+                      for x0, x1 in zip(self.x_edges, self.x_edges[1:])]
+        self.bands = list(zip(self.z_edges, self.z_edges[1:]))
+        # z 띠마다 가운데에서 자른 단면의 topography
+        self.topography = TopographyEngine(flow, cuts=[(z0 + z1) / 2 for z0, z1 in self.bands])
+        # 단계 키: z 띠와 그 단계 단면의 키 (마스크 표시도 단면 키가 포함하는 흐름 앞부분으로 정해진다)
+        self.keys = [canonical_key("step", [self.bands, key]) for key in self.topography.keys]
+        self._snapshots = []
+        # 여러 세션 (스레드)이 공유하므로 증분 계산 중에 다른 스레드가 끼어들지 않게 한다
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.flow)
+
+    def _covered(self, rects):
+        """rects 안에 들어가는 column 인덱스 집합."""
+        return frozenset(
+            i for i, (x0, x1, z0, z1) in enumerate(self.cells)
+            if any(rx0 <= x0 and x1 <= rx1 and rz0 <= z0 and z1 <= rz1 for rx0, rx1, rz0, rz1 in rects)
+        )
+
+    # --- 공정 연산 ---------------------------------------------------------
+
+    def wafer(self, state):
+        return Snapshot(tuple((("Si", -WAFER_THICKNESS, 0.0),) for _ in self.cells))
+
+    def deposit(self, state, material, thickness):
+        """각 column 윗면 위에 같은 두께로 쌓는 conformal 증착."""
+        return Snapshot(tuple(col + ((material, col[-1][2], col[-1][2] + thickness),)
+                              for col in state.columns))
+
+    def cmp(self, state, material, thickness):
+        """증착 후 CMP 평탄화: 가장 높은 윗면 위 thickness 높이까지 채우고 그 높이에서 연마한다."""
+        level = max(col[-1][2] for col in state.columns) + thickness
+        return Snapshot(tuple(col + ((material, col[-1][2], level),) if col[-1][2] < level else col
+                              for col in state.columns))
+
+    def oxidize(self, state, material, ambient, T_C, minutes):
+        """
+        Deal-Grove 열산화. Si가 드러난 column에는 새 산화막 (material)이 자라고, Si 위에 산화막이 있는
+        column은 그 산화막이 더 두꺼워진다 (기존 두께에서 시작하므로 더 느리게 자란다).
+        늘어난 두께의 SI_CONSUMED 비율만큼 Si가 소모되어 Si/산화막 경계가 내려간다.
+        다른 물질이 덮은 column은 산화되지 않는다.
+        """
+        from semisim.kinetics import SI_CONSUMED, oxide_thickness
+
+        def oxide_on_si(col):
+            return len(col) >= 2 and col[-2][0] == "Si" and col[-1][0] in OXIDES
+
+        x0 = [col[-1][2] - col[-1][1] if oxide_on_si(col) else 0.0 for col in state.columns]
+        x = oxide_thickness(minutes, T_C, ambient, x0)  # 모든 column을 한 번에 계산
+        columns = []
+        for col, old, new in zip(state.columns, x0, x.tolist()):
+            growth = new - old
+            if col[-1][0] == "Si":
+                _, y0, y1 = col[-1]
+                interface = y1 - SI_CONSUMED * growth
+                col = col[:-1] + (("Si", y0, interface), (material, interface, interface + new))
+            elif oxide_on_si(col):
+                (_, y0, y1), (oxide, _, _) = col[-2], col[-1]
+                interface = y1 - SI_CONSUMED * growth
+                col = col[:-2] + (("Si", y0, interface), (oxide, interface, interface + new))
+            columns.append(col)
+        return Snapshot(tuple(columns))
+
+    def pattern(self, state, mask, tone="positive"):
+        """마스크를 올리고 노광. positive PR은 마스크 밖, negative PR은 마스크 아래가 현상된다."""
+        covered = self._covered(mask)
+        exposed = covered if tone == "negative" else frozenset(range(len(self.cells))) - covered
+        return Snapshot(state.columns, mask=tuple(mask), exposed=exposed)
+
+    def develop(self, state):
+        """노광된 column의 PR과 마스크 제거."""
+        return Snapshot(tuple(col[:-1] if i in state.exposed and col[-1][0] == "PR" else col
+                              for i, col in enumerate(state.columns)))
+
+    def etch(self, state, materials):
+        """PR로 덮이지 않은 column에서 윗면부터 연속된 materials 구간을 제거 (이방성 식각)."""
+        columns = []
+        for col in state.columns:
+            while len(col) > 1 and col[-1][0] in materials:
+                col = col[:-1]
+            columns.append(col)
+        columns = [old if old[-1][0] == "PR" else new for old, new in zip(state.columns, columns)]
+        return Snapshot(tuple(columns))
+
+    def ash(self, state):
+        """모든 PR 제거."""
+        return Snapshot(tuple(tuple(seg for seg in col if seg[0] != "PR") for col in state.columns))
+
+    def implant(self, state, windows, material, depth):
+        """
+        창 안에서 Si가 드러난 column의 Si 윗부분 depth 만큼을 도핑 영역으로 바꾼다.
+        산화막과 게이트가 덮은 곳은 주입을 막는다 (자기 정렬).
+        """
+        inside = self._covered(windows)
+        columns = []
+        for i, col in enumerate(state.columns):
+            if i in inside and len(col) == 1 and col[0][0] == "Si":
+                _, y0, y1 = col[0]
+                col = (("Si", y0, y1 - depth), (material, y1 - depth, y1))
+            columns.append(col)
+        return Snapshot(tuple(columns))
+
+    # --- 단계별 snapshot ---------------------------------------------------
+
+    def snapshot(self, step):
+        """step 단계의 snapshot. 마지막으로 계산한 단계부터 증분 계산하고 캐시한다."""
+        with self._lock:
+            while len(self._snapshots) <= step:
+                _, op, args = self.flow[len(self._snapshots)]
+                previous = self._snapshots[-1] if self._snapshots else None
+                self._snapshots.append(getattr(self, op)(previous, **args))
+            return self._snapshots[step]
+
+    def openings(self, op="implant"):
+        """
+        op 연산 (첫 번째) 단계의 주입 창 중 Si 윗면이 드러난 가로 구간 (x0, x1) 목록.
+        산화막이나 게이트가 덮은 곳은 주입을 막으므로 (자기 정렬) 창보다 좁을 수 있다.
+        단면은 첫 번째 창의 z 가운데에서 자른다.
+        """
+        step = next(i for i, (_, name, _) in enumerate(self.flow) if name == op)
+        windows = self.flow[step][2]["windows"]
+        z = (windows[0][2] + windows[0][3]) / 2
+        state = self.snapshot(step - 1)
+        spans = [(x0, x1) for (x0, x1, z0, z1), col in zip(self.cells, state.columns)
+                 if z0 <= z < z1 and col[-1][0] == "Si"
+                 and any(wx0 <= x0 and x1 <= wx1 for wx0, wx1, _, _ in windows)]
+        return _merge_spans(spans)
+
+    def boxes(self, step):
+        """
+        step 단계의 box 목록. 띠별 단면 topography의 box를 띠 폭만큼 z 방향으로 늘리고,
+        같은 물질/범위의 인접한 띠는 하나의 box로 합친다.
+        """
+        strips = {}
+        for (z0, z1), pieces in zip(self.bands, self.topography.boxes(step)):
+            for material, x0, x1, y0, y1 in pieces:
+                strips.setdefault((material, y0, y1, x0, x1), []).append((z0, z1))
+        boxes = [Box(material, x0, x1, y0, y1, z0, z1)
+                 for (material, y0, y1, x0, x1), spans in strips.items()
+                 for z0, z1 in _merge_spans(spans)]
+
+        state = self.snapshot(step)
+        top = max(box.y1 for box in boxes)
+        y0 = top + MASK_GAP
+        boxes += [Box("Mask", x0, x1, y0, y0 + MASK_THICKNESS, z0, z1) for x0, x1, z0, z1 in state.mask]
+        return boxes
+
+    def _compact(self, boxes):
+        """box 목록 -> [[물질, x, y, z, w, h, d], ...]"""
+        return [[box.material, *(round(v, 4) for v in box.position + box.size)] for box in boxes]
+
+    def step_json(self, step):
+        """step 단계의 compact box 목록 JSON ([[물질, x, y, z, w, h, d], ...]). 단계 키로 세션 간에 공유한다."""
+        return step_cache.get_or_compute(
+            self.keys[step], lambda: json.dumps(self._compact(self.boxes(step)), separators=(",", ":")))
+
+    def delta(self, known=()):
+        """
+        모든 단계의 키와, 키가 known (브라우저가 이미 가진 단계 키)에 없는 단계의 box만 담은 compact JSON.
+        형식: {"colors": {물질: 색상}, "descriptions": [설명, ...], "keys": [단계 키, ...],
+        "steps": {"단계 인덱스": [[물질, x, y, z, w, h, d], ...], ...}}
+        """
+        head = json.dumps({
+            "colors": MATERIAL_COLORS,
+            "descriptions": [description for description, _, _ in self.flow],
+            "keys": self.keys,
+        }, ensure_ascii=False, separators=(",", ":"))
+        steps = ",".join(f'"{step}":{self.step_json(step)}' for step, key in enumerate(self.keys) if key not in known)
+        return head[:-1] + ',"steps":{' + steps + "}}"
+
+
+def _merge_spans(spans):
+    """정렬된 (a, b) 구간 중 맞닿은 구간을 합친다."""
+    merged = []
+    for a, b in sorted(spans):
+        if merged and merged[-1][1] == a:
+            merged[-1] = (merged[-1][0], b)
+        else:
+            merged.append((a, b))
+    return merged
+
+
+step_cache = shared_cache("process_steps", STEP_CACHE_BYTES)
+
+
+@functools.lru_cache(maxsize=ENGINE_CACHE_SIZE)
+def _recipe_engine(recipe):
+    return ProcessEngine(process_flow(dict(recipe)))
+
+
+def recipe_engine(recipe=None):
+    """recipe (DEFAULT_RECIPE에서 바꿀 항목 dict)의 공정 흐름 엔진. recipe별로 프로세스 전역에서 공유한다."""
+    return _recipe_engine(tuple(sorted({**DEFAULT_RECIPE, **(recipe or {})}.items())))
+
+
+@functools.lru_cache(maxsize=1)
+def default_engine():
+    """프로세스 전역에서 공유하는 기본 공정 흐름 엔진."""
+    return ProcessEngine()
@@ -0,0 +1,243 @@
+"""
+rerun 프로파일러 (opt-in).
+
+``?profile=1`` 쿼리 파라미터 또는 ``SEMISIM_PROFILE=1`` 환경 변수로 켠다.
+페이지의 주요 구간을 section으로 감싸 시간과 메모리 할당량을 기록하고,
+사이드바에 rerun별 구간 분석과 최근 rerun의 p50/p95를 표시한다.
+기록은 Chrome trace-event JSON (chrome://tracing, Perfetto)으로 내보낼 수 있다.
+
+메모리는 tracemalloc으로 재는데, tracemalloc은 프로세스 전역이다. 프로파일링 중인 세션이 하나라도
+있는 동안만 켜 두고 (세션 수를 세어 마지막 세션이 끝나거나 프로파일링을 끄면 멈춘다), 할당량과
+최대값은 같은 시간에 실행 중인 다른 세션의 할당까지 포함한 프로세스 전체 값으로 표시한다.
+
+    from semisim import profiler
+
+    profiler.start()                      # 페이지 맨 위
+    with profiler.section("mobility"):    # 측정할 구간
+        ...
+    profiler.panel()                      # 페이지 맨 아래: 사이드바 패널 표시
+"""
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import defaultdict, deque
+
+ENV_VAR = "SEMISIM_PROFILE"
+QUERY_PARAM = "profile"
+SESSION_KEY = "_semisim_profiler"
+HISTORY = 200  # p50/p95 계산에 사용하는 최근 rerun 수
+MAX_EVENTS = 20_000  # 보관할 trace event 수
+
+_tracing_lock = threading.Lock()
+_tracing_sessions = 0  # tracemalloc을 쓰는 프로파일러 수
+_owns_tracing = False  # tracemalloc을 이 모듈이 켰는지 (다른 곳에서 켠 경우 멈추지 않는다)
+
+
+def _acquire_tracing():
+    global _tracing_sessions, _owns_tracing
+    with _tracing_lock:
+        if _tracing_sessions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _tracing_sessions += 1
+
+
+def _release_tracing():
+    global _tracing_sessions, _owns_tracing
+    with _tracing_lock:
+        _tracing_sessions -= 1
+        if _tracing_sessions == 0 and _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+class Profiler:
+    """
+    한 세션의 rerun별 구간 시간과 할당량 기록.
+    track_memory이면 살아 있는 동안 tracemalloc을 켜 두고, close()하거나 회수되면 참조를 놓는다.
+    """
+
+    def __init__(self, track_memory=True):
+        self.track_memory = track_memory
+        self._release = None
+        if track_memory:
+            _acquire_tracing()
+            self._release = weakref.finalize(self, _release_tracing)
+        self.rerun = 0
+        self.records = []  # 현재 rerun: (이름, 분류, 시간 s, 할당 bytes, 최대 bytes)
+        self.last = []  # 직전에 끝난 rerun의 records
+        self.history = defaultdict(lambda: deque(maxlen=HISTORY))
+        self.categories = {"(rerun 전체)": "rerun"}
+        self.events = deque(maxlen=MAX_EVENTS)
+        self._origin = time.perf_counter()
+        self._rerun_start = None
+
+    def close(self):
+        """tracemalloc 참조를 놓는다 (마지막 세션이면 tracemalloc을 멈춘다)."""
+        if self._release is not None:
+            self._release()
+
+    def begin_rerun(self):
+        self.rerun += 1
+        self.records = []
+        self._rerun_start = time.perf_counter()
+
+    def end_rerun(self):
+        if self._rerun_start is None:
+            return
+        total = time.perf_counter() - self._rerun_start
+        self._add_event("rerun", "rerun", self._rerun_start, total, {"rerun": self.rerun})
+        totals = defaultdict(float)
+        for name, category, duration, _, _ in self.records:
+            totals[name] += duration
+            self.categories[name] = category
+        totals["(rerun 전체)"] = total
+        for name, duration in totals.items():
+            self.history[name].append(duration)
+        self.last = self.records
+        self._rerun_start = None
+
+    @contextlib.contextmanager
+    def section(self, name, category="compute", **args):
+        # 할당량과 최대값은 프로세스 전체 값이다 (reset_peak도 전역이므로 동시에 실행 중인 다른 세션의
+        # 구간이나 중첩된 안쪽 구간이 최대값을 초기화하면 근사값이 된다)
+        memory = self.track_memory and tracemalloc.is_tracing()
+        if memory:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            allocated = peak = 0
+            if memory:
+                after, peak = tracemalloc.get_traced_memory()
+                allocated, peak = after - before, peak - before
+            self.records.append((name, category, duration, allocated, peak))
+            self._add_event(name, category, start, duration,
+                            dict(args, process_alloc_bytes=allocated, process_peak_bytes=peak, rerun=self.rerun))
+
+    def _add_event(self, name, category, start, duration, args):
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    def summary(self):
+        """
+        구간별 요약: 직전 rerun 시간과 최근 rerun의 p50/p95.
+
+        Returns:
+        - [{"구간", "분류", "이번 (ms)", "p50 (ms)", "p95 (ms)", "프로세스 할당 (KB)"}] 목록
+        """
+        # 이번 rerun에서 실행되지 않은 구간 (캐시 적중 등)은 0으로 표시한다
+        last = defaultdict(lambda: [0.0, 0])
+        for name, _, duration, allocated, _ in self.last:
+            last[name][0] += duration
+            last[name][1] += allocated
+        last["(rerun 전체)"][0] = self.history["(rerun 전체)"][-1]
+        rows = []
+        for name, durations in self.history.items():
+            ordered = sorted(durations)
+            duration, allocated = last.get(name, (0.0, 0))
+            rows.append({
+                "구간": name,
+                "분류": self.categories[name],
+                "이번 (ms)": round(duration * 1e3, 2),
+                "p50 (ms)": round(_percentile(ordered, 50) * 1e3, 2),
+                "p95 (ms)": round(_percentile(ordered, 95) * 1e3, 2),
+                "프로세스 할당 (KB)": round(allocated / 1024, 1),
+            })
+        return rows
+
+    def chrome_trace(self):
+        """Chrome trace-event 형식 JSON 문자열."""
+        return json.dumps({"traceEvents": list(self.events), "displayTimeUnit": "ms"})
+
+
+class _NullProfiler:
+    """프로파일링이 꺼져 있을 때 사용하는 아무 일도 하지 않는 프로파일러."""
+
+    def section(self, name, category="compute", **args):
+        return contextlib.nullcontext()
+
+
+_null = _NullProfiler()
+
+
+def _percentile(ordered, q):
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _query_enabled(st):
+    return st.query_params.get(QUERY_PARAM) not in (None, "", "0", "false")
+
+
+def enabled():
+    """환경 변수 또는 쿼리 파라미터로 프로파일링이 켜져 있는지 여부."""
+    if os.environ.get(ENV_VAR, "") not in ("", "0", "false"):
+        return True
+    try:
+        import streamlit as st
+        return _query_enabled(st)
+    except Exception:
+        return False
+
+
+def current():
+    """현재 세션의 프로파일러. 꺼져 있거나 Streamlit 밖이면 아무 일도 하지 않는 객체."""
+    if "streamlit" not in sys.modules:  # CLI, 벤치마크 등에서 streamlit을 새로 import하지 않는다
+        return _null
+    try:
+        import streamlit as st
+        return st.session_state.get(SESSION_KEY) or _null
+    except Exception:
+        return _null
+
+
+def start():
+    """페이지 맨 위에서 호출: 프로파일링이 켜져 있으면 새 rerun 기록을 시작한다."""
+    import streamlit as st
+    if not enabled():
+        profiler = st.session_state.pop(SESSION_KEY, None)
+        if profiler is not None:
+            profiler.close()
+        return _null
+    profiler = st.session_state.get(SESSION_KEY)
+    if profiler is None:
+        profiler = st.session_state[SESSION_KEY] = Profiler()
+    profiler.end_rerun()  # 이전 rerun이 중단된 경우
+    profiler.begin_rerun()
+    return profiler
+
+
+def section(name, category="compute", **args):
+    """현재 세션 프로파일러의 측정 구간 (꺼져 있으면 비용 없음)."""
+    return current().section(name, category, **args)
+
+
+def panel():
+    """페이지 맨 아래에서 호출: rerun을 마치고 사이드바에 프로파일 패널을 표시한다."""
+    import streamlit as st
+    profiler = current()
+    if profiler is _null:
+        return
+    profiler.end_rerun()
+    with st.sidebar.expander(f"⏱ 프로파일 (rerun #{profiler.rerun})", expanded=True):
+        st.dataframe(profiler.summary(), hide_index=True)
+        st.caption("할당량은 tracemalloc 기준 프로세스 전체 값이다 (동시에 실행 중인 다른 세션 포함).")
+        st.download_button("Chrome trace 내보내기", profiler.chrome_trace(),
+                           file_name="semisim-trace.json", mime="application/json")
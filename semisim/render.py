@@ -0,0 +1,130 @@
+"""
+Matplotlib 그래프 렌더링 계층.
+
+- 정규화한 파라미터 집합 -> 렌더링된 PNG/SVG bytes를 저장하는 세션 공유 LRU 캐시 (semisim.cache)
+- pyplot figure 레지스트리를 거치지 않는 Figure 생성과 사용 후 명시적 해제
+- 곡선 배열을 그대로 브라우저 차트로 보내는 client-side 모드용 데이터 변환 (점이 많으면 LTTB로 줄인다)
+"""
+import hashlib
+import io
+import json
+import sys
+import threading
+
+import numpy as np
+
+from semisim import profiler
+from semisim.cache import shared_cache
+from semisim.sampling import lttb
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 캐시 전체 크기 상한 (bytes)
+KEY_DIGITS = 12  # 키 정규화 시 float 유효 자릿수
+MAX_CHART_POINTS = 500  # 브라우저 차트로 보내는 곡선당 최대 점 개수 (넘으면 LTTB로 줄인다)
+
+render_cache = shared_cache("render", DEFAULT_MAX_BYTES)  # 모든 세션이 공유하는 이미지 캐시
+
+# 세션 스레드들은 각자 만든 Figure (와 그 Agg canvas)를 동시에 그린다. FreeType font 객체는 Matplotlib이
+# 스레드별로 캐시하므로, 프로세스 전역으로 공유되는 상태는 mathtext parser (클래스 전역 pyparsing 객체,
+# log 축 눈금과 $...$ label에서 쓰인다)뿐이다. mathtext를 해석할 수 있는 draw / savefig 호출은 이 lock
+# 안에서 한다 (render 밖에서 Figure를 그리는 곳도 같은 lock을 쓴다).
+mathtext_lock = threading.RLock()
+
+
+def _normalize(value):
+    """캐시 키용 값 정규화: numpy 값은 파이썬 값으로, float은 KEY_DIGITS 자리로 반올림."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (float, np.floating)):
+        return float(f"{float(value):.{KEY_DIGITS}g}")
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def canonical_key(kind, params):
+    """그래프 종류와 파라미터 dict로부터 정규화된 캐시 키 생성."""
+    payload = json.dumps([kind, _normalize(params)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def new_figure(**kwargs):
+    """pyplot 레지스트리에 등록되지 않는 Figure 생성 (참조가 사라지면 바로 회수된다)."""
+    from matplotlib.figure import Figure
+    return Figure(**kwargs)
+
+
+def release(fig):
+    """Figure의 artist를 정리하고, pyplot으로 만든 figure라면 레지스트리에서도 제거."""
+    fig.clear()
+    # pyplot을 쓰지 않는 프로세스에서 pyplot (과 GUI backend)을 새로 import하지 않는다
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is not None:
+        plt.close(fig)
+
+
+def render(kind, params, draw, fmt="png", figsize=None, dpi=100, cache=render_cache):
+    """
+    그래프를 렌더링한 bytes를 돌려준다. 같은 (kind, params)는 캐시에서 바로 꺼내므로
+    draw 함수(계산 + Matplotlib 작업)가 다시 실행되지 않는다.
+
+    Parameters:
+    - kind: 그래프 종류 이름
+    - params: 그래프를 결정하는 모든 입력 값 dict
+    - draw: Figure를 받아 그리는 함수
+    - fmt: "png" 또는 "svg"
+    - figsize, dpi: Figure 크기와 해상도
+
+    Returns:
+    - 렌더링된 이미지 bytes
+    """
+    key = canonical_key(kind, {"params": params, "fmt": fmt, "figsize": figsize, "dpi": dpi})
+
+    def draw_bytes():
+        fig = new_figure(figsize=figsize)
+        try:
+            with mathtext_lock:
+                with profiler.section(f"{kind}: draw", "render"):
+                    draw(fig)
+                with profiler.section(f"{kind}: rasterize", "render"):
+                    buffer = io.BytesIO()
+                    fig.savefig(buffer, format=fmt, dpi=dpi)
+            return buffer.getvalue()
+        finally:
+            release(fig)
+
+    # 같은 그래프를 여러 세션이 동시에 요청하면 한 번만 그린다
+    return cache.get_or_compute(key, draw_bytes)
+
+
+def curves_frame(x, curves, x_name="x"):
+    """
+    client-side 차트용 데이터. {곡선 이름: y 배열}을 x를 index로 하는 DataFrame으로 변환.
+    """
+    import pandas as pd
+    frame = pd.DataFrame({name: np.asarray(y) for name, y in curves.items()}, index=np.asarray(x))
+    frame.index.name = x_name
+    return frame
+
+
+def show_image(kind, data):
+    """렌더링된 이미지 bytes를 Streamlit에 표시."""
+    import streamlit as st
+    with profiler.section(f"{kind}: st.image", "serialize", bytes=len(data)):
+        st.image(data)
+
+
+def show_curves(kind, curves):
+    """(x, {곡선 이름: y}, x 이름) 곡선 데이터를 브라우저 차트로 표시 (MAX_CHART_POINTS 점 이하로 decimation)."""
+    import streamlit as st
+    x, series, x_name = curves
+    if series and len(x) > MAX_CHART_POINTS:
+        # 모든 곡선이 같은 x 점을 쓰도록 곡선 묶음 전체로 점을 고른다
+        index = lttb(x, np.array([np.asarray(y, dtype=float) for y in series.values()]), MAX_CHART_POINTS)
+        x, series = np.asarray(x)[index], {name: np.asarray(y)[index] for name, y in series.items()}
+    with profiler.section(f"{kind}: line_chart", "serialize", points=len(x) * len(series)):
+        st.line_chart(curves_frame(x, series, x_name))
+
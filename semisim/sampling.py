@@ -0,0 +1,105 @@
+"""
+곡선 그래프용 적응 bias 격자와 표시용 decimation (LTTB).
+
+적응 격자는 균일한 초기 격자에서 시작해, 구간마다 가운데 점을 계산하고 그 값과 양 끝점을 잇는
+직선 (선형 보간)의 차이가 그래프 높이의 tol 배보다 크면 그 구간을 반으로 나누어 다시 검사한다.
+보간 오차는 곡률에 비례하므로 점은 포화 knee (Vds = Vgs - Vt)나 지수 turn-on 근처에 모이고,
+평평하거나 곧은 구간에는 거의 추가되지 않는다. 한 단계에서 나눌 구간의 가운데 점은 모두 한 번의
+모델 호출로 계산하고, 곡선 묶음 (예: 여러 Vgs의 출력 특성)은 같은 x 격자를 공유하며 모든 곡선
+중 가장 큰 오차로 나눌지 정한다.
+
+LTTB (Largest-Triangle-Three-Buckets)는 점을 고정 개수의 bucket으로 나누고, bucket마다 직전에 고른
+점과 다음 bucket 평균이 이루는 삼각형 넓이가 가장 큰 점 하나를 고른다. 여러 곡선은 높이로 정규화한
+넓이의 합으로 같은 인덱스를 고르므로 공통 x축이 유지된다.
+
+    x, y = adaptive_grid(lambda Vds: id_grid(Vgs_values, Vds, W, L, N_D, N_A), 0.0, 5.0)
+    index = lttb(x, y, 500)
+"""
+import numpy as np
+
+PLOT_TOL = 1e-3  # 허용 보간 오차 (그래프 높이 대비)
+INITIAL_POINTS = 17  # 초기 균일 격자 점 개수
+MAX_POINTS = 2000  # 적응 격자의 최대 점 개수
+MAX_DEPTH = 12  # 초기 구간을 나누는 최대 횟수
+
+
+def adaptive_grid(func, start, stop, tol=PLOT_TOL, initial=INITIAL_POINTS, max_points=MAX_POINTS,
+                  max_depth=MAX_DEPTH):
+    """
+    선형 보간 오차가 tol 이하가 되도록 [start, stop]을 적응적으로 나눈 격자와 그 위의 곡선 값.
+
+    Parameters:
+    - func: x 1차원 배열 -> shape (..., len(x)) 배열 (마지막 축이 x)
+    - start, stop: x 범위
+    - tol: 허용 오차 (곡선 묶음 전체 높이 대비)
+    - initial: 초기 균일 격자 점 개수
+    - max_points: 점 개수 상한 (넘으면 그 단계까지만 나눈다)
+    - max_depth: 초기 구간을 나누는 최대 횟수
+
+    Returns:
+    - 정렬된 x 격자, func(x)
+    """
+    x = np.linspace(start, stop, initial)
+    y = np.asarray(func(x), dtype=float)
+    shape = y.shape[:-1]
+    y = y.reshape(-1, len(x))
+    # 검사할 구간 (왼쪽 점 인덱스)
+    pending = np.arange(len(x) - 1)
+    for _ in range(max_depth):
+        if len(pending) == 0 or len(x) + len(pending) > max_points:
+            break
+        mid = (x[pending] + x[pending + 1]) / 2
+        y_mid = np.asarray(func(mid), dtype=float).reshape(len(y), len(mid))
+        with np.errstate(invalid="ignore"):
+            scale = np.nanmax(np.abs(np.ptp(np.concatenate([y, y_mid], axis=1), axis=1)), initial=0.0)
+            error = np.nanmax(np.abs(y_mid - (y[:, pending] + y[:, pending + 1]) / 2), axis=0, initial=0.0)
+        refine = error > tol * (scale if scale > 0 else 1.0)
+
+        # 계산한 가운데 점은 모두 격자에 넣고, 오차가 큰 구간의 두 반쪽만 다음 단계에서 검사한다
+        order = np.argsort(np.concatenate([x, mid]), kind="stable")
+        position = np.empty(len(order), dtype=int)
+        position[order] = np.arange(len(order))
+        inserted = position[len(x):]
+        x = np.concatenate([x, mid])[order]
+        y = np.concatenate([y, y_mid], axis=1)[:, order]
+        pending = np.sort(np.concatenate([inserted[refine] - 1, inserted[refine]]))
+    return x, y.reshape(shape + (len(x),))
+
+
+def lttb(x, y, threshold):
+    """
+    LTTB로 고른 점 인덱스 (처음과 마지막 점 포함, 정렬됨).
+
+    Parameters:
+    - x: shape (n,)의 정렬된 x
+    - y: shape (n,) 또는 곡선 묶음 shape (k, n)
+    - threshold: 남길 점 개수 (n 이상이거나 3 미만이면 모든 점)
+
+    Returns:
+    - shape (min(n, threshold),)의 인덱스 배열
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    Y = np.atleast_2d(np.asarray(y, dtype=float))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        low = np.nanmin(Y, axis=1, keepdims=True)
+        span = np.nanmax(Y, axis=1, keepdims=True) - low
+        Y = np.nan_to_num((Y - low) / np.where(span > 0, span, 1.0))
+
+    # 처음과 마지막 점을 뺀 점들을 threshold - 2개의 bucket으로 나눈다
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (hi, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = Y[:, next_lo:next_hi].mean(axis=1, keepdims=True)
+        area = np.abs((x[a] - avg_x) * (Y[:, lo:hi] - Y[:, a:a + 1])
+                      - (x[a] - x[lo:hi]) * (avg_y - Y[:, a:a + 1])).sum(axis=0)
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
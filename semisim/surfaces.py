@@ -0,0 +1,313 @@
+"""
+미리 계산한 특성 곡면 (Id, I_C)의 memory-mapped 저장소.
+
+sidebar slider가 다루는 범위에 대해 Id(N_A, N_D, Vgs, Vds), I_C(I_S, V_T, I_E, V_CB)를 조밀한 격자로
+미리 계산해 ``.npy`` 파일로 저장하고, 페이지는 slider가 움직일 때 이 파일을 ``np.load(mmap_mode="r")``로
+열어 필요한 부분만 잘라 다선형 보간한다. mmap은 복사 없이 OS page cache를 통해 모든 서버 프로세스가
+공유한다. 저장된 범위 밖이거나 고정 파라미터 (Gummel-Poon 파라미터, 산화막 두께 등)가 다르면
+None을 돌려주고, 페이지는 직접 계산으로 돌아간다.
+
+    python -m semisim.surfaces build                # 모든 곡면 계산 (기본 위치: data/surfaces)
+    python -m semisim.surfaces build mosfet_id --jobs 4
+    python -m semisim.surfaces list
+
+저장 위치는 환경 변수 ``SEMISIM_SURFACES``로 바꿀 수 있다.
+
+Id는 square-law 모델에서 W/L에 정확히 비례하므로 W = L = 1 µm로 저장하고 조회할 때 W/L을 곱한다.
+보간은 log 간격 축에서는 log 좌표로 한다. 임계 전압 부근에서는 N_A 격자 사이의 선형 보간 오차가
+있으므로, 더 정확한 값이 필요하면 격자를 조밀하게 다시 만든다.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from semisim.bjt import MODELS, common_base_output, default_params
+from semisim.mosfet import calculate_id
+from semisim.poisson import T_OX
+from semisim.sweep import imap_ordered
+from semisim.thermal import T_NOMINAL
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIR = ROOT / "data" / "surfaces"
+INDEX_NAME = "index.json"
+DTYPE = np.float32  # 보간 오차보다 충분히 작은 정밀도로 파일 크기를 절반으로 줄인다
+MATCH_DIGITS = 9  # 고정 파라미터 비교 유효 자릿수
+
+# 소자 모델에서 곡면 축이 아닌 BJT 파라미터 (Gummel-Poon 기본값과 같을 때만 곡면을 쓴다)
+_BJT_FIXED = {k: v for k, v in default_params.items() if k not in ("I_S", "V_T") and not k.startswith(("V_CB_", "I_E_"))}
+
+
+def _log_axis(start, stop, per_decade):
+    return ("log", np.geomspace(start, stop, int(round(np.log10(stop / start) * per_decade)) + 1))
+
+
+def _mosfet_id(fixed, N_A, N_D, Vgs, Vds):
+    return calculate_id(Vgs[:, None], Vds[None, :], 1.0, 1.0, N_D, N_A, T=fixed["T"], t_ox=fixed["t_ox"])
+
+
+def _bjt_output(fixed, I_S, V_T, I_E, V_CB):
+    params = dict(fixed, I_S=I_S, V_T=V_T)
+    model = params.pop("model")
+    return common_base_output(I_E[:, None], V_CB[None, :], params, model)
+
+
+def _definitions():
+    """
+    곡면 정의. 마지막 두 축은 한 번의 벡터화 호출로 계산하는 평면이다.
+
+    Returns:
+    - {이름: {"axes": [(축 이름, scale, 값)], "fixed": {이름: 값}, "func": 평면 계산 함수}}
+    """
+    surfaces = {
+        "mosfet_id": {
+            "axes": [("N_A",) + _log_axis(1e15, 1e17, 20),
+                     ("N_D",) + _log_axis(1e13, 1e20, 4),
+                     ("Vgs", "linear", np.linspace(0, 5, 201)),
+                     ("Vds", "linear", np.linspace(0, 5, 101))],
+            "fixed": {"T": T_NOMINAL, "t_ox": T_OX},
+            "func": _mosfet_id,
+        },
+    }
+    for model in MODELS:
+        surfaces[f"bjt_output_{model}"] = {
+            "axes": [("I_S",) + _log_axis(1e-15, 1e-12, 4),
+                     ("V_T", "linear", np.linspace(0.01, 0.05, 21)),
+                     ("I_E", "linear", np.linspace(1e-4, 1e-2, 100)),
+                     ("V_CB", "linear", np.linspace(0, 20, 201))],
+            "fixed": dict(_BJT_FIXED, model=model),
+            "func": _bjt_output,
+        }
+    return surfaces
+
+
+SURFACES = _definitions()
+
+
+def store_dir():
+    return Path(os.environ.get("SEMISIM_SURFACES", DEFAULT_DIR))
+
+
+def _plane(task):
+    """프로세스 풀 worker: 앞쪽 축 인덱스 하나에 대한 평면 계산."""
+    name, index = task
+    definition = SURFACES[name]
+    axes = definition["axes"]
+    leading = {axis: values[i] for (axis, _, values), i in zip(axes[:-2], index)}
+    trailing = {axis: values for axis, _, values in axes[-2:]}
+    return index, np.asarray(definition["func"](definition["fixed"], **leading, **trailing), dtype=DTYPE)
+
+
+def build(name, directory=None, jobs=1, log=None):
+    """
+    곡면 하나를 계산하여 ``<이름>.npy``로 저장하고 index를 갱신한다.
+    평면 단위로 memmap에 바로 쓰므로 곡면 전체를 메모리에 올리지 않는다.
+
+    Returns:
+    - 저장한 파일 경로
+    """
+    directory = Path(directory or store_dir())
+    directory.mkdir(parents=True, exist_ok=True)
+    definition = SURFACES[name]
+    axes = definition["axes"]
+    shape = tuple(len(values) for _, _, values in axes)
+    path = directory / f"{name}.npy"
+    tmp = directory / f".{name}.npy.tmp"
+
+    data = np.lib.format.open_memmap(tmp, mode="w+", dtype=DTYPE, shape=shape)
+    tasks = [(name, index) for index in np.ndindex(*shape[:-2])]
+    t0 = time.perf_counter()
+    for done, (index, plane) in enumerate(imap_ordered(_plane, tasks, jobs), 1):
+        data[index] = plane
+        if log and (done == len(tasks) or done % 50 == 0):
+            log(f"\r{name}: {done}/{len(tasks)} 평면, {time.perf_counter() - t0:.1f} s")
+    data.flush()
+    del data
+    os.replace(tmp, path)  # 읽는 쪽은 항상 완성된 파일만 본다
+    if log:
+        log(f"\n{name}: {path} ({path.stat().st_size / 1e6:.1f} MB)\n")
+
+    index = _read_index(directory)
+    index[name] = {
+        "file": path.name,
+        "axes": [[axis, scale, values.tolist()] for axis, scale, values in axes],
+        "fixed": definition["fixed"],
+        "built": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    (directory / INDEX_NAME).write_text(json.dumps(index, indent=1) + "\n", encoding="utf-8")
+    _stores.pop(directory, None)  # 같은 mtime 해상도 안에서 다시 빌드한 경우
+    return path
+
+
+def _read_index(directory):
+    try:
+        return json.loads((Path(directory) / INDEX_NAME).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+class Surface:
+    """mmap으로 연 곡면 하나. lookup으로 격자 사이 값을 다선형 보간한다."""
+
+    def __init__(self, directory, entry):
+        self.data = np.load(Path(directory) / entry["file"], mmap_mode="r")
+        self.axes = [(axis, scale, np.asarray(values)) for axis, scale, values in entry["axes"]]
+        self.fixed = entry["fixed"]
+
+    def matches(self, fixed):
+        """고정 파라미터가 곡면을 만들 때의 값과 같은지."""
+        for name, value in self.fixed.items():
+            given = fixed.get(name, value)
+            if isinstance(value, str) or isinstance(given, str):
+                if given != value:
+                    return False
+            elif f"{float(given):.{MATCH_DIGITS}g}" != f"{float(value):.{MATCH_DIGITS}g}":
+                return False
+        return True
+
+    def lookup(self, **coords):
+        """
+        축 좌표 (스칼라 또는 1차원 배열)에서의 보간 값.
+
+        Returns:
+        - 배열 좌표 축들의 shape (축 순서)인 값, 범위 밖의 좌표가 있으면 None
+        """
+        scalar, arrays = [], []
+        for position, (axis, scale, grid) in enumerate(self.axes):
+            x = np.asarray(coords[axis], dtype=float)
+            if np.any(x < grid[0]) or np.any(x > grid[-1]):
+                return None
+            if scale == "log":
+                x, grid = np.log(x), np.log(grid)
+            i = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+            w = (x - grid[i]) / (grid[i + 1] - grid[i])
+            (scalar if x.ndim == 0 else arrays).append((position, i, w))
+
+        # 스칼라 축: 주변 2^k개 단면만 기본 인덱싱으로 읽어 (mmap에서 복사 없음) 가중 합한다
+        data = 0.0
+        for corner in itertools.product((0, 1), repeat=len(scalar)):
+            index = [slice(None)] * self.data.ndim
+            weight = 1.0
+            for (position, i, w), c in zip(scalar, corner):
+                index[position] = int(i) + c
+                weight *= w if c else 1 - w
+            if weight != 0:
+                data = data + weight * self.data[tuple(index)].astype(float)
+
+        # 배열 축: 남은 축을 순서대로 선형 보간
+        for axis, (_, i, w) in enumerate(arrays):
+            w = w.reshape(w.shape + (1,) * (data.ndim - axis - 1))
+            data = np.take(data, i, axis=axis) * (1 - w) + np.take(data, i + 1, axis=axis) * w
+        return data
+
+
+# 저장소 경로 -> (index.json mtime, {이름: Surface}). 여러 세션 스레드가 반쯤 갱신된 상태를 보지 않도록
+# tuple 전체를 한 번에 바꾼다
+_stores = {}
+
+
+def open_store(directory=None):
+    """
+    저장소의 곡면을 모두 mmap으로 연다. index.json이 바뀐 경우 (새로 빌드한 곡면)에만 다시 연다.
+
+    Returns:
+    - {이름: Surface} dict, 저장소가 없으면 빈 dict
+    """
+    directory = Path(directory or store_dir())
+    try:
+        mtime = (directory / INDEX_NAME).stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached = _stores.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    surfaces = {}
+    for name, entry in _read_index(directory).items():
+        try:
+            surfaces[name] = Surface(directory, entry)
+        except (OSError, ValueError):
+            continue  # 손상되었거나 빌드 중인 파일은 건너뛴다
+    _stores[directory] = (mtime, surfaces)
+    return surfaces
+
+
+# 조회 통계 (hits: 곡면에서 응답, misses: 직접 계산으로 돌아감). 여러 세션 스레드가 갱신하므로 lock 안에서 바꾼다
+stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def lookup_stats():
+    """조회 통계의 복사본 {"hits", "misses"}."""
+    with _stats_lock:
+        return dict(stats)
+
+
+def _lookup(name, fixed, **coords):
+    surface = open_store().get(name)
+    value = None
+    if surface is not None and surface.matches(fixed):
+        value = surface.lookup(**coords)
+    with _stats_lock:
+        stats["hits" if value is not None else "misses"] += 1
+    return value
+
+
+def mosfet_id(Vgs, Vds, W, L, N_D, N_A, T=T_NOMINAL, t_ox=T_OX):
+    """
+    Id 곡면 조회. Vgs, Vds는 1차원 배열, 나머지는 스칼라다.
+
+    Returns:
+    - shape (len(Vgs), len(Vds))의 Id (A), 곡면이 없거나 범위 밖이면 None
+    """
+    Id = _lookup("mosfet_id", {"T": T, "t_ox": t_ox}, N_A=N_A, N_D=N_D, Vgs=Vgs, Vds=Vds)
+    return None if Id is None else Id * (W / L)
+
+
+def bjt_output(I_E, V_CB, params, model="gummel-poon"):
+    """
+    공통 베이스 출력 특성 I_C 곡면 조회. I_E, V_CB는 1차원 배열이다.
+
+    Returns:
+    - shape (len(I_E), len(V_CB))의 I_C (A), 곡면이 없거나 범위 밖이면 None
+    """
+    fixed = dict(params, model=model)
+    return _lookup(f"bjt_output_{model}", fixed, I_S=params["I_S"], V_T=params["V_T"], I_E=I_E, V_CB=V_CB)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.surfaces", description="특성 곡면 저장소 관리")
+    parser.add_argument("--dir", help=f"저장 위치 (기본값: $SEMISIM_SURFACES 또는 {DEFAULT_DIR})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build", help="곡면 계산")
+    build_parser.add_argument("names", nargs="*", help=f"곡면 이름 (기본값: 전체, {', '.join(SURFACES)})")
+    build_parser.add_argument("--jobs", type=int, default=1, help="프로세스 수 (기본값: 1)")
+    sub.add_parser("list", help="저장된 곡면 출력")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        unknown = set(args.names) - set(SURFACES)
+        if unknown:
+            parser.error(f"알 수 없는 곡면: {', '.join(sorted(unknown))}")
+        log = lambda message: print(message, end="", file=sys.stderr, flush=True)  # noqa: E731
+        for name in args.names or SURFACES:
+            build(name, args.dir, args.jobs, log)
+    else:
+        index = _read_index(args.dir or store_dir())
+        for name in SURFACES:
+            entry = index.get(name)
+            if entry is None:
+                print(f"{name}: (없음)")
+                continue
+            axes = " x ".join(f"{axis}[{len(values)}]" for axis, _, values in entry["axes"])
+            print(f"{name}: {axes}, {entry['file']}, {entry['built']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
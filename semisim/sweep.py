@@ -0,0 +1,392 @@
+"""
+Streamlit 없이 MOSFET / BJT sweep을 실행하는 batch CLI.
+
+sweep 정의 (JSON 또는 YAML)의 모든 축을 곱한 격자를 고정 크기 chunk로 나누어 계산하고,
+chunk마다 결과를 파일에 바로 쓴다. 따라서 10^8 점 sweep도 chunk 크기만큼의 메모리로 실행된다.
+
+사용법::
+
+    python -m semisim.sweep spec.yaml -o out.parquet --jobs 4
+    python -m semisim.sweep spec.json -o out.csv --chunk-size 200000
+    python -m semisim.sweep spec.yaml --dry-run      # 격자 크기와 출력 열만 확인
+
+sweep 정의 예::
+
+    device: mosfet            # mosfet 또는 bjt
+    parameters:
+      Vgs: {start: 0, stop: 5, num: 501}
+      Vds: {start: 0, stop: 5, num: 501}
+      N_A: {start: 1e15, stop: 1e17, num: 21, scale: log}
+      L: [1, 2, 5, 10]        # 값 목록
+      W: 10                   # 고정값
+    outputs: [Id, mobility, gm, gds]
+    chunk_size: 1000000       # 선택 (명령행 --chunk-size가 우선)
+
+- mosfet 입력: Vgs, Vds, W, L, N_D, N_A, T, t_ox / 출력: Id, mu_e, mu_h, mu_eff (mobility), gm, gds, Vt
+- bjt 입력: V_BE, V_CB, T와 default_params의 모델 파라미터, model: gummel-poon | ebers-moll /
+  출력: I_C, I_B, I_E, beta. T (K)를 주면 V_T, I_S, β를 TNOM 기준 SPICE 온도 모델로 보정한다.
+
+출력 형식은 파일 확장자로 정한다: .csv, .npz, .parquet, .arrow (.feather).
+Parquet / Arrow 출력에는 pyarrow, YAML 정의에는 PyYAML이 필요하다.
+출력 파일에는 sweep 축 열과 출력 열이 들어간다 (고정값은 정의 파일에 남아 있으므로 쓰지 않는다).
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from semisim.bjt import MODELS, at_temperature, default_params, terminal_currents
+from semisim.mobility import mobility_bulk
+from semisim.mosfet import calculate_id, small_signal
+from semisim.poisson import T_OX, oxide_capacitance, threshold_voltage
+
+CHUNK_SIZE = 1_000_000
+
+# 소자별 입력 기본값과 출력 이름
+DEVICES = {
+    "mosfet": {
+        "inputs": {"Vgs": 1.0, "Vds": 1.0, "W": 10.0, "L": 10.0, "N_D": 1e19, "N_A": 1e16,
+                   "T": 300.0, "t_ox": T_OX},
+        "outputs": ("Id", "mu_e", "mu_h", "mu_eff", "gm", "gds", "Vt"),
+    },
+    "bjt": {
+        "inputs": dict({"V_BE": 0.7, "V_CB": 0.0, "T": None},  # T가 None이면 V_T, I_S를 그대로 쓴다
+                       **{k: v for k, v in default_params.items() if not k.startswith(("V_CB_", "I_E_"))}),
+        "outputs": ("I_C", "I_B", "I_E", "beta"),
+    },
+}
+
+# 여러 열로 펼쳐지는 출력 이름
+OUTPUT_GROUPS = {"mobility": ("mu_e", "mu_h", "mu_eff")}
+
+
+def load_spec(path):
+    """JSON 또는 YAML sweep 정의 파일 읽기."""
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit("YAML 정의 파일을 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def _axis(name, value):
+    """파라미터 정의를 값 배열 (sweep 축) 또는 스칼라 (고정값)로 변환."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, list):
+        return np.asarray(value, dtype=float)
+    if isinstance(value, dict):
+        if "values" in value:
+            return np.asarray(value["values"], dtype=float)
+        start, stop, num = float(value["start"]), float(value["stop"]), int(value["num"])
+        scale = value.get("scale", "linear")
+        if scale == "log":
+            return np.geomspace(start, stop, num)
+        if scale == "linear":
+            return np.linspace(start, stop, num)
+        raise ValueError(f"{name}: 지원하지 않는 scale: {scale}")
+    raise ValueError(f"{name}: 파라미터 정의는 숫자, 목록 또는 {{start, stop, num}}이어야 합니다")
+
+
+def compile_spec(spec, chunk_size=None):
+    """
+    sweep 정의를 실행 계획 dict로 변환.
+
+    Returns:
+    - {"device", "model", "axes": [(이름, 값 배열)], "fixed": {이름: 값}, "outputs", "shape",
+       "size", "chunk_size", "Vt_table"} dict
+    """
+    device = spec.get("device", "mosfet")
+    if device not in DEVICES:
+        raise ValueError(f"지원하지 않는 소자: {device}")
+    model = spec.get("model", "gummel-poon")
+    if device == "bjt" and model not in MODELS:
+        raise ValueError(f"지원하지 않는 BJT 모델: {model}")
+
+    known = DEVICES[device]["inputs"]
+    unknown = set(spec.get("parameters", {})) - set(known)
+    if unknown:
+        raise ValueError(f"{device}에 없는 파라미터: {', '.join(sorted(unknown))}")
+    axes, fixed = [], dict(known)
+    for name, value in spec.get("parameters", {}).items():
+        value = _axis(name, value)
+        if np.ndim(value) == 0:
+            fixed[name] = value
+        else:
+            axes.append((name, value))
+            fixed.pop(name)
+
+    outputs = []
+    for name in spec.get("outputs", DEVICES[device]["outputs"][:1]):
+        for output in OUTPUT_GROUPS.get(name, (name,)):
+            if output not in DEVICES[device]["outputs"]:
+                raise ValueError(f"{device}에 없는 출력: {output}")
+            if output not in outputs:
+                outputs.append(output)
+
+    shape = tuple(len(values) for _, values in axes)
+    plan = {
+        "device": device,
+        "model": model,
+        "axes": axes,
+        "fixed": fixed,
+        "outputs": outputs,
+        "shape": shape,
+        "size": math.prod(shape),
+        "chunk_size": int(chunk_size or spec.get("chunk_size", CHUNK_SIZE)),
+        "Vt_table": None,
+    }
+    if device == "mosfet" and set(outputs) & {"Id", "gm", "gds", "Vt"}:
+        plan["Vt_table"] = _threshold_table(plan)
+    return plan
+
+
+def _threshold_table(plan):
+    """
+    (N_A, t_ox, T) 축의 부분 격자에서 Poisson 임계 전압을 미리 계산한다.
+    chunk마다 서로 다른 조합을 다시 찾지 않고 인덱스로 조회하기 위해서다.
+    """
+    names = ("N_A", "t_ox", "T")
+    grids = [dict(plan["axes"]).get(name, plan["fixed"].get(name)) for name in names]
+    grids = np.meshgrid(*(np.atleast_1d(g) for g in grids), indexing="ij")
+    return threshold_voltage(*grids)
+
+
+def column_names(plan):
+    """출력 파일의 열 이름: sweep 축 다음에 출력."""
+    return [name for name, _ in plan["axes"]] + list(plan["outputs"])
+
+
+def evaluate_chunk(plan, start, stop):
+    """
+    평탄화한 격자 인덱스 [start, stop) 구간 계산.
+
+    Returns:
+    - {열 이름: 배열} dict (column_names 순서)
+    """
+    index = np.unravel_index(np.arange(start, stop), plan["shape"]) if plan["axes"] else ()
+    columns = {name: values[i] for (name, values), i in zip(plan["axes"], index)}
+    x = dict(plan["fixed"], **columns)
+    outputs = plan["outputs"]
+    result = {}
+
+    if plan["device"] == "mosfet":
+        mu_e, mu_h, mu_eff = mobility_bulk(x["N_D"], x["N_A"], x["T"])
+        if plan["Vt_table"] is not None:
+            axis_index = dict(zip((name for name, _ in plan["axes"]), index))
+            lookup = tuple(axis_index.get(name, 0) for name in ("N_A", "t_ox", "T"))
+            Vt = plan["Vt_table"][lookup]
+            kwargs = {"T": x["T"], "Vt": Vt, "Cox": oxide_capacitance(x["t_ox"]), "mu_eff": mu_eff}
+            args = (x["Vgs"], x["Vds"], x["W"], x["L"], x["N_D"], x["N_A"])
+            if "Id" in outputs:
+                result["Id"] = calculate_id(*args, **kwargs)
+            if "gm" in outputs or "gds" in outputs:
+                result["gm"], result["gds"] = small_signal(*args, **kwargs)
+            result["Vt"] = Vt
+        result.update(mu_e=mu_e, mu_h=mu_h, mu_eff=mu_eff)
+    else:
+        params = {k: x[k] for k in DEVICES["bjt"]["inputs"] if k not in ("V_BE", "V_CB", "T")}
+        if x["T"] is not None:
+            params = at_temperature(x["T"], params)
+        I_C, I_B, I_E = terminal_currents(x["V_BE"], np.negative(x["V_CB"]), params, plan["model"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.where(I_B > 0, I_C / I_B, np.nan)
+        result.update(I_C=I_C, I_B=I_B, I_E=I_E, beta=beta)
+
+    n = stop - start
+    for name in outputs:
+        columns[name] = np.broadcast_to(np.asarray(result[name], dtype=float), (n,))
+    return columns
+
+
+def _run_chunk(task):
+    """프로세스 풀 worker (pickle 가능한 최상위 함수)."""
+    plan, start, stop = task
+    return evaluate_chunk(plan, start, stop)
+
+
+def _chunks(plan):
+    size, step = plan["size"], plan["chunk_size"]
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def imap_ordered(func, tasks, jobs):
+    """순서를 유지하는 map. 진행 중인 작업을 2 * jobs개로 제한하여 결과가 메모리에 쌓이지 않게 한다."""
+    if jobs == 1:
+        yield from map(func, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(func, task))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class CsvWriter:
+    def __init__(self, path, columns, size):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.file.write(",".join(columns) + "\n")
+
+    def write(self, chunk):
+        np.savetxt(self.file, np.column_stack(list(chunk.values())), delimiter=",", fmt="%.9g")
+
+    def close(self):
+        self.file.close()
+
+
+class NpzWriter:
+    """열마다 임시 .npy 파일에 이어 쓰고, 마지막에 압축 없이 .npz로 묶는다 (메모리 사용량 일정)."""
+
+    def __init__(self, path, columns, size):
+        self.path = Path(path)
+        self.tmpdir = tempfile.mkdtemp(prefix=".sweep-", dir=self.path.parent)
+        self.files = {}
+        for name in columns:
+            f = self.files[name] = open(os.path.join(self.tmpdir, f"{name}.npy"), "wb")
+            np.lib.format.write_array_header_1_0(f, {"descr": "<f8", "fortran_order": False, "shape": (size,)})
+
+    def write(self, chunk):
+        for name, values in chunk.items():
+            self.files[name].write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+
+    def close(self):
+        try:
+            for f in self.files.values():
+                f.close()
+            with zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+                for name in sorted(os.listdir(self.tmpdir)):
+                    with open(os.path.join(self.tmpdir, name), "rb") as source, \
+                            archive.open(name, "w", force_zip64=True) as target:
+                        shutil.copyfileobj(source, target, 1 << 20)
+        finally:
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        import pyarrow.ipc
+    except ImportError:
+        raise SystemExit("Parquet / Arrow 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+    return pyarrow
+
+
+class ParquetWriter:
+    """chunk 하나를 row group 하나로 쓴다."""
+
+    def __init__(self, path, columns, size):
+        pa = _pyarrow()
+        self.pa = pa
+        self.writer = pa.parquet.ParquetWriter(path, pa.schema([(name, pa.float64()) for name in columns]))
+
+    def write(self, chunk):
+        self.writer.write_table(self.pa.table(chunk))
+
+    def close(self):
+        self.writer.close()
+
+
+class ArrowWriter:
+    """Arrow IPC 파일 (Feather v2). chunk 하나가 record batch 하나다."""
+
+    def __init__(self, path, columns, size):
+        pa = _pyarrow()
+        self.pa = pa
+        self.writer = pa.ipc.new_file(path, pa.schema([(name, pa.float64()) for name in columns]))
+
+    def write(self, chunk):
+        self.writer.write_batch(self.pa.record_batch(chunk))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {
+    ".csv": CsvWriter,
+    ".npz": NpzWriter,
+    ".parquet": ParquetWriter,
+    ".arrow": ArrowWriter,
+    ".feather": ArrowWriter,
+}
+
+
+def run_sweep(plan, output, jobs=1, log=None):
+    """
+    실행 계획을 chunk 단위로 계산하여 output 파일에 쓴다.
+
+    Returns:
+    - 계산한 점 개수
+    """
+    suffix = Path(output).suffix.lower()
+    if suffix not in WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식: {suffix} ({', '.join(WRITERS)})")
+    writer = WRITERS[suffix](output, column_names(plan), plan["size"])
+    chunks = _chunks(plan)
+    done = 0
+    t0 = time.perf_counter()
+    try:
+        tasks = ((plan, start, stop) for start, stop in chunks)
+        for i, chunk in enumerate(imap_ordered(_run_chunk, tasks, jobs), 1):
+            writer.write(chunk)
+            done += len(next(iter(chunk.values())))
+            if log:
+                elapsed = time.perf_counter() - t0
+                log(f"\r{i}/{len(chunks)} chunk, {done:,}/{plan['size']:,} 점, {done / elapsed:,.0f} 점/s")
+    finally:
+        writer.close()
+    if log:
+        log("\n")
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.sweep", description="MOSFET / BJT batch sweep")
+    parser.add_argument("spec", help="sweep 정의 파일 (.json, .yaml)")
+    parser.add_argument("-o", "--output", help=f"출력 파일 ({', '.join(WRITERS)})")
+    parser.add_argument("--jobs", type=int, default=1, help="프로세스 수 (기본값: 1)")
+    parser.add_argument("--chunk-size", type=int, help=f"chunk 하나의 점 개수 (기본값: {CHUNK_SIZE:,})")
+    parser.add_argument("--dry-run", action="store_true", help="격자 크기와 출력 열만 출력")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 상황을 출력하지 않음")
+    args = parser.parse_args(argv)
+
+    try:
+        plan = compile_spec(load_spec(args.spec), args.chunk_size)
+    except (ValueError, KeyError) as error:
+        parser.error(str(error))
+    axes = " x ".join(f"{name}[{len(values)}]" for name, values in plan["axes"]) or "(고정값)"
+    print(f"{plan['device']}: {axes} = {plan['size']:,} 점, 열: {', '.join(column_names(plan))}",
+          file=sys.stderr)
+    if args.dry_run:
+        return 0
+    if not args.output:
+        parser.error("출력 파일 (-o)이 필요합니다")
+    if args.jobs < 1:
+        parser.error("--jobs는 1 이상이어야 합니다")
+
+    log = None if args.quiet else (lambda message: print(message, end="", file=sys.stderr, flush=True))
+    try:
+        run_sweep(plan, args.output, args.jobs, log)
+    except ValueError as error:
+        parser.error(str(error))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
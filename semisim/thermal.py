@@ -0,0 +1,156 @@
+"""
+온도 sweep 엔진.
+
+소자 모델은 모든 인자를 broadcast하므로 온도를 맨 앞 배열 축으로 두면 여러 온도의 곡선을
+한 번의 호출로 계산한다. 온도에 의존하는 양은 다음에서 온다.
+
+- 이동도 μ(T): calculate_mobility_sic의 격자 산란 온도 지수 (alpha_e, alpha_h)
+- 임계 전압 Vt(T): 1D Poisson 해 (온도 배열 전체를 한 번의 batch Newton 반복으로 푼다)
+- BJT 열전압 V_T = kT/q, 포화전류 I_S(T), 전류 이득 β(T): SPICE 온도 모델 (bjt.at_temperature)
+
+기본 온도 격자는 -55 °C ~ 150 °C (5 °C 간격)이다. MOSFET의 (N_D, N_A, t_ox) 조합별 온도
+테이블 (Vt(T), μ_eff(T))은 프로세스 전역 LRU 캐시로 모든 세션이 공유한다.
+
+    table = mosfet_table(1e19, 1e16)
+    Id = mosfet_id(Vgs, Vds, 10, 10, table)     # shape (len(table.T),) + Vgs, Vds broadcast shape
+"""
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from semisim.bjt import at_temperature, common_base_output, gummel, solve_v_be
+from semisim.mobility import mobility_bulk
+from semisim.mosfet import calculate_id
+from semisim.poisson import T_OX, oxide_capacitance, threshold_voltage
+
+ZERO_CELSIUS = 273.15  # 0 °C (K)
+T_NOMINAL = ZERO_CELSIUS + 27.0  # 기본 온도 (K), SPICE TNOM과 같다
+T_MIN_C, T_MAX_C = -55.0, 150.0  # 온도 범위 (°C)
+TEMPERATURES_C = np.arange(T_MIN_C, T_MAX_C + 5.0, 5.0)  # 테이블 온도 격자 (°C)
+CURVE_TEMPERATURES_C = np.array([-55.0, -25.0, 0.0, 25.0, 50.0, 75.0, 100.0, 125.0, 150.0])  # 곡선 묶음 온도
+TABLE_CACHE_SIZE = 64
+
+
+def kelvin(T_C):
+    """섭씨 (°C) -> 켈빈 (K)."""
+    return np.add(T_C, ZERO_CELSIUS)
+
+
+def celsius(T):
+    """켈빈 (K) -> 섭씨 (°C)."""
+    return np.subtract(T, ZERO_CELSIUS)
+
+
+def _leading(values, ndim):
+    """온도 축 배열을 맨 앞 축으로 두고 뒤에 ndim개의 길이 1 축을 붙인다."""
+    values = np.asarray(values, dtype=float)
+    return values.reshape(values.shape + (1,) * ndim)
+
+
+@dataclass(frozen=True)
+class MosfetTable:
+    """(N_D, N_A, t_ox) 조합 하나의 온도 테이블. 배열 필드는 모두 온도 축 T를 따른다."""
+    N_D: float
+    N_A: float
+    t_ox: float
+    Cox: float  # F/cm^2
+    T: np.ndarray  # 온도 (K)
+    Vt: np.ndarray  # 임계 전압 (V)
+    mu_eff: np.ndarray  # 유효 이동도 (cm^2/V·s)
+
+    @property
+    def T_C(self):
+        return celsius(self.T)
+
+    def select(self, temperatures_C):
+        """테이블 온도 격자에서 주어진 온도 (°C)에 가장 가까운 행의 인덱스."""
+        return np.abs(self.T_C[:, np.newaxis] - np.asarray(temperatures_C)).argmin(axis=0)
+
+
+def _key(value):
+    return float(f"{float(value):.10g}")
+
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _mosfet_table(N_D, N_A, t_ox, temperatures_C):
+    T = kelvin(np.array(temperatures_C))
+    Vt = threshold_voltage(N_A, t_ox, T)
+    mu_eff = mobility_bulk(N_D, N_A, T)[2]
+    for array in (T, Vt, mu_eff):
+        array.setflags(write=False)
+    return MosfetTable(N_D=N_D, N_A=N_A, t_ox=t_ox, Cox=float(oxide_capacitance(t_ox)), T=T, Vt=Vt, mu_eff=mu_eff)
+
+
+def mosfet_table(N_D, N_A, t_ox=T_OX, temperatures_C=TEMPERATURES_C):
+    """
+    MOSFET 온도 테이블. Vt(T)는 온도 배열 전체를 한 번에 풀고, 결과는 프로세스 전역 캐시에 저장한다.
+
+    Parameters:
+    - N_D: n형 도핑 농도 (cm^-3)
+    - N_A: p형 도핑 농도 (cm^-3)
+    - t_ox: 산화막 두께 (nm)
+    - temperatures_C: 온도 격자 (°C)
+
+    Returns:
+    - MosfetTable
+    """
+    return _mosfet_table(_key(N_D), _key(N_A), _key(t_ox), tuple(_key(t) for t in np.ravel(temperatures_C)))
+
+
+def mosfet_id(Vgs, Vds, W, L, table, rows=None):
+    """
+    온도 테이블의 모든 (또는 rows로 고른) 온도에서의 드레인 전류.
+
+    Parameters:
+    - Vgs, Vds: 서로 broadcast 가능한 바이어스 배열 (V)
+    - W, L: 채널 폭, 길이 (µm)
+    - table: MosfetTable
+    - rows: 사용할 테이블 행 인덱스 (None이면 전체)
+
+    Returns:
+    - shape (온도 개수,) + broadcast(Vgs, Vds).shape의 Id (A)
+    """
+    rows = slice(None) if rows is None else rows
+    ndim = np.broadcast(Vgs, Vds).ndim
+    return calculate_id(Vgs, Vds, W, L, table.N_D, table.N_A, T=_leading(table.T[rows], ndim),
+                        Vt=_leading(table.Vt[rows], ndim), Cox=table.Cox,
+                        mu_eff=_leading(table.mu_eff[rows], ndim), t_ox=table.t_ox)
+
+
+def bjt_params(T, params=None, ndim=0):
+    """온도 배열 T (K)를 맨 앞 축으로 둔 BJT 파라미터 (뒤에 ndim개의 바이어스 축이 붙는다)."""
+    return at_temperature(_leading(T, ndim), params)
+
+
+def bjt_output(T, I_E, V_CB, params=None, model="gummel-poon"):
+    """
+    온도 배열 T (K)에서의 공통 베이스 출력 특성.
+
+    Returns:
+    - shape (len(T),) + broadcast(I_E, V_CB).shape의 I_C (A)
+    """
+    ndim = np.broadcast(I_E, V_CB).ndim
+    return common_base_output(I_E, V_CB, bjt_params(T, params, ndim), model)
+
+
+def bjt_gummel(T, V_BE, V_CB=0.0, params=None, model="gummel-poon"):
+    """
+    온도 배열 T (K)에서의 Gummel plot 데이터.
+
+    Returns:
+    - I_C (A), I_B (A), β, 각각 shape (len(T),) + broadcast(V_BE, V_CB).shape
+    """
+    ndim = np.broadcast(V_BE, V_CB).ndim
+    return gummel(V_BE, V_CB, bjt_params(T, params, ndim), model)
+
+
+def bjt_v_be(T, I_E, V_CB=0.0, params=None, model="gummel-poon"):
+    """
+    고정 이미터 전류에서의 V_BE(T) (온도 derating의 기본 지표, 약 -2 mV/°C).
+
+    Returns:
+    - shape (len(T),) + broadcast(I_E, V_CB).shape의 V_BE (V)
+    """
+    ndim = np.broadcast(I_E, V_CB).ndim
+    return solve_v_be(I_E, V_CB, bjt_params(T, params, ndim), model)
@@ -0,0 +1,525 @@
+"""
+공정 흐름의 2D 단면 topography (식각, 증착, CMP).
+
+웨이퍼를 z 방향 띠마다 한 장의 (y: 높이, x: 가로) 단면으로 자르고, 각 단면을 물질 label 격자로
+표현한다 (0은 공기, MATERIALS 순서의 인덱스 + 1). 모든 띠의 단면은 shape (띠, y, x) 배열 하나로
+묶어서 한 번에 계산한다.
+
+표면이 움직이는 식각과 증착은 level set으로 푼다. φ는 고체 안에서 음수인 signed distance이고,
+
+- 증착 (conformal): φ_t + |∇φ| = 0, 새로 고체가 된 칸은 증착 물질
+- 식각: φ_t = r_iso |∇φ| + r_dir ∂φ/∂y, r은 표면 물질의 식각 속도 (선택비), r_dir은 아래로만 향하는
+  이방성 성분, r_iso는 등방성 성분 (PR 아래로 파고드는 undercut)
+
+|∇φ|는 Osher-Sethian upwind (Godunov) 차분으로 계산한다. 갱신은 표면 근처 칸 (|φ| < BAND 칸,
+narrow band)의 인덱스 배열에서만 하고, REINIT_EVERY step마다 band를 다시 잡고 재초기화
+(φ_t + S(φ0)(|∇φ| - 1) = 0)로 φ를 거리 함수로 되돌린다.
+
+열산화, 패턴/현상, 애싱, 이온 주입은 column 단위 연산이다. CMP는 conformal 증착 후 표면 높이를
+pattern density 모델 (Stine)로 연마한다: 평탄화 길이 CMP_LENGTH 안에서 튀어나온 영역은 그 영역의
+밀도 ρ에 반비례하는 속도로, 튀어나온 영역이 없는 곳은 기본 속도로 깎인다. 따라서 밀도가 낮은
+패턴 위에서는 목표 높이보다 더 깎인다 (erosion).
+
+단계 i의 단면은 단면 격자와 공정 흐름의 앞부분 (0 ~ i단계의 연산과 인자)으로만 정해진다. 단계마다 그
+앞부분의 hash (keys[i])를 키로 프로세스 전역 캐시 (semisim.cache)에 보관하므로, recipe가 바뀌어도 바뀐
+조건보다 앞 단계의 단면은 (다른 세션이 계산한 것까지) 그대로 재사용한다. 이온 주입처럼 고체 칸의 물질만
+바꾸는 연산 (RELABEL_OPS)의 결과는 그 뒤 연산이 주입 물질과 원래 물질을 구별하지 않으면 표면 이동에
+영향을 주지 않는다. 이때 뒤 단계는 주입을 뺀 흐름의 단면에 주입 영역만 덧입히므로, 접합 깊이가 바뀌어도
+level set을 다시 풀지 않는다.
+
+    engine = TopographyEngine(PROCESS_FLOW, cuts=(-1.0, -0.4, 0.6))
+    engine.section(15).labels            # 16단계 (ILD CMP) 후의 단면들
+    engine.boxes(15)                      # 띠별 (물질, x0, x1, y0, y1) 목록
+    engine.keys[15]                       # 16단계 단면의 캐시 키
+"""
+import math
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from semisim.cache import shared_cache
+from semisim.render import canonical_key
+
+MATERIALS = ("Si", "Oxide", "PR", "GateOxide", "Poly", "N+", "ILD", "Al")
+AIR = 0
+
+X_RANGE = (-2.0, 2.0)  # 단면 가로 범위 (µm), 공정 엔진의 웨이퍼 x 범위와 같다
+Y_RANGE = (-1.0, 4.0)  # 단면 높이 범위 (µm), 아래쪽은 웨이퍼 바닥
+SPACING = (0.01, 0.02)  # (y, x) 격자 간격 (µm)
+BAND = 4  # narrow band 폭 (칸)
+CFL = 0.5
+REINIT_EVERY = 4  # 재초기화 간격 (step)
+REINIT_ITERATIONS = 4
+
+ETCH_SELECTIVITY = 20.0  # 식각 대상이 아닌 물질 대비 식각 속도 비
+PR_SELECTIVITY = 10.0  # PR 대비 식각 속도 비
+ANISOTROPY = 0.95  # 식각 속도 중 수직 (이방성) 성분 비율
+OVERETCH = 0.2  # 가장 두꺼운 곳 기준 과식각 비율
+
+CMP_LENGTH = 1.0  # CMP 평탄화 길이 (µm)
+CMP_MIN_DENSITY = 0.05
+CMP_CONTACT = 0.05  # 패드가 완전히 닿는 단차 (µm), 그보다 낮으면 단차에 비례해서 닿는다
+CMP_STEP = 2.0  # 연마 step마다 가장 빨리 깎이는 곳의 최대 이동 (칸)
+
+SECTION_CACHE_BYTES = 64 * 1024 * 1024  # 세션 공유 단면 캐시 크기 상한
+RELABEL_OPS = ("implant",)  # 표면을 움직이지 않고 고체 칸의 물질만 바꾸는 연산
+# 주입 물질과 원래 물질 (Si)을 구별하지 않는 연산 (etch는 두 물질이 식각 대상이 아닐 때만)
+RELABEL_SAFE = ("deposit", "cmp", "pattern", "develop", "ash", "etch")
+
+section_cache = shared_cache("topography", SECTION_CACHE_BYTES)
+
+
+def material_index(material):
+    """물질 이름의 label 값."""
+    return MATERIALS.index(material) + 1
+
+
+def _indices(materials):
+    return np.array([material_index(m) for m in materials], dtype=np.int8)
+
+
+# --- level set ------------------------------------------------------------
+
+def _gradient(dxm, dxp, dym, dyp, outward):
+    """
+    Godunov upwind |∇φ|. outward=True는 표면이 공기 쪽 (φ > 0)으로 나가는 경우 (증착),
+    False는 고체 쪽으로 들어가는 경우 (식각).
+    """
+    if outward:
+        terms = (np.maximum(dxm, 0), np.minimum(dxp, 0), np.maximum(dym, 0), np.minimum(dyp, 0))
+    else:
+        terms = (np.minimum(dxm, 0), np.maximum(dxp, 0), np.minimum(dym, 0), np.maximum(dyp, 0))
+    return np.sqrt(sum(t * t for t in terms))
+
+
+def _shift_or(mask):
+    """4방향 이웃 중 하나라도 True인 칸 (경계 밖은 False)."""
+    grown = mask.copy()
+    grown[:, 1:] |= mask[:, :-1]
+    grown[:, :-1] |= mask[:, 1:]
+    grown[:, :, 1:] |= mask[:, :, :-1]
+    grown[:, :, :-1] |= mask[:, :, 1:]
+    return grown
+
+
+class NarrowBand:
+    """
+    표면 근처 칸 (|φ| < BAND h)에서만 값을 갱신하는 level set. φ는 (띠, y, x) 배열을 평탄화해 두고,
+    band 칸의 인덱스와 4방향 이웃 인덱스 (경계에서는 자기 자신)로 차분을 계산한다.
+    band 밖의 φ는 ±BAND h로 고정된다.
+    """
+
+    def __init__(self, solid, hy, hx):
+        self.shape = solid.shape
+        self.hy, self.hx = hy, hx
+        self.h = min(hy, hx)
+        self.limit = BAND * self.h
+        interface = _shift_or(solid) & _shift_or(~solid)
+        near = interface
+        for _ in range(BAND):
+            near = _shift_or(near)
+        self.phi = np.where(solid, -self.limit, self.limit).ravel()
+        inside = near.ravel()
+        self.phi[inside] = np.where(solid.ravel()[inside], -0.5 * self.h, 0.5 * self.h)
+        self._index(np.flatnonzero(inside))
+        self.reinitialize(2 * BAND + 2)
+
+    def _index(self, idx):
+        _, ny, nx = self.shape
+        i = idx % nx
+        j = (idx // nx) % ny
+        self.idx = idx
+        self.left = np.where(i > 0, idx - 1, idx)
+        self.right = np.where(i < nx - 1, idx + 1, idx)
+        self.down = np.where(j > 0, idx - nx, idx)
+        self.up = np.where(j < ny - 1, idx + nx, idx)
+
+    def rebuild(self):
+        """band를 현재 표면 근처로 다시 잡는다 (표면이 움직인 만큼 앞쪽 칸을 포함하도록 두 칸 넓힌다)."""
+        mark = np.zeros(self.phi.size, dtype=bool)
+        self._index(self.idx[np.abs(self.phi[self.idx]) < self.limit])
+        for _ in range(2):
+            for neighbor in (self.idx, self.left, self.right, self.down, self.up):
+                mark[neighbor] = True
+            self._index(np.flatnonzero(mark))
+
+    def differences(self):
+        """band 칸의 φ와 한쪽 차분 (D-x, D+x, D-y, D+y)."""
+        phi = self.phi
+        c = phi[self.idx]
+        return c, ((c - phi[self.left]) / self.hx, (phi[self.right] - c) / self.hx,
+                   (c - phi[self.down]) / self.hy, (phi[self.up] - c) / self.hy)
+
+    def reinitialize(self, iterations=REINIT_ITERATIONS):
+        """φ_t + S(φ0)(|∇φ| - 1) = 0 을 iterations번 풀어 band 안의 φ를 거리 함수로 되돌린다."""
+        c = self.phi[self.idx]
+        S = c / np.sqrt(c * c + self.h * self.h)
+        dt = CFL * self.h
+        for _ in range(iterations):
+            c, d = self.differences()
+            grad = np.where(S > 0, _gradient(*d, outward=True), _gradient(*d, outward=False))
+            self.phi[self.idx] = c - dt * S * (grad - 1)
+        self.phi[self.idx] = np.clip(self.phi[self.idx], -self.limit, self.limit)
+
+
+def _interface_rows(solid):
+    """고체/공기 경계가 있는 행 범위 [lo, hi]."""
+    edge = np.zeros_like(solid)
+    edge[:, :-1] |= solid[:, :-1] != solid[:, 1:]
+    edge[:, :, :-1] |= solid[:, :, :-1] != solid[:, :, 1:]
+    rows = np.nonzero(edge.any(axis=(0, 2)))[0]
+    return int(rows[0]), int(rows[-1])
+
+
+# --- column 연산 도우미 -----------------------------------------------------
+
+def top_index(labels):
+    """(띠, x) column마다 가장 위 고체 칸의 행 인덱스 (고체가 없으면 -1)."""
+    solid = labels[:, ::-1] != AIR
+    found = solid.any(axis=1)
+    return np.where(found, labels.shape[1] - 1 - solid.argmax(axis=1), -1)
+
+
+def _take_rows(labels, rows):
+    """(띠, x) column마다 rows 행의 label."""
+    return np.take_along_axis(labels, np.clip(rows, 0, labels.shape[1] - 1)[:, np.newaxis], axis=1)[:, 0]
+
+
+def _run_below(labels, top, materials):
+    """column 윗면부터 아래로 materials가 연속되는 칸 수."""
+    inside = np.isin(labels, materials)
+    rows = np.arange(labels.shape[1])[np.newaxis, :, np.newaxis]
+    below = rows <= top[:, np.newaxis]
+    # 윗면 아래에서 처음으로 materials가 아닌 칸 (없으면 -1)
+    broken = below & ~inside
+    last = np.where(broken.any(axis=1), labels.shape[1] - 1 - broken[:, ::-1].argmax(axis=1), -1)
+    return np.where(top >= 0, top - last, 0)
+
+
+def _chain(key, item):
+    """앞 단계까지의 키에 연산 하나 (이름, 인자)를 이어 붙인 키."""
+    return canonical_key(key, item)
+
+
+def _relabel_safe(flow, step):
+    """step 단계의 물질 변경 연산 뒤 연산들이 모두 주입 물질을 원래 물질 (Si)과 같게 다루는지."""
+    material = flow[step][2]["material"]
+    return all(op in RELABEL_SAFE and not {material, "Si"} & set(args.get("materials", ()))
+               for _, op, args in flow[step + 1:])
+
+
+def _sliding(values, width, reduce):
+    """가로 방향 (마지막 축) 폭 width 칸의 이동 창 reduce (경계는 값 복사)."""
+    half = width // 2
+    padded = np.pad(values, ((0, 0), (half, half)), mode="edge")
+    return reduce(np.lib.stride_tricks.sliding_window_view(padded, 2 * half + 1, axis=-1), axis=-1)
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    한 공정 단계의 단면들 (읽기 전용).
+
+    - labels: shape (띠, y, x)의 물질 label
+    - exposed: 노광되어 현상될 column (shape (띠, x)), 노광 단계 이후에만 있다
+    """
+    labels: np.ndarray
+    exposed: np.ndarray = None
+
+
+class TopographyEngine:
+    """
+    공정 흐름을 단면 격자에서 단계별로 계산하는 엔진. 연산 이름과 인자는 ProcessEngine과 같다.
+
+    Parameters:
+    - flow: (설명, 연산 이름, 연산 인자) 목록
+    - cuts: 단면을 자르는 z 위치 목록 (µm), 띠마다 하나
+    - spacing: (y, x) 격자 간격 (µm)
+    """
+
+    def __init__(self, flow, cuts, spacing=SPACING):
+        self.flow = flow
+        self.cuts = tuple(cuts)
+        self.hy, self.hx = spacing
+        ny = int(round((Y_RANGE[1] - Y_RANGE[0]) / self.hy))
+        nx = int(round((X_RANGE[1] - X_RANGE[0]) / self.hx))
+        self.shape = (len(self.cuts), ny, nx)
+        self.y = Y_RANGE[0] + self.hy * (np.arange(ny) + 0.5)  # 칸 중심
+        self.x = X_RANGE[0] + self.hx * (np.arange(nx) + 0.5)
+        # 단계별 캐시 키 (흐름의 앞부분 hash). 물질 변경 연산 (RELABEL_OPS) 뒤 단계의 표면은 그 연산을
+        # 뺀 흐름 (base 키)으로 계산하고, relabel[i]는 그 단계에 덧입힐 물질 변경 단계다
+        key = base = _chain("", [self.cuts, spacing])
+        self.keys, self._base_keys, self._relabel = [], [], []
+        relabel = None
+        for step, (_, op, args) in enumerate(flow):
+            key = _chain(key, [op, args])
+            if op in RELABEL_OPS and step and relabel is None and _relabel_safe(flow, step):
+                relabel = step
+            else:
+                base = _chain(base, [op, args])
+            self.keys.append(key)
+            self._base_keys.append(base if relabel is not None and step > relabel else key)
+            self._relabel.append(relabel if relabel is not None and step > relabel else None)
+        self._sections = []
+        self._boxes = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.flow)
+
+    def _top_height(self, labels):
+        """column 윗면 높이 (µm)."""
+        return Y_RANGE[0] + (top_index(labels) + 1) * self.hy
+
+    def _covered(self, rects):
+        """(띠, x) column 중 rects 안에 드는 것 (단면 위치와 칸 중심 기준)."""
+        covered = np.zeros((len(self.cuts), len(self.x)), dtype=bool)
+        for x0, x1, z0, z1 in rects:
+            band = np.array([z0 <= z <= z1 for z in self.cuts])
+            covered |= band[:, np.newaxis] & ((self.x >= x0) & (self.x <= x1))[np.newaxis, :]
+        return covered
+
+    # --- level set 표면 이동 -------------------------------------------------
+
+    def _evolve(self, labels, distance, speed=None, material=None):
+        """
+        표면을 distance (µm)만큼 움직인다. speed가 None이면 속도 1의 conformal 증착 (material),
+        아니면 speed(칸 label, band) -> band 칸의 (r_iso, r_dir)를 쓰는 식각 (최대 속도 1 기준 시간 distance).
+        """
+        hy, hx = self.hy, self.hx
+        h = min(hy, hx)
+        lo, hi = _interface_rows(labels != AIR)
+        reach = int(math.ceil(distance / hy)) + BAND + 2
+        if speed is None:
+            lo, hi = max(lo - BAND - 2, 0), min(hi + reach, labels.shape[1] - 1)
+            if hi == labels.shape[1] - 1:
+                raise ValueError("증착 후 높이가 단면 범위 (Y_RANGE)를 넘습니다")
+        else:
+            lo, hi = max(lo - reach, 0), min(hi + BAND + 2, labels.shape[1] - 1)
+        labels = labels.copy()
+        slab = labels[:, lo:hi + 1].copy()
+        cells = slab.reshape(-1)
+        band = NarrowBand(slab != AIR, hy, hx)
+
+        steps = max(1, int(math.ceil(distance / (CFL * h))))
+        dt = distance / steps
+        fill = material_index(material) if material else AIR
+        for step in range(steps):
+            if step and step % REINIT_EVERY == 0:
+                band.rebuild()
+                band.reinitialize()
+            if speed is not None and step % REINIT_EVERY == 0:
+                r_iso, r_dir = speed(cells, band)
+            c, d = band.differences()
+            if speed is None:
+                c = c - dt * _gradient(*d, outward=True)
+                grown = band.idx[c <= 0]
+                cells[grown[cells[grown] == AIR]] = fill
+            else:
+                c = c + dt * (r_iso * _gradient(*d, outward=False) + r_dir * d[3])
+                cells[band.idx[c > 0]] = AIR
+            band.phi[band.idx] = c
+        labels[:, lo:hi + 1] = slab
+        return labels
+
+    def _etch_speed(self, rates):
+        """
+        label별 식각 속도로 band 칸의 (r_iso, r_dir)를 만드는 함수. band 안의 공기 칸은 가까운 아래
+        (없으면 옆, 위) 고체의 속도를 이어받아, 표면 양쪽의 φ가 같은 속도로 움직이게 한다.
+        """
+        def speed(cells, band):
+            # band 칸 배열 안에서 이웃 위치 (band 밖이면 자기 자신)
+            position = np.full(cells.size, -1)
+            position[band.idx] = np.arange(len(band.idx))
+            own = np.arange(len(band.idx))
+            neighbors = [np.where(position[n] >= 0, position[n], own) for n in (band.down, band.left, band.right, band.up)]
+            material = cells[band.idx]
+            for _ in range(BAND + 2):
+                empty = material == AIR
+                if not empty.any():
+                    break
+                fill = material
+                for n in neighbors:
+                    fill = np.where(fill == AIR, material[n], fill)
+                material = np.where(empty, fill, material)
+            r = rates[material]
+            return (1 - ANISOTROPY) * r, ANISOTROPY * r
+        return speed
+
+    # --- 공정 연산 ---------------------------------------------------------
+
+    def wafer(self, state):
+        labels = np.full(self.shape, AIR, dtype=np.int8)
+        labels[:, self.y < 0] = material_index("Si")
+        return Section(labels)
+
+    def deposit(self, state, material, thickness):
+        """conformal 증착 (level set)."""
+        return Section(self._evolve(state.labels, thickness, material=material))
+
+    def oxidize(self, state, material, ambient, T_C, minutes):
+        """
+        Deal-Grove 열산화 (column 단위). Si가 드러난 column에는 새 산화막이, Si 위 산화막이 있는
+        column은 기존 산화막이 자란다. 늘어난 두께의 SI_CONSUMED 비율만큼 Si가 소모된다.
+        """
+        from semisim.kinetics import SI_CONSUMED, oxide_thickness
+        from semisim.process import OXIDES
+
+        labels = state.labels
+        top = top_index(labels)
+        top_label = _take_rows(labels, top)
+        oxides = _indices(OXIDES)
+        run = _run_below(labels, top, oxides)
+        on_si = np.isin(top_label, oxides) & (_take_rows(labels, top - run) == material_index("Si"))
+        bare = top_label == material_index("Si")
+        x0 = np.where(on_si, run * self.hy, 0.0)
+        x = oxide_thickness(minutes, T_C, ambient, x0)
+        growth = x - x0
+        surface = self._top_height(labels)
+        interface = surface - x0 - SI_CONSUMED * growth
+        fill = np.where(bare, material_index(material), top_label).astype(np.int8)
+        y = self.y[np.newaxis, :, np.newaxis]
+        grow = ((bare | on_si)[:, np.newaxis] & (y >= interface[:, np.newaxis]) & (y < (interface + x)[:, np.newaxis]))
+        return Section(np.where(grow, fill[:, np.newaxis], labels))
+
+    def pattern(self, state, mask, tone="positive"):
+        covered = self._covered(mask)
+        exposed = covered if tone == "negative" else ~covered
+        return Section(state.labels, exposed)
+
+    def develop(self, state):
+        """노광된 column의 PR 제거."""
+        pr = (state.labels == material_index("PR")) & state.exposed[:, np.newaxis]
+        return Section(np.where(pr, AIR, state.labels).astype(np.int8))
+
+    def etch(self, state, materials):
+        """
+        level set 식각. 드러난 평평한 column의 materials 층 두께 (최대값)를 OVERETCH만큼 더 식각하는 시간 동안,
+        materials는 속도 1, PR은 1 / PR_SELECTIVITY, 나머지 물질은 1 / ETCH_SELECTIVITY로 깎인다.
+        """
+        labels = state.labels
+        targets = _indices(materials)
+        top = top_index(labels)
+        run = _run_below(labels, top, targets)
+        open_ = (run > 0) & (_take_rows(labels, top) != material_index("PR"))
+        if not open_.any():
+            return Section(labels)
+        # 끝점은 평평한 곳의 막 두께 기준 (단차 옆벽의 conformal 막은 더 두꺼워 stringer로 남을 수 있다)
+        # (막 두께만큼 좌우로 윗면 높이가 거의 같은 column)
+        width = 2 * int(np.median(run[open_]) * self.hy / self.hx) + 1
+        flat = open_ & (_sliding(top, width, np.max) - _sliding(top, width, np.min) <= 2)
+        depth = float(run[flat].max() if flat.any() else np.median(run[open_])) * self.hy
+        rates = np.full(len(MATERIALS) + 1, 1 / ETCH_SELECTIVITY)
+        rates[AIR] = 0.0
+        rates[material_index("PR")] = 1 / PR_SELECTIVITY
+        rates[targets] = 1.0
+        return Section(self._evolve(labels, depth * (1 + OVERETCH), speed=self._etch_speed(rates)))
+
+    def ash(self, state):
+        """모든 PR 제거."""
+        return Section(np.where(state.labels == material_index("PR"), AIR, state.labels).astype(np.int8))
+
+    def implant(self, state, windows, material, depth):
+        """창 안에서 Si가 드러난 column의 Si 윗부분 depth를 도핑 영역으로 바꾼다."""
+        labels = state.labels
+        top = top_index(labels)
+        bare = self._covered(windows) & (_take_rows(labels, top) == material_index("Si"))
+        y = self.y[np.newaxis, :, np.newaxis]
+        doped = bare[:, np.newaxis] & (y >= (self._top_height(labels) - depth)[:, np.newaxis]) \
+            & (labels == material_index("Si"))
+        return Section(np.where(doped, material_index(material), labels).astype(np.int8))
+
+    def cmp(self, state, material, thickness):
+        """
+        증착 후 CMP. 가장 높은 윗면 위 thickness 높이 (목표)를 넘도록 단차만큼 더 두껍게 conformal
+        증착한 뒤, pattern density 모델로 가장 높은 곳이 목표 높이가 될 때까지 연마한다.
+        """
+        labels = state.labels
+        surface = self._top_height(labels)
+        level = float(surface.max()) + thickness
+        step = float(surface.max() - surface.min())
+        labels = self._evolve(labels, thickness + step, material=material)
+
+        h = self._top_height(labels)
+        width = max(1, int(round(CMP_LENGTH / self.hx)))
+        while h.max() > level + 1e-9:
+            contact = np.clip((h - _sliding(h, width, np.min)) / CMP_CONTACT, 0, 1)
+            density = _sliding(contact, width, np.mean)
+            # 닿는 영역은 밀도에 반비례, 창 안이 거의 평평하면 기본 속도
+            rate = np.where(density > CMP_MIN_DENSITY, contact / np.maximum(density, CMP_MIN_DENSITY), 1.0)
+            dt = CMP_STEP * self.hy / rate.max()
+            top_rate = rate[h == h.max()].max()
+            if top_rate > 0:
+                dt = min(dt, (h.max() - level) / top_rate)
+            h = h - rate * dt
+        removed = self.y[np.newaxis, :, np.newaxis] > h[:, np.newaxis]
+        return Section(np.where(removed, AIR, labels).astype(np.int8))
+
+    # --- 단계별 단면 -------------------------------------------------------
+
+    def section(self, step):
+        """
+        step 단계의 단면. 단계마다 흐름의 앞부분을 키로 하는 세션 공유 캐시에서 찾고, 없으면 직전 단계부터
+        계산한다. 물질 변경 연산 뒤 단계는 그 연산을 뺀 단면 (base)에 변경된 칸을 덧입힌다.
+        """
+        with self._lock:
+            while len(self._sections) <= step:
+                i = len(self._sections)
+                base = section_cache.get_or_compute(self._base_keys[i], lambda: self._apply(i))
+                k = self._relabel[i]
+                if k is not None:
+                    # 물질 변경 전과 같은 물질이 그대로 남은 칸 (한 번도 깎이지 않은 칸)만 변경된 물질로 덧입힌다
+                    before, after = self._sections[k - 1].labels, self._sections[k].labels
+                    kept = (after != before) & (base.labels == before)
+                    base = Section(np.where(kept, after, base.labels), base.exposed)
+                    base.labels.setflags(write=False)
+                self._sections.append(base)
+            return self._sections[step]
+
+    def _apply(self, step):
+        """base 흐름의 직전 단계 단면 (물질 변경 단계는 건너뜀)에 step 단계의 연산을 적용한 단면."""
+        _, op, args = self.flow[step]
+        previous = step - 1
+        if previous >= 0 and self._relabel[step] == previous:
+            previous -= 1
+        state = None
+        if previous >= 0:
+            state = section_cache.get_or_compute(self._base_keys[previous], lambda: self._apply(previous))
+        result = getattr(self, op)(state, **args)
+        result.labels.setflags(write=False)
+        return result
+
+    def boxes(self, step):
+        """
+        step 단계의 띠별 box 목록 [[(물질, x0, x1, y0, y1), ...], ...] (캐시됨).
+        column마다 같은 물질 구간을 나누고, 같은 (물질, y0, y1) 구간은 가로로 맞닿으면 합친다.
+        """
+        with self._lock:
+            if step not in self._boxes:
+                labels = self.section(step).labels
+                self._boxes[step] = [self._band_boxes(band) for band in labels]
+            return self._boxes[step]
+
+    def _band_boxes(self, labels):
+        from semisim.process import _merge_spans
+
+        columns = labels.T  # (x, y)
+        # 옆 column과 label 열이 같은 column은 건너뛰고 묶음의 (x0, x1)로 처리한다
+        change = np.nonzero((columns[1:] != columns[:-1]).any(axis=1))[0] + 1
+        starts = np.concatenate([[0], change]).tolist()
+        ends = np.concatenate([change, [len(columns)]]).tolist()
+        pieces = {}
+        for a, b in zip(starts, ends):
+            column = columns[a]
+            edges = np.nonzero(column[1:] != column[:-1])[0] + 1
+            run_starts = np.concatenate([[0], edges]).tolist()
+            run_ends = np.concatenate([edges, [len(column)]]).tolist()
+            span = (round(X_RANGE[0] + a * self.hx, 4), round(X_RANGE[0] + b * self.hx, 4))
+            for r0, r1 in zip(run_starts, run_ends):
+                if column[r0] != AIR:
+                    key = (MATERIALS[column[r0] - 1], round(Y_RANGE[0] + r0 * self.hy, 4),
+                           round(Y_RANGE[0] + r1 * self.hy, 4))
+                    pieces.setdefault(key, []).append(span)
+        return [(material, x0, x1, y0, y1)
+                for (material, y0, y1), spans in pieces.items() for x0, x1 in _merge_spans(spans)]
@@ -0,0 +1,87 @@
+"""
+공정 단계 3D 뷰어 (양방향 Streamlit custom component).
+
+브라우저 쪽 (``frontend/process_viewer/index.html``)은 모든 단계의 box 목록을 받아 WebGL scene 하나를
+계속 유지하고, 단계 이동, 전환 효과, 카메라 상태를 직접 처리한다. 단계별 box 목록은 단계 키
+(ProcessEngine.keys)로 브라우저에 보관하므로, 공정 조건이 바뀌면 키가 바뀐 단계만 보낸다 (ProcessEngine.delta).
+브라우저에 없는 단계가 있으면 (새 iframe 등) 브라우저가 새 resync token을 보고하고, 다음 실행에서 모든
+단계를 다시 보낸다.
+iframe 높이는 브라우저가 내용에 맞춰 정한다.
+scene은 카메라가 움직이거나 단계 전환 중일 때만 다시 그리므로 가만히 있는 뷰어는 프레임을 그리지 않는다.
+box는 단위 geometry 하나를 scale해서 공유하고 material은 층 종류별로 공유하며, 전환 중에만 쓰는
+material 복사본은 전환이 끝나면 바로 해제한다.
+Python에는 현재 단계 인덱스와 frame 통계를 보고하며, 연속으로 누르면 마지막 단계만 한 번 보고한다.
+단계가 그대로여도 그 사이 프레임을 그렸으면 (카메라 이동 등) 2초에 한 번 통계를 보고한다.
+페이지는 뷰어를 ``st.fragment`` 안에서 호출하므로 보고에 따른 rerun은 뷰어 호출만 다시 실행한다.
+
+    @st.fragment
+    def viewer(recipe):
+        engine = recipe_engine(recipe)
+        st.session_state["step"] = process_viewer(engine, step=st.session_state["step"], key="process_viewer")
+        stats = frame_stats()   # 마지막 보고 시점의 프레임 수, 렌더 시간, draw call 등 (보고 전에는 None)
+"""
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from semisim import profiler
+from semisim.assets import asset_url
+
+FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "process_viewer"
+
+STATS_KEY = "_semisim_viewer_stats"  # 마지막으로 보고된 frame 통계를 두는 session_state key
+SENT_KEY = "_semisim_viewer_sent"  # 뷰어 key -> 브라우저에 보낸 단계 키 집합과 마지막 resync token
+
+_component = components.declare_component("process_viewer", path=str(FRONTEND_DIR))
+
+
+def process_viewer(engine, step=0, key=None):
+    """
+    공정 단계 뷰어를 표시하고 브라우저에서 선택한 단계를 돌려준다.
+
+    Parameters:
+    - engine: 표시할 공정 흐름의 ProcessEngine
+    - step: 처음 표시할 단계 (iframe이 처음 만들어질 때만 사용하고, 이후에는 브라우저 상태를 따른다)
+      engine이 바뀌면 (공정 조건 변경) 바뀐 단계만 보내고 같은 WebGL scene에서 현재 단계를 다시 그린다
+    - key: Streamlit 위젯 key (rerun 사이에 같은 iframe을 유지하려면 지정한다. 없으면 매번 모든 단계를 보낸다)
+
+    Returns:
+    - 현재 단계 인덱스
+    """
+    sent = st.session_state.setdefault(SENT_KEY, {}).setdefault(key, {"keys": frozenset(), "resync": None})
+    # 브라우저가 빠진 단계를 다시 요청했으면 (새 resync token) 모든 단계를 보낸다
+    previous = st.session_state.get(key) if key is not None else None
+    resync = previous.get("resync") if isinstance(previous, dict) else None
+    if key is None or resync != sent["resync"]:
+        sent.update(keys=frozenset(), resync=resync)
+    with profiler.section("process sequence"):
+        sequence = engine.delta(sent["keys"])
+    sent["keys"] = frozenset(engine.keys)  # 브라우저도 현재 단계 키만 남긴다
+
+    with profiler.section("process_viewer", "serialize", bytes=len(sequence.encode("utf-8"))):
+        value = _component(
+            sequence=sequence,
+            step=step,
+            three_url=asset_url("three"),
+            orbit_controls_url=asset_url("orbit_controls"),
+            key=key,
+            default={"step": step},
+        )
+    if not isinstance(value, dict):  # 단계만 보고하던 이전 형식 (정수)
+        value = {"step": value}
+    if value.get("stats") is not None:
+        st.session_state[STATS_KEY] = value["stats"]
+    return int(value["step"])
+
+
+def frame_stats():
+    """
+    브라우저가 마지막으로 보고한 3D 뷰어 frame 통계.
+
+    Returns:
+    - dict (frames: 누적 렌더 프레임 수, seconds: 뷰어 수명 (s), mean_ms / max_ms: 최근 프레임의 CPU
+      렌더 시간, draw_calls / triangles: 마지막 프레임, geometries / textures: GPU 자원 수,
+      meshes: scene의 box 수) 또는 아직 보고가 없으면 None
+    """
+    return st.session_state.get(STATS_KEY)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from semisim.bjt import EBERS_MOLL, default_params, gummel, model_params, solve_v_be, terminal_currents
+
+
+def test_ebers_moll_forward_active_is_ideal_diode():
+    p = model_params(model="ebers-moll")
+    V_BE = np.linspace(0.4, 0.7, 4)
+    I_C, I_B, I_E = terminal_currents(V_BE, -2.0, model="ebers-moll")
+    I_f = p["I_S"] * np.expm1(V_BE / (p["NF"] * p["V_T"]))
+    I_r = p["I_S"] * np.expm1(-2.0 / (p["NR"] * p["V_T"]))
+    np.testing.assert_allclose(I_C, I_f - I_r - I_r / p["BR"], rtol=1e-12)
+    np.testing.assert_allclose(I_B, I_f / p["BF"] + I_r / p["BR"], rtol=1e-12)
+    np.testing.assert_allclose(I_E, I_C + I_B, rtol=1e-12)
+
+
+def test_ebers_moll_model_disables_second_order_effects():
+    p = model_params({"VAF": 50.0}, model="ebers-moll")
+    assert all(p[name] == value for name, value in EBERS_MOLL.items())
+
+
+def test_early_effect_raises_collector_current():
+    V_CB = np.array([0.0, 2.0, 5.0])
+    I_C = terminal_currents(0.65, -V_CB, {"VAF": 50.0})[0]
+    assert np.all(np.diff(I_C) > 0)
+    flat = terminal_currents(0.65, -V_CB, {"VAF": 50.0}, model="ebers-moll")[0]
+    np.testing.assert_allclose(flat, flat[0], rtol=1e-9)
+
+
+def test_high_injection_lowers_beta():
+    _, _, beta = gummel(np.array([0.6, 0.95]), params={"IKF": 1e-3})
+    assert beta[1] < beta[0]
+
+
+def test_solve_v_be_inverts_emitter_current():
+    I_E = np.geomspace(1e-6, 1e-2, 5)[:, np.newaxis]
+    V_CB = np.array([0.0, 1.0, 5.0])[np.newaxis, :]
+    V_BE = solve_v_be(I_E, V_CB)
+    assert V_BE.shape == (5, 3)
+    np.testing.assert_allclose(terminal_currents(V_BE, -V_CB)[2], np.broadcast_to(I_E, V_BE.shape), rtol=1e-8)
+
+
+def test_default_params_are_not_modified():
+    before = dict(default_params)
+    model_params({"BF": 10.0}, model="ebers-moll")
+    assert default_params == before
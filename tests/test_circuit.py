@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from semisim.circuit import Circuit, common_emitter, common_source
+from semisim.mosfet import calculate_id
+
+
+def test_resistor_divider():
+    solution = (Circuit()
+                .vsource("V1", "in", "0", 10.0)
+                .resistor("R1", "in", "mid", 1e3)
+                .resistor("R2", "mid", "0", 3e3)
+                .operating_point())
+    assert solution.voltage("mid")[0] == pytest.approx(7.5, rel=1e-6)
+    # GMIN (노드-접지 컨덕턴스) 때문에 정확히 같지는 않다. 전압원 전류는 + 단자에서 source로 들어가는 방향
+    assert solution.current("V1")[0] == pytest.approx(-10.0 / 4e3, rel=1e-6)
+
+
+def test_current_source_into_resistor():
+    solution = Circuit().isource("I1", "0", "a", 1e-3).resistor("R1", "a", "0", 2e3).operating_point()
+    assert solution.voltage("a")[0] == pytest.approx(2.0, rel=1e-6)
+
+
+def test_duplicate_name_rejected():
+    circuit = Circuit().resistor("R1", "a", "0", 1.0)
+    with pytest.raises(ValueError):
+        circuit.resistor("R1", "a", "b", 1.0)
+
+
+def test_common_source_matches_device_model():
+    device = {"W": 10.0, "L": 10.0, "Vt": 1.0, "Cox": 6.9e-8, "mu_eff": 500.0}
+    solution = common_source(5.0, 10e3, 2.0, device).operating_point()
+    assert solution.converged.all()
+    out = solution.voltage("out")[0]
+    M1 = solution.device("M1")
+    Id = calculate_id(2.0, out, 10.0, 10.0, 1e19, 1e16, Vt=1.0, Cox=6.9e-8, mu_eff=500.0)
+    assert M1["Id"][0] == pytest.approx(Id, rel=1e-6)
+    # KCL: 부하 저항 전류 = drain 전류
+    assert (5.0 - out) / 10e3 == pytest.approx(Id, rel=1e-5)
+
+
+def test_dc_sweep_transfer_curve_is_monotonic():
+    values = np.linspace(0.0, 5.0, 41)
+    solution = common_source(5.0, 10e3, 0.0, {"Vt": 1.0}).dc_sweep("V_in", values)
+    assert solution.converged.all()
+    out = solution.voltage("out")
+    assert out[0] == pytest.approx(5.0, abs=1e-6)
+    assert np.all(np.diff(out) <= 1e-9)
+
+
+def test_common_emitter_kcl():
+    solution = common_emitter(5.0, 1e3, 100e3, 1.0).operating_point()
+    assert solution.converged.all()
+    Q1 = solution.device("Q1")
+    assert (5.0 - solution.voltage("out")[0]) / 1e3 == pytest.approx(Q1["I_C"][0], rel=1e-5)
+    assert (1.0 - solution.voltage("base")[0]) / 100e3 == pytest.approx(Q1["I_B"][0], rel=1e-5)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from semisim.bjt import terminal_currents
+from semisim.extract import extract, load_measurements
+from semisim.mosfet import calculate_id
+from semisim.poisson import T_OX, oxide_capacitance
+
+TRUE_MOSFET = {"a": (1.2, 500.0), "b": (0.9, 300.0)}  # 소자 이름: (Vt, mu_eff)
+
+
+def _mosfet_columns():
+    Vgs, Vds = np.meshgrid(np.linspace(0.0, 5.0, 21), np.linspace(0.0, 5.0, 11), indexing="ij")
+    parts = []
+    for name, (Vt, mu_eff) in TRUE_MOSFET.items():
+        Id = calculate_id(Vgs, Vds, 10.0, 10.0, 1e19, 1e16, Vt=Vt, Cox=oxide_capacitance(T_OX), mu_eff=mu_eff)
+        parts.append({"Vgs": Vgs.ravel(), "Vds": Vds.ravel(), "Id": Id.ravel(), "device": np.full(Id.size, name)})
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def test_mosfet_recovers_parameters_per_device():
+    result = extract(_mosfet_columns())
+    assert list(result.devices) == ["a", "b"]
+    assert result.converged.all()
+    for i, (Vt, mu_eff) in enumerate(TRUE_MOSFET.values()):
+        assert result["Vt"][i] == pytest.approx(Vt, rel=1e-6)
+        assert result["mu_eff"][i] == pytest.approx(mu_eff, rel=1e-6)
+    assert result.rms.max() < 1e-8
+
+
+def test_mosfet_batches_give_same_result():
+    columns = _mosfet_columns()
+    np.testing.assert_allclose(extract(columns, batch_size=1).params, extract(columns).params, rtol=1e-9)
+
+
+def test_bjt_recovers_gummel_poon_parameters():
+    V_BE, V_CB = np.meshgrid(np.linspace(0.4, 0.8, 30), np.array([0.0, 2.0, 5.0]), indexing="ij")
+    true = {"I_S": 2e-15, "BF": 80.0, "VAF": 40.0}
+    I_C, _, I_E = terminal_currents(V_BE, -V_CB, true)
+    columns = {"V_BE": V_BE.ravel(), "V_CB": V_CB.ravel(), "I_C": I_C.ravel(), "I_E": I_E.ravel()}
+    result = extract(columns, "bjt", fit=tuple(true))
+    assert result.converged.all()
+    for name, value in true.items():
+        assert result[name][0] == pytest.approx(value, rel=1e-6)
+
+
+def test_csv_round_trip(tmp_path):
+    columns = _mosfet_columns()
+    path = tmp_path / "lot.csv"
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("device,Vgs,Vds,Id\n")
+        for row in zip(columns["device"], columns["Vgs"], columns["Vds"], columns["Id"]):
+            file.write(f"{row[0]},{row[1]:.17g},{row[2]:.17g},{row[3]:.17g}\n")
+    result = extract(load_measurements(path))
+    assert result["Vt"] == pytest.approx([Vt for Vt, _ in TRUE_MOSFET.values()], rel=1e-6)
+
+
+def test_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        extract(_mosfet_columns(), fit=("Vt", "BF"))
@@ -0,0 +1,108 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from semisim.graph import Graph, GraphState
+
+_names = itertools.count()
+
+
+@pytest.fixture
+def graph():
+    """a -> double, b -> triple, (double, triple) -> total, a -> sign (cutoff) -> label."""
+    # 노드 값은 프로세스 전역 캐시에 그래프 이름으로 저장되므로 테스트마다 이름을 바꾼다
+    graph = Graph(f"test-{next(_names)}")
+    graph.calls = []
+
+    @graph.node("a")
+    def double(a):
+        graph.calls.append("double")
+        return 2 * a
+
+    @graph.node("b")
+    def triple(b):
+        graph.calls.append("triple")
+        return 3 * b
+
+    @graph.node("double", "triple")
+    def total(x, y):
+        graph.calls.append("total")
+        return x + y
+
+    @graph.node("a", cutoff=True)
+    def sign(a):
+        graph.calls.append("sign")
+        return bool(a > 0)
+
+    @graph.node("sign")
+    def label(positive):
+        graph.calls.append("label")
+        return "+" if positive else "-"
+
+    return graph
+
+
+def test_dependencies(graph):
+    assert graph.upstream_params("total") == {"a", "b"}
+    assert graph.upstream_params("label") == {"a"}
+    assert graph.downstream(["b"]) == {"triple", "total"}
+    assert graph.downstream(["a"]) == {"double", "total", "sign", "label"}
+
+
+def test_first_run_is_lazy(graph):
+    run = graph.session({"a": 1, "b": 1}, GraphState())
+    assert run["double"] == 2
+    assert graph.calls == ["double"]
+
+
+def test_reruns_only_downstream_nodes(graph):
+    state = GraphState()
+    run = graph.session({"a": 1, "b": 1}, state)
+    assert run["total"] == 5
+    assert sorted(run.ran) == ["double", "total", "triple"]
+
+    run = graph.session({"a": 2, "b": 1}, state)
+    assert run["total"] == 7
+    assert run.ran == ["double", "total"]
+    assert run.reused == ["triple"]
+    assert run.report()["changed"] == ["a"]
+
+
+def test_unchanged_params_reuse_everything(graph):
+    state = GraphState()
+    graph.session({"a": 1, "b": 1}, state)["total"]
+    graph.calls.clear()
+    run = graph.session({"a": 1, "b": 1}, state)
+    assert run["total"] == 5
+    assert run.ran == [] and graph.calls == []
+
+
+def test_cutoff_stops_propagation(graph):
+    state = GraphState()
+    graph.session({"a": 1, "b": 1}, state)["label"]
+    run = graph.session({"a": 2, "b": 1}, state)
+    assert run["label"] == "+"
+    assert run.ran == ["sign"]  # sign 값이 그대로이므로 label은 다시 실행하지 않는다
+    assert run.reused == ["label"]
+
+    run = graph.session({"a": -1, "b": 1}, state)
+    assert run["label"] == "-"
+    assert run.ran == ["sign", "label"]
+
+
+def test_array_params_compare_by_value(graph):
+    state = GraphState()
+    graph.session({"a": np.arange(3), "b": 1}, state)["double"]
+    run = graph.session({"a": np.arange(3), "b": 1}, state)
+    run["double"]
+    assert run.changed == [] and run.ran == []
+
+
+def test_sessions_share_computed_values(graph):
+    graph.session({"a": 3, "b": 4}, GraphState())["total"]
+    graph.calls.clear()
+    run = graph.session({"a": 3, "b": 4}, GraphState())
+    assert run["total"] == 18
+    assert graph.calls == []
+    assert sorted(run.shared) == ["double", "total", "triple"]
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from semisim.litho import FIELD, aerial_image, critical_dimension, develop, kernels, rasterize
+
+GRID = (128, 128)
+
+
+@pytest.fixture(scope="module")
+def optics():
+    return kernels(wavelength=0.193, NA=0.93, sigma=0.5, grid=GRID)
+
+
+def _x():
+    dx = (FIELD[1] - FIELD[0]) / GRID[1]
+    return FIELD[0] + dx * (np.arange(GRID[1]) + 0.5)
+
+
+def test_kernels_are_cached(optics):
+    assert kernels(wavelength=0.193, NA=0.93, sigma=0.5, grid=GRID) is optics
+    assert optics.energy >= 0.97
+
+
+def test_rasterize_edge_pixels_are_partial():
+    mask = rasterize([(-0.26, 0.26, -2.0, 2.0)], grid=GRID)  # 가장자리가 픽셀 경계 (0.03125 µm 간격)가 아니다
+    row = mask[GRID[0] // 2]
+    assert row.min() == 0.0 and row.max() == 1.0
+    assert ((row > 0) & (row < 1)).sum() == 2
+    assert (1 - row).sum() * (FIELD[1] - FIELD[0]) / GRID[1] == pytest.approx(0.52, rel=1e-5)
+
+
+def test_open_field_is_uniform(optics):
+    intensity = aerial_image(np.ones(GRID), optics)
+    np.testing.assert_allclose(intensity, 1.0, atol=1e-3)
+
+
+def test_line_cd_is_near_mask_width(optics):
+    mask = rasterize([(-0.25, 0.25, -2.0, 2.0)], grid=GRID)
+    profile = aerial_image(mask, optics)[GRID[0] // 2]
+    assert profile[GRID[1] // 2] < 0.3  # 선 가운데는 어둡다
+    assert critical_dimension(_x(), profile, 0.3) == pytest.approx(0.5, abs=0.05)
+
+
+def test_batch_matches_single(optics):
+    masks = np.stack([rasterize([(-0.25, 0.25, -2.0, 2.0)], grid=GRID),
+                      rasterize([(-1.0, 0.0, -0.5, 0.5)], grid=GRID)])
+    batch = aerial_image(masks, optics)
+    for mask, intensity in zip(masks, batch):
+        np.testing.assert_allclose(intensity, aerial_image(mask, optics), atol=1e-5)
+
+
+def test_develop_tone():
+    intensity = np.array([0.1, 0.5])
+    np.testing.assert_array_equal(develop(intensity, threshold=0.3), [False, True])
+    np.testing.assert_array_equal(develop(intensity, threshold=0.3, tone="negative"), [True, False])
+    np.testing.assert_array_equal(develop(intensity, dose=0.5, threshold=0.3), [False, False])
+
+
+def test_critical_dimension_without_edges_is_nan():
+    x = np.linspace(-1.0, 1.0, 11)
+    assert np.isnan(critical_dimension(x, np.ones(11), 0.3))
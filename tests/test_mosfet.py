@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from semisim.mosfet import calculate_id
+from semisim.poisson import oxide_capacitance, threshold_voltage
+
+DEVICE = {"W": 10.0, "L": 2.0, "N_D": 1e19, "N_A": 1e16, "T": 300.0}
+VT, COX, MU = 1.0, 6.9e-8, 500.0
+BETA = MU * COX * DEVICE["W"] / DEVICE["L"]
+
+
+def _id(Vgs, Vds):
+    return calculate_id(Vgs, Vds, **DEVICE, Vt=VT, Cox=COX, mu_eff=MU)
+
+
+def test_threshold_voltage_1e16_50nm():
+    assert threshold_voltage(1e16, 50) == pytest.approx(1.43, abs=0.01)
+
+
+def test_threshold_voltage_increases_with_doping():
+    Vt = threshold_voltage(np.array([1e15, 1e16, 1e17]), 50)
+    assert np.all(np.diff(Vt) > 0)
+
+
+def test_cutoff():
+    assert _id(0.5, 2.0) == 0.0
+    assert _id(VT, 2.0) == 0.0
+
+
+def test_linear_region():
+    Vgs, Vds = 3.0, 0.5
+    Vov = Vgs - VT
+    assert _id(Vgs, Vds) == pytest.approx(BETA * (Vov * Vds - Vds ** 2 / 2), rel=1e-12)
+
+
+def test_saturation_region():
+    Vgs, Vds = 2.5, 4.0
+    assert _id(Vgs, Vds) == pytest.approx(0.5 * BETA * (Vgs - VT) ** 2, rel=1e-12)
+
+
+def test_continuous_at_pinch_off():
+    Vgs = 2.0
+    Vov = Vgs - VT
+    assert _id(Vgs, Vov - 1e-9) == pytest.approx(_id(Vgs, Vov), rel=1e-6)
+
+
+def test_broadcast_matches_scalar_calls():
+    Vgs = np.linspace(0.0, 4.0, 9)[:, np.newaxis]
+    Vds = np.linspace(0.0, 4.0, 7)[np.newaxis, :]
+    grid = _id(Vgs, Vds)
+    assert grid.shape == (9, 7)
+    expected = [[_id(float(g), float(d)) for d in Vds[0]] for g in Vgs[:, 0]]
+    np.testing.assert_allclose(grid, expected, rtol=1e-12)
+
+
+def test_default_device_parameters_use_poisson_threshold():
+    kwargs = {"Cox": oxide_capacitance(50), "mu_eff": MU}
+    Vt = threshold_voltage(DEVICE["N_A"], 50, DEVICE["T"])
+    assert calculate_id(3.0, 5.0, **DEVICE, **kwargs) == pytest.approx(
+        calculate_id(3.0, 5.0, **DEVICE, Vt=Vt, **kwargs), rel=1e-9)
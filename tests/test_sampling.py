@@ -0,0 +1,63 @@
+import numpy as np
+
+from semisim.sampling import adaptive_grid, lttb
+
+
+def _step(x):
+    return np.tanh(10 * (x - 2.5))
+
+
+def test_lttb_keeps_endpoints_and_count():
+    x = np.linspace(0.0, 10.0, 1000)
+    index = lttb(x, np.sin(x), 100)
+    assert len(index) == 100
+    assert index[0] == 0 and index[-1] == 999
+    assert np.all(np.diff(index) > 0)
+
+
+def test_lttb_keeps_spike():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[437] = 1.0
+    assert 437 in lttb(x, y, 50)
+
+
+def test_lttb_curve_bundle_shares_index():
+    x = np.linspace(0.0, 1.0, 500)
+    y = np.stack([x ** 2, np.zeros_like(x)])
+    y[1, 321] = 5.0
+    index = lttb(x, y, 40)
+    assert len(index) == 40 and 321 in index
+
+
+def test_lttb_small_threshold_returns_all_points():
+    x = np.arange(10.0)
+    np.testing.assert_array_equal(lttb(x, x, 20), np.arange(10))
+    np.testing.assert_array_equal(lttb(x, x, 2), np.arange(10))
+
+
+def test_adaptive_grid_interpolation_error():
+    tol = 1e-3
+    x, y = adaptive_grid(_step, 0.0, 5.0, tol=tol)
+    assert np.all(np.diff(x) > 0)
+    np.testing.assert_array_equal(y, _step(x))
+    dense = np.linspace(0.0, 5.0, 20001)
+    error = np.abs(np.interp(dense, x, y) - _step(dense)).max()
+    assert error < 4 * tol * 2.0  # 곡선 높이 2
+
+
+def test_adaptive_grid_refines_near_knee():
+    x, _ = adaptive_grid(_step, 0.0, 5.0)
+    near = np.sum(np.abs(x - 2.5) < 0.5)
+    far = np.sum(np.abs(x - 2.5) > 2.0)
+    assert near > 3 * far
+
+
+def test_adaptive_grid_curve_bundle_shape():
+    x, y = adaptive_grid(lambda v: np.stack([v, v ** 2, _step(v)]), 0.0, 5.0)
+    assert y.shape == (3, len(x))
+
+
+def test_adaptive_grid_straight_line_not_refined():
+    x, _ = adaptive_grid(lambda v: 2 * v + 1, 0.0, 5.0, initial=17)
+    assert len(x) <= 2 * 17
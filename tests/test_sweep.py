@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from semisim.sweep import column_names, compile_spec, evaluate_chunk, run_sweep
+
+SPEC = {
+    "device": "mosfet",
+    "parameters": {"Vgs": {"start": 0.0, "stop": 5.0, "num": 11}, "Vds": [0.1, 1.0, 5.0], "W": 20.0},
+    "outputs": ["Id", "mobility"],
+}
+
+
+@pytest.fixture
+def plan():
+    return compile_spec(SPEC, chunk_size=7)  # 여러 chunk로 나뉘도록
+
+
+def test_plan(plan):
+    assert plan["shape"] == (11, 3)
+    assert plan["fixed"]["W"] == 20.0
+    assert column_names(plan) == ["Vgs", "Vds", "Id", "mu_e", "mu_h", "mu_eff"]
+
+
+def test_chunks_match_whole(plan):
+    whole = evaluate_chunk(plan, 0, plan["size"])
+    parts = [evaluate_chunk(plan, start, min(start + 7, plan["size"])) for start in range(0, plan["size"], 7)]
+    for name in whole:
+        np.testing.assert_array_equal(np.concatenate([part[name] for part in parts]), whole[name])
+
+
+def test_csv_round_trip(plan, tmp_path):
+    path = tmp_path / "sweep.csv"
+    assert run_sweep(plan, path) == plan["size"]
+    with open(path, encoding="utf-8") as file:
+        assert file.readline().strip().split(",") == column_names(plan)
+    table = np.loadtxt(path, delimiter=",", skiprows=1)
+    expected = evaluate_chunk(plan, 0, plan["size"])
+    for i, name in enumerate(column_names(plan)):
+        np.testing.assert_allclose(table[:, i], expected[name], rtol=1e-8)
+
+
+def test_npz_round_trip(plan, tmp_path):
+    path = tmp_path / "sweep.npz"
+    run_sweep(plan, path)
+    expected = evaluate_chunk(plan, 0, plan["size"])
+    with np.load(path) as data:
+        assert sorted(data.files) == sorted(column_names(plan))
+        for name in column_names(plan):
+            np.testing.assert_array_equal(data[name], expected[name])
+    assert [p.name for p in tmp_path.iterdir()] == ["sweep.npz"]  # 임시 디렉터리 정리
+
+
+def test_parquet_round_trip(plan, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "sweep.parquet"
+    run_sweep(plan, path)
+    table = pq.read_table(path)
+    assert table.column_names == column_names(plan)
+    expected = evaluate_chunk(plan, 0, plan["size"])
+    for name in column_names(plan):
+        np.testing.assert_array_equal(table[name].to_numpy(), expected[name])
+
+
+def test_unknown_output_format(plan, tmp_path):
+    with pytest.raises(ValueError):
+        run_sweep(plan, tmp_path / "sweep.xlsx")
+
+
+def test_unknown_parameter():
+    with pytest.raises(ValueError):
+        compile_spec({"device": "mosfet", "parameters": {"Vbs": [0.0]}})
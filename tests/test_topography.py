@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from semisim.topography import AIR, TopographyEngine, material_index
+
+CUTS = (0.0,)
+WINDOW = [(-1.0, 1.0, -1.0, 1.0)]
+
+
+def _flow(depth):
+    return [
+        ("wafer", "wafer", {}),
+        ("implant", "implant", {"windows": WINDOW, "material": "N+", "depth": depth}),
+        ("oxide", "deposit", {"material": "Oxide", "thickness": 0.2}),
+    ]
+
+
+def _thickness(engine, labels, material):
+    return (labels == material_index(material)).sum(axis=1) * engine.hy
+
+
+def test_conformal_deposit_thickness():
+    engine = TopographyEngine(_flow(0.1), CUTS)
+    labels = engine.section(2).labels
+    np.testing.assert_allclose(_thickness(engine, labels, "Oxide"), 0.2, atol=engine.hy)
+
+
+def test_implant_depth_only_inside_window():
+    engine = TopographyEngine(_flow(0.1), CUTS)
+    doped = _thickness(engine, engine.section(1).labels, "N+")[0]
+    inside = np.abs(engine.x) < 0.9
+    outside = np.abs(engine.x) > 1.1
+    np.testing.assert_allclose(doped[inside], 0.1, atol=engine.hy)
+    assert not doped[outside].any()
+
+
+def test_relabel_matches_full_chain():
+    for depth in (0.1, 0.25):
+        engine = TopographyEngine(_flow(depth), CUTS)
+        state = None
+        for _, op, args in engine.flow:
+            state = getattr(engine, op)(state, **args)
+        np.testing.assert_array_equal(engine.section(2).labels, state.labels)
+
+
+def test_keys_depend_only_on_prefix():
+    a = TopographyEngine(_flow(0.1), CUTS)
+    b = TopographyEngine(_flow(0.25), CUTS)
+    assert a.keys[0] == b.keys[0]
+    assert a.keys[1] != b.keys[1] and a.keys[2] != b.keys[2]
+
+
+def test_sections_are_read_only():
+    engine = TopographyEngine(_flow(0.1), CUTS)
+    labels = engine.section(0).labels
+    assert (labels[0, engine.y > 0] == AIR).all()
+    with pytest.raises(ValueError):
+        labels[0, 0, 0] = AIR